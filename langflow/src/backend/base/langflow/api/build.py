@@ -97,6 +97,8 @@ async def get_flow_events_response(
                 queue=main_queue,
                 event_manager=event_manager,
                 event_task=event_task,
+                job_id=job_id,
+                queue_service=queue_service,
             )
 
         # Polling mode - get all available events
@@ -150,6 +152,8 @@ async def create_flow_response(
     queue: asyncio.Queue,
     event_manager: EventManager,
     event_task: asyncio.Task,
+    job_id: str | None = None,
+    queue_service: JobQueueService | None = None,
 ) -> DisconnectHandlerStreamingResponse:
     """Create a streaming response for the flow build process."""
 
@@ -166,8 +170,12 @@ async def create_flow_response(
                 logger.exception(f"Error consuming event: {exc}")
                 break
 
-    def on_disconnect() -> None:
+    async def on_disconnect() -> None:
         logger.debug("Client disconnected, closing tasks")
+        if job_id is not None and queue_service is not None:
+            # Cancel the build and release its queue right away instead of waiting for the periodic cleanup
+            await queue_service.cleanup_job(job_id)
+            return
         event_task.cancel()
         event_manager.on_end(data={})
 
@@ -225,7 +233,7 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            await chat_service.set_graph_cache(flow_id_str, graph)
             await log_telemetry(start_time, components_count, success=True)
 
         except Exception as exc:
@@ -342,7 +350,7 @@ async def generate_flow_events(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await chat_service.update_graph_cache(flow_id_str, graph, vertex=vertex)
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -1,10 +1,12 @@
 import asyncio
 import typing
+from functools import partial
 
+import anyio
 from fastapi.responses import StreamingResponse
 from starlette.background import BackgroundTask
 from starlette.responses import ContentStream
-from starlette.types import Receive
+from starlette.types import Receive, Scope, Send
 
 
 class DisconnectHandlerStreamingResponse(StreamingResponse):
@@ -20,6 +22,21 @@ class DisconnectHandlerStreamingResponse(StreamingResponse):
         super().__init__(content, status_code, headers, media_type, background)
         self.on_disconnect = on_disconnect
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        # Always listen for the disconnect message, even on servers implementing ASGI 2.4 where
+        # StreamingResponse only notices a disconnection when sending fails
+        async with anyio.create_task_group() as task_group:
+
+            async def wrap(func: typing.Callable[[], typing.Awaitable[None]]) -> None:
+                await func()
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(wrap, partial(self.stream_response, send))
+            await wrap(partial(self.listen_for_disconnect, receive))
+
+        if self.background is not None:
+            await self.background()
+
     async def listen_for_disconnect(self, receive: Receive) -> None:
         while True:
             message = await receive()
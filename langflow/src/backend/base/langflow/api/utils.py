@@ -7,6 +7,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import Depends, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi_pagination import Params
 from loguru import logger
 from sqlalchemy import delete
@@ -19,11 +20,14 @@ from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.user.model import User
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
-from langflow.services.deps import get_session, session_scope
+from langflow.services.deps import get_build_log_service, get_session, session_scope
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
+    from fastapi.responses import Response
+
     from langflow.services.chat.service import ChatService
+    from langflow.services.storage.service import StorageService
     from langflow.services.store.schema import StoreComponentCreate
 
 
@@ -194,7 +198,7 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService, **kwargs):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session, **kwargs)
-    await chat_service.set_cache(str(flow_id), graph)
+    await chat_service.set_graph_cache(str(flow_id), graph)
     return graph
 
 
@@ -207,7 +211,7 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    await chat_service.set_graph_cache(str_flow_id, graph)
     return graph
 
 
@@ -303,6 +307,8 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         # If we delete messages directly, rather than setting flow_id to null,
         # it might cause unexpected behaviors because the session id could still be
         # used elsewhere to search for these messages.
+        # Pending builds and transactions of the flow must be written before they can be deleted.
+        await get_build_log_service().flush()
         await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
@@ -379,3 +385,77 @@ async def verify_public_flow_and_get_user(flow_id: uuid.UUID, client_id: str | N
         raise HTTPException(status_code=403, detail=msg)
 
     return user, new_flow_id
+
+
+def parse_range_header(range_header: str | None, file_size: int) -> tuple[int, int] | None:
+    """Return the first and last offsets requested by a single-range `Range` header.
+
+    Returns None when the whole file should be sent: no header, another unit, several ranges or a
+    malformed range. Raises a 416 HTTPException when the range starts after the end of the file.
+    """
+    if not range_header:
+        return None
+    unit, _, byte_range = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in byte_range:
+        return None
+    first, separator, last = byte_range.strip().partition("-")
+    if not separator:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else file_size - 1
+        else:
+            start = max(0, file_size - int(last))
+            end = file_size - 1
+    except ValueError:
+        return None
+    end = min(end, file_size - 1)
+    if start < 0 or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    return start, end
+
+
+async def build_file_response(
+    storage_service: StorageService,
+    flow_id: str,
+    file_name: str,
+    *,
+    media_type: str,
+    range_header: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Stream a stored file to the client, honoring single-range `Range` requests.
+
+    Files on the local disk are sent with a `FileResponse`, which handles ranges itself and lets the
+    server send the file without copying it through Python when it supports it. Other files are
+    streamed chunk by chunk from the storage service.
+    """
+    file_path = await storage_service.get_file_path(flow_id=flow_id, file_name=file_name)
+    if file_path is not None:
+        return FileResponse(file_path, media_type=media_type, headers=headers)
+
+    headers = {**(headers or {}), "Accept-Ranges": "bytes"}
+    file_size = await storage_service.get_file_size(flow_id=flow_id, file_name=file_name)
+    byte_range = parse_range_header(range_header, file_size)
+    if byte_range is None:
+        headers["Content-Length"] = str(file_size)
+        return StreamingResponse(
+            storage_service.get_file_stream(flow_id=flow_id, file_name=file_name),
+            media_type=media_type,
+            headers=headers,
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        storage_service.get_file_stream(flow_id=flow_id, file_name=file_name, start=start, end=end),
+        status_code=206,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -10,10 +10,10 @@ from uuid import UUID
 import sqlalchemy as sa
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, UploadFile, status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlmodel import select
 
+from langflow.api.disconnect import DisconnectHandlerStreamingResponse
 from langflow.api.utils import CurrentActiveUser, DbSession, parse_value
 from langflow.api.v1.schemas import (
     ConfigResponse,
@@ -41,6 +41,7 @@ from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.compiled_flow import build_graph_from_flow_data
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user
@@ -125,9 +126,15 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph = build_graph_from_flow_data(
+            flow.data,
+            flow_id=flow_id_str,
+            updated_at=flow.updated_at,
+            tweaks=input_request.tweaks,
+            stream=stream,
+            flow_name=flow.name,
+            user_id=str(user_id),
+        )
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -334,10 +341,10 @@ async def simplified_run_flow(
             logger.debug("Client disconnected, closing tasks")
             main_task.cancel()
 
-        return StreamingResponse(
+        return DisconnectHandlerStreamingResponse(
             consume_and_yield(asyncio_queue, asyncio_queue_client_consumed),
-            background=on_disconnect,
             media_type="text/event-stream",
+            on_disconnect=on_disconnect,
         )
 
     try:
@@ -1,15 +1,13 @@
 import hashlib
 from datetime import datetime, timezone
 from http import HTTPStatus
-from io import BytesIO
 from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, build_file_response
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
@@ -73,7 +71,10 @@ async def upload_file(
 
 @router.get("/download/{flow_id}/{file_name}")
 async def download_file(
-    file_name: str, flow_id: UUID, storage_service: Annotated[StorageService, Depends(get_storage_service)]
+    file_name: str,
+    flow_id: UUID,
+    request: Request,
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
 ):
     flow_id_str = str(flow_id)
     extension = file_name.split(".")[-1]
@@ -89,19 +90,26 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
         }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        return await build_file_response(
+            storage_service,
+            flow_id_str,
+            file_name,
+            media_type=content_type,
+            range_header=request.headers.get("range"),
+            headers=headers,
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 @router.get("/images/{flow_id}/{file_name}")
-async def download_image(file_name: str, flow_id: UUID):
+async def download_image(file_name: str, flow_id: UUID, request: Request):
     storage_service = get_storage_service()
     extension = file_name.split(".")[-1]
     flow_id_str = str(flow_id)
@@ -119,8 +127,15 @@ async def download_image(file_name: str, flow_id: UUID):
         raise HTTPException(status_code=500, detail=f"Content type {content_type} is not an image")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await build_file_response(
+            storage_service,
+            flow_id_str,
+            file_name,
+            media_type=content_type,
+            range_header=request.headers.get("range"),
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -129,6 +144,7 @@ async def download_image(file_name: str, flow_id: UUID):
 async def download_profile_picture(
     folder_name: str,
     file_name: str,
+    request: Request,
 ):
     try:
         storage_service = get_storage_service()
@@ -137,9 +153,16 @@ async def download_profile_picture(
         config_path = Path(config_dir)  # type: ignore[arg-type]
         folder_path = config_path / "profile_pictures" / folder_name
         content_type = build_content_type_from_extension(extension)
-        file_content = await storage_service.get_file(flow_id=str(folder_path), file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await build_file_response(
+            storage_service,
+            str(folder_path),
+            file_name,
+            media_type=content_type,
+            range_header=request.headers.get("range"),
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -272,6 +272,7 @@ class ResultDataResponse(BaseModel):
     timedelta: float | None = None
     duration: str | None = None
     used_frozen_result: bool | None = False
+    used_memoized_result: bool | None = False
 
     @field_serializer("results")
     @classmethod
@@ -301,6 +302,7 @@ class ResultDataResponse(BaseModel):
             "timedelta": self.timedelta,
             "duration": self.duration,
             "used_frozen_result": self.used_frozen_result,
+            "used_memoized_result": self.used_memoized_result,
         }
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import io
 import re
 import uuid
@@ -9,13 +10,14 @@ from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+import anyio
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlmodel import col, select
 
 from langflow.api.schemas import UploadFileResponse
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, build_file_response
 from langflow.services.database.models.file.model import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.storage.service import StorageService
@@ -27,23 +29,46 @@ MCP_SERVERS_FILE = "_mcp_servers"
 SAMPLE_DATA_DIR = Path(__file__).parent / "sample_data"
 
 
-async def byte_stream_generator(file_input, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
-    """Convert bytes object or stream into an async generator that yields chunks."""
-    if isinstance(file_input, bytes):
-        # Handle bytes object
-        for i in range(0, len(file_input), chunk_size):
-            yield file_input[i : i + chunk_size]
-    # Handle stream object
-    elif hasattr(file_input, "read"):
-        while True:
-            chunk = await file_input.read(chunk_size) if callable(file_input.read) else file_input.read(chunk_size)
-            if not chunk:
-                break
-            yield chunk
-    else:
-        # Handle async iterator
-        async for chunk in file_input:
-            yield chunk
+class _ZipChunkSink(io.RawIOBase):
+    """Unseekable file collecting what `zipfile` writes, so the archive can be sent as it is built."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def zip_stream_generator(
+    storage_service: StorageService, flow_id: str, entries: list[tuple[str, str]]
+) -> AsyncGenerator[bytes, None]:
+    """Stream a ZIP archive of stored files, given as (name in the archive, stored file name) pairs.
+
+    Only one chunk of one file is held in memory at a time.
+    """
+    sink = _ZipChunkSink()
+    with zipfile.ZipFile(sink, "w") as zip_file:
+        for archive_name, file_name in entries:
+            # The size is not known up front, so always leave room for ZIP64 sizes
+            with zip_file.open(archive_name, "w", force_zip64=True) as entry:
+                async for chunk in storage_service.get_file_stream(flow_id=flow_id, file_name=file_name):
+                    entry.write(chunk)
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+    if data := sink.drain():
+        yield data
 
 
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
@@ -193,7 +218,7 @@ async def get_file_by_name(
 
 async def load_sample_files(current_user: CurrentActiveUser, session: DbSession, storage_service: StorageService):
     # Check if the sample files in the SAMPLE_DATA_DIR exist
-    for sample_file_path in Path(SAMPLE_DATA_DIR).iterdir():
+    async for sample_file_path in anyio.Path(SAMPLE_DATA_DIR).iterdir():
         sample_file_name = sample_file_path.name
         root_filename, _ = sample_file_name.rsplit(".", 1)
 
@@ -205,7 +230,7 @@ async def load_sample_files(current_user: CurrentActiveUser, session: DbSession,
             continue
 
         # Read the binary data of the sample file
-        binary_data = sample_file_path.read_bytes()
+        binary_data = await sample_file_path.read_bytes()
 
         # Write the sample file content to the storage service
         file_id, _ = await save_file_routine(
@@ -307,34 +332,20 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
+        # Name each file in the ZIP with the extension of the original filename
+        entries = [(f"{file.name}{Path(file.path).suffix}", file.path.split("/")[-1]) for file in files]
 
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # The archive is streamed after the response has started, so check that every file exists first
+        await asyncio.gather(
+            *(storage_service.get_file_size(flow_id=str(current_user.id), file_name=name) for _, name in entries)
+        )
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
         return StreamingResponse(
-            zip_stream,
+            zip_stream_generator(storage_service, str(current_user.id), entries),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -379,9 +390,37 @@ async def read_file_content(file_stream: AsyncIterable[bytes] | bytes, *, decode
         raise HTTPException(status_code=500, detail=f"Error reading file: {exc}") from exc
 
 
+async def get_file_content(
+    file_id: uuid.UUID,
+    current_user: CurrentActiveUser,
+    session: DbSession,
+    storage_service: StorageService,
+) -> str:
+    """Read the content of a file by its ID, for internal use.
+
+    Args:
+        file_id: UUID of the file.
+        current_user: Authenticated user.
+        session: Database session.
+        storage_service: File storage service.
+
+    Returns:
+        The content of the file, decoded as UTF-8.
+    """
+    file = await fetch_file_object(file_id, current_user, session)
+    if not file:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file.path.split("/")[-1])
+    if file_stream is None:
+        raise HTTPException(status_code=404, detail="File stream not available")
+    return await read_file_content(file_stream, decode=True)
+
+
 @router.get("/{file_id}")
 async def download_file(
     file_id: uuid.UUID,
+    request: Request,
     current_user: CurrentActiveUser,
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
@@ -392,6 +431,7 @@ async def download_file(
 
     Args:
         file_id: UUID of the file.
+        request: The HTTP request, whose `Range` header is honored.
         current_user: Authenticated user.
         session: Database session.
         storage_service: File storage service.
@@ -401,6 +441,10 @@ async def download_file(
         StreamingResponse for client downloads or str for internal use.
     """
     try:
+        # If return_content is True, read the file content and return it
+        if return_content:
+            return await get_file_content(file_id, current_user, session, storage_service)
+
         # Fetch the file from the DB
         file = await fetch_file_object(file_id, current_user, session)
         if not file:
@@ -409,27 +453,17 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        if file_stream is None:
-            raise HTTPException(status_code=404, detail="File stream not available")
-
-        # If return_content is True, read the file content and return it
-        if return_content:
-            return await read_file_content(file_stream, decode=True)
-
-        # For streaming, ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
-
         # Create the filename with extension
         file_extension = Path(file.path).suffix
         filename_with_extension = f"{file.name}{file_extension}"
 
-        # Return the file as a streaming response
-        return StreamingResponse(
-            byte_stream,
+        # Stream the file without loading it in memory
+        return await build_file_response(
+            storage_service,
+            str(current_user.id),
+            file_name,
             media_type="application/octet-stream",
+            range_header=request.headers.get("range"),
             headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
         )
 
@@ -5,7 +5,7 @@ from io import BytesIO
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
 
 from langflow.api.utils import CurrentActiveUser, DbSession
-from langflow.api.v2.files import MCP_SERVERS_FILE, delete_file, download_file, get_file_by_name, upload_user_file
+from langflow.api.v2.files import MCP_SERVERS_FILE, delete_file, get_file_by_name, get_file_content, upload_user_file
 from langflow.base.mcp.util import update_tools
 from langflow.logging import logger
 from langflow.services.deps import get_settings_service, get_storage_service
@@ -46,12 +46,11 @@ async def get_server_list(
 
     # Attempt to download the configuration file content
     try:
-        server_config_bytes = await download_file(
+        server_config_bytes = await get_file_content(
             server_config_file.id if server_config_file else None,
             current_user,
             session,
-            storage_service=storage_service,
-            return_content=True,
+            storage_service,
         )
     except (FileNotFoundError, HTTPException):
         # Storage file missing - DB entry may be stale. Remove it and recreate.
@@ -73,12 +72,11 @@ async def get_server_list(
         if not server_config_file:
             raise HTTPException(status_code=500, detail="Failed to create _mcp_servers.json") from None
 
-        server_config_bytes = await download_file(
+        server_config_bytes = await get_file_content(
             server_config_file.id,
             current_user,
             session,
-            storage_service=storage_service,
-            return_content=True,
+            storage_service,
         )
 
     # Parse JSON content
@@ -0,0 +1,224 @@
+"""Process-wide pool of loaded FAISS indexes.
+
+Indexes are kept in memory keyed by their persist directory and index name, so searches do not
+deserialize the index from disk on every build. An entry is reloaded when the modification time of the
+index file changes, e.g. because another process rewrote it. The pooled store is shared: callers use it
+through `PooledFaissIndex.view`, with the embedding of their own build, and views search the index under the
+read lock of the pooled index so searches never run while documents are being added.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from langchain_community.vectorstores import FAISS
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from langchain_core.documents import Document
+    from langchain_core.embeddings import Embeddings
+
+
+class ReadWriteLock:
+    """Lets any number of readers in at once, or a single writer."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._condition:
+            self._condition.wait_for(lambda: not self._writer)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._condition:
+            self._condition.wait_for(lambda: not self._writer and not self._readers)
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class FaissIndexView(FAISS):
+    """A FAISS store sharing the index and documents of a pooled store, searching them under its read lock.
+
+    Every search of a FAISS store, async ones included, goes through `similarity_search_with_score_by_vector`
+    or `max_marginal_relevance_search_with_score_by_vector`, so queries are embedded before taking the lock.
+    """
+
+    def __init__(self, store: FAISS, embedding: Embeddings, lock: ReadWriteLock) -> None:
+        super().__init__(
+            embedding_function=embedding,
+            index=store.index,
+            docstore=store.docstore,
+            index_to_docstore_id=store.index_to_docstore_id,
+            relevance_score_fn=store.override_relevance_score_fn,
+            normalize_L2=store._normalize_L2,
+            distance_strategy=store.distance_strategy,
+        )
+        self._lock = lock
+
+    def similarity_search_with_score_by_vector(self, *args: Any, **kwargs: Any) -> list[tuple[Document, float]]:
+        with self._lock.read():
+            return super().similarity_search_with_score_by_vector(*args, **kwargs)
+
+    def max_marginal_relevance_search_with_score_by_vector(
+        self, *args: Any, **kwargs: Any
+    ) -> list[tuple[Document, float]]:
+        with self._lock.read():
+            return super().max_marginal_relevance_search_with_score_by_vector(*args, **kwargs)
+
+
+@dataclass
+class PooledFaissIndex:
+    store: FAISS
+    mtime_ns: int
+    lock: ReadWriteLock = field(default_factory=ReadWriteLock)
+    _document_ids: set[str] | None = field(default=None, repr=False)
+
+    def view(self, embedding: Embeddings) -> FaissIndexView:
+        """Returns the store with another embedding, sharing the index and documents of the pooled one."""
+        return FaissIndexView(self.store, embedding, self.lock)
+
+    def document_ids(self) -> set[str]:
+        """Returns the content ids of the documents in the index, whatever ids they are stored under."""
+        if self._document_ids is None:
+            self._document_ids = set()
+            for docstore_id in self.store.index_to_docstore_id.values():
+                document = self.store.docstore.search(docstore_id)
+                # The docstore returns an error message for unknown ids
+                if not isinstance(document, str):
+                    self._document_ids.add(document_id(document))
+        return self._document_ids
+
+
+def document_id(document: Document) -> str:
+    """Returns the id a document is stored under: the hash of its content."""
+    return hashlib.sha256(document.page_content.encode()).hexdigest()
+
+
+def _index_file(folder_path: Path, index_name: str) -> Path:
+    return folder_path / f"{index_name}.faiss"
+
+
+class FaissIndexPool:
+    """Keeps up to `max_size` FAISS indexes loaded, evicting the least recently used."""
+
+    def __init__(self, max_size: int = 16) -> None:
+        self.max_size = max_size
+        self._indexes: OrderedDict[tuple[str, str], PooledFaissIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(
+        self,
+        folder_path: Path,
+        index_name: str,
+        embedding: Embeddings,
+        *,
+        allow_dangerous_deserialization: bool = False,
+    ) -> PooledFaissIndex | None:
+        """Returns the pooled index, loading it if it is not loaded or changed on disk.
+
+        `embedding` is only used to load the index; use `PooledFaissIndex.view` to search or add documents.
+        Returns None if the index does not exist on disk.
+        """
+        key = (str(folder_path.resolve()), index_name)
+        try:
+            mtime_ns = _index_file(folder_path, index_name).stat().st_mtime_ns
+        except FileNotFoundError:
+            with self._lock:
+                self._indexes.pop(key, None)
+            return None
+
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and index.mtime_ns == mtime_ns:
+                self._indexes.move_to_end(key)
+                return index
+
+        store = FAISS.load_local(
+            folder_path=str(folder_path),
+            embeddings=embedding,
+            index_name=index_name,
+            allow_dangerous_deserialization=allow_dangerous_deserialization,
+        )
+        self.loads += 1
+        logger.debug(f"Loaded FAISS index {index_name} from {folder_path}")
+        return self._put(key, PooledFaissIndex(store=store, mtime_ns=mtime_ns))
+
+    def add_documents(
+        self,
+        folder_path: Path,
+        index_name: str,
+        embedding: Embeddings,
+        documents: list[Document],
+        *,
+        allow_dangerous_deserialization: bool = False,
+    ) -> PooledFaissIndex:
+        """Adds the documents that are not in the index yet and saves it, creating it if needed.
+
+        Only the new documents are embedded. Documents are identified by the hash of their content, including
+        the ones stored under other ids by earlier versions.
+        """
+        new_documents = {document_id(document): document for document in documents}
+        index = self.get(
+            folder_path, index_name, embedding, allow_dangerous_deserialization=allow_dangerous_deserialization
+        )
+        if index is None:
+            store = FAISS.from_documents(
+                documents=list(new_documents.values()), embedding=embedding, ids=list(new_documents)
+            )
+            store.save_local(str(folder_path), index_name)
+            mtime_ns = _index_file(folder_path, index_name).stat().st_mtime_ns
+            return self._put((str(folder_path.resolve()), index_name), PooledFaissIndex(store, mtime_ns))
+
+        with index.lock.write():
+            document_ids = index.document_ids()
+            for existing_id in document_ids.intersection(new_documents):
+                del new_documents[existing_id]
+            if new_documents:
+                store = index.view(embedding)
+                store.add_documents(list(new_documents.values()), ids=list(new_documents))
+                store.save_local(str(folder_path), index_name)
+                document_ids.update(new_documents)
+                index.mtime_ns = _index_file(folder_path, index_name).stat().st_mtime_ns
+        logger.debug(f"Added {len(new_documents)} documents to FAISS index {index_name}")
+        return index
+
+    def _put(self, key: tuple[str, str], index: PooledFaissIndex) -> PooledFaissIndex:
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_size:
+                self._indexes.popitem(last=False)
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+faiss_index_pool = FaissIndexPool()
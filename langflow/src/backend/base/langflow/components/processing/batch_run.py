@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from typing import TYPE_CHECKING, Any, cast
 
+import orjson
 import toml  # type: ignore[import-untyped]
 from loguru import logger
 
 from langflow.custom.custom_component.component import Component
-from langflow.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from langflow.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output
 from langflow.schema.dataframe import DataFrame
+from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.deps import get_cache_service
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
 
+# Delay before the first retry of a failed chunk, doubled on every further attempt
+RETRY_BACKOFF_SECONDS = 1.0
+
 
 class BatchRunComponent(Component):
     display_name = "Batch Run"
@@ -65,6 +74,28 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="Number of rows sent to the model in each batch call. Use 0 to send all rows at once.",
+            value=100,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of chunks processed at the same time.",
+            value=4,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Number of times a failed chunk is retried, with exponential backoff, before its rows are "
+            "marked as failed. Rows completed before a failure are skipped when the batch is run again.",
+            value=2,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -110,9 +141,79 @@ class BatchRunComponent(Component):
                 "processing_status": "failed",
             }
 
+    def _checkpoint_key(self, conversations: list[list[dict[str, str]]]) -> str:
+        """Key of the checkpoint holding the responses already received for these conversations."""
+        flow_id = self.flow_id if self._vertex is not None else None
+        digest = hashlib.sha256(orjson.dumps([self.output_column_name, conversations])).hexdigest()
+        return f"batch_run:{flow_id}:{self._id}:{digest}"
+
+    async def _call_cache_service(self, method: str, *args) -> Any:
+        cache_service = get_cache_service()
+        if isinstance(cache_service, AsyncBaseCacheService):
+            return await getattr(cache_service, method)(*args)
+        return getattr(cache_service, method)(*args)
+
+    @staticmethod
+    def _chunk_key(key: str, chunk_id: int) -> str:
+        return f"{key}:chunk:{chunk_id}"
+
+    async def _load_checkpoint(self, key: str) -> tuple[list[int], dict[int, str]]:
+        """Return the IDs of the chunks stored in a checkpoint and the responses they hold.
+
+        The checkpoint is a list of chunk IDs, and the responses of each chunk are stored under their own key,
+        so completing a chunk never writes the responses of the other chunks again.
+        """
+        chunk_ids = await self._call_cache_service("get", key)
+        if isinstance(chunk_ids, CacheMiss) or not isinstance(chunk_ids, list):
+            return [], {}
+        responses: dict[int, str] = {}
+        for chunk_id in chunk_ids:
+            chunk_responses = await self._call_cache_service("get", self._chunk_key(key, chunk_id))
+            if isinstance(chunk_responses, dict):
+                responses.update((int(idx), response) for idx, response in chunk_responses.items())
+        return chunk_ids, responses
+
+    async def _delete_checkpoint(self, key: str, chunk_ids: list[int]) -> None:
+        for chunk_id in chunk_ids:
+            await self._call_cache_service("delete", self._chunk_key(key, chunk_id))
+        await self._call_cache_service("delete", key)
+
+    def _send_progress(self, completed: int, failed: int, total: int) -> None:
+        logger.info(f"Processed {completed + failed}/{total} rows ({failed} failed)")
+        if self._event_manager is not None:
+            self._event_manager.on_batch_progress(
+                data={"component_id": self._id, "completed": completed, "failed": failed, "total": total}
+            )
+
+    async def _run_chunk(
+        self, model: Runnable, conversations: list[list[dict[str, str]]], semaphore: asyncio.Semaphore
+    ) -> list[str]:
+        """Send one chunk of conversations to the model, retrying it with exponential backoff."""
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    responses = await model.abatch(conversations)
+            except (KeyError, AttributeError):
+                raise
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = RETRY_BACKOFF_SECONDS * 2**attempt
+                attempt += 1
+                logger.warning(f"Batch chunk failed ({e!s}), retry {attempt}/{self.max_retries} in {delay}s")
+                await asyncio.sleep(delay)
+            else:
+                return [response.content if hasattr(response, "content") else str(response) for response in responses]
+
     async def run_batch(self) -> DataFrame:
         """Process each row in df[column_name] with the language model asynchronously.
 
+        Rows are sent to the model in chunks of `chunk_size`, at most `max_concurrency` chunks at a time.
+        Failed chunks are retried with exponential backoff; rows of a chunk that still fails are returned
+        with an empty response (and a failed status in the metadata). Responses are checkpointed in the
+        cache service as chunks complete, so running the same batch again only sends the remaining rows.
+
         Returns:
             DataFrame: A new DataFrame containing:
                 - All original columns
@@ -158,6 +259,13 @@ class BatchRunComponent(Component):
                 for text in user_texts
             ]
 
+            # Skip the rows completed by an earlier attempt
+            checkpoint_key = self._checkpoint_key(conversations)
+            chunk_ids, responses = await self._load_checkpoint(checkpoint_key)
+            if responses:
+                logger.info(f"Resuming batch run, {len(responses)} rows already completed")
+            pending = [idx for idx in range(total_rows) if idx not in responses]
+
             # Configure the model with project info and callbacks
             model = model.with_config(
                 {
@@ -166,35 +274,52 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
 
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
+            chunk_size = self.chunk_size if self.chunk_size > 0 else max(1, len(pending))
+            chunks = [pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)]
+            semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+            errors: dict[int, str] = {}
+            checkpoint_lock = asyncio.Lock()
+
+            async def run_chunk(chunk: list[int]) -> None:
+                try:
+                    chunk_responses = await self._run_chunk(model, [conversations[i] for i in chunk], semaphore)
+                except (KeyError, AttributeError):
+                    raise
+                except Exception as e:  # noqa: BLE001
+                    logger.error(f"Batch chunk failed after {self.max_retries} retries: {e!s}")
+                    errors.update(dict.fromkeys(chunk, str(e)))
+                else:
+                    chunk_responses_by_idx = dict(zip(chunk, chunk_responses, strict=True))
+                    responses.update(chunk_responses_by_idx)
+                    # A chunk is identified by its first row, which no other chunk of any run contains
+                    await self._call_cache_service(
+                        "set", self._chunk_key(checkpoint_key, chunk[0]), chunk_responses_by_idx
+                    )
+                    async with checkpoint_lock:
+                        chunk_ids.append(chunk[0])
+                        await self._call_cache_service("set", checkpoint_key, list(chunk_ids))
+                self._send_progress(len(responses), len(errors), total_rows)
+
+            await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
 
             # Build the final data with enhanced metadata
             rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
-            ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
+            for idx, original_row in enumerate(df.to_dict(orient="records")):
                 row = self._create_base_row(
-                    cast(dict[str, Any], original_row), model_response=response_text, batch_index=idx
+                    cast(dict[str, Any], original_row), model_response=responses.get(idx, ""), batch_index=idx
                 )
-                self._add_metadata(row, success=True, system_msg=system_msg)
+                if idx in errors:
+                    self._add_metadata(row, success=False, error=errors[idx])
+                else:
+                    self._add_metadata(row, success=True, system_msg=system_msg)
                 rows.append(row)
 
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    logger.info(f"Processed {idx + 1}/{total_rows} rows")
-
-            logger.info("Batch processing completed successfully")
+            if errors:
+                logger.warning(f"Batch processing completed with {len(errors)} failed rows")
+            else:
+                await self._delete_checkpoint(checkpoint_key, chunk_ids)
+                logger.info("Batch processing completed successfully")
             return DataFrame(rows)
 
         except (KeyError, AttributeError) as e:
@@ -5,6 +5,7 @@ from langflow.custom import Component
 from langflow.io import BoolInput, DropdownInput, MessageTextInput, Output, SecretStrInput
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
+from langflow.services.deps import get_http_client_service
 
 
 class TavilyExtractComponent(Component):
@@ -73,9 +74,9 @@ class TavilyExtractComponent(Component):
                 "include_images": self.include_images,
             }
 
-            with httpx.Client(timeout=90.0) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
+            client = get_http_client_service().get_client(url)
+            response = client.post(url, json=payload, headers=headers, timeout=90.0)
+            response.raise_for_status()
 
         except httpx.TimeoutException as exc:
             error_message = f"Request timed out (90s): {exc}"
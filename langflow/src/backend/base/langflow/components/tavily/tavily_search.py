@@ -5,6 +5,7 @@ from langflow.custom.custom_component.component import Component
 from langflow.inputs.inputs import BoolInput, DropdownInput, IntInput, MessageTextInput, SecretStrInput
 from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
+from langflow.services.deps import get_http_client_service
 from langflow.template.field.base import Output
 
 
@@ -160,8 +161,8 @@ class TavilySearchComponent(Component):
                 payload["time_range"] = self.time_range
 
             # Add timeout handling
-            with httpx.Client(timeout=90.0) as client:
-                response = client.post(url, json=payload, headers=headers)
+            client = get_http_client_service().get_client(url)
+            response = client.post(url, json=payload, headers=headers, timeout=90.0)
 
             response.raise_for_status()
             search_results = response.json()
@@ -10,6 +10,7 @@ from langflow.base.langchain_utilities.model import LCToolComponent
 from langflow.field_typing import Tool
 from langflow.inputs.inputs import BoolInput, DropdownInput, IntInput, MessageTextInput, SecretStrInput
 from langflow.schema.data import Data
+from langflow.services.deps import get_http_client_service
 
 # Add at the top with other constants
 MAX_CHUNKS_PER_SOURCE = 3
@@ -299,8 +300,8 @@ Note: Check 'Advanced' for all options.
                 "time_range": time_range.value if time_range else None,
             }
 
-            with httpx.Client(timeout=90.0) as client:
-                response = client.post(url, json=payload, headers=headers)
+            client = get_http_client_service().get_client(url)
+            response = client.post(url, json=payload, headers=headers, timeout=90.0)
 
             response.raise_for_status()
             search_results = response.json()
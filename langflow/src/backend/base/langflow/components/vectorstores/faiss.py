@@ -2,6 +2,7 @@ from pathlib import Path
 
 from langchain_community.vectorstores import FAISS
 
+from langflow.base.vectorstores.faiss_pool import faiss_index_pool
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from langflow.helpers.data import docs_to_data
 from langflow.io import BoolInput, HandleInput, IntInput, StrInput
@@ -9,7 +10,11 @@ from langflow.schema.data import Data
 
 
 class FaissVectorStoreComponent(LCVectorStoreComponent):
-    """FAISS Vector Store with search capabilities."""
+    """FAISS Vector Store with search capabilities.
+
+    Loaded indexes are shared by every build of the process through `faiss_index_pool`, and ingesting only
+    embeds the documents that are not in the index yet.
+    """
 
     display_name: str = "FAISS"
     description: str = "FAISS Vector Store with search capabilities"
@@ -79,9 +84,14 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             else:
                 documents.append(_input)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
-        return faiss
+        index = faiss_index_pool.add_documents(
+            path,
+            self.index_name,
+            self.embedding,
+            documents,
+            allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+        )
+        return index.view(self.embedding)
 
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
@@ -89,21 +99,20 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
         index_path = path / f"{self.index_name}.faiss"
 
         if not index_path.exists():
-            vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
-                folder_path=str(path),
-                embeddings=self.embedding,
-                index_name=self.index_name,
-                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
-            )
-
-        if not vector_store:
+            self.build_vector_store()
+
+        index = faiss_index_pool.get(
+            path,
+            self.index_name,
+            self.embedding,
+            allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+        )
+        if index is None:
             msg = "Failed to load the FAISS index."
             raise ValueError(msg)
 
         if self.search_query and isinstance(self.search_query, str) and self.search_query.strip():
-            docs = vector_store.similarity_search(
+            docs = index.view(self.embedding).similarity_search(
                 query=self.search_query,
                 k=self.number_of_results,
             )
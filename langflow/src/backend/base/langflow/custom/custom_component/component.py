@@ -21,7 +21,9 @@ from langflow.base.tools.constants import (
     TOOLS_METADATA_INFO,
     TOOLS_METADATA_INPUT_NAME,
 )
+from langflow.custom.memoization import build_memo_key, get_memoized_results
 from langflow.custom.tree_visitor import RequiredInputsVisitor
+from langflow.events.event_manager import TokenStream
 from langflow.exceptions.component import StreamingError
 from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
 
@@ -30,11 +32,13 @@ from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_out
 # Lazy import to avoid circular dependency
 # from langflow.graph.utils import has_chat_output
 from langflow.helpers.custom import format_type
-from langflow.memory import astore_message, aupdate_messages, delete_message
+from langflow.memory import astore_message, aupdate_message_text, delete_message
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
 from langflow.schema.properties import Source
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.deps import get_settings_service
 from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
@@ -99,6 +103,12 @@ class Component(CustomComponent):
     outputs: list[Output] = []
     selected_output: str | None = None
     code_class_base_inheritance: ClassVar[str] = "Component"
+    memoize_outputs: ClassVar[bool] = False
+    """Whether the results of the outputs are reused by later builds with the same inputs.
+
+    Only enable it for components whose outputs depend on nothing but their inputs. Outputs can
+    override it with `Output(memoize=...)`.
+    """
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -116,6 +126,7 @@ class Component(CustomComponent):
         self._inputs: dict[str, InputTypes] = {}
         self._outputs_map: dict[str, Output] = {}
         self._results: dict[str, Any] = {}
+        self._memoized_outputs: set[str] = set()
         self._attributes: dict[str, Any] = {}
         self._edges: list[EdgeData] = []
         self._components: list[Component] = []
@@ -1068,6 +1079,7 @@ class Component(CustomComponent):
 
     async def _build_results(self) -> tuple[dict, dict]:
         results, artifacts = {}, {}
+        self._memoized_outputs = set()
 
         self._pre_run_setup_if_needed()
         self._handle_tool_mode()
@@ -1137,7 +1149,8 @@ class Component(CustomComponent):
 
         If the output is cached and a value is already defined, returns the cached value. Otherwise,
         invokes the associated output method asynchronously, applies output options, updates the cache,
-        and returns the result. Raises a ValueError if the output method is not defined, or a TypeError
+        and returns the result. Outputs that opt in to memoization reuse the result of an earlier build
+        with the same code and inputs. Raises a ValueError if the output method is not defined, or a TypeError
         if the method invocation fails.
         """
         if output.cache and output.value != UNDEFINED:
@@ -1147,6 +1160,19 @@ class Component(CustomComponent):
             msg = f'Output "{output.name}" does not have a method defined.'
             raise ValueError(msg)
 
+        memoized_results = get_memoized_results() if self._should_memoize(output) else None
+        memo_key = None
+        if memoized_results is not None:
+            memo_key = build_memo_key(self._code or "", self.__class__.__name__, output.name, self._attributes)
+        if memo_key is not None:
+            result = await memoized_results.get(memo_key)
+            if not isinstance(result, CacheMiss):
+                if isinstance(result, Message) and self._vertex is not None and self._vertex.graph.flow_id is not None:
+                    result.set_flow_id(self._vertex.graph.flow_id)
+                self._memoized_outputs.add(output.name)
+                output.value = result
+                return result
+
         method = getattr(self, output.method)
         try:
             result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
@@ -1163,9 +1189,14 @@ class Component(CustomComponent):
             result.set_flow_id(self._vertex.graph.flow_id)
         result = output.apply_options(result)
         output.value = result
+        if memo_key is not None:
+            await memoized_results.set(memo_key, result)
 
         return result
 
+    def _should_memoize(self, output: Output) -> bool:
+        return self.memoize_outputs if output.memoize is None else output.memoize
+
     async def resolve_output(self, output_name: str) -> Any:
         """Resolves and returns the value for a specified output by name.
 
@@ -1491,7 +1522,7 @@ class Component(CustomComponent):
             ):
                 complete_message = await self._stream_message(message.text, stored_message)
                 stored_message.text = complete_message
-                stored_message = await self._update_stored_message(stored_message)
+                await aupdate_message_text(stored_message.id, complete_message)
             else:
                 # Only send message event for non-streaming messages
                 await self._send_message_event(stored_message, id_=id_)
@@ -1512,6 +1543,8 @@ class Component(CustomComponent):
             msg = "Only one message can be stored at a time."
             raise ValueError(msg)
         stored_message = stored_messages[0]
+        if isinstance(stored_message, Message):
+            return stored_message
         return await Message.create(**stored_message.model_dump())
 
     async def _send_message_event(self, message: Message, id_: str | None = None, category: str | None = None) -> None:
@@ -1547,24 +1580,6 @@ class Component(CustomComponent):
             and not isinstance(original_message.text, str)
         )
 
-    async def _update_stored_message(self, message: Message) -> Message:
-        """Update the stored message."""
-        if hasattr(self, "_vertex") and self._vertex is not None and hasattr(self._vertex, "graph"):
-            flow_id = (
-                UUID(self._vertex.graph.flow_id)
-                if isinstance(self._vertex.graph.flow_id, str)
-                else self._vertex.graph.flow_id
-            )
-
-            message.flow_id = flow_id
-
-        message_tables = await aupdate_messages(message)
-        if not message_tables:
-            msg = "Failed to update message"
-            raise ValueError(msg)
-        message_table = message_tables[0]
-        return await Message.create(**message_table.model_dump())
-
     async def _stream_message(self, iterator: AsyncIterator | Iterator, message: Message) -> str:
         if not isinstance(iterator, AsyncIterator | Iterator):
             msg = "The message must be an iterator or an async iterator."
@@ -1573,46 +1588,48 @@ class Component(CustomComponent):
         if isinstance(iterator, AsyncIterator):
             return await self._handle_async_iterator(iterator, message.id, message)
         try:
-            complete_message = ""
-            first_chunk = True
+            chunks: list[str] = []
+            token_stream = self._create_token_stream(message.id)
             for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
-                first_chunk = False
+                await self._process_chunk(chunk.content, chunks, message.id, message, token_stream)
+            if token_stream:
+                await token_stream.flush()
         except Exception as e:
             raise StreamingError(cause=e, source=message.properties.source) from e
         else:
-            return complete_message
+            return "".join(chunks)
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
-        first_chunk = True
+        chunks: list[str] = []
+        token_stream = self._create_token_stream(message_id)
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
-        return complete_message
+            await self._process_chunk(chunk.content, chunks, message_id, message, token_stream)
+        if token_stream:
+            await token_stream.flush()
+        return "".join(chunks)
+
+    def _create_token_stream(self, message_id: str) -> TokenStream | None:
+        if not self._event_manager:
+            return None
+        settings = get_settings_service().settings
+        return TokenStream(
+            self._event_manager,
+            message_id,
+            flush_interval=settings.token_stream_flush_interval / 1000,
+            flush_size=settings.token_stream_flush_size,
+        )
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
-        if self._event_manager:
-            if first_chunk:
+        self, chunk: str, chunks: list[str], message_id: str, message: Message, token_stream: TokenStream | None
+    ) -> None:
+        chunks.append(chunk)
+        if token_stream:
+            if len(chunks) == 1:
                 # Send the initial message only on the first chunk
                 msg_copy = message.model_copy()
-                msg_copy.text = complete_message
+                msg_copy.text = chunk
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+            await token_stream.add(chunk)
 
     async def send_error(
         self,
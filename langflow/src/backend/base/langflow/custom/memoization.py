@@ -0,0 +1,138 @@
+"""Memoization of component outputs across graph builds.
+
+Outputs of deterministic components can opt in to memoization, either for every output of a component
+class (`Component.memoize_outputs = True`) or for a single output (`Output(memoize=True)`). Their results
+are stored in the configured cache service, keyed by a hash of the component code, the output name and
+the resolved values of the component inputs, so a build receiving the same inputs reuses the result
+computed by any earlier build, whatever its flow or session.
+
+Fields that change on every build (ids, timestamps and the flow id) are left out of the key, and models such
+as LLMs or embeddings are keyed by their class and non-secret configuration. The cache service may be shared
+by several workers, so it is responsible for expiring and evicting memoized results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import threading
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel, SecretBytes, SecretStr
+
+from langflow.schema.data import Data
+from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.cache.utils import CACHE_MISS, CacheMiss
+from langflow.services.deps import get_cache_service, get_settings_service
+
+MEMOIZED_RESULT_PREFIX = "memoized_result:"
+
+VOLATILE_FIELDS = frozenset({"id", "timestamp", "flow_id"})
+"""Fields that differ between builds of otherwise identical values, e.g. messages, and are not part of keys."""
+
+
+def _model_fingerprint(value: BaseModel) -> dict[str, Any]:
+    """Returns the class of a model and the values of its fields, leaving out volatile and secret fields.
+
+    Fields excluded from serialization, like the API clients of LangChain models, are left out as well.
+    """
+    secret_fields = getattr(value, "lc_secrets", None) or {}
+    fields = {
+        name: getattr(value, name)
+        for name, field in type(value).model_fields.items()
+        if not field.exclude and name not in VOLATILE_FIELDS and name not in secret_fields
+    }
+    fields.update(value.model_extra or {})
+    if isinstance(value, Data):
+        # Messages copy their fields in their data
+        fields["data"] = {key: item for key, item in value.data.items() if key not in VOLATILE_FIELDS}
+    return {
+        "class": f"{type(value).__module__}.{type(value).__qualname__}",
+        "fields": {name: item for name, item in fields.items() if not isinstance(item, SecretStr | SecretBytes)},
+    }
+
+
+def _stable_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return _model_fingerprint(value)
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient="split")
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=repr)
+    msg = f"Cannot hash a value of type {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def build_memo_key(code: str, class_name: str, output_name: str, inputs: dict[str, Any]) -> str | None:
+    """Returns the memoization key of an output, or None if one of the inputs cannot be hashed."""
+    try:
+        serialized_inputs = orjson.dumps(
+            inputs, default=_stable_default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError as exc:
+        logger.debug(f"Not memoizing {class_name}.{output_name}: {exc}")
+        return None
+    digest = hashlib.sha256()
+    for part in (code.encode(), class_name.encode(), output_name.encode(), serialized_inputs):
+        digest.update(part)
+        digest.update(b"\0")
+    return MEMOIZED_RESULT_PREFIX + digest.hexdigest()
+
+
+class MemoizedResults:
+    """Reads and writes memoized results in the cache service.
+
+    Results are not tracked here: the cache service may be shared with other workers, so its own
+    expiration time and size limit decide how long results are kept.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Any:
+        value = await _call_cache_service("get", key)
+        with self._lock:
+            if isinstance(value, CacheMiss):
+                self.misses += 1
+                return CACHE_MISS
+            self.hits += 1
+        # Results are stored pickled, so each build gets its own copy even from an in-memory cache
+        return pickle.loads(value) if isinstance(value, bytes) else value  # noqa: S301
+
+    async def set(self, key: str, value: Any) -> None:
+        try:
+            pickled = pickle.dumps(value)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Not memoizing a result of type {type(value).__name__}: {exc}")
+            return
+        await _call_cache_service("set", key, pickled)
+
+
+async def _call_cache_service(method: str, *args) -> Any:
+    cache_service = get_cache_service()
+    if isinstance(cache_service, AsyncBaseCacheService):
+        return await getattr(cache_service, method)(*args)
+    return getattr(cache_service, method)(*args)
+
+
+_memoized_results: MemoizedResults | None = None
+
+
+def get_memoized_results() -> MemoizedResults | None:
+    """Returns the process-wide memoized results store, or None if memoization is disabled."""
+    global _memoized_results  # noqa: PLW0603
+    if not get_settings_service().settings.memoize_component_outputs:
+        return None
+    if _memoized_results is None:
+        _memoized_results = MemoizedResults()
+    return _memoized_results
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
+import itertools
 import json
 import time
 import uuid
+from datetime import datetime, timezone
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -14,10 +17,22 @@ from typing_extensions import Protocol
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
+# Token events are encoded without building a TokenEvent: this is the JSON it would be encoded to
+_TOKEN_EVENT_TEMPLATE = '{"event": "token", "data": {"chunk": %s, "id": %s, "timestamp": "%s"}}\n\n'  # noqa: S105
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _token_timestamp() -> str:
+    """The timestamp of TokenEvent, formatted at most once per second."""
+    global _timestamp_cache  # noqa: PLW0603
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        timestamp = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+        _timestamp_cache = (now, timestamp)
+    return _timestamp_cache[1]
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -31,6 +46,8 @@ class EventManager:
     def __init__(self, queue: asyncio.Queue):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self._custom_callbacks: set[str] = set()
+        self._token_ids = itertools.count()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -61,11 +78,20 @@ class EventManager:
             raise ValueError(msg)
         if callback is None:
             callback_ = partial(self.send_event, event_type=event_type)
+            self._custom_callbacks.discard(name)
         else:
             callback_ = partial(callback, manager=self, event_type=event_type)
+            self._custom_callbacks.add(name)
         self.events[name] = callback_
 
+    def has_custom_callback(self, name: str) -> bool:
+        """Whether the event runs a registered callback, which may block, instead of just queuing the event."""
+        return name in self._custom_callbacks
+
     def send_event(self, *, event_type: str, data: LoggableType):
+        if event_type == "token" and isinstance(data, dict) and data.keys() == {"chunk", "id"}:
+            self._send_token(data["chunk"], data["id"])
+            return
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -79,6 +105,14 @@ class EventManager:
         str_data = json.dumps(json_data) + "\n\n"
         self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
 
+    def _send_token(self, chunk: str, id_: str | None) -> None:
+        str_data = _TOKEN_EVENT_TEMPLATE % (
+            json.dumps(chunk),
+            "null" if id_ is None else json.dumps(str(id_)),
+            _token_timestamp(),
+        )
+        self.queue.put_nowait((f"token-{next(self._token_ids)}", str_data.encode("utf-8"), time.time()))
+
     def noop(self, *, data: LoggableType) -> None:
         pass
 
@@ -86,6 +120,66 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+class TokenStream:
+    """Coalesces the tokens of a streamed message into fewer `token` events.
+
+    The first token is sent right away. Later tokens are held until `flush_size` characters are pending
+    or `flush_interval` seconds have passed since the last event, then sent together as one chunk, even if
+    no other token arrives in the meantime. `flush` must be called once the stream ends to send the
+    remaining tokens right away.
+    """
+
+    def __init__(
+        self, event_manager: EventManager, message_id: str, *, flush_interval: float = 0.03, flush_size: int = 1024
+    ) -> None:
+        self.event_manager = event_manager
+        self.message_id = str(message_id)
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        # Registered callbacks may block, so they are run in a thread like before
+        self._in_thread = event_manager.has_custom_callback("on_token")
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._last_flush = float("-inf")
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+        # Events sent from threads must still reach the client in order
+        self._send_lock = asyncio.Lock()
+        self.events_sent = 0
+
+    async def add(self, chunk: str) -> None:
+        self._pending.append(chunk)
+        self._pending_size += len(chunk)
+        delay = self._last_flush + self.flush_interval - time.monotonic()
+        if self._pending_size >= self.flush_size or delay <= 0:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(delay, self._flush_held_tokens)
+
+    def _flush_held_tokens(self) -> None:
+        self._flush_timer = None
+        task = asyncio.create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        data = {"chunk": "".join(self._pending), "id": self.message_id}
+        self._pending.clear()
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+        self.events_sent += 1
+        if self._in_thread:
+            async with self._send_lock:
+                await asyncio.to_thread(self.event_manager.on_token, data=data)
+        else:
+            self.event_manager.on_token(data=data)
+
+
 def create_default_event_manager(queue):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
@@ -97,6 +191,7 @@ def create_default_event_manager(queue):
     manager.register_event("on_end_vertex", "end_vertex")
     manager.register_event("on_build_start", "build_start")
     manager.register_event("on_build_end", "build_end")
+    manager.register_event("on_batch_progress", "batch_progress")
     return manager
 
 
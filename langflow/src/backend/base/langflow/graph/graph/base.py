@@ -11,7 +11,6 @@ import traceback
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -21,6 +20,7 @@ from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
+from langflow.graph.graph.scheduler import SchedulerMode, SchedulerStats
 from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_model import create_state_model_from_graph
 from langflow.graph.graph.utils import (
@@ -40,7 +40,7 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -125,6 +125,8 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self.scheduler_stats: SchedulerStats | None = None
+        self.component_classes: dict[str, type[Component]] = {}
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -753,7 +755,7 @@ class Graph:
         try:
             cache_service = get_chat_service()
             if self.flow_id:
-                await cache_service.set_cache(self.flow_id, self)
+                await cache_service.set_graph_cache(self.flow_id, self)
         except Exception:  # noqa: BLE001
             logger.exception("Error setting cache")
 
@@ -1037,6 +1039,7 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        state.setdefault("component_classes", {})
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.tracing_service = get_tracing_service()
@@ -1049,6 +1052,7 @@ class Graph:
         flow_id: str | None = None,
         flow_name: str | None = None,
         user_id: str | None = None,
+        component_classes: dict[str, type[Component]] | None = None,
     ) -> Graph:
         """Creates a graph from a payload.
 
@@ -1057,6 +1061,8 @@ class Graph:
             flow_id: The ID of the flow.
             flow_name: The flow name.
             user_id: The user ID.
+            component_classes: Already evaluated component classes by vertex ID. Vertices found
+                here are instantiated without evaluating their code again.
 
         Returns:
             Graph: The created graph.
@@ -1067,6 +1073,8 @@ class Graph:
             vertices = payload["nodes"]
             edges = payload["edges"]
             graph = cls(flow_id=flow_id, flow_name=flow_name, user_id=user_id)
+            if component_classes:
+                graph.component_classes = component_classes
             graph.add_nodes_and_edges(vertices, edges)
         except KeyError as exc:
             logger.exception(exc)
@@ -1261,7 +1269,7 @@ class Graph:
     def _instantiate_components_in_vertices(self) -> None:
         """Instantiates the components in the vertices."""
         for vertex in self.vertices:
-            vertex.instantiate_component(self.user_id)
+            vertex.instantiate_component(self.user_id, class_object=self.component_classes.get(vertex.id))
 
     def remove_vertex(self, vertex_id: str) -> None:
         """Removes a vertex from the graph."""
@@ -1347,7 +1355,9 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        await chat_service.update_graph_cache(
+            str(self.flow_id or self._run_id), self, vertex=vertex_build_result.vertex
+        )
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
@@ -1526,10 +1536,36 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: SchedulerMode | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph with vertices in each layer run in parallel.
+
+        Args:
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            start_component_id: The component to start the run from.
+            event_manager: The event manager for the graph.
+            scheduler: "layered" waits for a whole layer before computing the next one, "dataflow"
+                starts each vertex as soon as its own predecessors are built. Defaults to the
+                `graph_scheduler` setting.
+            max_concurrency: Maximum number of vertices building at once in "dataflow" mode.
+                Defaults to the `graph_max_concurrent_vertices` setting (0 means unlimited).
+        """
+        if scheduler is None or max_concurrency is None:
+            settings = get_settings_service().settings
+            scheduler = scheduler or settings.graph_scheduler
+            max_concurrency = settings.graph_max_concurrent_vertices if max_concurrency is None else max_concurrency
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        if scheduler == "dataflow":
+            await self._process_dataflow(
+                first_layer,
+                fallback_to_env_vars=fallback_to_env_vars,
+                event_manager=event_manager,
+                has_webhook_component=has_webhook_component,
+                max_concurrency=max_concurrency,
+            )
+            return self
         vertex_task_run_count: dict[str, int] = {}
         to_process = deque(first_layer)
         layer_index = 0
@@ -1573,6 +1609,100 @@ class Graph:
         logger.debug("Graph processing complete")
         return self
 
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        *,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None,
+        has_webhook_component: bool,
+        max_concurrency: int,
+    ) -> None:
+        """Runs the graph launching every vertex as soon as its last predecessor finishes.
+
+        Unlike the layered mode, a slow vertex only delays its own successors. Vertex completion
+        goes through the same `RunnableVerticesManager` bookkeeping as the layered mode, so
+        cycles, loops and conditional branches keep their behaviour. The timings of the run
+        are stored in `self.scheduler_stats`.
+        """
+        chat_service = get_chat_service()
+        await self.initialize_run()
+        lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency and max_concurrency > 0 else None
+        stats = SchedulerStats()
+        self.scheduler_stats = stats
+        vertex_task_run_count: dict[str, int] = {}
+        in_flight: dict[asyncio.Task, tuple[str, int]] = {}
+
+        async def _build(vertex_id: str, run_index: int) -> VertexBuildResult:
+            async with semaphore if semaphore is not None else contextlib.nullcontext():
+                stats.mark_started(run_index)
+                try:
+                    return await self.build_vertex(
+                        vertex_id=vertex_id,
+                        user_id=self.user_id,
+                        inputs_dict={},
+                        fallback_to_env_vars=fallback_to_env_vars,
+                        get_cache=chat_service.get_cache,
+                        set_cache=chat_service.set_cache,
+                        event_manager=event_manager,
+                    )
+                finally:
+                    stats.mark_finished(run_index)
+
+        def _launch(vertex_id: str, triggered_by: int | None = None) -> None:
+            if any(running_id == vertex_id for running_id, _ in in_flight.values()):
+                return
+            run_index = stats.mark_ready(vertex_id, triggered_by)
+            task = asyncio.create_task(
+                _build(vertex_id, run_index),
+                name=f"{vertex_id} Run {vertex_task_run_count.get(vertex_id, 0)}",
+            )
+            vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+            in_flight[task] = (vertex_id, run_index)
+
+        for vertex_id in first_layer:
+            _launch(vertex_id)
+
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    vertex_id, run_index = in_flight.pop(task)
+                    result = task.exception() or task.result()
+                    if isinstance(result, BaseException):
+                        logger.error(f"Task {task.get_name()} failed with exception: {result}")
+                        if has_webhook_component and isinstance(result, Exception):
+                            await self._log_vertex_build_from_exception(vertex_id, result)
+                        raise result
+                    if self.flow_id is not None:
+                        await log_vertex_build(
+                            flow_id=self.flow_id,
+                            vertex_id=result.vertex.id,
+                            valid=result.valid,
+                            params=result.params,
+                            data=result.result_dict,
+                            artifacts=result.artifacts,
+                        )
+                    self.run_manager.remove_vertex_from_runnables(vertex_id)
+                    next_runnable_vertices = await self.get_next_runnable_vertices(
+                        lock, vertex=result.vertex, cache=False
+                    )
+                    for next_vertex_id in dict.fromkeys(next_runnable_vertices):
+                        _launch(next_vertex_id, triggered_by=run_index)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        report = stats.critical_path()
+        logger.debug(
+            f"Dataflow run finished in {report.total_duration:.3f}s with {len(stats.runs)} vertex runs "
+            f"(max in flight: {report.max_in_flight}, parallelism: {report.parallelism:.2f}). "
+            f"Critical path ({report.duration:.3f}s): {' -> '.join(report.vertices)}"
+        )
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         """Determines the next set of runnable vertices from a list of successor vertex IDs.
 
@@ -1615,8 +1745,7 @@ class Graph:
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+                await get_chat_service().update_graph_cache(self.flow_id, self, vertex=vertex, lock=lock)
         if vertex.is_state:
             next_runnable_vertices.extend(self.activated_vertices)
         return next_runnable_vertices
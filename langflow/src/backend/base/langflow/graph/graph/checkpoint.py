@@ -0,0 +1,146 @@
+"""Incremental checkpoints of the state of a graph run.
+
+Caches that serialize their values (Redis, disk) used to receive the whole `Graph` after each built
+vertex, pickling every vertex, built object and client again at every step. A checkpoint instead splits
+the state of a run in three kinds of records:
+
+- the graph record, written once per build: the flow payload and the identity of the run;
+- the run record, a few KB: the run manager state, the layers, the state of every vertex and the IDs of
+  the built vertices;
+- one vertex record per built vertex, written once when the vertex finishes building.
+
+Restoring a checkpoint rebuilds the graph from the payload and replays the vertex records on top of it.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
+from langflow.graph.utils import UnbuiltObject, UnbuiltResult
+from langflow.graph.vertex.base import VertexStates
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.vertex.base import Vertex
+
+
+def graph_record_key(key: str) -> str:
+    return f"{key}:checkpoint:graph"
+
+
+def run_record_key(key: str) -> str:
+    return f"{key}:checkpoint:run"
+
+
+def vertex_record_key(key: str, vertex_id: str) -> str:
+    return f"{key}:checkpoint:vertex:{vertex_id}"
+
+
+def can_checkpoint(graph: Graph) -> bool:
+    """Graphs built directly from components have no payload to be rebuilt from."""
+    return bool(graph.raw_graph_data.get("nodes"))
+
+
+def dump_graph_record(graph: Graph) -> dict[str, Any]:
+    return {
+        "payload": graph.raw_graph_data,
+        "flow_id": graph.flow_id,
+        "flow_name": graph.flow_name,
+        "user_id": graph.user_id,
+        "session_id": graph.session_id,
+        "run_id": graph._run_id,
+    }
+
+
+def dump_run_record(graph: Graph) -> dict[str, Any]:
+    return {
+        "run_manager": graph.run_manager.to_dict(),
+        "cycle_vertices": graph.run_manager.cycle_vertices,
+        "vertices_layers": graph.vertices_layers,
+        "vertices_to_run": graph.vertices_to_run,
+        "stop_vertex": graph.stop_vertex,
+        "inactivated_vertices": graph.inactivated_vertices,
+        "inactive_vertices": graph.inactive_vertices,
+        "activated_vertices": graph.activated_vertices,
+        # Branches are marked inactive on vertices that have not been built yet
+        "vertex_states": {vertex.id: vertex.state.name for vertex in graph.vertices},
+        "run_queue": list(graph._run_queue),
+        "first_layer": graph._first_layer,
+        "prepared": graph._prepared,
+        "built_vertices": [vertex.id for vertex in graph.vertices if vertex.built],
+    }
+
+
+def dump_vertex_record(vertex: Vertex) -> dict[str, Any]:
+    return {
+        "built": vertex.built,
+        "results": vertex.results,
+        "artifacts": vertex.artifacts,
+        "built_object": None if isinstance(vertex.built_object, UnbuiltObject) else vertex.built_object,
+        "built_result": None if isinstance(vertex.built_result, UnbuiltResult) else vertex.built_result,
+        "full_data": vertex.full_data,
+        "outputs_logs": vertex.outputs_logs,
+        "logs": vertex.logs,
+    }
+
+
+def graph_record_vertex_ids(graph_record: dict[str, Any]) -> list[str]:
+    """The IDs of the vertices whose records may be stored along with a graph record."""
+    return [node["id"] for node in graph_record["payload"].get("nodes", []) if "id" in node]
+
+
+def load_graph_record(graph_record: dict[str, Any]) -> Graph:
+    from langflow.graph.graph.base import Graph
+
+    graph = Graph.from_payload(
+        graph_record["payload"],
+        flow_id=graph_record["flow_id"],
+        flow_name=graph_record["flow_name"],
+        user_id=graph_record["user_id"],
+    )
+    if session_id := graph_record["session_id"]:
+        for vertex_id in graph.has_session_id_vertices:
+            vertex = graph.get_vertex(vertex_id)
+            if not vertex.raw_params.get("session_id"):
+                vertex.update_raw_params({"session_id": session_id}, overwrite=True)
+        graph.session_id = session_id
+    if graph_record["run_id"]:
+        graph.set_run_id(graph_record["run_id"])
+    return graph
+
+
+def load_run_record(graph: Graph, run_record: dict[str, Any]) -> None:
+    graph.run_manager = RunnableVerticesManager.from_dict(run_record["run_manager"])
+    graph.run_manager.cycle_vertices = run_record["cycle_vertices"]
+    graph.vertices_layers = run_record["vertices_layers"]
+    graph.vertices_to_run = run_record["vertices_to_run"]
+    graph.stop_vertex = run_record["stop_vertex"]
+    graph.inactivated_vertices = run_record["inactivated_vertices"]
+    graph.inactive_vertices = run_record["inactive_vertices"]
+    graph.activated_vertices = run_record["activated_vertices"]
+    graph._run_queue = deque(run_record["run_queue"])
+    graph._first_layer = run_record["first_layer"]
+    graph._prepared = run_record["prepared"]
+    for vertex_id, state in run_record["vertex_states"].items():
+        if vertex_id in graph.vertex_map:
+            graph.vertex_map[vertex_id].state = VertexStates[state]
+
+
+def load_vertex_record(vertex: Vertex, vertex_record: dict[str, Any]) -> None:
+    vertex.built = vertex_record["built"]
+    vertex.results = vertex_record["results"]
+    vertex.artifacts = vertex_record["artifacts"]
+    vertex.built_object = vertex_record["built_object"] or UnbuiltObject()
+    vertex.built_result = vertex_record["built_result"] or UnbuiltResult()
+    vertex.full_data = vertex_record["full_data"]
+    vertex.outputs_logs = vertex_record["outputs_logs"]
+    vertex.logs = vertex_record["logs"]
+    try:
+        vertex.finalize_build()
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug(f"Error finalizing restored vertex {vertex.id}")
+        vertex.built = False
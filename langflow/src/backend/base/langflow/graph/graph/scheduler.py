@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SchedulerMode = Literal["layered", "dataflow"]
+
+
+class VertexRunTiming(BaseModel):
+    """Timing of a single vertex run, relative to the start of the graph run (in seconds)."""
+
+    vertex_id: str
+    triggered_by: int | None = None
+    """Index (in `SchedulerStats.runs`) of the run whose completion made this vertex runnable."""
+    ready_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def queued(self) -> float:
+        """Time the vertex waited for a concurrency slot after becoming runnable."""
+        if self.started_at is None:
+            return 0.0
+        return self.started_at - self.ready_at
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+class CriticalPathReport(BaseModel):
+    """The chain of vertex runs that determined the total duration of a graph run."""
+
+    vertices: list[str] = Field(default_factory=list)
+    duration: float = 0.0
+    total_duration: float = 0.0
+    busy_time: float = 0.0
+    max_in_flight: int = 0
+
+    @property
+    def parallelism(self) -> float:
+        """Average number of vertices building at the same time during the run."""
+        if not self.total_duration:
+            return 0.0
+        return self.busy_time / self.total_duration
+
+
+class SchedulerStats:
+    """Collects per-vertex timings for the dataflow scheduler and derives the critical path.
+
+    Every vertex run records the run whose completion made it runnable. Walking those links
+    back from the last run to finish gives the chain of builds the total latency depends on.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self.runs: list[VertexRunTiming] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def mark_ready(self, vertex_id: str, triggered_by: int | None = None) -> int:
+        """Registers a new run of `vertex_id` and returns its index."""
+        self.runs.append(VertexRunTiming(vertex_id=vertex_id, triggered_by=triggered_by, ready_at=self._now()))
+        return len(self.runs) - 1
+
+    def mark_started(self, run_index: int) -> None:
+        self.runs[run_index].started_at = self._now()
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def mark_finished(self, run_index: int) -> None:
+        self.runs[run_index].finished_at = self._now()
+        self._in_flight -= 1
+
+    def critical_path(self) -> CriticalPathReport:
+        finished = [timing for timing in self.runs if timing.finished_at is not None]
+        if not finished:
+            return CriticalPathReport()
+        last_index = max(
+            (index for index, timing in enumerate(self.runs) if timing.finished_at is not None),
+            key=lambda index: self.runs[index].finished_at or 0.0,
+        )
+
+        path: list[VertexRunTiming] = []
+        index: int | None = last_index
+        while index is not None:
+            timing = self.runs[index]
+            path.append(timing)
+            index = timing.triggered_by
+        path.reverse()
+
+        return CriticalPathReport(
+            vertices=[timing.vertex_id for timing in path],
+            duration=sum(timing.duration for timing in path),
+            total_duration=self.runs[last_index].finished_at or 0.0,
+            busy_time=sum(timing.duration for timing in finished),
+            max_in_flight=self.max_in_flight,
+        )
@@ -12,12 +12,9 @@ from langflow.interface.utils import extract_input_variables_from_prompt
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.serialization.serialization import get_max_items_length, get_max_text_length, serialize
-from langflow.services.database.models.transactions.crud import log_transaction as crud_log_transaction
 from langflow.services.database.models.transactions.model import TransactionBase
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
-from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import get_build_log_service, get_settings_service
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -120,6 +117,7 @@ async def log_transaction(
     Serializes the source vertex's primitive parameters and result, handling pandas DataFrames as needed,
     and records transaction details including inputs, outputs, status, error, and flow ID in the database.
     If the flow ID is not provided, attempts to retrieve it from the source vertex's graph.
+    The record is written in a batch by the build log service.
     Logs warnings and errors on serialization or database failures.
     """
     try:
@@ -155,11 +153,7 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        async with session_getter(get_db_service()) as session:
-            with session.no_autoflush:
-                inserted = await crud_log_transaction(session, transaction)
-                if inserted:
-                    logger.debug(f"Logged transaction: {inserted.id}")
+        await get_build_log_service().log_transaction(transaction)
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Error logging transaction: {exc!s}")
 
@@ -176,7 +170,8 @@ async def log_vertex_build(
     """Asynchronously logs a vertex build record to the database if vertex build storage is enabled.
 
     Serializes the provided data and artifacts with configurable length and item limits before storing.
-    Converts parameters to string if present. Handles exceptions by logging errors.
+    Converts parameters to string if present. The record is written in a batch by the build log service.
+    Handles exceptions by logging errors.
     """
     try:
         if not get_settings_service().settings.vertex_builds_storage_enabled:
@@ -196,9 +191,7 @@ async def log_vertex_build(
             data=serialize(data, max_length=get_max_text_length(), max_items=get_max_items_length()),
             artifacts=serialize(artifacts, max_length=get_max_text_length(), max_items=get_max_items_length()),
         )
-        async with session_getter(get_db_service()) as session:
-            inserted = await crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+        await get_build_log_service().log_vertex_build(vertex_build)
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
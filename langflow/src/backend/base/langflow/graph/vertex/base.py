@@ -154,6 +154,11 @@ class Vertex:
     def set_result(self, result: ResultData) -> None:
         self.result = result
 
+    @property
+    def used_memoized_result(self) -> bool:
+        """Whether an output of the last build was reused from an earlier build with the same inputs."""
+        return bool(getattr(self.custom_component, "_memoized_outputs", None))
+
     def get_built_result(self):
         # If the Vertex.type is a power component
         # then we need to return the built object
@@ -364,11 +369,12 @@ class Vertex:
         self.params = self.raw_params.copy()
         self.updated_raw_params = True
 
-    def instantiate_component(self, user_id=None) -> None:
+    def instantiate_component(self, user_id=None, class_object: type[Component] | None = None) -> None:
         if not self.custom_component:
             self.custom_component, _ = initialize.loading.instantiate_class(
                 user_id=user_id,
                 vertex=self,
+                class_object=class_object,
             )
 
     async def _build(
@@ -460,6 +466,7 @@ class Vertex:
             messages=messages,
             component_display_name=self.display_name,
             component_id=self.id,
+            used_memoized_result=self.used_memoized_result,
         )
         self.set_result(result_dict)
 
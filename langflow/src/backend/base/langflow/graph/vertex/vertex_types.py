@@ -200,6 +200,7 @@ class ComponentVertex(Vertex):
             messages=messages,
             component_display_name=self.display_name,
             component_id=self.id,
+            used_memoized_result=self.used_memoized_result,
         )
         self.set_result(result_dict)
 
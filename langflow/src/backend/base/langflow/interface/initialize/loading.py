@@ -25,8 +25,12 @@ def instantiate_class(
     vertex: Vertex,
     user_id=None,
     event_manager: EventManager | None = None,
+    class_object: type[CustomComponent | Component] | None = None,
 ) -> Any:
-    """Instantiate class from module type and key, and params."""
+    """Instantiate class from module type and key, and params.
+
+    If `class_object` is given it is used instead of evaluating the component code again.
+    """
     vertex_type = vertex.vertex_type
     base_type = vertex.base_type
     logger.debug(f"Instantiating {vertex_type} of type {base_type}")
@@ -37,7 +41,8 @@ def instantiate_class(
 
     custom_params = get_params(vertex.params)
     code = custom_params.pop("code")
-    class_object: type[CustomComponent | Component] = eval_custom_component_code(code)
+    if class_object is None:
+        class_object = eval_custom_component_code(code)
     custom_component: CustomComponent | Component = class_object(
         _user_id=user_id,
         _parameters=custom_params,
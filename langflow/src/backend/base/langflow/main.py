@@ -35,7 +35,7 @@ from langflow.initial_setup.setup import (
 from langflow.interface.components import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
-from langflow.middleware import ContentSizeLimitMiddleware
+from langflow.middleware import ContentSizeLimitMiddleware, RequestCancelledMiddleware
 from langflow.services.deps import (
     get_queue_service,
     get_settings_service,
@@ -54,32 +54,6 @@ _tasks: list[asyncio.Task] = []
 MAX_PORT = 65535
 
 
-class RequestCancelledMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app) -> None:
-        super().__init__(app)
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        sentinel = object()
-
-        async def cancel_handler():
-            while True:
-                if await request.is_disconnected():
-                    return sentinel
-                await asyncio.sleep(0.1)
-
-        handler_task = asyncio.create_task(call_next(request))
-        cancel_task = asyncio.create_task(cancel_handler())
-
-        done, pending = await asyncio.wait([handler_task, cancel_task], return_when=asyncio.FIRST_COMPLETED)
-
-        for task in pending:
-            task.cancel()
-
-        if cancel_task in done:
-            return Response("Request was cancelled", status_code=499)
-        return await handler_task
-
-
 class JavaScriptMIMETypeMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         try:
@@ -287,6 +261,7 @@ def create_app():
     app.add_middleware(
         ContentSizeLimitMiddleware,
     )
+    app.add_middleware(RequestCancelledMiddleware)
 
     setup_sentry(app)
     origins = ["*"]
@@ -6,7 +6,7 @@ from uuid import UUID
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import delete, update
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -96,7 +96,19 @@ async def aget_messages(
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
-        return [await Message.create(**d.model_dump()) for d in messages]
+        return await _to_messages(messages.all())
+
+
+async def _to_messages(records: Sequence[MessageTable | MessageRead]) -> list[Message]:
+    """Builds the Message of each record.
+
+    Building a message with files is blocking, since it checks whether the files are images, so the messages
+    are then all built in a single worker thread instead of one thread hop per message.
+    """
+    dumps = [record.model_dump() for record in records]
+    if any(dump.get("files") for dump in dumps):
+        return await asyncio.to_thread(lambda: [Message(**dump) for dump in dumps])
+    return [Message(**dump) for dump in dumps]
 
 
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
@@ -121,7 +133,7 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
         async with session_scope() as session:
             messages_models = await aadd_messagetables(messages_models, session)
-        return [await Message.create(**message.model_dump()) for message in messages_models]
+        return await _to_messages(messages_models)
     except Exception as e:
         logger.exception(e)
         raise
@@ -151,6 +163,25 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
         return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
 
 
+async def aupdate_message_text(id_: str | UUID, text: str) -> None:
+    """Sets the text of a stored message with a single UPDATE, without reading the message back.
+
+    Args:
+        id_ (str | UUID): The ID of the message to update.
+        text (str): The new text of the message.
+
+    Raises:
+        ValueError: If no message has this ID.
+    """
+    message_id = id_ if isinstance(id_, UUID) else UUID(id_)
+    async with session_scope() as session:
+        stmt = update(MessageTable).where(col(MessageTable.id) == message_id).values(text=text)
+        result = await session.exec(stmt)
+        if not result.rowcount:
+            msg = f"Message with id {message_id} not found"
+            raise ValueError(msg)
+
+
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
     try:
         try:
@@ -215,11 +246,9 @@ async def delete_message(id_: str) -> None:
     Args:
         id_ (str): The ID of the message to delete.
     """
+    message_id = id_ if isinstance(id_, UUID) else UUID(id_)
     async with session_scope() as session:
-        message = await session.get(MessageTable, id_)
-        if message:
-            await session.delete(message)
-            await session.commit()
+        await session.exec(delete(MessageTable).where(col(MessageTable.id) == message_id))
 
 
 def store_message(
@@ -1,8 +1,18 @@
+import asyncio
+import re
+from collections.abc import Iterable
+
 from fastapi import HTTPException
 from loguru import logger
 
 from langflow.services.deps import get_settings_service
 
+CANCELLABLE_REQUEST_PATHS = (
+    r"/api/v1/build/[^/]+/vertices(/[^/]+)?",
+    r"/api/v1/run/(advanced/)?[^/]+",
+)
+"""Paths of the long-running build and run endpoints whose handling is cancelled when the client goes away."""
+
 
 class MaxFileSizeException(HTTPException):
     def __init__(self, detail: str = "File size is larger than the maximum file size {}MB"):
@@ -57,3 +67,85 @@ class ContentSizeLimitMiddleware:
 
         wrapper = self.receive_wrapper(receive)
         await self.app(scope, wrapper, send)
+
+
+class RequestCancelledMiddleware:
+    """Cancels the handling of a long-running request when its client disconnects before the response starts.
+
+    Only requests whose path matches one of `paths` are watched. Other requests, such as those of endpoints
+    writing to the database, always run to completion.
+
+    Disconnection is detected from the `http.disconnect` message of the ASGI server rather than by
+    polling: once the request body has been read, a single task waits on `receive` for it, so an idle
+    connection costs nothing until the client goes away. Calls to `receive` made by the application
+    after the body, such as a streaming response listening for disconnection, get the message too.
+    Once the response has started, the application is left to handle the disconnection itself.
+    """
+
+    def __init__(self, app, paths: Iterable[str] = CANCELLABLE_REQUEST_PATHS) -> None:
+        self.app = app
+        self.paths = re.compile("|".join(f"(?:{path})" for path in paths))
+
+    @staticmethod
+    def has_body(scope) -> bool:
+        headers = dict(scope.get("headers", []))
+        return b"transfer-encoding" in headers or headers.get(b"content-length", b"0") != b"0"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.paths.fullmatch(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        disconnected = asyncio.get_running_loop().create_future()
+        body_pending = self.has_body(scope)
+        # Without a body, the watcher owns `receive` from the start and the empty body is sent from here
+        empty_body_pending = not body_pending
+        response_started = False
+        watcher: asyncio.Task | None = None
+
+        async def wait_for_disconnect() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set_result(None)
+            if not response_started:
+                logger.debug(f"Client disconnected, cancelling {scope['method']} {scope['path']}")
+                handler.cancel()
+
+        def watch_disconnect() -> None:
+            nonlocal watcher
+            watcher = asyncio.create_task(wait_for_disconnect())
+
+        async def receive_wrapper():
+            nonlocal body_pending, empty_body_pending
+            if empty_body_pending:
+                empty_body_pending = False
+                return {"type": "http.request", "body": b"", "more_body": False}
+            if body_pending:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    body_pending = False
+                    disconnected.set_result(None)
+                elif not message.get("more_body", False):
+                    body_pending = False
+                    watch_disconnect()
+                return message
+            await asyncio.shield(disconnected)
+            return {"type": "http.disconnect"}
+
+        async def send_wrapper(message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        handler = asyncio.create_task(self.app(scope, receive_wrapper, send_wrapper))
+        if not body_pending:
+            watch_disconnect()
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected.done() or response_started:
+                raise
+        finally:
+            if watcher is not None:
+                watcher.cancel()
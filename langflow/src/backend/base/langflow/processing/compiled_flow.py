@@ -0,0 +1,170 @@
+"""Cache of compiled flows used by the run endpoints.
+
+Building a graph from a stored flow means copying the flow data, applying the tweaks, parsing
+every node and edge and evaluating the code of every component. For flows that are run over
+and over through the API this setup can cost more than the run itself, so the result of the
+first build is kept per flow version and reused by the next requests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from langflow.graph.graph.base import Graph
+from langflow.processing.process import process_tweaks
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from langflow.custom.custom_component.component import Component
+    from langflow.schema.graph import Tweaks
+
+
+class CompiledFlow:
+    """The parts of a graph build that do not change between runs of the same flow version.
+
+    Holds the tweaked flow payload serialized to JSON and the evaluated component class of every
+    vertex. Each run gets its own graph (and so its own vertices, components and run state) built
+    from a fresh copy of the payload, without applying the tweaks or evaluating any code again.
+    """
+
+    def __init__(self, key: str, payload: bytes, component_classes: dict[str, type[Component]]) -> None:
+        self.key = key
+        self.payload = payload
+        self.component_classes = component_classes
+
+    @classmethod
+    def from_graph(cls, key: str, payload: bytes, graph: Graph) -> CompiledFlow:
+        """Creates a compiled flow from the payload and a graph freshly built from it."""
+        component_classes = {
+            vertex.id: type(vertex.custom_component) for vertex in graph.vertices if vertex.custom_component is not None
+        }
+        return cls(key=key, payload=payload, component_classes=component_classes)
+
+    def build_graph(self, *, flow_id: str, flow_name: str | None = None, user_id: str | None = None) -> Graph:
+        return Graph.from_payload(
+            orjson.loads(self.payload),
+            flow_id=flow_id,
+            flow_name=flow_name,
+            user_id=user_id,
+            component_classes=self.component_classes,
+        )
+
+
+class CompiledFlowCache:
+    """A thread-safe LRU cache of `CompiledFlow` objects.
+
+    Only the latest version of each flow is kept: storing a compiled flow for a new `updated_at`
+    drops every entry of the older versions of that flow.
+    """
+
+    def __init__(self, max_size: int = 100) -> None:
+        self.max_size = max_size
+        self._cache: OrderedDict[str, CompiledFlow] = OrderedDict()
+        self._versions: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def build_key(
+        flow_id: str, updated_at: datetime | None, tweaks: Tweaks | dict[str, Any] | None, *, stream: bool
+    ) -> str:
+        tweaks_dict = tweaks.model_dump() if tweaks is not None and not isinstance(tweaks, dict) else tweaks or {}
+        tweaks_hash = hashlib.sha256(orjson.dumps(tweaks_dict, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        version = str(updated_at.timestamp()) if updated_at is not None else ""
+        return f"{flow_id}:{version}:{tweaks_hash}:{int(stream)}"
+
+    def get(self, key: str) -> CompiledFlow | None:
+        with self._lock:
+            compiled = self._cache.get(key)
+            if compiled is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return compiled
+
+    def set(self, flow_id: str, compiled: CompiledFlow) -> None:
+        version = compiled.key.split(":")[1]
+        with self._lock:
+            if self._versions.get(flow_id) != version:
+                self._invalidate_without_lock(flow_id)
+                self._versions[flow_id] = version
+            self._cache[compiled.key] = compiled
+            self._cache.move_to_end(compiled.key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, flow_id: str) -> None:
+        with self._lock:
+            self._invalidate_without_lock(flow_id)
+            self._versions.pop(flow_id, None)
+
+    def _invalidate_without_lock(self, flow_id: str) -> None:
+        prefix = f"{flow_id}:"
+        for key in [key for key in self._cache if key.startswith(prefix)]:
+            del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._versions.clear()
+
+
+_compiled_flow_cache: CompiledFlowCache | None = None
+
+
+def get_compiled_flow_cache() -> CompiledFlowCache:
+    global _compiled_flow_cache  # noqa: PLW0603
+    if _compiled_flow_cache is None:
+        _compiled_flow_cache = CompiledFlowCache(max_size=get_settings_service().settings.compiled_flow_cache_size)
+    return _compiled_flow_cache
+
+
+def build_graph_from_flow_data(
+    flow_data: dict[str, Any],
+    *,
+    flow_id: str,
+    updated_at: datetime | None,
+    tweaks: Tweaks | dict[str, Any] | None,
+    stream: bool = False,
+    flow_name: str | None = None,
+    user_id: str | None = None,
+) -> Graph:
+    """Builds a graph for one run of a stored flow, reusing the compiled flow when possible.
+
+    Args:
+        flow_data: The stored flow data. It is not modified.
+        flow_id: The ID of the flow.
+        updated_at: The last update time of the flow, used as the version of the flow.
+        tweaks: The tweaks to apply to the flow.
+        stream: Whether streaming is enabled for the run.
+        flow_name: The flow name.
+        user_id: The user ID.
+
+    Returns:
+        Graph: A new graph, owned by the caller.
+    """
+    max_size = get_settings_service().settings.compiled_flow_cache_size
+    if max_size <= 0:
+        graph_data = process_tweaks(flow_data.copy(), tweaks or {}, stream=stream)
+        return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id, flow_name=flow_name)
+
+    cache = get_compiled_flow_cache()
+    key = cache.build_key(flow_id, updated_at, tweaks, stream=stream)
+    if (compiled := cache.get(key)) is not None:
+        return compiled.build_graph(flow_id=flow_id, flow_name=flow_name, user_id=user_id)
+
+    # Work on a private copy: process_tweaks and the graph build modify the nodes in place
+    graph_data = process_tweaks(orjson.loads(orjson.dumps(flow_data)), tweaks or {}, stream=stream)
+    payload = orjson.dumps(graph_data)
+    graph = Graph.from_payload(orjson.loads(payload), flow_id=flow_id, user_id=user_id, flow_name=flow_name)
+    cache.set(flow_id, CompiledFlow.from_graph(key, payload, graph))
+    return graph
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import log_transaction, log_transactions, prune_transactions
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.crud import (
+    log_vertex_build,
+    log_vertex_builds,
+    prune_vertex_builds,
+)
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.database.utils import session_getter
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from langflow.services.database.service import DatabaseService
+    from langflow.services.settings.service import SettingsService
+
+
+class BuildLogService(Service):
+    """Write-behind sink for the vertex builds and transactions logged while flows run.
+
+    Records are put in a bounded queue and written by a background task with one multi-row INSERT per
+    table, every `build_log_flush_interval` ms or as soon as `build_log_batch_size` records are waiting.
+    When the queue is full, logging a record waits for the writer to catch up. The history limits
+    (`max_vertex_builds_to_keep`, `max_vertex_builds_per_vertex` and `max_transactions_to_keep`) are
+    enforced by a separate periodic sweep instead of on every insert.
+
+    The writer runs in the event loop it was started in. Records logged from another event loop are handed
+    to it while it runs, and the records left by a writer whose event loop has stopped are taken over by the
+    next one. Pending records are written when the service is torn down.
+    """
+
+    name = "build_log_service"
+
+    def __init__(self, settings_service: SettingsService, database_service: DatabaseService) -> None:
+        self.settings_service = settings_service
+        self.database_service = database_service
+        self._queue: asyncio.Queue[VertexBuildBase | TransactionBase] | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._prune_task: asyncio.Task | None = None
+        self._unwritten: list[VertexBuildBase | TransactionBase] = []
+        self._last_prune: float | None = None
+        self._closed = False
+        self.written_records = 0
+        self.failed_records = 0
+
+    @property
+    def write_behind(self) -> bool:
+        return self.settings_service.settings.build_log_flush_interval > 0
+
+    def _writer_loop(self) -> asyncio.AbstractEventLoop | None:
+        """The event loop of the background writer, if the writer can still run in it."""
+        if self._flush_task is None or self._flush_task.done():
+            return None
+        loop = self._flush_task.get_loop()
+        return None if loop.is_closed() else loop
+
+    def is_started(self) -> bool:
+        return self._writer_loop() is asyncio.get_running_loop()
+
+    def start(self) -> None:
+        """Start the background writer and the periodic pruning sweep in the running event loop."""
+        settings = self.settings_service.settings
+        previous_queue = self._queue
+        self._stop_writer()
+        self._closed = False
+        # Take over the records the previous writer did not get to write
+        unwritten, self._unwritten = self._unwritten, []
+        while previous_queue is not None and not previous_queue.empty():
+            unwritten.append(previous_queue.get_nowait())
+        self._queue = asyncio.Queue(maxsize=max(settings.build_log_queue_size, len(unwritten)))
+        for record in unwritten:
+            self._queue.put_nowait(record)
+        self._flush_task = asyncio.create_task(self._flush_worker())
+        self._prune_task = asyncio.create_task(self._prune_worker())
+        logger.debug("BuildLogService started")
+
+    def _stop_writer(self) -> None:
+        for task in (self._flush_task, self._prune_task):
+            if task is not None and not task.done() and not task.get_loop().is_closed():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+        self._flush_task = None
+        self._prune_task = None
+
+    async def log_vertex_build(self, vertex_build: VertexBuildBase) -> None:
+        await self._enqueue(vertex_build)
+
+    async def log_transaction(self, transaction: TransactionBase) -> None:
+        await self._enqueue(transaction)
+
+    async def _enqueue(self, record: VertexBuildBase | TransactionBase) -> None:
+        if self._closed or not self.write_behind:
+            await self._write_one(record)
+            return
+        writer_loop = self._writer_loop()
+        if writer_loop is not None and writer_loop is not asyncio.get_running_loop() and writer_loop.is_running():
+            await self._run_in_writer_loop(self._queue.put(record), writer_loop)
+            return
+        if not self.is_started():
+            self.start()
+        await self._queue.put(record)
+
+    async def flush(self) -> None:
+        """Wait until every record logged so far is written to the database."""
+        writer_loop = self._writer_loop()
+        if writer_loop is None:
+            return
+        if writer_loop is asyncio.get_running_loop():
+            await self._queue.join()
+        elif writer_loop.is_running():
+            await self._run_in_writer_loop(self._queue.join(), writer_loop)
+
+    @staticmethod
+    async def _run_in_writer_loop(coro: Coroutine[Any, Any, None], writer_loop: asyncio.AbstractEventLoop) -> None:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, writer_loop))
+
+    async def _flush_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            settings = self.settings_service.settings
+            deadline = loop.time() + settings.build_log_flush_interval / 1000
+            try:
+                while len(batch) < settings.build_log_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # The event loop is shutting down, leave the batch to the next writer
+                self._unwritten.extend(batch)
+                raise
+            try:
+                await self._write(batch)
+            except asyncio.CancelledError:
+                # Cancelled mid-write, the next writer writes the batch again
+                self._unwritten.extend(batch)
+                raise
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _prune_worker(self) -> None:
+        while True:
+            await asyncio.sleep(self.settings_service.settings.build_log_prune_interval)
+            await self._prune()
+
+    async def _write(self, records: list[VertexBuildBase | TransactionBase]) -> None:
+        vertex_builds = [record for record in records if isinstance(record, VertexBuildBase)]
+        transactions = [record for record in records if isinstance(record, TransactionBase)]
+        try:
+            async with session_getter(self.database_service) as session:
+                if vertex_builds:
+                    await log_vertex_builds(session, vertex_builds)
+                if transactions:
+                    await log_transactions(session, transactions)
+        except Exception:  # noqa: BLE001
+            self.failed_records += len(records)
+            logger.exception(f"Error writing {len(records)} vertex builds and transactions")
+        else:
+            self.written_records += len(records)
+            logger.debug(f"Logged {len(vertex_builds)} vertex builds and {len(transactions)} transactions")
+
+    async def _write_one(self, record: VertexBuildBase | TransactionBase) -> None:
+        """Write a record and enforce the history limits of its vertex or flow.
+
+        The global limits are enforced at most once per `build_log_prune_interval`.
+        """
+        settings = self.settings_service.settings
+        try:
+            async with session_getter(self.database_service) as session:
+                if isinstance(record, VertexBuildBase):
+                    await log_vertex_build(
+                        session,
+                        record,
+                        max_builds_per_vertex=settings.max_vertex_builds_per_vertex,
+                        enforce_global_limit=False,
+                    )
+                else:
+                    await log_transaction(session, record)
+        except Exception:  # noqa: BLE001
+            self.failed_records += 1
+            logger.exception("Error writing a vertex build or transaction")
+        else:
+            self.written_records += 1
+        now = time.monotonic()
+        if self._last_prune is None or now - self._last_prune >= settings.build_log_prune_interval:
+            self._last_prune = now
+            await self._prune()
+
+    async def _prune(self) -> None:
+        settings = self.settings_service.settings
+        try:
+            async with session_getter(self.database_service) as session:
+                if settings.vertex_builds_storage_enabled:
+                    await prune_vertex_builds(
+                        session,
+                        max_builds_to_keep=settings.max_vertex_builds_to_keep,
+                        max_builds_per_vertex=settings.max_vertex_builds_per_vertex,
+                    )
+                if settings.transactions_storage_enabled:
+                    await prune_transactions(session, settings.max_transactions_to_keep)
+        except Exception:  # noqa: BLE001
+            logger.exception("Error pruning vertex builds and transactions")
+
+    async def teardown(self) -> None:
+        self._closed = True
+        await self.flush()
+        if self.is_started():
+            self._prune_task.cancel()
+            self._flush_task.cancel()
+            await asyncio.gather(self._prune_task, self._flush_task, return_exceptions=True)
+            await self._prune()
+        self._stop_writer()
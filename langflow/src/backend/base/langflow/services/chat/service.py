@@ -1,12 +1,23 @@
+from __future__ import annotations
+
 import asyncio
+import pickle
 from collections import defaultdict
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CacheMiss
 from langflow.services.deps import get_cache_service
 
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.vertex.base import Vertex
+
 
 class ChatService(Service):
     """Service class for managing chat-related operations."""
@@ -62,6 +73,159 @@ class ChatService(Service):
             key (str): The cache key.
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
+        if self.uses_graph_checkpoints:
+            await self._delete_graph_records(key)
         if isinstance(self.cache_service, AsyncBaseCacheService):
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    @property
+    def uses_graph_checkpoints(self) -> bool:
+        """Whether graphs are stored as incremental checkpoints instead of whole objects.
+
+        In-memory caches keep a reference to the graph, so storing it again costs nothing. The other
+        caches serialize every value they receive.
+        """
+        return not isinstance(self.cache_service, ThreadingInMemoryCache | AsyncInMemoryCache)
+
+    async def set_graph_cache(self, key: str, graph: Graph, lock: asyncio.Lock | None = None) -> bool:
+        """Store a graph, replacing any graph previously stored under the same key.
+
+        Args:
+            key (str): The cache key.
+            graph (Graph): The graph to store.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            bool: True if the graph was stored successfully, False otherwise.
+        """
+        from langflow.graph.graph.checkpoint import (
+            can_checkpoint,
+            dump_graph_record,
+            dump_run_record,
+            graph_record_key,
+            run_record_key,
+        )
+
+        if not self.uses_graph_checkpoints or not can_checkpoint(graph):
+            return await self.set_cache(key, graph, lock=lock)
+        # The vertices of the previous graph may not exist in the new one
+        await self._delete_graph_records(key)
+        await self._set(graph_record_key(key), dump_graph_record(graph))
+        for vertex in graph.vertices:
+            if vertex.built:
+                await self._set_vertex_record(key, vertex)
+        await self._set(run_record_key(key), dump_run_record(graph))
+        return True
+
+    async def update_graph_cache(
+        self, key: str, graph: Graph, vertex: Vertex | None = None, lock: asyncio.Lock | None = None
+    ) -> bool:
+        """Store the changes made to a graph since it was stored with `set_graph_cache`.
+
+        With a checkpointing cache only the record of `vertex` and the run state of the graph are written.
+
+        Args:
+            key (str): The cache key.
+            graph (Graph): The graph to store.
+            vertex (Optional[Vertex], optional): The vertex that has just been built. Defaults to None.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            bool: True if the graph was stored successfully, False otherwise.
+        """
+        from langflow.graph.graph.checkpoint import can_checkpoint, dump_run_record, run_record_key
+
+        if not self.uses_graph_checkpoints or not can_checkpoint(graph):
+            return await self.set_cache(key, graph, lock=lock)
+        if vertex is not None and vertex.built:
+            await self._set_vertex_record(key, vertex)
+        await self._set(run_record_key(key), dump_run_record(graph))
+        return True
+
+    async def get_graph_cache(self, key: str, lock: asyncio.Lock | None = None) -> Graph | CacheMiss:
+        """Get a graph stored with `set_graph_cache`.
+
+        Args:
+            key (str): The cache key.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            Graph | CacheMiss: The graph, rebuilt from its checkpoint if needed, or a cache miss.
+        """
+        from langflow.graph.graph.checkpoint import (
+            graph_record_key,
+            load_graph_record,
+            load_run_record,
+            load_vertex_record,
+            run_record_key,
+            vertex_record_key,
+        )
+
+        graph_record = await self._get(graph_record_key(key)) if self.uses_graph_checkpoints else CacheMiss()
+        if isinstance(graph_record, CacheMiss):
+            # Graphs that cannot be checkpointed are stored whole
+            cache = await self.get_cache(key, lock=lock)
+            return cache if isinstance(cache, CacheMiss) else cache["result"]
+
+        graph = load_graph_record(graph_record)
+        run_record = await self._get(run_record_key(key))
+        if isinstance(run_record, CacheMiss):
+            return graph
+        load_run_record(graph, run_record)
+        vertex_ids = run_record["built_vertices"]
+        vertex_records = await asyncio.gather(*(self._get(vertex_record_key(key, v_id)) for v_id in vertex_ids))
+        for vertex_id, vertex_record in zip(vertex_ids, vertex_records, strict=True):
+            if not isinstance(vertex_record, CacheMiss):
+                load_vertex_record(graph.get_vertex(vertex_id), vertex_record)
+        return graph
+
+    async def _delete_graph_records(self, key: str) -> None:
+        """Delete the graph, run and vertex records of a checkpoint."""
+        from langflow.graph.graph.checkpoint import (
+            graph_record_key,
+            graph_record_vertex_ids,
+            run_record_key,
+            vertex_record_key,
+        )
+
+        vertex_ids: set[str] = set()
+        graph_record = await self._get(graph_record_key(key))
+        if not isinstance(graph_record, CacheMiss):
+            vertex_ids.update(graph_record_vertex_ids(graph_record))
+        run_record = await self._get(run_record_key(key))
+        if not isinstance(run_record, CacheMiss):
+            # Vertices created when the graph was loaded, e.g. from group nodes, are not in the payload
+            vertex_ids.update(run_record["built_vertices"])
+        await asyncio.gather(*(self._delete(vertex_record_key(key, v_id)) for v_id in vertex_ids))
+        await self._delete(graph_record_key(key))
+        await self._delete(run_record_key(key))
+
+    async def _set_vertex_record(self, key: str, vertex: Vertex) -> None:
+        from langflow.graph.graph.checkpoint import dump_vertex_record, vertex_record_key
+
+        vertex_record = dump_vertex_record(vertex)
+        try:
+            await self._set(vertex_record_key(key, vertex.id), vertex_record)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            # Built objects such as clients are not always serializable, the results are enough to resume
+            logger.opt(exception=True).debug(f"Could not store the built object of {vertex.id}")
+            vertex_record["built_object"] = None
+            await self._set(vertex_record_key(key, vertex.id), vertex_record)
+
+    async def _set(self, key: str, value: Any) -> None:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            await self.cache_service.set(key, value, lock=self.async_cache_locks[key])
+        else:
+            await asyncio.to_thread(self.cache_service.set, key, value, lock=self._sync_cache_locks[key])
+
+    async def _get(self, key: str) -> Any:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            return await self.cache_service.get(key, lock=self.async_cache_locks[key])
+        return await asyncio.to_thread(self.cache_service.get, key, lock=self._sync_cache_locks[key])
+
+    async def _delete(self, key: str) -> None:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            await self.cache_service.delete(key, lock=self.async_cache_locks[key])
+        else:
+            await asyncio.to_thread(self.cache_service.delete, key, lock=self._sync_cache_locks[key])
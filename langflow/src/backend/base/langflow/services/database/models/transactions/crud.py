@@ -1,7 +1,8 @@
 from uuid import UUID
 
 from loguru import logger
-from sqlmodel import col, delete, select
+from sqlalchemy import insert
+from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.transactions.model import (
@@ -74,6 +75,52 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: list[TransactionBase]) -> None:
+    """Insert several transactions with a single multi-row INSERT and commit them.
+
+    Unlike `log_transaction`, this function does not enforce the maximum number of transactions.
+    Use `prune_transactions` to do it periodically.
+
+    Args:
+        db: Database session
+        transactions: Transactions data to log
+    """
+    rows = [
+        TransactionTable(**transaction.model_dump()).model_dump() for transaction in transactions if transaction.flow_id
+    ]
+    if not rows:
+        return
+    try:
+        await db.exec(insert(TransactionTable).values(rows))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
+async def prune_transactions(db: AsyncSession, max_entries: int | None = None) -> None:
+    """Remove the oldest transactions of every flow that has more than the maximum number of transactions.
+
+    Args:
+        db: Database session
+        max_entries: Maximum number of transactions to keep per flow. If None, uses system settings.
+    """
+    max_entries = max_entries or get_settings_service().settings.max_transactions_to_keep
+    ranked_transactions = select(
+        TransactionTable.id,
+        func.row_number()
+        .over(partition_by=TransactionTable.flow_id, order_by=col(TransactionTable.timestamp).desc())
+        .label("position"),
+    ).subquery()
+    older_transactions = select(ranked_transactions.c.id).where(ranked_transactions.c.position > max_entries)
+    try:
+        await db.exec(delete(TransactionTable).where(col(TransactionTable.id).in_(older_transactions)))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -55,13 +56,14 @@ async def log_vertex_build(
     *,
     max_builds_to_keep: int | None = None,
     max_builds_per_vertex: int | None = None,
+    enforce_global_limit: bool = True,
 ) -> VertexBuildTable:
     """Log a vertex build and maintain build history within specified limits.
 
     This function performs a series of operations in a single transaction:
     1. Inserts the new build record
     2. Enforces per-vertex build limit by removing older builds
-    3. Enforces global build limit across all vertices
+    3. Enforces global build limit across all vertices, unless `enforce_global_limit` is False
     4. Commits the transaction
 
     Args:
@@ -71,6 +73,8 @@ async def log_vertex_build(
             If None, uses system settings.
         max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
             If None, uses system settings.
+        enforce_global_limit (bool, optional): Whether to enforce `max_builds_to_keep`, which scans every build.
+            Defaults to True.
 
     Returns:
         VertexBuildTable: The newly created vertex build record.
@@ -112,13 +116,16 @@ async def log_vertex_build(
         await db.exec(delete_vertex_older)
 
         # 3) Delete older builds globally, keeping newest max_global
-        keep_global_subq = (
-            select(VertexBuildTable.build_id)
-            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
-            .limit(max_global)
-        )
-        delete_global_older = delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
-        await db.exec(delete_global_older)
+        if enforce_global_limit:
+            keep_global_subq = (
+                select(VertexBuildTable.build_id)
+                .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+                .limit(max_global)
+            )
+            delete_global_older = delete(VertexBuildTable).where(
+                col(VertexBuildTable.build_id).not_in(keep_global_subq)
+            )
+            await db.exec(delete_global_older)
 
         # 4) Commit transaction
         await db.commit()
@@ -130,6 +137,70 @@ async def log_vertex_build(
     return table
 
 
+async def log_vertex_builds(db: AsyncSession, vertex_builds: list[VertexBuildBase]) -> None:
+    """Insert several vertex builds with a single multi-row INSERT and commit them.
+
+    Unlike `log_vertex_build`, this function does not enforce the build history limits.
+    Use `prune_vertex_builds` to do it periodically.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_builds (list[VertexBuildBase]): The vertex builds to insert.
+    """
+    if not vertex_builds:
+        return
+    rows = [VertexBuildTable(**vertex_build.model_dump()).model_dump() for vertex_build in vertex_builds]
+    try:
+        await db.exec(insert(VertexBuildTable).values(rows))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
+async def prune_vertex_builds(
+    db: AsyncSession,
+    *,
+    max_builds_to_keep: int | None = None,
+    max_builds_per_vertex: int | None = None,
+) -> None:
+    """Remove the builds that exceed the build history limits, for every vertex at once.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        max_builds_to_keep (int | None, optional): Maximum number of builds to keep globally.
+            If None, uses system settings.
+        max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
+            If None, uses system settings.
+    """
+    settings = get_settings_service().settings
+    max_global = max_builds_to_keep or settings.max_vertex_builds_to_keep
+    max_per_vertex = max_builds_per_vertex or settings.max_vertex_builds_per_vertex
+
+    ranked_builds = select(
+        VertexBuildTable.build_id,
+        func.row_number()
+        .over(
+            partition_by=(VertexBuildTable.flow_id, VertexBuildTable.id),
+            order_by=(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc()),
+        )
+        .label("position"),
+    ).subquery()
+    older_vertex_builds = select(ranked_builds.c.build_id).where(ranked_builds.c.position > max_per_vertex)
+    keep_global_subq = (
+        select(VertexBuildTable.build_id)
+        .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+        .limit(max_global)
+    )
+    try:
+        await db.exec(delete(VertexBuildTable).where(col(VertexBuildTable.build_id).in_(older_vertex_builds)))
+        await db.exec(delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq)))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
@@ -12,9 +13,11 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.build_log.service import BuildLogService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.http_client.service import HTTPClientService
     from langflow.services.job_queue.service import JobQueueService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
@@ -172,7 +175,13 @@ async def session_scope() -> AsyncGenerator[AsyncSession, None]:
     async with db_service.with_session() as session:
         try:
             yield session
-            await session.commit()
+            # A request cancelled because its client disconnected must not interrupt a commit in progress
+            commit = asyncio.ensure_future(session.commit())
+            try:
+                await asyncio.shield(commit)
+            except asyncio.CancelledError:
+                await commit
+                raise
         except Exception:
             logger.exception("An error occurred during the session scope.")
             await session.rollback()
@@ -247,3 +256,17 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_build_log_service() -> BuildLogService:
+    """Retrieves the BuildLogService instance from the service manager."""
+    from langflow.services.build_log.factory import BuildLogServiceFactory
+
+    return get_service(ServiceType.BUILD_LOG_SERVICE, BuildLogServiceFactory())
+
+
+def get_http_client_service() -> HTTPClientService:
+    """Retrieves the HTTPClientService instance from the service manager."""
+    from langflow.services.http_client.factory import HTTPClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HTTPClientServiceFactory())
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING
+
+import httpx
+from loguru import logger
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+@dataclass
+class OriginMetrics:
+    requests: int = 0
+    responses: int = 0
+    errors: int = 0
+    response_time: float = 0.0
+
+    @property
+    def average_response_time(self) -> float:
+        return self.response_time / self.responses if self.responses else 0.0
+
+
+def get_origin(url: str | httpx.URL) -> str:
+    """Return the scheme, host and port of a URL, which identify the client used for it."""
+    url = httpx.URL(url)
+    port = f":{url.port}" if url.port else ""
+    return f"{url.scheme}://{url.host}{port}"
+
+
+class HTTPClientService(Service):
+    """Long-lived HTTP clients shared by the components making outbound requests.
+
+    Components borrow a client for the origin they call instead of opening one per build, so connections
+    (and the DNS lookups and TLS handshakes behind them) are kept alive and reused across builds. Each
+    origin gets its own connection pool, limited to `http_client_max_connections_per_host` connections,
+    and HTTP/2 is negotiated when `http_client_http2` is enabled. Async clients are bound to the event
+    loop they were created in, so there is one per origin and event loop.
+
+    Clients never store cookies, since they are shared by every user. Borrowed clients must not be
+    closed; per-request options such as headers, timeout and redirects are passed to each request.
+    """
+
+    name = "http_client_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        self.settings_service = settings_service
+        self._clients: dict[str, httpx.Client] = {}
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.metrics: defaultdict[str, OriginMetrics] = defaultdict(OriginMetrics)
+
+    def _client_options(self) -> dict:
+        settings = self.settings_service.settings
+        return {
+            "http2": settings.http_client_http2,
+            "limits": httpx.Limits(
+                max_connections=settings.http_client_max_connections_per_host,
+                max_keepalive_connections=settings.http_client_max_keepalive_connections,
+                keepalive_expiry=settings.http_client_keepalive_expiry,
+            ),
+            "cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        }
+
+    def _event_hooks(self, origin: str) -> dict:
+        metrics = self.metrics[origin]
+
+        def on_request(request: httpx.Request) -> None:
+            metrics.requests += 1
+            request.extensions["langflow_start_time"] = time.perf_counter()
+
+        def on_response(response: httpx.Response) -> None:
+            metrics.responses += 1
+            if response.status_code >= 400:  # noqa: PLR2004
+                metrics.errors += 1
+            start_time = response.request.extensions.get("langflow_start_time")
+            if start_time is not None:
+                metrics.response_time += time.perf_counter() - start_time
+
+        return {"request": [on_request], "response": [on_response]}
+
+    def get_client(self, url: str | httpx.URL) -> httpx.Client:
+        """Return the shared client for the origin of `url`."""
+        origin = get_origin(url)
+        with self._lock:
+            client = self._clients.get(origin)
+            if client is None or client.is_closed:
+                client = httpx.Client(**self._client_options(), event_hooks=self._event_hooks(origin))
+                self._clients[origin] = client
+                logger.debug(f"Created HTTP client for {origin}")
+        return client
+
+    def get_async_client(self, url: str | httpx.URL) -> httpx.AsyncClient:
+        """Return the shared async client for the origin of `url` and the running event loop."""
+        origin = get_origin(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._async_clients.setdefault(loop, {})
+            client = loop_clients.get(origin)
+            if client is None or client.is_closed:
+                hooks = self._event_hooks(origin)
+                event_hooks = {event: [_as_async_hook(hook) for hook in hooks[event]] for event in hooks}
+                client = httpx.AsyncClient(**self._client_options(), event_hooks=event_hooks)
+                loop_clients[origin] = client
+                logger.debug(f"Created async HTTP client for {origin}")
+        return client
+
+    def get_metrics(self) -> dict[str, dict[str, float]]:
+        """Return the request metrics of each origin."""
+        return {
+            origin: {
+                "requests": metrics.requests,
+                "responses": metrics.responses,
+                "errors": metrics.errors,
+                "average_response_time": metrics.average_response_time,
+            }
+            for origin, metrics in self.metrics.items()
+        }
+
+    async def teardown(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            # Clients of other event loops cannot be closed from this one
+            async_clients = list(self._async_clients.get(asyncio.get_running_loop(), {}).values())
+            self._clients.clear()
+            self._async_clients.clear()
+        for client in clients:
+            client.close()
+        for async_client in async_clients:
+            await async_client.aclose()
+
+
+def _as_async_hook(hook):
+    async def async_hook(value) -> None:
+        hook(value)
+
+    return async_hook
@@ -233,7 +233,7 @@ class JobQueueService(Service):
             task.cancel()
             await asyncio.wait([task])
             # Log any exceptions that occurred during the task's execution.
-            if exc := task.exception():
+            if not task.cancelled() and (exc := task.exception()):
                 logger.error(f"Error in task for job_id {job_id}: {exc}")
             logger.debug(f"Task cancellation complete for job_id {job_id}")
 
@@ -321,6 +321,7 @@ class JobQueueService(Service):
             ("on_end_vertex", "end_vertex"),
             ("on_build_start", "build_start"),
             ("on_build_end", "build_end"),
+            ("on_batch_progress", "batch_progress"),
         ]
         for name, event_type in event_names_types:
             manager.register_event(name, event_type)
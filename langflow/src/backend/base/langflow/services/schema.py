@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
+    BUILD_LOG_SERVICE = "build_log_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
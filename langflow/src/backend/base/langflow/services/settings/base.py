@@ -240,12 +240,60 @@ class Settings(BaseSettings):
     """The maximum file size for the upload in MB."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_sample_rate: float = Field(default=1.0, ge=0, le=1)
+    """The fraction of the flow runs that are traced."""
+    tracing_queue_size: int = Field(default=1000, ge=1)
+    """The maximum number of spans of a run waiting to be exported. Spans started beyond it are dropped."""
+    tracing_export_batch_size: int = Field(default=100, ge=1)
+    """The maximum number of queued spans the export thread sends to the tracers in one pass."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    build_log_batch_size: int = Field(default=200, ge=1)
+    """Maximum number of vertex builds or transactions written to the database in a single INSERT."""
+    build_log_flush_interval: int = Field(default=500, ge=0)
+    """The interval in ms at which pending vertex builds and transactions are written to the database.
+    Set to 0 to write each record as soon as it is logged, without batching."""
+    build_log_queue_size: int = Field(default=10000, ge=1)
+    """Maximum number of vertex builds and transactions waiting to be written. When the queue is full,
+    logging a record waits until the queue has room for it."""
+    build_log_prune_interval: int = Field(default=60, ge=1)
+    """The interval in seconds at which vertex builds and transactions over the limits above are deleted."""
+    graph_scheduler: Literal["layered", "dataflow"] = "layered"
+    """How vertices are scheduled when a flow runs. 'layered' builds the graph layer by layer, waiting for
+    every vertex of a layer before starting the next one. 'dataflow' starts each vertex as soon as its own
+    predecessors are built, so a slow vertex only delays its own successors."""
+    graph_max_concurrent_vertices: int = Field(default=0, ge=0)
+    """Maximum number of vertices of a single run building at the same time with the 'dataflow' scheduler.
+    0 means no limit."""
+    compiled_flow_cache_size: int = 100
+    """Number of compiled flows (parsed flow data and evaluated component classes) kept in memory to speed up
+    repeated runs of the same flow through the API. Set to 0 to build the graph from scratch on every run."""
+    component_class_cache_size: int = 512
+    """Number of classes created from component code kept in memory, keyed by a hash of the code, so that
+    building a graph does not evaluate the same component code again. Set to 0 to disable the cache."""
+    memoize_component_outputs: bool = True
+    """Whether results of the components and outputs that opt in to memoization are stored in the cache service
+    and reused by later builds receiving the same inputs. The cache service expires and evicts them."""
+    component_bytecode_cache_dir: str | None = None
+    """Directory where the compiled code of components is stored so that new workers can create component
+    classes without parsing and compiling their code again. If not set, compiled code is only kept in memory."""
+    token_stream_flush_interval: int = Field(default=30, ge=0)
+    """The maximum time in ms streamed tokens are held so they can be sent to the client together in a
+    single event. Set to 0 to send every token as soon as it is generated."""
+    token_stream_flush_size: int = Field(default=1024, ge=1)
+    """The number of streamed characters after which held tokens are sent, whatever the time elapsed."""
+    http_client_http2: bool = True
+    """Whether the shared HTTP clients used by components negotiate HTTP/2 with the servers supporting it."""
+    http_client_max_connections_per_host: int = Field(default=100, ge=1)
+    """The maximum number of concurrent connections the shared HTTP clients open to a single origin."""
+    http_client_max_keepalive_connections: int = Field(default=20, ge=0)
+    """The maximum number of idle connections kept alive to a single origin."""
+    http_client_keepalive_expiry: float = Field(default=30.0, ge=0)
+    """The time in seconds after which an idle connection of the shared HTTP clients is closed."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
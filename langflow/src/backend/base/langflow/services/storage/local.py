@@ -1,8 +1,11 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import DEFAULT_CHUNK_SIZE, StorageService
 
 
 class LocalStorageService(StorageService):
@@ -67,6 +70,52 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the local storage in chunks.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be retrieved.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, or None to read until the end of the file.
+            chunk_size: The maximum size of each chunk.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = await self.get_file_path(flow_id, file_name)
+        remaining = None if end is None else end + 1 - start
+        async with await anyio.open_file(file_path, "rb") as f:
+            await f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def get_file_path(self, flow_id: str, file_name: str) -> Path:
+        """Return the path of a file in the local storage.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.is_file():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+        return Path(file_path)
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -1,8 +1,11 @@
+import asyncio
+from collections.abc import AsyncIterator
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import DEFAULT_CHUNK_SIZE, StorageService
 
 
 class S3StorageService(StorageService):
@@ -57,6 +60,43 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the S3 bucket in chunks, with a ranged request if only part of it is needed.
+
+        Args:
+            flow_id: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be retrieved.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, or None to read until the end of the file.
+            chunk_size: The maximum size of each chunk.
+
+        Raises:
+            Exception: If an error occurs during file retrieval.
+        """
+        kwargs = {"Bucket": self.bucket, "Key": f"{flow_id}/{file_name}"}
+        if start or end is not None:
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = await asyncio.to_thread(self.s3_client.get_object, **kwargs)
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
+            raise
+
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -101,4 +141,12 @@ class S3StorageService(StorageService):
         # No specific teardown actions required for S3 storage at the moment.
 
     async def get_file_size(self, flow_id: str, file_name: str):
-        raise NotImplementedError
+        """Get the size of a file in the S3 bucket."""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving the size of file {file_name} from folder {flow_id}")
+            raise
+        return response["ContentLength"]
@@ -8,10 +8,16 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
 class StorageService(Service):
     name = "storage_service"
 
@@ -35,6 +41,32 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Yield the content of a file in chunks, from byte `start` to byte `end` (inclusive).
+
+        This default implementation reads the whole file with `get_file`; storage services override it
+        to only hold one chunk in memory at a time.
+        """
+        content = memoryview(await self.get_file(flow_id, file_name))
+        stop = len(content) if end is None else min(end + 1, len(content))
+        for offset in range(start, stop, chunk_size):
+            yield bytes(content[offset : min(offset + chunk_size, stop)])
+
+    async def get_file_path(self, flow_id: str, file_name: str) -> Path | None:  # noqa: ARG002
+        """Return the path of a file on the local disk, or None if the storage is not local.
+
+        Files with a local path can be served directly from disk.
+        """
+        return None
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
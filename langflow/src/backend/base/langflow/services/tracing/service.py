@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import os
+import queue
+import random
+import threading
+import time
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -12,6 +18,7 @@ from loguru import logger
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -22,6 +29,10 @@ if TYPE_CHECKING:
     from langflow.services.tracing.base import BaseTracer
     from langflow.services.tracing.schema import Log
 
+# Spans waiting longer than this in the export queue are counted as delayed
+DELAYED_SPAN_SECONDS = 1.0
+EXPORT_THREAD_JOIN_TIMEOUT = 5.0
+
 
 def _get_langsmith_tracer():
     from langflow.services.tracing.langsmith import LangSmithTracer
@@ -75,9 +86,9 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
         self.running = False
-        self.worker_task: asyncio.Task | None = None
+        self.pending_spans = 0
+        self.lock = threading.Lock()
 
 
 class ComponentTraceContext:
@@ -101,6 +112,15 @@ class ComponentTraceContext:
         self.logs: dict[str, list[Log | dict[Any, Any]]] = defaultdict(list)
 
 
+@dataclass
+class _TraceJob:
+    trace_func: Callable[..., None]
+    args: tuple
+    trace_context: TraceContext | None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    done: concurrent.futures.Future | None = None
+
+
 class TracingService(Service):
     """Tracing service.
 
@@ -113,6 +133,12 @@ class TracingService(Service):
         3. end_tracers: end the trace for a graph run
 
     check context var in public methods.
+
+    The tracers' SDK calls are made by a single export thread rather than on the event loop, so a slow
+    tracing backend does not stall the flows. The thread drains the span operations queued by every run
+    in batches of up to `tracing_export_batch_size`. Each run may have at most `tracing_queue_size` span
+    operations waiting; the component traces started beyond that are dropped and counted in
+    `dropped_spans`. Only a `tracing_sample_rate` fraction of the runs is traced.
     """
 
     name = "tracing_service"
@@ -120,25 +146,83 @@ class TracingService(Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
         self.deactivated = self.settings_service.settings.deactivate_tracing
+        self._export_queue: queue.SimpleQueue[_TraceJob | None] = queue.SimpleQueue()
+        self._export_thread: threading.Thread | None = None
+        self._export_thread_lock = threading.Lock()
+        # Guards the counters, which are updated from both the event loop and the export thread
+        self._stats_lock = threading.Lock()
+        self.exported_spans = 0
+        self.delayed_spans = 0
+        self.dropped_spans = 0
+        self.sampled_out_runs = 0
+
+    def _ensure_export_thread(self) -> None:
+        with self._export_thread_lock:
+            if self._export_thread is None or not self._export_thread.is_alive():
+                self._export_thread = threading.Thread(
+                    target=self._export_worker, name="langflow-trace-export", daemon=True
+                )
+                self._export_thread.start()
 
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
-            try:
-                trace_func(*args)
-            except Exception:  # noqa: BLE001
-                logger.exception("Error processing trace_func")
-            finally:
-                trace_context.traces_queue.task_done()
-
-    async def _start(self, trace_context: TraceContext) -> None:
-        if trace_context.running or self.deactivated:
-            return
+    def _export_worker(self) -> None:
+        while True:
+            batch = [self._export_queue.get()]
+            batch_size = self.settings_service.settings.tracing_export_batch_size
+            while len(batch) < batch_size:
+                try:
+                    batch.append(self._export_queue.get_nowait())
+                except queue.Empty:
+                    break
+            for job in batch:
+                if job is None:
+                    return
+                self._run_job(job)
+
+    def _run_job(self, job: _TraceJob) -> None:
+        if job.trace_context is not None and time.monotonic() - job.enqueued_at > DELAYED_SPAN_SECONDS:
+            with self._stats_lock:
+                self.delayed_spans += 1
         try:
-            trace_context.running = True
-            trace_context.worker_task = asyncio.create_task(self._trace_worker(trace_context))
+            job.trace_func(*job.args)
         except Exception:  # noqa: BLE001
-            logger.exception("Error starting tracing service")
+            logger.exception("Error processing trace_func")
+        finally:
+            if job.trace_context is not None:
+                with job.trace_context.lock:
+                    job.trace_context.pending_spans -= 1
+                with self._stats_lock:
+                    self.exported_spans += 1
+            if job.done is not None:
+                job.done.set_result(None)
+
+    def _enqueue(
+        self,
+        trace_context: TraceContext | None,
+        trace_func: Callable[..., None],
+        args: tuple,
+        *,
+        droppable: bool = True,
+        done: concurrent.futures.Future | None = None,
+    ) -> bool:
+        """Queue a call for the export thread, returning False if it was dropped because the run's queue is full."""
+        if trace_context is not None:
+            with trace_context.lock:
+                if droppable and trace_context.pending_spans >= self.settings_service.settings.tracing_queue_size:
+                    with self._stats_lock:
+                        self.dropped_spans += 1
+                    return False
+                trace_context.pending_spans += 1
+        self._ensure_export_thread()
+        self._export_queue.put(_TraceJob(trace_func, args, trace_context, done=done))
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every span queued so far is exported."""
+        if self._export_thread is None:
+            return
+        done: concurrent.futures.Future = concurrent.futures.Future()
+        self._enqueue(None, lambda: None, (), droppable=False, done=done)
+        await asyncio.wrap_future(done)
 
     def _initialize_langsmith_tracer(self, trace_context: TraceContext) -> None:
         langsmith_tracer = _get_langsmith_tracer()
@@ -221,7 +305,12 @@ class TracingService(Service):
             project_name = project_name or os.getenv("LANGCHAIN_PROJECT", "Langflow")
             trace_context = TraceContext(run_id, run_name, project_name, user_id, session_id)
             trace_context_var.set(trace_context)
-            await self._start(trace_context)
+            if random.random() >= self.settings_service.settings.tracing_sample_rate:  # noqa: S311
+                # Without tracers, nothing is queued for this run
+                with self._stats_lock:
+                    self.sampled_out_runs += 1
+                return
+            trace_context.running = True
             self._initialize_langsmith_tracer(trace_context)
             self._initialize_langwatch_tracer(trace_context)
             self._initialize_langfuse_tracer(trace_context)
@@ -230,19 +319,6 @@ class TracingService(Service):
         except Exception as e:  # noqa: BLE001
             logger.debug(f"Error initializing tracers: {e}")
 
-    async def _stop(self, trace_context: TraceContext) -> None:
-        try:
-            trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
-            if trace_context.worker_task:
-                trace_context.worker_task.cancel()
-                trace_context.worker_task = None
-
-        except Exception:  # noqa: BLE001
-            logger.exception("Error stopping tracing service")
-
     def _end_all_tracers(self, trace_context: TraceContext, outputs: dict, error: Exception | None = None) -> None:
         for tracer in trace_context.tracers.values():
             if tracer.ready:
@@ -260,8 +336,9 @@ class TracingService(Service):
     async def end_tracers(self, outputs: dict, error: Exception | None = None) -> None:
         """End the trace for a graph run.
 
-        - stop worker for current trace_context
-        - call end for all the tracers
+        - queue the end of all the tracers after the spans queued for the current trace_context
+
+        The run does not wait for the export thread, which is shared by every run. Use `flush` to wait for it.
         """
         if self.deactivated:
             return
@@ -269,8 +346,10 @@ class TracingService(Service):
         if trace_context is None:
             msg = "called end_tracers but no trace context found"
             raise RuntimeError(msg)
-        await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
+        trace_context.running = False
+        if not trace_context.tracers:
+            return
+        self._enqueue(trace_context, self._end_all_tracers, (trace_context, outputs, error), droppable=False)
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -353,18 +432,29 @@ class TracingService(Service):
             msg = "called trace_component but no trace context found"
             raise RuntimeError(msg)
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        # A component trace is ended only if its start was queued, and ending it is never dropped
+        started = bool(trace_context.tracers) and self._enqueue(
+            trace_context, self._start_component_traces, (component_trace_context, trace_context)
+        )
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            if started:
+                self._enqueue(
+                    trace_context,
+                    self._end_component_traces,
+                    (component_trace_context, trace_context, e),
+                    droppable=False,
+                )
             raise
         else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+            if started:
+                self._enqueue(
+                    trace_context,
+                    self._end_component_traces,
+                    (component_trace_context, trace_context, None),
+                    droppable=False,
+                )
 
     @property
     def project_name(self):
@@ -429,3 +519,13 @@ class TracingService(Service):
             if langchain_callback:
                 callbacks.append(langchain_callback)
         return callbacks
+
+    async def teardown(self) -> None:
+        """Export the queued spans and stop the export thread."""
+        with self._export_thread_lock:
+            export_thread = self._export_thread
+            self._export_thread = None
+        if export_thread is None or not export_thread.is_alive():
+            return
+        self._export_queue.put(None)
+        await asyncio.to_thread(export_thread.join, EXPORT_THREAD_JOIN_TIMEOUT)
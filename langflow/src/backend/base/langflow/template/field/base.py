@@ -217,6 +217,10 @@ class Output(BaseModel):
     tool_mode: bool = Field(default=True)
     """Specifies if the output should be used as a tool"""
 
+    memoize: bool | None = Field(default=None)
+    """Specifies if the result should be reused by builds with the same inputs. If None, the component's
+    `memoize_outputs` attribute is used."""
+
     def to_dict(self):
         return self.model_dump(by_alias=True, exclude_none=True)
 
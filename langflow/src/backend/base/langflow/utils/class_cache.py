@@ -0,0 +1,144 @@
+"""Process-wide cache of the classes created from component source code.
+
+Every graph build evaluates the code of each of its components. Most of the time the exact same
+source (the code of a built-in component) was already evaluated moments before, so the compiled
+class definition and the global scope it runs in are kept here, keyed by a hash of the source.
+The class definition is executed again for every build: components keep per-build state in class
+attributes (e.g. `inputs`), so the same class must never be handed out twice.
+
+Optionally, the compiled bytecode is also written to a directory shared by the workers, so that
+a cold worker can skip parsing and compiling the code the first time it sees it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from loguru import logger
+
+ImportSpec = tuple[str, str, Any]
+"""An import of the component module: ("import", module, variable name) or ("from", module, names)."""
+
+CompiledComponentCode = tuple[list[ImportSpec], CodeType | None, CodeType]
+"""The import specs, the module level definitions and the class definition of a component."""
+
+CachedComponentClass = tuple[CodeType, dict[str, Any]]
+"""The compiled class definition of a component and the global scope it is executed in."""
+
+
+class ComponentClassCache:
+    """A thread-safe LRU cache of the compiled classes used by `validate.create_class`.
+
+    Attributes:
+        max_size: Maximum number of compiled classes kept in memory.
+        bytecode_dir: Directory used to store compiled component code. None disables the on-disk store.
+        hits: Number of lookups answered from memory.
+        misses: Number of lookups that had to create the class.
+        bytecode_hits: Number of misses that could reuse compiled code from `bytecode_dir`.
+    """
+
+    def __init__(self, max_size: int = 512, bytecode_dir: str | Path | None = None) -> None:
+        self.max_size = max_size
+        self.bytecode_dir = Path(bytecode_dir) if bytecode_dir else None
+        self._cache: OrderedDict[str, CachedComponentClass] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytecode_hits = 0
+
+    @staticmethod
+    def build_key(code: str, class_name: str) -> str:
+        return hashlib.sha256(f"{class_name}\0{code}".encode()).hexdigest()
+
+    def get(self, key: str) -> CachedComponentClass | None:
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+    def set(self, key: str, cached: CachedComponentClass) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = cached
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.bytecode_hits = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytecode_hits": self.bytecode_hits,
+        }
+
+    def _bytecode_path(self, key: str) -> Path | None:
+        if self.bytecode_dir is None:
+            return None
+        # Bytecode is only valid for the interpreter version that produced it
+        return self.bytecode_dir / importlib.util.MAGIC_NUMBER.hex() / f"{key}.bin"
+
+    def load_bytecode(self, key: str) -> CompiledComponentCode | None:
+        path = self._bytecode_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            import_specs, definitions_code, class_code = marshal.loads(path.read_bytes())  # noqa: S302
+        except (OSError, EOFError, ValueError, TypeError):
+            logger.opt(exception=True).debug(f"Could not load component bytecode from {path}")
+            return None
+        with self._lock:
+            self.bytecode_hits += 1
+        return [tuple(spec) for spec in import_specs], definitions_code, class_code
+
+    def store_bytecode(self, key: str, compiled: CompiledComponentCode) -> None:
+        path = self._bytecode_path(key)
+        if path is None or path.exists():
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent workers never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(marshal.dumps(compiled))
+            Path(tmp_path).replace(path)
+        except (OSError, ValueError):
+            logger.opt(exception=True).debug(f"Could not store component bytecode in {path}")
+
+
+_component_class_cache: ComponentClassCache | None = None
+
+
+def get_component_class_cache() -> ComponentClassCache:
+    global _component_class_cache  # noqa: PLW0603
+    if _component_class_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        settings = get_settings_service().settings
+        _component_class_cache = ComponentClassCache(
+            max_size=settings.component_class_cache_size,
+            bytecode_dir=settings.component_bytecode_cache_dir,
+        )
+    return _component_class_cache
@@ -2,7 +2,7 @@ import ast
 import contextlib
 import importlib
 import warnings
-from types import FunctionType
+from types import CodeType, FunctionType
 from typing import Optional, Union
 
 from langchain_core._api.deprecation import LangChainDeprecationWarning
@@ -10,6 +10,7 @@ from loguru import logger
 from pydantic import ValidationError
 
 from langflow.field_typing.constants import CUSTOM_COMPONENT_SUPPORTED_TYPES, DEFAULT_IMPORT_STRING
+from langflow.utils.class_cache import ImportSpec, get_component_class_cache
 
 
 def add_type_ignores() -> None:
@@ -262,14 +263,26 @@ def create_class(code, class_name):
     )
 
     code = DEFAULT_IMPORT_STRING + "\n" + code
+    class_cache = get_component_class_cache()
+    cache_key = class_cache.build_key(code, class_name)
+    if (cached := class_cache.get(cache_key)) is not None:
+        compiled_class, exec_globals = cached
+        # Execute the class definition again so that class attributes are not shared between builds
+        return build_class_constructor(compiled_class, exec_globals.copy(), class_name)
     try:
-        module = ast.parse(code)
-        exec_globals = prepare_global_scope(module)
+        if (compiled := class_cache.load_bytecode(cache_key)) is not None:
+            import_specs, definitions_code, compiled_class = compiled
+            exec_globals = _build_global_scope(import_specs, definitions_code)
+        else:
+            module = ast.parse(code)
+            exec_globals = prepare_global_scope(module)
 
-        class_code = extract_class_code(module, class_name)
-        compiled_class = compile_class_code(class_code)
+            class_code = extract_class_code(module, class_name)
+            compiled_class = compile_class_code(class_code)
+            if class_cache.bytecode_dir is not None:
+                class_cache.store_bytecode(cache_key, (*_collect_global_scope(module), compiled_class))
 
-        return build_class_constructor(compiled_class, exec_globals, class_name)
+        cls = build_class_constructor(compiled_class, exec_globals.copy(), class_name)
 
     except SyntaxError as e:
         msg = f"Syntax error in code: {e!s}"
@@ -284,6 +297,9 @@ def create_class(code, class_name):
     except Exception as e:
         msg = f"Error creating class: {e!s}"
         raise ValueError(msg) from e
+    else:
+        class_cache.set(cache_key, (compiled_class, exec_globals))
+        return cls
 
 
 def create_type_ignore_class():
@@ -311,32 +327,44 @@ def prepare_global_scope(module):
     Raises:
         ModuleNotFoundError: If a module is not found in the code
     """
-    exec_globals = globals().copy()
-    imports = []
-    import_froms = []
+    return _build_global_scope(*_collect_global_scope(module))
+
+
+def _collect_global_scope(module) -> tuple[list[ImportSpec], CodeType | None]:
+    """Splits a parsed module into its imports and its compiled module level definitions."""
+    import_specs: list[ImportSpec] = []
     definitions = []
 
     for node in module.body:
         if isinstance(node, ast.Import):
-            imports.append(node)
+            import_specs.extend(("import", alias.name, alias.asname or alias.name) for alias in node.names)
         elif isinstance(node, ast.ImportFrom) and node.module is not None:
-            import_froms.append(node)
+            import_specs.append(("from", node.module, tuple(alias.name for alias in node.names)))
         elif isinstance(node, ast.ClassDef | ast.FunctionDef | ast.Assign):
             definitions.append(node)
 
-    for node in imports:
-        for alias in node.names:
+    # Plain imports are resolved before the "from" imports, as they always have been
+    import_specs.sort(key=lambda spec: spec[0] != "import")
+    definitions_code = None
+    if definitions:
+        combined_module = ast.Module(body=definitions, type_ignores=[])
+        definitions_code = compile(combined_module, "<string>", "exec")
+    return import_specs, definitions_code
+
+
+def _build_global_scope(import_specs: list[ImportSpec], definitions_code: CodeType | None) -> dict:
+    """Builds the global scope of a component from its imports and module level definitions."""
+    exec_globals = globals().copy()
+
+    for kind, module_name, names in import_specs:
+        if kind == "import":
             try:
-                module_name = alias.name
-                variable_name = alias.asname or alias.name
-                exec_globals[variable_name] = importlib.import_module(module_name)
+                exec_globals[names] = importlib.import_module(module_name)
             except ModuleNotFoundError as e:
-                msg = f"Module {alias.name} not found. Please install it and try again."
+                msg = f"Module {module_name} not found. Please install it and try again."
                 raise ModuleNotFoundError(msg) from e
-
-    for node in import_froms:
+            continue
         try:
-            module_name = node.module
             # Apply warning suppression only when needed
             if "langchain" in module_name:
                 with warnings.catch_warnings():
@@ -345,22 +373,20 @@ def prepare_global_scope(module):
             else:
                 imported_module = importlib.import_module(module_name)
 
-            for alias in node.names:
+            for name in names:
                 try:
                     # First try getting it as an attribute
-                    exec_globals[alias.name] = getattr(imported_module, alias.name)
+                    exec_globals[name] = getattr(imported_module, name)
                 except AttributeError:
                     # If that fails, try importing the full module path
-                    full_module_path = f"{module_name}.{alias.name}"
-                    exec_globals[alias.name] = importlib.import_module(full_module_path)
+                    full_module_path = f"{module_name}.{name}"
+                    exec_globals[name] = importlib.import_module(full_module_path)
         except ModuleNotFoundError as e:
-            msg = f"Module {node.module} not found. Please install it and try again"
+            msg = f"Module {module_name} not found. Please install it and try again"
             raise ModuleNotFoundError(msg) from e
 
-    if definitions:
-        combined_module = ast.Module(body=definitions, type_ignores=[])
-        compiled_code = compile(combined_module, "<string>", "exec")
-        exec(compiled_code, exec_globals)
+    if definitions_code is not None:
+        exec(definitions_code, exec_globals)
 
     return exec_globals
 
@@ -0,0 +1,93 @@
+"""Benchmark the scheduler overhead of disconnect detection on idle connections.
+
+Compares the polling middleware langflow used before, which checked `request.is_disconnected()`
+every 100 ms, with `RequestCancelledMiddleware`, which waits for the `http.disconnect` message.
+"""
+
+import asyncio
+import time
+
+from langflow.middleware import RequestCancelledMiddleware
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+CONNECTIONS = 200
+IDLE_SECONDS = 1.0
+
+
+class PollingRequestCancelledMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        sentinel = object()
+
+        async def cancel_handler():
+            while True:
+                if await request.is_disconnected():
+                    return sentinel
+                await asyncio.sleep(0.1)
+
+        handler_task = asyncio.create_task(call_next(request))
+        cancel_task = asyncio.create_task(cancel_handler())
+        done, pending = await asyncio.wait([handler_task, cancel_task], return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        if cancel_task in done:
+            return Response("Request was cancelled", status_code=499)
+        return await handler_task
+
+
+async def _idle_endpoint(request: Request) -> Response:  # noqa: ARG001
+    await asyncio.sleep(IDLE_SECONDS * 10)
+    return Response("done")
+
+
+async def _measure(app) -> tuple[float, float]:
+    """Return the receive calls and the CPU milliseconds per idle connection and second."""
+    receive_calls = 0
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal receive_calls
+        receive_calls += 1
+        if receive_calls <= CONNECTIONS:
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        pass
+
+    def scope():
+        return {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b"", "app": app}
+
+    requests = [asyncio.create_task(app(scope(), receive, send)) for _ in range(CONNECTIONS)]
+    await asyncio.sleep(0.2)
+    receive_calls_before, cpu_before = receive_calls, time.process_time()
+    await asyncio.sleep(IDLE_SECONDS)
+    idle_receive_calls, idle_cpu = receive_calls - receive_calls_before, time.process_time() - cpu_before
+    disconnected.set()
+    # Only the idle period is measured: stop the requests the middleware did not cancel
+    _, pending = await asyncio.wait(requests, timeout=1)
+    for request in pending:
+        request.cancel()
+    await asyncio.gather(*requests, return_exceptions=True)
+    per_connection_second = CONNECTIONS * IDLE_SECONDS
+    return idle_receive_calls / per_connection_second, idle_cpu * 1000 / per_connection_second
+
+
+async def test_idle_connection_overhead():
+    routes = [Route("/", _idle_endpoint)]
+    polling_app = PollingRequestCancelledMiddleware(Starlette(routes=routes))
+    event_app = RequestCancelledMiddleware(Starlette(routes=routes), paths=["/"])
+
+    polling_wakeups, polling_cpu = await _measure(polling_app)
+    event_wakeups, event_cpu = await _measure(event_app)
+
+    print(  # noqa: T201
+        f"\nPer idle connection and second: polling {polling_wakeups:.1f} wakeups, {polling_cpu:.3f} ms CPU; "
+        f"event-driven {event_wakeups:.1f} wakeups, {event_cpu:.3f} ms CPU"
+    )
+    assert event_wakeups == 0
+    assert polling_wakeups > 5
@@ -0,0 +1,21 @@
+"""Benchmark persisting streamed chat turns."""
+
+import pytest
+from langflow.memory import aget_messages, astore_message, aupdate_message_text
+from langflow.schema.message import Message
+
+TURNS = 50
+
+
+@pytest.mark.usefixtures("client")
+async def test_chat_turns():
+    """Benchmark storing chat turns and writing their streamed text, then reading them back."""
+    text = "streamed token " * 200
+
+    for _ in range(TURNS):
+        stored = (await astore_message(Message(text="", sender="Machine", sender_name="AI", session_id="session")))[0]
+        await aupdate_message_text(stored.id, text)
+
+    history = await aget_messages(session_id="session")
+    assert len(history) == TURNS
+    assert all(message.text == text for message in history)
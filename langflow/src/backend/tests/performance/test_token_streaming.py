@@ -0,0 +1,64 @@
+"""Benchmark the throughput of streaming tokens to the client through the event manager.
+
+Compares the per-token path langflow used before, which hopped to a thread and encoded a TokenEvent
+for every token, with `TokenStream`, which coalesces tokens and encodes them on the event loop.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+
+from fastapi.encoders import jsonable_encoder
+from langflow.events.event_manager import EventManager, TokenStream
+from langflow.schema.playground_events import create_event_by_type
+
+TOKENS = 4000
+
+
+def _legacy_send_token(queue: asyncio.Queue, data: dict) -> None:
+    event = create_event_by_type("token", **data)
+    str_data = json.dumps({"event": "token", "data": jsonable_encoder(event)}) + "\n\n"
+    queue.put_nowait((f"token-{uuid.uuid4()}", str_data.encode("utf-8"), time.time()))
+
+
+async def _legacy_stream(tokens: list[str]) -> tuple[str, int]:
+    queue: asyncio.Queue = asyncio.Queue()
+    complete_message = ""
+    for token in tokens:
+        complete_message += token
+        await asyncio.to_thread(_legacy_send_token, queue, {"chunk": token, "id": "message-id"})
+    return complete_message, queue.qsize()
+
+
+async def _coalesced_stream(tokens: list[str]) -> tuple[str, int]:
+    queue: asyncio.Queue = asyncio.Queue()
+    manager = EventManager(queue)
+    manager.register_event("on_token", "token")
+    stream = TokenStream(manager, "message-id")
+    chunks: list[str] = []
+    for token in tokens:
+        chunks.append(token)
+        await stream.add(token)
+    await stream.flush()
+    return "".join(chunks), queue.qsize()
+
+
+async def test_token_streaming_throughput():
+    tokens = [f"token{i} " for i in range(TOKENS)]
+
+    start = time.perf_counter()
+    legacy_message, legacy_events = await _legacy_stream(tokens)
+    legacy_rate = TOKENS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    message, events = await _coalesced_stream(tokens)
+    rate = TOKENS / (time.perf_counter() - start)
+
+    print(  # noqa: T201
+        f"\nTokens per second: per-token events {legacy_rate:,.0f} ({legacy_events} events); "
+        f"coalesced {rate:,.0f} ({events} events)"
+    )
+    assert message == legacy_message
+    assert events < legacy_events
+    assert rate > legacy_rate
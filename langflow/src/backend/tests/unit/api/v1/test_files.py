@@ -186,6 +186,25 @@ async def test_download_file(files_client, files_created_api_key, files_flow):
     assert response.content == b"test content"
 
 
+async def test_download_file_range(files_client, files_created_api_key, files_flow):
+    headers = {"x-api-key": files_created_api_key.api_key}
+
+    response = await files_client.post(
+        f"api/v1/files/upload/{files_flow.id}",
+        files={"file": ("test.txt", b"test content")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    file_name = response.json()["file_path"].split("/")[-1]
+
+    response = await files_client.get(
+        f"api/v1/files/download/{files_flow.id}/{file_name}", headers={**headers, "Range": "bytes=5-8"}
+    )
+    assert response.status_code == 206
+    assert response.content == b"cont"
+    assert response.headers["content-range"] == "bytes 5-8/12"
+
+
 async def test_list_files(files_client, files_created_api_key, files_flow):
     headers = {"x-api-key": files_created_api_key.api_key}
 
@@ -1,5 +1,7 @@
 import asyncio
+import io
 import tempfile
+import zipfile
 from contextlib import suppress
 from pathlib import Path
 
@@ -13,7 +15,7 @@ from langflow.services.auth.utils import get_password_hash
 from langflow.services.database.models.api_key.model import ApiKey
 from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service
+from langflow.services.deps import get_db_service, get_storage_service
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
@@ -156,6 +158,58 @@ async def test_download_file(files_client, files_created_api_key):
     assert response.content == b"test content"
 
 
+async def test_download_file_content(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("test.txt", b"test content")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    upload_response = response.json()
+
+    response = await files_client.get(
+        f"api/v2/files/{upload_response['id']}", params={"return_content": True}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == "test content"
+
+
+async def test_download_files_batch(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+
+    file_ids = []
+    for name, content in [("first.txt", b"first content"), ("second.txt", b"second content")]:
+        response = await files_client.post("api/v2/files", files={"file": (name, content)}, headers=headers)
+        assert response.status_code == 201
+        file_ids.append(response.json()["id"])
+
+    response = await files_client.post("api/v2/files/batch/", json=file_ids, headers=headers)
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assert zip_file.read("first.txt") == b"first content"
+        assert zip_file.read("second.txt") == b"second content"
+
+
+async def test_download_files_batch_fails_before_streaming_if_a_file_is_missing(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+
+    uploaded = []
+    for name, content in [("first.txt", b"first content"), ("second.txt", b"second content")]:
+        response = await files_client.post("api/v2/files", files={"file": (name, content)}, headers=headers)
+        assert response.status_code == 201
+        uploaded.append(response.json())
+    user_id, file_name = uploaded[1]["path"].split("/")
+    await get_storage_service().delete_file(flow_id=user_id, file_name=file_name)
+
+    response = await files_client.post("api/v2/files/batch/", json=[file["id"] for file in uploaded], headers=headers)
+
+    assert response.status_code == 500
+
+
 async def test_list_files(files_client, files_created_api_key):
     headers = {"x-api-key": files_created_api_key.api_key}
 
@@ -3,11 +3,37 @@ import re
 import pytest
 from langflow.components.processing.batch_run import BatchRunComponent
 from langflow.schema import DataFrame
+from langflow.services.cache.service import AsyncInMemoryCache
 
 from tests.base import ComponentTestBaseWithoutClient
 from tests.unit.mock_language_model import MockLanguageModel
 
 
+class FlakyModel(MockLanguageModel):
+    """Fails every batch call containing a row listed in `failing`, `failures` times per row."""
+
+    failing: dict = {}
+    calls: list = []
+
+    async def abatch(self, messages, *args, **kwargs):
+        self.calls.append([msg[-1]["content"] for msg in messages])
+        for message in messages:
+            content = message[-1]["content"]
+            if self.failing.get(content, 0) > 0:
+                self.failing[content] -= 1
+                msg = f"Rate limited on {content}"
+                raise RuntimeError(msg)
+        return await super().abatch(messages, *args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def batch_cache(mocker):
+    mocker.patch("langflow.components.processing.batch_run.RETRY_BACKOFF_SECONDS", 0)
+    cache = AsyncInMemoryCache()
+    mocker.patch("langflow.components.processing.batch_run.get_cache_service", return_value=cache)
+    return cache
+
+
 class TestBatchRunComponent(ComponentTestBaseWithoutClient):
     @pytest.fixture
     def component_class(self):
@@ -256,3 +282,68 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         )
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_rows_are_sent_in_chunks(self):
+        model = FlakyModel(failing={}, calls=[])
+        component = BatchRunComponent(
+            model=model, df=DataFrame({"text": ["a", "b", "c", "d", "e"]}), column_name="text", chunk_size=2
+        )
+
+        result = await component.run_batch()
+
+        assert sorted(model.calls) == [["a", "b"], ["c", "d"], ["e"]]
+        assert result["model_response"].tolist() == [f"Response for {text}" for text in "abcde"]
+        assert result["batch_index"].tolist() == [0, 1, 2, 3, 4]
+
+    async def test_failed_chunk_is_retried(self):
+        model = FlakyModel(failing={"b": 2}, calls=[])
+        component = BatchRunComponent(
+            model=model, df=DataFrame({"text": ["a", "b"]}), column_name="text", chunk_size=1, max_retries=2
+        )
+
+        result = await component.run_batch()
+
+        assert model.calls.count(["b"]) == 3
+        assert result["model_response"].tolist() == ["Response for a", "Response for b"]
+
+    async def test_rerun_skips_rows_completed_before_a_failure(self):
+        model = FlakyModel(failing={"b": 1}, calls=[])
+        kwargs = {
+            "_id": "batch",
+            "df": DataFrame({"text": ["a", "b", "c"]}),
+            "column_name": "text",
+            "chunk_size": 1,
+            "max_retries": 0,
+            "enable_metadata": True,
+        }
+
+        first = await BatchRunComponent(model=model, **kwargs).run_batch()
+        assert first["model_response"].tolist() == ["Response for a", "", "Response for c"]
+        assert first.iloc[1]["metadata"] == {"error": "Rate limited on b", "processing_status": "failed"}
+
+        model.calls.clear()
+        second = await BatchRunComponent(model=model, **kwargs).run_batch()
+
+        assert model.calls == [["b"]]
+        assert second["model_response"].tolist() == ["Response for a", "Response for b", "Response for c"]
+        assert all(row["processing_status"] == "success" for row in second["metadata"])
+
+    async def test_checkpoint_stores_each_chunk_once(self, batch_cache, mocker):
+        model = FlakyModel(failing={"c": 1}, calls=[])
+        kwargs = {
+            "_id": "batch",
+            "df": DataFrame({"text": ["a", "b", "c"]}),
+            "column_name": "text",
+            "chunk_size": 1,
+            "max_retries": 0,
+        }
+        cache_set = mocker.spy(batch_cache, "set")
+
+        await BatchRunComponent(model=model, **kwargs).run_batch()
+
+        chunk_values = [call.args[1] for call in cache_set.call_args_list if ":chunk:" in call.args[0]]
+        assert sorted(chunk_values, key=str) == [{0: "Response for a"}, {1: "Response for b"}]
+
+        await BatchRunComponent(model=model, **kwargs).run_batch()
+
+        assert not batch_cache.cache
@@ -0,0 +1,126 @@
+import os
+import threading
+import uuid
+
+import pytest
+from langchain_community.embeddings.fake import DeterministicFakeEmbedding
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langflow.base.vectorstores.faiss_pool import FaissIndexPool, faiss_index_pool
+from langflow.components.vectorstores.faiss import FaissVectorStoreComponent
+from langflow.schema.data import Data
+
+pytest.importorskip("faiss")
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    embedded: list = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+@pytest.fixture
+def embedding():
+    return CountingEmbedding(size=8, embedded=[])
+
+
+@pytest.fixture(autouse=True)
+def _clear_pool():
+    faiss_index_pool.clear()
+    yield
+    faiss_index_pool.clear()
+
+
+def _component(tmp_path, embedding, texts, search_query=""):
+    return FaissVectorStoreComponent().set(
+        index_name="test_index",
+        persist_directory=str(tmp_path),
+        embedding=embedding,
+        ingest_data=[Data(text=text) for text in texts],
+        search_query=search_query,
+        number_of_results=1,
+    )
+
+
+def test_ingest_only_embeds_new_documents(tmp_path, embedding):
+    _component(tmp_path, embedding, ["cat", "dog"]).build_vector_store()
+    store = _component(tmp_path, embedding, ["cat", "dog", "bird", "bird"]).build_vector_store()
+
+    assert embedding.embedded == ["cat", "dog", "bird"]
+    assert len(store.index_to_docstore_id) == 3
+
+
+def test_searches_reuse_loaded_index(tmp_path, embedding):
+    _component(tmp_path, embedding, ["cat", "dog"]).build_vector_store()
+    pool = FaissIndexPool()
+
+    first = pool.get(tmp_path, "test_index", embedding, allow_dangerous_deserialization=True)
+    second = pool.get(tmp_path, "test_index", embedding, allow_dangerous_deserialization=True)
+
+    assert first is second
+    assert pool.loads == 1
+
+
+def test_index_is_reloaded_when_file_changes(tmp_path, embedding):
+    _component(tmp_path, embedding, ["cat"]).build_vector_store()
+    pool = FaissIndexPool()
+    first = pool.get(tmp_path, "test_index", embedding, allow_dangerous_deserialization=True)
+
+    index_file = tmp_path / "test_index.faiss"
+    stat = index_file.stat()
+    os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = pool.get(tmp_path, "test_index", embedding, allow_dangerous_deserialization=True)
+
+    assert first is not second
+    assert pool.loads == 2
+
+
+def test_search_documents(tmp_path, embedding):
+    _component(tmp_path, embedding, ["cat", "dog"]).build_vector_store()
+
+    results = _component(tmp_path, embedding, [], search_query="dog").search_documents()
+
+    assert [result.text for result in results] == ["dog"]
+
+
+def test_ingest_skips_documents_stored_under_other_ids(tmp_path, embedding):
+    documents = [Document(page_content=text) for text in ["cat", "dog"]]
+    FAISS.from_documents(documents, embedding, ids=[str(uuid.uuid4()) for _ in documents]).save_local(
+        str(tmp_path), "test_index"
+    )
+    embedding.embedded.clear()
+
+    store = _component(tmp_path, embedding, ["cat", "dog", "bird"]).build_vector_store()
+
+    assert embedding.embedded == ["bird"]
+    assert len(store.index_to_docstore_id) == 3
+
+
+def test_views_do_not_change_the_pooled_embedding(tmp_path, embedding):
+    _component(tmp_path, embedding, ["cat"]).build_vector_store()
+    index = faiss_index_pool.get(tmp_path, "test_index", embedding, allow_dangerous_deserialization=True)
+    other_embedding = CountingEmbedding(size=8, embedded=[])
+
+    view = index.view(other_embedding)
+
+    assert view.embedding_function is other_embedding
+    assert index.store.embedding_function is not other_embedding
+    assert view.index is index.store.index
+
+
+def test_view_searches_wait_for_documents_being_added(tmp_path, embedding):
+    _component(tmp_path, embedding, ["cat", "dog"]).build_vector_store()
+    index = faiss_index_pool.get(tmp_path, "test_index", embedding, allow_dangerous_deserialization=True)
+    view = index.view(embedding)
+    results = []
+
+    with index.lock.write():
+        search = threading.Thread(target=lambda: results.extend(view.similarity_search("cat", k=1)))
+        search.start()
+        search.join(timeout=0.1)
+        assert search.is_alive()
+
+    search.join(timeout=5)
+    assert [document.page_content for document in results] == ["cat"]
@@ -0,0 +1,110 @@
+import pytest
+from langchain_openai import OpenAIEmbeddings
+from langflow.custom import Component
+from langflow.custom.memoization import MemoizedResults, build_memo_key
+from langflow.inputs import MessageTextInput
+from langflow.schema.data import Data
+from langflow.schema.message import Message
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CacheMiss
+from langflow.template import Output
+
+
+class UpperComponent(Component):
+    memoize_outputs = True
+    inputs = [MessageTextInput(name="text")]
+    outputs = [
+        Output(name="upper", display_name="Upper", method="build_upper"),
+        Output(name="length", display_name="Length", method="build_length", memoize=False),
+    ]
+    calls: dict[str, int] = {}
+
+    def build_upper(self) -> Data:
+        self.calls["upper"] = self.calls.get("upper", 0) + 1
+        return Data(data={"text": self.text.upper()})
+
+    def build_length(self) -> Data:
+        self.calls["length"] = self.calls.get("length", 0) + 1
+        return Data(data={"length": len(self.text)})
+
+
+@pytest.fixture
+def cache_service(mocker):
+    cache_service = ThreadingInMemoryCache()
+    mocker.patch("langflow.custom.memoization.get_cache_service", return_value=cache_service)
+    return cache_service
+
+
+@pytest.fixture
+def memoized_results(mocker, cache_service):  # noqa: ARG001
+    UpperComponent.calls = {}
+    results = MemoizedResults()
+    mocker.patch("langflow.custom.custom_component.component.get_memoized_results", return_value=results)
+    return results
+
+
+async def test_same_inputs_reuse_result(memoized_results):
+    first, _ = await UpperComponent(text="hello")._build_results()
+    component = UpperComponent(text="hello")
+    second, _ = await component._build_results()
+
+    assert second["upper"].data == first["upper"].data == {"text": "HELLO"}
+    assert second["upper"] is not first["upper"]
+    assert UpperComponent.calls["upper"] == 1
+    assert component._memoized_outputs == {"upper"}
+    assert memoized_results.hits == 1
+
+
+async def test_different_inputs_are_computed(memoized_results):
+    await UpperComponent(text="hello")._build_results()
+    results, _ = await UpperComponent(text="world")._build_results()
+
+    assert results["upper"].data == {"text": "WORLD"}
+    assert UpperComponent.calls["upper"] == 2
+    assert memoized_results.hits == 0
+
+
+async def test_output_can_opt_out(memoized_results):  # noqa: ARG001
+    await UpperComponent(text="hello")._build_results()
+    await UpperComponent(text="hello")._build_results()
+
+    assert UpperComponent.calls["length"] == 2
+
+
+async def test_memoized_results_are_kept_by_the_cache_service(cache_service):
+    """Results written by one worker are visible to another one sharing the cache service."""
+    await MemoizedResults().set("memoized_result:first", Data(data={"value": 1}))
+
+    assert (await MemoizedResults().get("memoized_result:first")).data == {"value": 1}
+
+    cache_service.delete("memoized_result:first")
+    assert isinstance(await MemoizedResults().get("memoized_result:first"), CacheMiss)
+
+
+def test_memo_key_skips_unhashable_inputs():
+    key = build_memo_key("code", "UpperComponent", "upper", {"text": "a", "data": Data(data={"a": 1})})
+
+    assert key == build_memo_key("code", "UpperComponent", "upper", {"data": Data(data={"a": 1}), "text": "a"})
+    assert build_memo_key("code", "UpperComponent", "upper", {"client": object()}) is None
+
+
+def test_memo_key_ignores_volatile_message_fields():
+    first = Message(text="hello", sender="User", flow_id="flow-a", timestamp="2024-01-01 00:00:00 UTC")
+    second = Message(text="hello", sender="User", flow_id="flow-b", timestamp="2024-01-02 00:00:00 UTC")
+    second.data["id"] = "message-id"
+
+    assert build_memo_key("code", "C", "o", {"message": first}) == build_memo_key("code", "C", "o", {"message": second})
+    assert build_memo_key("code", "C", "o", {"message": first}) != build_memo_key(
+        "code", "C", "o", {"message": Message(text="world", sender="User")}
+    )
+
+
+def test_memo_key_of_embeddings_uses_their_configuration():
+    def key(**kwargs):
+        return build_memo_key("code", "C", "o", {"embedding": OpenAIEmbeddings(**kwargs)})
+
+    small = key(model="text-embedding-3-small", api_key="sk-first")
+
+    assert small is not None
+    assert small == key(model="text-embedding-3-small", api_key="sk-second")
+    assert small != key(model="text-embedding-3-large", api_key="sk-first")
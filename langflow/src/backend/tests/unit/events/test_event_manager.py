@@ -4,8 +4,10 @@ import time
 import uuid
 
 import pytest
-from langflow.events.event_manager import EventManager
+from fastapi.encoders import jsonable_encoder
+from langflow.events.event_manager import EventManager, TokenStream
 from langflow.schema.log import LoggableType
+from langflow.schema.playground_events import create_token
 
 
 class TestEventManager:
@@ -210,3 +212,72 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+    # Token events are encoded from a template to the same JSON as a TokenEvent
+    def test_token_event_matches_token_event_model(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+
+        manager.on_token(data={"chunk": 'say "hi"\n', "id": "message-id"})
+
+        event_id, str_data, _ = queue.get_nowait()
+        event = json.loads(str_data.decode("utf-8"))
+        expected = jsonable_encoder(create_token(chunk='say "hi"\n', id="message-id"))
+        assert event_id.startswith("token-")
+        assert str_data.endswith(b"\n\n")
+        assert event["event"] == "token"
+        assert event["data"].keys() == expected.keys()
+        assert event["data"]["chunk"] == expected["chunk"]
+        assert event["data"]["id"] == expected["id"]
+        assert event["data"]["timestamp"].endswith(" UTC")
+
+
+class TestTokenStream:
+    @staticmethod
+    def _chunks(queue: asyncio.Queue) -> list[str]:
+        chunks = []
+        while not queue.empty():
+            _, str_data, _ = queue.get_nowait()
+            chunks.append(json.loads(str_data)["data"]["chunk"])
+        return chunks
+
+    async def test_tokens_are_coalesced(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        stream = TokenStream(manager, "message-id", flush_interval=60, flush_size=5)
+
+        for token in ["a", "b", "c", "d", "e", "f", "g"]:
+            await stream.add(token)
+        await stream.flush()
+
+        assert self._chunks(queue) == ["a", "bcdef", "g"]
+
+    async def test_without_flush_interval_every_token_is_sent(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        stream = TokenStream(manager, "message-id", flush_interval=0)
+
+        for token in ["a", "b", "c"]:
+            await stream.add(token)
+        await stream.flush()
+
+        assert self._chunks(queue) == ["a", "b", "c"]
+        assert stream.events_sent == 3
+
+    async def test_held_tokens_are_sent_after_flush_interval(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        stream = TokenStream(manager, "message-id", flush_interval=0.01)
+
+        await stream.add("a")
+        await stream.add("b")
+        assert self._chunks(queue) == ["a"]
+
+        await asyncio.sleep(0.05)
+        assert self._chunks(queue) == ["b"]
+        await stream.flush()
+        assert stream.events_sent == 2
@@ -0,0 +1,122 @@
+import orjson
+import pytest
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
+from langflow.graph.graph.checkpoint import graph_record_key, run_record_key, vertex_record_key
+from langflow.graph.vertex.base import VertexStates
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import AsyncInMemoryCache
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.chat.service import ChatService
+
+
+@pytest.fixture
+def flow_data():
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(input_value="hello", should_store_message=False)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+    return orjson.loads(orjson.dumps(graph.dump()["data"]))
+
+
+@pytest.fixture
+def checkpoint_chat_service(tmp_path, mocker):
+    mocker.patch("langflow.services.chat.service.get_cache_service", return_value=AsyncDiskCache(tmp_path))
+    return ChatService()
+
+
+async def test_update_graph_cache_only_writes_built_vertex(flow_data, checkpoint_chat_service):
+    cache = checkpoint_chat_service.cache_service
+    graph = Graph.from_payload(flow_data, flow_id="flow")
+    graph.prepare()
+    await checkpoint_chat_service.set_graph_cache("flow", graph)
+
+    assert isinstance(await cache.get("flow"), CacheMiss)
+    assert not isinstance(await cache.get(graph_record_key("flow")), CacheMiss)
+    assert isinstance(await cache.get(vertex_record_key("flow", "chat_input")), CacheMiss)
+
+    vertex = (await graph.build_vertex("chat_input")).vertex
+    await checkpoint_chat_service.update_graph_cache("flow", graph, vertex=vertex)
+
+    run_record = await cache.get(run_record_key("flow"))
+    assert run_record["built_vertices"] == ["chat_input"]
+    assert not isinstance(await cache.get(vertex_record_key("flow", "chat_input")), CacheMiss)
+    assert isinstance(await cache.get(vertex_record_key("flow", "chat_output")), CacheMiss)
+
+
+async def test_get_graph_cache_replays_checkpoint(flow_data, checkpoint_chat_service):
+    graph = Graph.from_payload(flow_data, flow_id="flow")
+    graph.prepare()
+    await checkpoint_chat_service.set_graph_cache("flow", graph)
+    vertex = (await graph.build_vertex("chat_input")).vertex
+    await checkpoint_chat_service.update_graph_cache("flow", graph, vertex=vertex)
+
+    restored = await checkpoint_chat_service.get_graph_cache("flow")
+
+    assert restored is not graph
+    assert restored._run_id == graph._run_id
+    assert restored.vertices_layers == graph.vertices_layers
+    restored_vertex = restored.get_vertex("chat_input")
+    assert restored_vertex.built
+    assert restored_vertex.result is not None
+    assert restored_vertex.results["message"].text == vertex.results["message"].text
+    assert not restored.get_vertex("chat_output").built
+
+    build_result = await restored.build_vertex("chat_output")
+    assert build_result.vertex.results["message"].text == "hello"
+
+
+async def test_get_graph_cache_restores_state_of_unbuilt_vertices(flow_data, checkpoint_chat_service):
+    graph = Graph.from_payload(flow_data, flow_id="flow")
+    graph.prepare()
+    await checkpoint_chat_service.set_graph_cache("flow", graph)
+    vertex = (await graph.build_vertex("chat_input")).vertex
+    graph.get_vertex("chat_output").state = VertexStates.INACTIVE
+    graph.inactive_vertices.add("chat_output")
+    await checkpoint_chat_service.update_graph_cache("flow", graph, vertex=vertex)
+
+    restored = await checkpoint_chat_service.get_graph_cache("flow")
+
+    assert restored.get_vertex("chat_input").state == VertexStates.ACTIVE
+    assert restored.get_vertex("chat_output").state == VertexStates.INACTIVE
+    assert restored.inactive_vertices == {"chat_output"}
+
+
+async def test_clear_cache_removes_checkpoint(flow_data, checkpoint_chat_service):
+    cache = checkpoint_chat_service.cache_service
+    graph = Graph.from_payload(flow_data, flow_id="flow")
+    graph.prepare()
+    await checkpoint_chat_service.set_graph_cache("flow", graph)
+    vertex = (await graph.build_vertex("chat_input")).vertex
+    await checkpoint_chat_service.update_graph_cache("flow", graph, vertex=vertex)
+
+    await checkpoint_chat_service.clear_cache("flow")
+
+    assert isinstance(await checkpoint_chat_service.get_graph_cache("flow"), CacheMiss)
+    assert isinstance(await cache.get(vertex_record_key("flow", "chat_input")), CacheMiss)
+    assert isinstance(await cache.get(run_record_key("flow")), CacheMiss)
+
+
+async def test_set_graph_cache_removes_previous_vertex_records(flow_data, checkpoint_chat_service):
+    cache = checkpoint_chat_service.cache_service
+    graph = Graph.from_payload(flow_data, flow_id="flow")
+    graph.prepare()
+    await checkpoint_chat_service.set_graph_cache("flow", graph)
+    vertex = (await graph.build_vertex("chat_input")).vertex
+    await checkpoint_chat_service.update_graph_cache("flow", graph, vertex=vertex)
+
+    await checkpoint_chat_service.set_graph_cache("flow", Graph.from_payload(flow_data, flow_id="flow"))
+
+    assert isinstance(await cache.get(vertex_record_key("flow", "chat_input")), CacheMiss)
+
+
+async def test_in_memory_cache_stores_graph_whole(flow_data, mocker):
+    mocker.patch("langflow.services.chat.service.get_cache_service", return_value=AsyncInMemoryCache())
+    chat_service = ChatService()
+    graph = Graph.from_payload(flow_data, flow_id="flow")
+
+    await chat_service.set_graph_cache("flow", graph)
+
+    assert not chat_service.uses_graph_checkpoints
+    assert await chat_service.get_graph_cache("flow") is graph
@@ -0,0 +1,52 @@
+import pytest
+from langflow.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from langflow.graph import Graph
+from langflow.graph.graph.scheduler import SchedulerStats
+
+
+def test_critical_path_follows_trigger_chain():
+    stats = SchedulerStats()
+    first = stats.mark_ready("a")
+    stats.mark_started(first)
+    stats.mark_finished(first)
+    fast = stats.mark_ready("b", triggered_by=first)
+    slow = stats.mark_ready("c", triggered_by=first)
+    stats.mark_started(fast)
+    stats.mark_started(slow)
+    stats.mark_finished(fast)
+    stats.mark_finished(slow)
+    last = stats.mark_ready("d", triggered_by=slow)
+    stats.mark_started(last)
+    stats.mark_finished(last)
+
+    report = stats.critical_path()
+
+    assert report.vertices == ["a", "c", "d"]
+    assert report.max_in_flight == 2
+    assert report.total_duration >= report.duration > 0
+
+
+def test_critical_path_empty():
+    report = SchedulerStats().critical_path()
+
+    assert report.vertices == []
+    assert report.parallelism == 0.0
+
+
+@pytest.mark.parametrize("max_concurrency", [0, 1])
+async def test_process_dataflow_builds_all_vertices(max_concurrency):
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=max_concurrency)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert graph.scheduler_stats is not None
+    report = graph.scheduler_stats.critical_path()
+    assert report.vertices == ["chat_input", "text_output", "chat_output"]
+    assert report.max_in_flight == 1
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.services.build_log.service import BuildLogService
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.settings.base import Settings
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def _service(engine, **overrides) -> BuildLogService:
+    settings = Settings()
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    settings_service = SimpleNamespace(settings=settings)
+    return BuildLogService(settings_service, SimpleNamespace(engine=engine))
+
+
+def _vertex_build(flow_id, vertex_id="vertex") -> VertexBuildBase:
+    return VertexBuildBase(id=vertex_id, flow_id=flow_id, valid=True, artifacts={})
+
+
+async def _count(engine, table) -> int:
+    async with AsyncSession(engine) as session:
+        return await session.scalar(select(func.count()).select_from(table))
+
+
+async def test_records_are_written_in_batches(engine, mocker):
+    service = _service(engine, build_log_flush_interval=50, build_log_batch_size=3)
+    write = mocker.spy(service, "_write")
+    flow_id = uuid4()
+
+    for i in range(5):
+        await service.log_vertex_build(_vertex_build(flow_id, vertex_id=f"vertex-{i}"))
+    await service.log_transaction(TransactionBase(vertex_id="vertex-0", status="success", flow_id=flow_id))
+    await service.flush()
+
+    assert [len(call.args[0]) for call in write.call_args_list] == [3, 3]
+    assert await _count(engine, VertexBuildTable) == 5
+    assert await _count(engine, TransactionTable) == 1
+    assert service.written_records == 6
+    await service.teardown()
+
+
+async def test_teardown_writes_pending_records(engine):
+    service = _service(engine, build_log_flush_interval=1000)
+    await service.log_vertex_build(_vertex_build(uuid4()))
+
+    assert await _count(engine, VertexBuildTable) == 0
+    await service.teardown()
+
+    assert await _count(engine, VertexBuildTable) == 1
+    assert not service.is_started()
+
+
+async def test_without_flush_interval_records_are_written_and_pruned_immediately(engine):
+    service = _service(engine, build_log_flush_interval=0, max_vertex_builds_per_vertex=2)
+    flow_id = uuid4()
+
+    for _ in range(4):
+        await service.log_vertex_build(_vertex_build(flow_id))
+
+    assert not service.is_started()
+    assert await _count(engine, VertexBuildTable) == 2
+
+
+async def test_without_flush_interval_global_limits_are_enforced_once_per_prune_interval(engine, mocker):
+    service = _service(engine, build_log_flush_interval=0, max_vertex_builds_to_keep=2)
+    prune = mocker.spy(service, "_prune")
+    flow_id = uuid4()
+
+    for i in range(3):
+        await service.log_vertex_build(_vertex_build(flow_id, vertex_id=f"vertex-{i}"))
+
+    assert prune.call_count == 1
+    assert await _count(engine, VertexBuildTable) == 3
+
+
+async def test_records_left_in_a_stopped_event_loop_are_written(engine):
+    service = _service(engine, build_log_flush_interval=1000)
+    flow_id = uuid4()
+
+    # The writer started in this event loop is cancelled when it closes, with the record still pending
+    await asyncio.to_thread(asyncio.run, service.log_vertex_build(_vertex_build(flow_id, vertex_id="a")))
+    await service.log_vertex_build(_vertex_build(flow_id, vertex_id="b"))
+    await service.teardown()
+
+    assert await _count(engine, VertexBuildTable) == 2
+
+
+async def test_records_logged_from_another_event_loop_are_handed_to_the_writer(engine):
+    service = _service(engine, build_log_flush_interval=10)
+    flow_id = uuid4()
+    await service.log_vertex_build(_vertex_build(flow_id, vertex_id="a"))
+    writer_queue = service._queue
+
+    def log_in_other_loop():
+        asyncio.run(service.log_vertex_build(_vertex_build(flow_id, vertex_id="b")))
+        assert threading.current_thread() is not threading.main_thread()
+
+    await asyncio.to_thread(log_in_other_loop)
+    await service.flush()
+
+    assert service._queue is writer_queue
+    assert service.is_started()
+    assert await _count(engine, VertexBuildTable) == 2
+    await service.teardown()
+
+
+async def test_records_being_written_when_the_writer_is_cancelled_are_written_again(engine, mocker):
+    service = _service(engine, build_log_flush_interval=10)
+    flow_id = uuid4()
+    writing = asyncio.Event()
+
+    async def blocked_write(records):  # noqa: ARG001
+        writing.set()
+        await asyncio.Event().wait()
+
+    write = mocker.patch.object(service, "_write", side_effect=blocked_write)
+    await service.log_vertex_build(_vertex_build(flow_id, vertex_id="a"))
+    await writing.wait()
+    service._flush_task.cancel()
+    await asyncio.gather(service._flush_task, return_exceptions=True)
+    write.side_effect = BuildLogService._write.__get__(service)
+
+    await service.log_vertex_build(_vertex_build(flow_id, vertex_id="b"))
+    await service.teardown()
+
+    assert await _count(engine, VertexBuildTable) == 2
@@ -3,7 +3,11 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build
+from langflow.services.database.models.vertex_builds.crud import (
+    log_vertex_build,
+    log_vertex_builds,
+    prune_vertex_builds,
+)
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
 from langflow.services.settings.base import Settings
 from sqlalchemy import delete, func, select
@@ -314,3 +318,24 @@ async def test_concurrent_log_vertex_build(vertex_build_data, mock_settings):
         async with AsyncSession(engine) as session:
             count = await session.scalar(select(func.count()).select_from(VertexBuildTable))
             assert count <= mock_settings.max_vertex_builds_to_keep
+
+
+@pytest.mark.asyncio
+async def test_log_vertex_builds_and_prune(async_session: AsyncSession, timestamp_generator):
+    """Test that batched builds are only limited by the pruning sweep."""
+    flow_id = uuid4()
+    builds = [
+        VertexBuildBase(id=f"vertex-{i % 2}", flow_id=flow_id, timestamp=timestamp_generator(i), valid=True)
+        for i in range(8)
+    ]
+
+    await log_vertex_builds(async_session, builds)
+    assert await async_session.scalar(select(func.count()).select_from(VertexBuildTable)) == 8
+
+    await prune_vertex_builds(async_session, max_builds_to_keep=5, max_builds_per_vertex=2)
+
+    remaining = (await async_session.execute(select(VertexBuildTable.id, VertexBuildTable.timestamp))).all()
+    assert len(remaining) == 4
+    assert sorted(row.timestamp.replace(tzinfo=timezone.utc) for row in remaining) == [
+        timestamp_generator(i) for i in range(4, 8)
+    ]
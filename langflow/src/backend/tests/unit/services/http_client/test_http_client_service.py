@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import respx
+from langflow.services.http_client.service import HTTPClientService, get_origin
+from langflow.services.settings.base import Settings
+
+
+@pytest.fixture
+async def service():
+    service = HTTPClientService(SimpleNamespace(settings=Settings(http_client_http2=False)))
+    yield service
+    await service.teardown()
+
+
+def test_get_origin():
+    assert get_origin("https://api.example.com/v1/search?q=a") == "https://api.example.com"
+    assert get_origin("http://localhost:8080/path") == "http://localhost:8080"
+
+
+async def test_clients_are_shared_per_origin(service):
+    client = service.get_async_client("https://api.example.com/a")
+
+    assert service.get_async_client("https://api.example.com/b") is client
+    assert service.get_async_client("https://other.example.com/a") is not client
+    assert service.get_client("https://api.example.com/a") is service.get_client("https://api.example.com/c")
+
+
+async def test_closed_client_is_replaced(service):
+    client = service.get_async_client("https://api.example.com")
+    await client.aclose()
+
+    assert service.get_async_client("https://api.example.com") is not client
+
+
+@respx.mock
+async def test_metrics_are_recorded_per_origin(service):
+    respx.get("https://api.example.com/ok").mock(return_value=httpx.Response(200))
+    respx.get("https://api.example.com/missing").mock(return_value=httpx.Response(404))
+    client = service.get_async_client("https://api.example.com")
+
+    await client.get("https://api.example.com/ok")
+    await client.get("https://api.example.com/missing")
+
+    metrics = service.get_metrics()["https://api.example.com"]
+    assert metrics["requests"] == metrics["responses"] == 2
+    assert metrics["errors"] == 1
+
+
+@respx.mock
+async def test_cookies_are_not_stored(service):
+    route = respx.get("https://api.example.com/").mock(
+        return_value=httpx.Response(200, headers={"set-cookie": "session=secret; Path=/"})
+    )
+    client = service.get_async_client("https://api.example.com")
+
+    await client.get("https://api.example.com/")
+    await client.get("https://api.example.com/")
+
+    assert not client.cookies
+    assert "cookie" not in route.calls.last.request.headers
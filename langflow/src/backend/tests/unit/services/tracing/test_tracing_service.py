@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -171,6 +172,7 @@ async def test_start_end_tracers(tracing_service):
     assert "arize_phoenix" in trace_context.tracers
 
     await tracing_service.end_tracers(outputs)
+    await tracing_service.flush()
 
     # Verify end method was called for all tracers
     trace_context = trace_context_var.get()
@@ -179,8 +181,8 @@ async def test_start_end_tracers(tracing_service):
         assert tracer.metadata_param == outputs
         assert tracer.outputs_param == trace_context.all_outputs
 
-    # Verify worker_task is cancelled
-    assert trace_context.worker_task is None
+    # Verify every queued span was exported
+    assert trace_context.pending_spans == 0
     assert not trace_context.running
 
 
@@ -421,10 +423,10 @@ async def test_trace_worker_with_exception(tracing_service):
 
         # Get trace_context and add failing trace function to queue
         trace_context = trace_context_var.get()
-        await trace_context.traces_queue.put((failing_trace_func, ()))
+        tracing_service._enqueue(trace_context, failing_trace_func, ())
 
-        # Wait for async queue processing
-        await asyncio.sleep(0.1)
+        # Wait for the export thread
+        await tracing_service.flush()
 
         # Verify exception was logged
         mock_logger.assert_called_with("Error processing trace_func")
@@ -465,6 +467,7 @@ async def test_concurrent_tracing(tracing_service, mock_component):
         await task2
 
         await tracing_service.end_tracers({"final_output": f"{task_prefix}_final_output"})
+        await tracing_service.flush()
         trace_context = trace_context_var.get()
         return trace_context.tracers["langfuse"]
 
@@ -517,3 +520,85 @@ async def test_concurrent_tracing(tracing_service, mock_component):
     assert tracer2.session_id == "session_id2"
     assert dict(tracer2.outputs_param.get("run_id2 trace_name1")) == {"output_key": "task2_run_id2 component1_output"}
     assert dict(tracer2.outputs_param.get("run_id2 trace_name2")) == {"output_key": "task2_run_id2 component2_output"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_spans_are_exported_off_the_event_loop(tracing_service, mock_component):
+    """Test that the tracers are called from the export thread."""
+    threads = []
+
+    def add_trace(*_args, **_kwargs):
+        threads.append(threading.current_thread())
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    for tracer in trace_context_var.get().tracers.values():
+        tracer.add_trace = add_trace
+
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+        pass
+    await tracing_service.end_tracers({})
+    await tracing_service.flush()
+
+    assert len(threads) == 5
+    assert all(thread is not threading.main_thread() for thread in threads)
+    await tracing_service.teardown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_spans_beyond_queue_size_are_dropped(mock_settings_service, mock_component):
+    """Test that a run with a full queue drops the component traces it starts."""
+    mock_settings_service.settings.tracing_queue_size = 2
+    tracing_service = TracingService(mock_settings_service)
+    release = threading.Event()
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    tracing_service._enqueue(trace_context, release.wait, ())
+    for i in range(3):
+        async with tracing_service.trace_component(mock_component, f"trace_{i}", {}):
+            pass
+    release.set()
+    await tracing_service.end_tracers({})
+    await tracing_service.flush()
+
+    # The first component trace fits in the queue, and its end is never dropped
+    assert tracing_service.dropped_spans == 2
+    assert [trace["trace_name"] for trace in trace_context.tracers["langfuse"].end_trace_list] == ["trace_0"]
+    await tracing_service.teardown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_end_tracers_does_not_wait_for_the_export_thread(tracing_service):
+    """Test that ending a run only queues the end of its tracers."""
+    release = threading.Event()
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    tracing_service._enqueue(None, release.wait, (), droppable=False)
+    await tracing_service.end_tracers({})
+
+    assert not any(tracer.end_called for tracer in trace_context.tracers.values())
+    release.set()
+    await tracing_service.flush()
+    assert all(tracer.end_called for tracer in trace_context.tracers.values())
+    await tracing_service.teardown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_sampled_out_runs_are_not_traced(mock_settings_service, mock_component):
+    """Test that runs left out by the sample rate have no tracers."""
+    mock_settings_service.settings.tracing_sample_rate = 0
+    tracing_service = TracingService(mock_settings_service)
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}) as ts:
+        ts.set_outputs("test_component_trace", {"output_key": "output_value"})
+    await tracing_service.end_tracers({})
+
+    assert trace_context_var.get().tracers == {}
+    assert tracing_service.sampled_out_runs == 1
+    assert tracing_service.exported_spans == 0
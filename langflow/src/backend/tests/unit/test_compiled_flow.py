@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
+from langflow.processing.compiled_flow import (
+    CompiledFlow,
+    CompiledFlowCache,
+    build_graph_from_flow_data,
+    get_compiled_flow_cache,
+)
+
+
+def _compiled(key: str) -> CompiledFlow:
+    return CompiledFlow(key=key, payload=b"{}", component_classes={})
+
+
+@pytest.fixture
+def flow_data():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    return orjson.loads(orjson.dumps(graph.dump()["data"]))
+
+
+@pytest.fixture
+def compiled_flow_cache():
+    cache = get_compiled_flow_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_build_graph_reuses_compiled_flow(flow_data, compiled_flow_cache, mocker):
+    updated_at = datetime.now(timezone.utc)
+    original = orjson.dumps(flow_data)
+    first = build_graph_from_flow_data(flow_data, flow_id="flow", updated_at=updated_at, tweaks=None)
+
+    eval_code = mocker.patch("langflow.interface.initialize.loading.eval_custom_component_code")
+    second = build_graph_from_flow_data(flow_data, flow_id="flow", updated_at=updated_at, tweaks=None)
+
+    eval_code.assert_not_called()
+    assert compiled_flow_cache.hits == 1
+    assert orjson.dumps(flow_data) == original
+    assert second is not first
+    assert [vertex.id for vertex in second.vertices] == [vertex.id for vertex in first.vertices]
+    for vertex in second.vertices:
+        assert type(vertex.custom_component) is type(first.get_vertex(vertex.id).custom_component)
+        assert vertex.custom_component is not first.get_vertex(vertex.id).custom_component
+
+
+def test_build_graph_applies_tweaks_per_key(flow_data, compiled_flow_cache):
+    updated_at = datetime.now(timezone.utc)
+    tweaks = {"chat_input": {"input_value": "tweaked"}}
+
+    plain = build_graph_from_flow_data(flow_data, flow_id="flow", updated_at=updated_at, tweaks=None)
+    tweaked = build_graph_from_flow_data(flow_data, flow_id="flow", updated_at=updated_at, tweaks=tweaks)
+    tweaked_again = build_graph_from_flow_data(flow_data, flow_id="flow", updated_at=updated_at, tweaks=tweaks)
+
+    assert plain.get_vertex("chat_input").params.get("input_value") != "tweaked"
+    assert tweaked.get_vertex("chat_input").params["input_value"] == "tweaked"
+    assert tweaked_again.get_vertex("chat_input").params["input_value"] == "tweaked"
+    assert compiled_flow_cache.hits == 1
+
+
+def test_new_flow_version_replaces_old_entries():
+    cache = CompiledFlowCache(max_size=10)
+    updated_at = datetime.now(timezone.utc)
+    old_key = cache.build_key("flow", updated_at, None, stream=False)
+    new_key = cache.build_key("flow", updated_at + timedelta(seconds=1), None, stream=False)
+
+    cache.set("flow", _compiled(old_key))
+    cache.set("flow", _compiled(new_key))
+
+    assert cache.get(old_key) is None
+    assert cache.get(new_key) is not None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = CompiledFlowCache(max_size=2)
+    keys = [cache.build_key(f"flow{i}", None, None, stream=False) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.set(f"flow{i}", _compiled(key))
+    cache.get(keys[0])
+    cache.set("flow2", _compiled(keys[2]))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
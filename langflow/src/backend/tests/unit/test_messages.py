@@ -9,7 +9,9 @@ from langflow.memory import (
     adelete_messages,
     aget_messages,
     astore_message,
+    aupdate_message_text,
     aupdate_messages,
+    delete_message,
     delete_messages,
     get_messages,
 )
@@ -179,6 +181,28 @@ async def test_aupdate_single_message(created_message):
     assert updated[0].id == created_message.id
 
 
+@pytest.mark.usefixtures("client")
+async def test_aupdate_message_text(created_message):
+    await aupdate_message_text(str(created_message.id), "Streamed message")
+
+    messages = await aget_messages(session_id="session_id")
+    assert [message.text for message in messages] == ["Streamed message"]
+    assert messages[0].sender_name == created_message.sender_name
+
+
+@pytest.mark.usefixtures("client")
+async def test_aupdate_message_text_of_nonexistent_message():
+    with pytest.raises(ValueError, match="not found"):
+        await aupdate_message_text(uuid4(), "Streamed message")
+
+
+@pytest.mark.usefixtures("client")
+async def test_delete_message(created_message):
+    await delete_message(str(created_message.id))
+
+    assert await aget_messages(session_id="session_id") == []
+
+
 @pytest.mark.usefixtures("client")
 async def test_aupdate_multiple_messages(created_messages):
     # Modify the messages
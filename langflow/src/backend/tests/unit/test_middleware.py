@@ -0,0 +1,136 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+from langflow.middleware import RequestCancelledMiddleware
+from langflow.services.deps import session_scope
+
+
+class FakeClient:
+    """ASGI server side of a single request: messages are pushed to `receive` by the test."""
+
+    def __init__(self, body_chunks: list[bytes] | None = None):
+        self.messages: asyncio.Queue = asyncio.Queue()
+        for i, chunk in enumerate(body_chunks or []):
+            self.messages.put_nowait({"type": "http.request", "body": chunk, "more_body": i < len(body_chunks) - 1})
+        self.sent: list[dict] = []
+        self.scope = {
+            "type": "http",
+            "method": "POST" if body_chunks else "GET",
+            "path": "/api/v1/build/flow/vertices/vertex",
+            "headers": [(b"content-length", str(sum(map(len, body_chunks))).encode())] if body_chunks else [],
+        }
+
+    async def receive(self):
+        return await self.messages.get()
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    def disconnect(self):
+        self.messages.put_nowait({"type": "http.disconnect"})
+
+
+async def test_handler_is_cancelled_when_client_disconnects():
+    started = asyncio.Event()
+    cancelled = False
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    client = FakeClient()
+    request = asyncio.create_task(RequestCancelledMiddleware(app)(client.scope, client.receive, client.send))
+    await started.wait()
+    client.disconnect()
+    await asyncio.wait_for(request, 1)
+
+    assert cancelled
+    assert client.sent == []
+
+
+async def test_started_response_receives_disconnect_after_body():
+    received = []
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        while (message := await receive())["type"] == "http.request":
+            received.append(message["body"])
+            if not message["more_body"]:
+                await send({"type": "http.response.start", "status": 200, "headers": []})
+        received.append(message["type"])
+
+    client = FakeClient([b"ab", b"cd"])
+    request = asyncio.create_task(RequestCancelledMiddleware(app)(client.scope, client.receive, client.send))
+    await asyncio.sleep(0.01)
+    client.disconnect()
+    await asyncio.wait_for(request, 1)
+
+    assert received == [b"ab", b"cd", "http.disconnect"]
+
+
+async def test_completed_request_stops_watching():
+    async def app(scope, receive, send):  # noqa: ARG001
+        assert await receive() == {"type": "http.request", "body": b"", "more_body": False}
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    tasks_before = asyncio.all_tasks()
+    client = FakeClient()
+    await RequestCancelledMiddleware(app)(client.scope, client.receive, client.send)
+    await asyncio.sleep(0)
+
+    assert [message["type"] for message in client.sent] == ["http.response.start", "http.response.body"]
+    assert asyncio.all_tasks() == tasks_before
+
+
+async def test_other_paths_are_not_cancelled():
+    completed = False
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        nonlocal completed
+        await asyncio.sleep(0.01)
+        completed = True
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    client = FakeClient()
+    client.scope["path"] = "/api/v1/flows/"
+    client.disconnect()
+    await asyncio.wait_for(RequestCancelledMiddleware(app)(client.scope, client.receive, client.send), 1)
+
+    assert completed
+    assert [message["type"] for message in client.sent] == ["http.response.start"]
+
+
+async def test_cancelled_request_finishes_its_commit():
+    commit_started = asyncio.Event()
+    committed = False
+
+    async def commit():
+        nonlocal committed
+        commit_started.set()
+        await asyncio.sleep(0.01)
+        committed = True
+
+    session = MagicMock(commit=commit)
+
+    @asynccontextmanager
+    async def with_session():
+        yield session
+
+    async def write():
+        async with session_scope():
+            pass
+
+    with patch("langflow.services.deps.get_db_service", return_value=MagicMock(with_session=with_session)):
+        task = asyncio.create_task(write())
+        await commit_started.wait()
+        task.cancel()
+        await asyncio.wait([task])
+
+    assert task.cancelled()
+    assert committed
@@ -5,6 +5,7 @@ import warnings
 from unittest.mock import Mock, patch
 
 import pytest
+from langflow.utils.class_cache import ComponentClassCache, get_component_class_cache
 from langflow.utils.validate import (
     _create_langflow_execution_context,
     add_type_ignores,
@@ -25,6 +26,13 @@ from langflow.utils.validate import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_component_class_cache():
+    get_component_class_cache().clear()
+    yield
+    get_component_class_cache().clear()
+
+
 class TestAddTypeIgnores:
     """Test cases for add_type_ignores function."""
 
@@ -434,6 +442,97 @@ class TestClass:
             create_class(code, "TestClass")
 
 
+class TestCreateClassCache:
+    """Test cases for the component class cache used by create_class."""
+
+    code = """
+import json
+
+class CachedClass:
+    def dump(self):
+        return json.dumps({})
+"""
+
+    def test_reuses_compiled_class_for_same_code(self):
+        cache = get_component_class_cache()
+        first = create_class(self.code, "CachedClass")
+
+        with patch("langflow.utils.validate.prepare_global_scope") as mock_prepare:
+            second = create_class(self.code, "CachedClass")
+
+        mock_prepare.assert_not_called()
+        assert second is not first
+        assert second().dump() == "{}"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_component_inputs_are_not_shared_between_builds(self):
+        code = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+
+
+class CachedComponent(Component):
+    inputs = [MessageTextInput(name="text")]
+    outputs = [Output(name="text_output", method="build_text")]
+
+    def build_text(self) -> str:
+        return self.text
+"""
+        first = create_class(code, "CachedComponent")
+        first()._get_or_create_input("extra")
+        assert [input_.name for input_ in first.inputs] == ["text", "extra"]
+
+        second = create_class(code, "CachedComponent")
+
+        assert second is not first
+        assert [input_.name for input_ in second.inputs] == ["text"]
+        assert second.outputs is not first.outputs
+
+    def test_different_code_creates_new_class(self):
+        first = create_class(self.code, "CachedClass")
+        second = create_class(self.code + "\n# changed\n", "CachedClass")
+
+        assert second is not first
+
+    def test_errors_are_not_cached(self):
+        code = "class BrokenClass\n    pass\n"
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Syntax error in code"):
+                create_class(code, "BrokenClass")
+        assert get_component_class_cache().hits == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = ComponentClassCache(max_size=2)
+        cache.set("a", int)
+        cache.set("b", str)
+        cache.get("a")
+        cache.set("c", float)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is int
+        assert cache.get("c") is float
+
+    def test_cold_cache_reuses_stored_bytecode(self, tmp_path):
+        with patch(
+            "langflow.utils.validate.get_component_class_cache",
+            return_value=ComponentClassCache(bytecode_dir=tmp_path),
+        ):
+            first = create_class(self.code, "CachedClass")
+
+        cold_cache = ComponentClassCache(bytecode_dir=tmp_path)
+        with (
+            patch("langflow.utils.validate.get_component_class_cache", return_value=cold_cache),
+            patch("langflow.utils.validate.ast.parse") as mock_parse,
+        ):
+            second = create_class(self.code, "CachedClass")
+
+        mock_parse.assert_not_called()
+        assert cold_cache.bytecode_hits == 1
+        assert second is not first
+        assert second().dump() == "{}"
+
+
 class TestHelperFunctions:
     """Test cases for helper functions."""
 
@@ -594,6 +594,29 @@ _create_option(
     scriptable=True,
 )
 
+_create_option(
+    "client.chartDownsampleThreshold",
+    description="""
+        The maximum number of rows of data that st.line_chart,
+        st.area_chart, st.bar_chart, and st.scatter_chart send to the
+        browser. Charts with more rows are downsampled on the server before
+        they're sent, keeping the shape of the chart:
+
+        - Line and area charts, and bar charts with numeric or datetime x
+          values, keep the lowest and highest value of each series for
+          evenly sized buckets of x values.
+        - Scatter charts keep one point per cell of a grid over the chart.
+
+        Charts whose x or y values aren't numbers or dates are never
+        downsampled. Rows added with add_rows aren't downsampled.
+
+        Set to 0 to disable downsampling.
+    """,
+    default_val=0,
+    type_=int,
+    scriptable=True,
+)
+
 # Config Section: Runner #
 
 _create_section("runner", "Settings for how Streamlit executes your script")
@@ -636,6 +659,35 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "runner.maxConcurrentScriptRuns",
+    description="""
+        The maximum number of script runs, across all sessions, that execute at
+        the same time.
+
+        Further runs wait for a running script to finish, and the rerun
+        requests that a session receives while it waits are combined into one.
+        This keeps latency predictable when many sessions run CPU-heavy
+        scripts at once. Set to 0 to not limit script runs.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.diffElements",
+    description="""
+        Only send the elements that changed since the previous run of a
+        session.
+
+        Unchanged elements are replaced by a small reference to the copy that
+        the browser cached. To make this possible, the browser caches every
+        element, regardless of `global.minCachedMessageSize`.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
 _create_option(
     "runner.enforceSerializableSessionState",
     description="""
@@ -894,6 +946,70 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.fileSpillThreshold",
+    description="""
+        Size, in megabytes, above which uploaded files and media files are
+        stored in memory-mapped temporary files instead of in memory.
+
+        Set to 0 to keep all files in memory.
+    """,
+    default_val=50,
+    type_=float,
+)
+
+_create_option(
+    "server.fileMemoryBudget",
+    description="""
+        Max size, in megabytes, of the uploaded files and of the media files
+        kept in memory.
+
+        When it's exceeded, the least recently used files are moved to
+        temporary files. Set to 0 for no limit.
+    """,
+    default_val=0,
+    type_=float,
+)
+
+_create_option(
+    "server.sessionFileMemoryBudget",
+    description="""
+        Max size, in megabytes, of the files uploaded by a single session that
+        are kept in memory.
+
+        When it's exceeded, the session's least recently used files are moved
+        to temporary files. Set to 0 for no limit.
+    """,
+    default_val=0,
+    type_=float,
+)
+
+_create_option(
+    "server.fileDiskBudget",
+    description="""
+        Max size, in megabytes, of the uploaded files and of the media files
+        stored in temporary files.
+
+        When it's exceeded, the least recently used files on disk are
+        discarded, and are no longer available to the app. Set to 0 for no
+        limit.
+    """,
+    default_val=0,
+    type_=float,
+)
+
+_create_option(
+    "server.fileSpillDirectory",
+    description="""
+        Directory of the temporary files that store large uploaded files and
+        media files.
+
+        Defaults to the system's temporary directory.
+    """,
+    default_val=None,
+    type_=str,
+)
+
 _create_option(
     "server.maxMessageSize",
     description="""
@@ -967,6 +1083,23 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.deepMemoryStatsInterval",
+    description="""
+        Interval, in seconds, between full measurements of the memory used by
+        session state and st.cache_resource entries for the metrics endpoint.
+
+        By default, the metrics endpoint reports estimates of this memory that
+        are updated as values are written, which keeps scraping it cheap. When
+        this is set, a scrape also starts a background measurement that walks
+        every stored object, if the last one is older than the interval, and
+        its results are reported instead. Measuring large objects holds the
+        GIL and slows down running scripts. Set to 0 to only report estimates.
+    """,
+    default_val=0,
+    type_=float,
+)
+
 _create_option(
     "server.trustedUserHeaders",
     description="""
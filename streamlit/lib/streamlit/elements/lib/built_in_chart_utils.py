@@ -30,7 +30,8 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
-from streamlit import dataframe_util, type_util
+from streamlit import config, dataframe_util, type_util
+from streamlit.elements.lib.chart_downsampling import downsample_chart_data
 from streamlit.elements.lib.color_util import (
     Color,
     is_color_like,
@@ -83,19 +84,33 @@ class AddRowsMetadata:
 
 
 class ChartType(Enum):
-    AREA: Final = {"mark_type": "area", "command": "area_chart"}
+    AREA: Final = {
+        "mark_type": "area",
+        "command": "area_chart",
+        "downsampling": "min_max",
+    }
     VERTICAL_BAR: Final = {
         "mark_type": "bar",
         "command": "bar_chart",
         "horizontal": False,
+        "downsampling": "min_max",
     }
     HORIZONTAL_BAR: Final = {
         "mark_type": "bar",
         "command": "bar_chart",
         "horizontal": True,
+        "downsampling": "min_max",
+    }
+    LINE: Final = {
+        "mark_type": "line",
+        "command": "line_chart",
+        "downsampling": "min_max",
+    }
+    SCATTER: Final = {
+        "mark_type": "circle",
+        "command": "scatter_chart",
+        "downsampling": "grid",
     }
-    LINE: Final = {"mark_type": "line", "command": "line_chart"}
-    SCATTER: Final = {"mark_type": "circle", "command": "scatter_chart"}
 
 
 # Color and size legends need different title paddings in order for them
@@ -207,6 +222,17 @@ def generate_chart(
     # At this point, all foo_column variables are either None/empty or contain actual
     # columns that are guaranteed to exist.
 
+    # Downsample large data before it's melted, so that neither the melt nor the
+    # serialization has to handle all of its rows.
+    df, downsampling_info = downsample_chart_data(
+        df,
+        chart_type.value["downsampling"],
+        x_column=x_column,
+        y_column_list=y_column_list,
+        color_column=color_column,
+        max_rows=config.get_option("client.chartDownsampleThreshold"),
+    )
+
     df, x_column, y_column, color_column, size_column = _prep_data(
         df, x_column, y_column_list, color_column, size_column
     )
@@ -227,7 +253,7 @@ def generate_chart(
     )
 
     # Create a Chart with x and y encodings.
-    chart = alt.Chart(
+    chart: alt.Chart | alt.LayerChart = alt.Chart(
         data=df,
         mark=chart_type.value["mark_type"],
         width=width or 0,
@@ -280,9 +306,11 @@ def generate_chart(
         # This is using the new selection API that was added in Altair 5.0.0
         and is_altair_version_5_or_greater
     ):
-        return _add_improved_hover_tooltips(
-            chart, x_column, width, height
-        ).interactive(), add_rows_metadata
+        chart = _add_improved_hover_tooltips(chart, x_column, width, height)
+
+    if downsampling_info is not None:
+        # Record that the chart doesn't show all rows of the data.
+        chart = chart.properties(usermeta=downsampling_info.to_usermeta())
 
     return chart.interactive(), add_rows_metadata
 
@@ -0,0 +1,254 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Server-side downsampling of the data of our built-in charts."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from typing_extensions import TypeAlias
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+    import pandas as pd
+
+# - "min_max": Splits the rows, sorted by x, into buckets of the same size and
+#   keeps the rows with the lowest and highest value of each series in each
+#   bucket. Used for lines, areas and bars, whose shape at the pixel level is
+#   the envelope of their values.
+# - "grid": Splits the plot area into a grid and keeps one row per cell of the
+#   grid. Used for scatter points, whose shape is the set of covered cells.
+DownsamplingMethod: TypeAlias = Literal["min_max", "grid"]
+
+
+@dataclass(frozen=True)
+class DownsamplingInfo:
+    """Describes how the data of a chart was downsampled."""
+
+    method: DownsamplingMethod
+    original_rows: int
+    rows: int
+
+    def to_usermeta(self) -> dict[str, Any]:
+        """Return this info for the `usermeta` property of a Vega-Lite spec."""
+        return {
+            "downsampling": {
+                "method": self.method,
+                "originalRows": self.original_rows,
+                "rows": self.rows,
+            }
+        }
+
+
+def downsample_chart_data(
+    df: pd.DataFrame,
+    method: DownsamplingMethod,
+    *,
+    x_column: str | None,
+    y_column_list: list[str],
+    color_column: str | None,
+    max_rows: int,
+) -> tuple[pd.DataFrame, DownsamplingInfo | None]:
+    """Reduce the data of a chart to about `max_rows` rows.
+
+    Rows are selected, never changed, so every point of the downsampled chart
+    is a point of the original data. Series of different colors are
+    downsampled separately.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The chart's data, in wide format.
+    method : DownsamplingMethod
+        How to select the rows to keep.
+    x_column : str or None
+        The name of the x column, or None to use the index.
+    y_column_list : list of str
+        The names of the y columns.
+    color_column : str or None
+        The name of the column whose values split the data into series.
+    max_rows : int
+        The maximum number of rows to keep. Data with more rows is
+        downsampled. If this is 0, data is never downsampled.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, DownsamplingInfo | None]
+        The downsampled data and how it was downsampled. If the data doesn't
+        need to be downsampled, or can't be because its x or y values aren't
+        numbers or dates, the data itself and None.
+    """
+    import numpy as np
+    import pandas as pd
+
+    num_rows = len(df)
+    if max_rows <= 0 or num_rows <= max_rows or not y_column_list:
+        return df, None
+
+    x_values = _to_float_array(df.index if x_column is None else df[x_column])
+    y_values_list = [_to_float_array(df[name]) for name in y_column_list]
+    if x_values is None or any(y_values is None for y_values in y_values_list):
+        return df, None
+    ys = cast("list[npt.NDArray[np.float64]]", y_values_list)
+
+    if color_column is None:
+        group_codes = np.zeros(num_rows, dtype=np.intp)
+    else:
+        # Missing colors get a code of -1, and form a series of their own.
+        group_codes = pd.factorize(df[color_column])[0]
+
+    # Order the rows by series, and by x within each series.
+    order = np.lexsort((x_values, group_codes))
+    sorted_codes = group_codes[order]
+    group_starts = np.flatnonzero(np.diff(sorted_codes, prepend=sorted_codes[0] - 1))
+    group_ends = np.append(group_starts[1:], num_rows)
+
+    rows_per_group = max_rows // len(group_starts)
+    if rows_per_group < 2 * len(ys):
+        # There are too many series to keep the shape of each of them.
+        return df, None
+
+    selected = []
+    for start, end in zip(group_starts, group_ends):
+        positions = order[start:end]
+        group_x = x_values[positions]
+        group_ys = [y_values[positions] for y_values in ys]
+        if method == "min_max":
+            kept = _select_min_max(group_ys, rows_per_group)
+        else:
+            kept = _select_grid(group_x, group_ys, rows_per_group)
+        selected.append(positions[kept])
+
+    # Keep the rows in their original order.
+    selected_rows = np.sort(np.concatenate(selected))
+    if len(selected_rows) >= num_rows:
+        return df, None
+
+    return df.iloc[selected_rows], DownsamplingInfo(
+        method=method, original_rows=num_rows, rows=len(selected_rows)
+    )
+
+
+def _to_float_array(
+    values: pd.Series[Any] | pd.Index[Any],
+) -> npt.NDArray[np.float64] | None:
+    """Return numbers, datetimes or timedeltas as floats, with NaN for missing
+    values, or None for values of other types.
+    """
+    import numpy as np
+    import pandas as pd
+    from pandas.api.types import (
+        is_bool_dtype,
+        is_datetime64_any_dtype,
+        is_numeric_dtype,
+        is_timedelta64_dtype,
+    )
+
+    if is_datetime64_any_dtype(values.dtype) or is_timedelta64_dtype(values.dtype):
+        index = (
+            pd.DatetimeIndex(values)
+            if is_datetime64_any_dtype(values.dtype)
+            else pd.TimedeltaIndex(values)
+        )
+        floats = index.asi8.astype(np.float64)
+        floats[np.asarray(index.isna())] = np.nan
+        return floats
+
+    if is_numeric_dtype(values.dtype) and not is_bool_dtype(values.dtype):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    return None
+
+
+def _select_min_max(
+    ys: list[npt.NDArray[np.float64]], max_rows: int
+) -> npt.NDArray[np.intp]:
+    """Return the positions of the first and last rows, and of the rows with the
+    lowest and highest values of each series in each bucket.
+    """
+    import numpy as np
+
+    num_rows = len(ys[0])
+    if num_rows <= max_rows:
+        return np.arange(num_rows)
+
+    # Every series keeps up to two rows per bucket.
+    num_buckets = max(1, (max_rows - 2) // (2 * len(ys)))
+    bucket_size = math.ceil(num_rows / num_buckets)
+    num_buckets = math.ceil(num_rows / bucket_size)
+    padding = num_buckets * bucket_size - num_rows
+    bucket_offsets = np.arange(num_buckets) * bucket_size
+
+    kept = [np.array([0, num_rows - 1])]
+    for y_values in ys:
+        # Missing values and padding are never the lowest or highest value,
+        # unless a bucket has no other values. The padding is at the end of
+        # the last bucket, which always has at least one row.
+        is_missing = np.isnan(y_values)
+        lows = np.append(np.where(is_missing, np.inf, y_values), [np.inf] * padding)
+        highs = np.append(np.where(is_missing, -np.inf, y_values), [-np.inf] * padding)
+        kept.append(lows.reshape(num_buckets, -1).argmin(axis=1) + bucket_offsets)
+        kept.append(highs.reshape(num_buckets, -1).argmax(axis=1) + bucket_offsets)
+
+    return np.unique(np.concatenate(kept))
+
+
+def _select_grid(
+    x_values: npt.NDArray[np.float64],
+    ys: list[npt.NDArray[np.float64]],
+    max_rows: int,
+) -> npt.NDArray[np.intp]:
+    """Return the positions of the first row in each cell of a grid over the
+    x and y values of each series.
+    """
+    import numpy as np
+
+    num_rows = len(x_values)
+    if num_rows <= max_rows:
+        return np.arange(num_rows)
+
+    # Every series keeps up to one row per cell.
+    grid_size = max(1, math.isqrt(max_rows // len(ys)) - 1)
+    x_bins = _get_bins(x_values, grid_size)
+    kept = []
+    for y_values in ys:
+        # Missing values are in a bin of their own.
+        cells = x_bins * (grid_size + 1) + _get_bins(y_values, grid_size)
+        kept.append(np.unique(cells, return_index=True)[1])
+
+    return np.unique(np.concatenate(kept))
+
+
+def _get_bins(values: npt.NDArray[np.float64], num_bins: int) -> npt.NDArray[np.intp]:
+    """Split the range of the values into bins of the same width, and return the
+    bin of each value. Missing values are in bin `num_bins`.
+    """
+    import numpy as np
+
+    is_missing = np.isnan(values)
+    if is_missing.all():
+        return np.full(len(values), num_bins, dtype=np.intp)
+
+    low = np.nanmin(values)
+    span = np.nanmax(values) - low
+    scaled = np.where(is_missing, 0, values - low)
+    if span > 0:
+        scaled *= num_bins / span
+    bins = np.minimum(scaled.astype(np.intp), num_bins - 1)
+    bins[is_missing] = num_bins
+    return bins
@@ -14,9 +14,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import os
 import re
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
 from enum import IntEnum
 from pathlib import Path
@@ -27,6 +30,9 @@ from typing_extensions import TypeAlias
 from streamlit import runtime, url_util
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime import caching
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    in_cached_function,
+)
 
 if TYPE_CHECKING:
     from typing import Any
@@ -57,6 +63,10 @@ ImageOrImageList: TypeAlias = Union[AtomicImage, Sequence[AtomicImage]]
 MAXIMUM_CONTENT_WIDTH: Final[int] = 2 * 730
 
 
+# The max number of encoded images remembered by `_encoded_images`.
+_MAX_ENCODED_IMAGES: Final = 1024
+
+
 # @see Image.proto
 # @see WidthBehavior on the frontend
 class WidthBehavior(IntEnum):
@@ -176,6 +186,14 @@ def _get_image_format_mimetype(image_format: ImageFormat) -> str:
     return f"image/{image_format.lower()}"
 
 
+def _get_target_width(layout_config: LayoutConfig) -> int:
+    return (
+        layout_config.width
+        if isinstance(layout_config.width, int)
+        else MAXIMUM_CONTENT_WIDTH
+    )
+
+
 def _ensure_image_size_and_format(
     image_data: bytes, layout_config: LayoutConfig, image_format: ImageFormat
 ) -> bytes:
@@ -188,11 +206,7 @@ def _ensure_image_size_and_format(
     pil_image: PILImage = Image.open(io.BytesIO(image_data))
     actual_width, actual_height = pil_image.size
 
-    target_width = (
-        layout_config.width
-        if isinstance(layout_config.width, int)
-        else MAXIMUM_CONTENT_WIDTH
-    )
+    target_width = _get_target_width(layout_config)
 
     # Resizing the image down if the embedded width is greater than
     # the target width.
@@ -234,6 +248,104 @@ def _clip_image(image: npt.NDArray[Any], clamp: bool) -> npt.NDArray[Any]:
     return data
 
 
+class _EncodedImages:
+    """Remembers the media files that images were encoded to, so that an
+    unchanged image doesn't have to be encoded, resized and hashed again on
+    every rerun.
+
+    Images are identified by a fingerprint of their pixels or bytes, so an
+    image that is mutated in place is encoded again. The least recently used
+    entries are forgotten when there are more than `_MAX_ENCODED_IMAGES`.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._file_ids: OrderedDict[str, str] = OrderedDict()
+
+    def get_url(self, key: str, image_id: str) -> str | None:
+        """Return the URL of the media file an image was encoded to, and
+        register the current session as its user. Return None if the image
+        wasn't encoded before, or if its media file was removed.
+        """
+        with self._lock:
+            file_id = self._file_ids.get(key)
+            if file_id is None:
+                return None
+            self._file_ids.move_to_end(key)
+
+        url = runtime.get_instance().media_file_mgr.add_existing(file_id, image_id)
+        if url is None:
+            with self._lock:
+                self._file_ids.pop(key, None)
+        return url
+
+    def add(self, key: str, image_id: str) -> None:
+        """Remember the media file that an image was just encoded to."""
+        file_id = runtime.get_instance().media_file_mgr.get_file_id(image_id)
+        if file_id is None:
+            return
+        with self._lock:
+            self._file_ids[key] = file_id
+            self._file_ids.move_to_end(key)
+            while len(self._file_ids) > _MAX_ENCODED_IMAGES:
+                self._file_ids.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._file_ids.clear()
+
+
+_encoded_images = _EncodedImages()
+
+
+def _get_encoded_image_key(
+    image: AtomicImage,
+    layout_config: LayoutConfig,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+) -> str | None:
+    """Return a key that identifies how an image is encoded, made of a
+    fingerprint of the image and the parameters that affect its encoding.
+    Return None if the image can't be fingerprinted.
+
+    Hashing the pixels of an image is much cheaper than encoding it.
+    """
+    import numpy as np
+    from PIL import Image, ImageFile
+
+    target_width = _get_target_width(layout_config)
+    h = hashlib.new("md5", usedforsecurity=False)
+    h.update(f"{target_width}:{clamp}:{channels}:{output_format}".encode())
+
+    if isinstance(image, (ImageFile.ImageFile, Image.Image)):
+        h.update(
+            f"PIL:{image.mode}:{image.size}:{image.format}:{image.tell()}:"
+            f"{image.info!r}".encode()
+        )
+        palette = image.getpalette()
+        if palette is not None:
+            h.update(bytes(palette))
+        h.update(image.tobytes())
+    elif isinstance(image, io.BytesIO):
+        h.update(b"bytes:")
+        h.update(_bytesio_to_bytes(image))
+    elif isinstance(image, np.ndarray):
+        if image.dtype.hasobject:
+            return None
+        h.update(f"ndarray:{image.dtype.str}:{image.shape}".encode())
+        h.update(np.ascontiguousarray(image).data)
+    elif isinstance(image, bytes):
+        h.update(b"bytes:")
+        h.update(image)
+    else:
+        return None
+
+    return h.hexdigest()
+
+
 def image_to_url(
     image: AtomicImage,
     layout_config: LayoutConfig,
@@ -289,7 +401,7 @@ def image_to_url(
         # Otherwise, try to open it as a file.
         try:
             with open(image, "rb") as f:
-                image_data = f.read()
+                image = f.read()
         except Exception:
             # When we aren't able to open the image file, we still pass the path to
             # the MediaFileManager - its storage backend may have access to files
@@ -304,8 +416,20 @@ def image_to_url(
             caching.save_media_data(image, mimetype, image_id)
             return url
 
+    # Media files of images displayed by cached functions must be recorded
+    # with their content, so they are only looked up in regular script code.
+    encoded_image_key = None
+    if runtime.exists() and not in_cached_function.get():
+        encoded_image_key = _get_encoded_image_key(
+            image, layout_config, clamp, channels, output_format
+        )
+        if encoded_image_key is not None:
+            url = _encoded_images.get_url(encoded_image_key, image_id)
+            if url is not None:
+                return url
+
     # PIL Images
-    elif isinstance(image, (ImageFile.ImageFile, Image.Image)):
+    if isinstance(image, (ImageFile.ImageFile, Image.Image)):
         img_format = _validate_image_format_string(image, output_format)
         image_data = _pil_to_bytes(image, img_format)
 
@@ -330,7 +454,7 @@ def image_to_url(
 
         image_data = _np_array_to_bytes(array=image, output_format=output_format)
 
-    # Raw bytes
+    # Raw bytes, and the content of image files
     else:
         image_data = image
 
@@ -342,6 +466,8 @@ def image_to_url(
     if runtime.exists():
         url = runtime.get_instance().media_file_mgr.add(image_data, mimetype, image_id)
         caching.save_media_data(image_data, mimetype, image_id)
+        if encoded_image_key is not None:
+            _encoded_images.add(encoded_image_key, image_id)
         return url
     # When running in "raw mode", we can't access the MediaFileManager.
     return ""
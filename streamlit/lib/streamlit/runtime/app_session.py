@@ -18,7 +18,9 @@ import asyncio
 import json
 import os
 import sys
+import threading
 import uuid
+from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable, Final
 
@@ -45,6 +47,7 @@ from streamlit.runtime.metrics_util import Installation
 from streamlit.runtime.pages_manager import PagesManager
 from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
 from streamlit.runtime.secrets import secrets_singleton
+from streamlit.runtime.stats import RuntimeStat, RuntimeStatsProvider
 from streamlit.string_util import to_snake_case
 from streamlit.version import STREAMLIT_VERSION_STRING
 from streamlit.watcher import LocalSourcesWatcher
@@ -53,6 +56,7 @@ if TYPE_CHECKING:
     from streamlit.proto.BackMsg_pb2 import BackMsg
     from streamlit.runtime.script_data import ScriptData
     from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.runtime.session_manager import SessionManager
     from streamlit.runtime.state import SessionState
     from streamlit.runtime.uploaded_file_manager import UploadedFileManager
     from streamlit.source_util import PageHash, PageInfo
@@ -453,6 +457,16 @@ class AppSession:
     def session_state(self) -> SessionState:
         return self._session_state
 
+    @property
+    def browser_queue_size(self) -> int:
+        """The number of messages waiting to be sent to the browser."""
+        return len(self._browser_queue)
+
+    @property
+    def has_scriptrunner(self) -> bool:
+        """True if a ScriptRunner thread is running this session's script."""
+        return self._scriptrunner is not None
+
     def _should_rerun_on_file_change(self, filepath: str) -> bool:
         pages = self._pages_manager.get_pages()
 
@@ -901,6 +915,55 @@ class AppSession:
             page_proto.icon = page_info["icon"]
 
 
+@dataclass
+class AppSessionStatProvider(RuntimeStatsProvider):
+    """Reports the sessions of a SessionManager, their outgoing message queues
+    and the threads running their scripts.
+    """
+
+    _session_mgr: SessionManager
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        sessions = [info.session for info in self._session_mgr.list_sessions()]
+        return [
+            RuntimeStat(
+                "sessions",
+                "gauge",
+                (),
+                len(sessions),
+                help="Sessions, including disconnected ones that may reconnect.",
+            ),
+            RuntimeStat(
+                "active_sessions",
+                "gauge",
+                (),
+                self._session_mgr.num_active_sessions(),
+                help="Sessions connected to a browser.",
+            ),
+            RuntimeStat(
+                "forward_msg_queue_depth",
+                "gauge",
+                (),
+                sum(session.browser_queue_size for session in sessions),
+                help="Messages waiting to be sent to the browser.",
+            ),
+            RuntimeStat(
+                "script_threads",
+                "gauge",
+                (),
+                sum(session.has_scriptrunner for session in sessions),
+                help="Sessions with a thread running their script.",
+            ),
+            RuntimeStat(
+                "threads",
+                "gauge",
+                (),
+                threading.active_count(),
+                help="Threads of the server process.",
+            ),
+        ]
+
+
 # Config.ToolbarMode.ValueType does not exist at runtime (only in the pyi stubs), so
 # we need to use quotes.
 # This field will be available at runtime as of protobuf 3.20.1, but
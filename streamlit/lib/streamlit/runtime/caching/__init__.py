@@ -27,6 +27,8 @@ from streamlit.runtime.caching.cache_resource_api import (
     CacheResourceAPI,
     get_resource_cache_stats_provider,
 )
+from streamlit.runtime.caching.cache_utils import get_cache_call_stats_provider
+from streamlit.runtime.caching.hashing import get_hash_stats_provider
 from streamlit.runtime.caching.legacy_cache_api import cache as _cache
 
 if TYPE_CHECKING:
@@ -102,7 +104,9 @@ __all__ = [
     "cache",
     "cache_data",
     "cache_resource",
+    "get_cache_call_stats_provider",
     "get_data_cache_stats_provider",
+    "get_hash_stats_provider",
     "get_resource_cache_stats_provider",
     "save_block_message",
     "save_element_message",
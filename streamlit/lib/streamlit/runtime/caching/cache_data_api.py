@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import pickle
+import struct
 import threading
 from typing import (
     TYPE_CHECKING,
@@ -77,6 +78,13 @@ CACHE_DATA_MESSAGE_REPLAY_CTX = CachedMessageReplayContext(CacheType.DATA)
 # The cache persistence options we support: "disk" or None
 CachePersistType: TypeAlias = Union[Literal["disk"], None]
 
+# Prefix of the entries written by caches that don't copy their values
+# (`copy=False`). Pickles always start with the PROTO opcode (0x80), so
+# they can't be mistaken for these entries.
+_SHARED_ENTRY_MAGIC: Final = b"STSHARED"
+# Alignment of the out-of-band buffers within a shared entry
+_SHARED_BUFFER_ALIGNMENT: Final = 64
+
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -88,6 +96,7 @@ class CachedDataFuncInfo(CachedFuncInfo[P, R]):
     persist: CachePersistType
     max_entries: int | None
     ttl: float | timedelta | str | None
+    copy: bool
 
     def __init__(
         self,
@@ -98,6 +107,8 @@ class CachedDataFuncInfo(CachedFuncInfo[P, R]):
         show_spinner: bool | str,
         show_time: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        *,
+        copy: bool = True,
     ) -> None:
         super().__init__(
             func,
@@ -108,6 +119,7 @@ class CachedDataFuncInfo(CachedFuncInfo[P, R]):
         self.persist = persist
         self.max_entries = max_entries
         self.ttl = ttl
+        self.copy = copy
 
         self.validate_params()
 
@@ -131,6 +143,7 @@ class CachedDataFuncInfo(CachedFuncInfo[P, R]):
             max_entries=self.max_entries,
             ttl=self.ttl,
             display_name=self.display_name,
+            copy=self.copy,
         )
 
     def validate_params(self) -> None:
@@ -162,6 +175,8 @@ class DataCaches(CacheStatsProvider):
         max_entries: int | None,
         ttl: int | float | timedelta | str | None,
         display_name: str,
+        *,
+        copy: bool = True,
     ) -> DataCache[Any]:
         """Return the mem cache for the given key.
 
@@ -179,6 +194,7 @@ class DataCaches(CacheStatsProvider):
                 and cache.ttl_seconds == ttl_seconds
                 and cache.max_entries == max_entries
                 and cache.persist == persist
+                and cache.copy == copy
             ):
                 return cache
 
@@ -186,22 +202,25 @@ class DataCaches(CacheStatsProvider):
             if cache is not None:
                 _LOGGER.debug(
                     "Closing existing DataCache storage "
-                    "(key=%s, persist=%s, max_entries=%s, ttl=%s) "
+                    "(key=%s, persist=%s, max_entries=%s, ttl=%s, copy=%s) "
                     "before creating new one with different params",
                     key,
                     persist,
                     max_entries,
                     ttl,
+                    copy,
                 )
                 cache.storage.close()
 
             # Create a new cache object and put it in our dict
             _LOGGER.debug(
-                "Creating new DataCache (key=%s, persist=%s, max_entries=%s, ttl=%s)",
+                "Creating new DataCache "
+                "(key=%s, persist=%s, max_entries=%s, ttl=%s, copy=%s)",
                 key,
                 persist,
                 max_entries,
                 ttl,
+                copy,
             )
 
             cache_context = self.create_cache_storage_context(
@@ -221,6 +240,7 @@ class DataCaches(CacheStatsProvider):
                 max_entries=max_entries,
                 ttl_seconds=ttl_seconds,
                 display_name=display_name,
+                copy=copy,
             )
             self._function_caches[key] = cache
             return cache
@@ -358,6 +378,7 @@ class CacheDataAPI:
         show_time: bool = False,
         persist: CachePersistType | bool = None,
         hash_funcs: HashFuncsDict | None = None,
+        copy: bool = True,
     ) -> Callable[[Callable[P, R]], CachedFunc[P, R]]: ...
 
     def __call__(
@@ -370,6 +391,7 @@ class CacheDataAPI:
         show_time: bool = False,
         persist: CachePersistType | bool = None,
         hash_funcs: HashFuncsDict | None = None,
+        copy: bool = True,
     ) -> CachedFunc[P, R] | Callable[[Callable[P, R]], CachedFunc[P, R]]:
         return self._decorator(
             func,
@@ -379,6 +401,7 @@ class CacheDataAPI:
             show_spinner=show_spinner,
             show_time=show_time,
             hash_funcs=hash_funcs,
+            copy=copy,
         )
 
     def _decorator(
@@ -391,6 +414,7 @@ class CacheDataAPI:
         show_time: bool = False,
         persist: CachePersistType | bool,
         hash_funcs: HashFuncsDict | None = None,
+        copy: bool = True,
     ) -> CachedFunc[P, R] | Callable[[Callable[P, R]], CachedFunc[P, R]]:
         """Decorator to cache functions that return data (e.g. dataframe transforms, database queries, ML inference).
 
@@ -472,6 +496,16 @@ class CacheDataAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        copy : bool
+            Whether each caller gets its own copy of the cached data. If this
+            is ``True`` (default), the cached value is unpickled for each
+            caller. If this is ``False``, the data buffers of NumPy arrays,
+            pandas DataFrames, Arrow tables, and other values supporting pickle
+            protocol 5 are shared by all callers instead of copied: they are
+            read-only views of a single in-memory copy. Use this to serve large
+            datasets to many sessions without duplicating them. Copy the
+            returned value before modifying it in place.
+
         Example
         -------
         >>> import streamlit as st
@@ -586,6 +620,7 @@ class CacheDataAPI:
                     max_entries=max_entries,
                     ttl=ttl,
                     hash_funcs=hash_funcs,
+                    copy=copy,
                 )
             )
 
@@ -601,6 +636,7 @@ class CacheDataAPI:
                 max_entries=max_entries,
                 ttl=ttl,
                 hash_funcs=hash_funcs,
+                copy=copy,
             )
         )
 
@@ -621,6 +657,8 @@ class DataCache(Cache[R]):
         max_entries: int | None,
         ttl_seconds: float | None,
         display_name: str,
+        *,
+        copy: bool = True,
     ) -> None:
         super().__init__()
         self.key = key
@@ -629,6 +667,7 @@ class DataCache(Cache[R]):
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
         self.persist = persist
+        self.copy = copy
 
     def get_stats(self) -> list[CacheStat]:
         if isinstance(self.storage, CacheStatsProvider):
@@ -648,14 +687,17 @@ class DataCache(Cache[R]):
             raise CacheError(str(e)) from e
 
         try:
-            entry = pickle.loads(pickled_entry)  # noqa: S301
+            if pickled_entry.startswith(_SHARED_ENTRY_MAGIC):
+                entry = _loads_shared(pickled_entry)
+            else:
+                entry = pickle.loads(pickled_entry)  # noqa: S301
             if not isinstance(entry, CachedResult):
                 # Loaded an old cache file format, remove it and let the caller
                 # rerun the function.
                 self.storage.delete(key)
                 raise CacheKeyNotFoundError()
             return entry
-        except pickle.UnpicklingError as exc:
+        except (pickle.UnpicklingError, struct.error) as exc:
             raise CacheError(f"Failed to unpickle {key}") from exc
 
     @gather_metrics("_cache_data_object")
@@ -667,7 +709,10 @@ class DataCache(Cache[R]):
             main_id = st._main.id
             sidebar_id = st.sidebar.id
             entry = CachedResult(value, messages, main_id, sidebar_id)
-            pickled_entry = pickle.dumps(entry)
+            if self.copy:
+                pickled_entry = pickle.dumps(entry)
+            else:
+                pickled_entry = _dumps_shared(entry)
         except (pickle.PicklingError, TypeError) as exc:
             raise CacheError(f"Failed to pickle {key}") from exc
         self.storage.set(key, pickled_entry)
@@ -677,3 +722,52 @@ class DataCache(Cache[R]):
             self.storage.clear()
         else:
             self.storage.delete(key)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _SHARED_BUFFER_ALIGNMENT) * _SHARED_BUFFER_ALIGNMENT
+
+
+def _dumps_shared(entry: CachedResult[Any]) -> bytes:
+    """Pickle an entry, keeping the data buffers of its value out-of-band.
+
+    The entry is laid out as the magic prefix, the number of out-of-band
+    buffers, the size of the pickle and of each buffer, then the pickle and the
+    buffers themselves, each starting at an aligned offset. Reading it back with
+    `_loads_shared` makes the buffers views of the entry bytes instead of copies.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    segments: list[bytes | memoryview] = [
+        pickle.dumps(entry, protocol=5, buffer_callback=buffers.append)
+    ]
+    segments.extend(buffer.raw() for buffer in buffers)
+    header = struct.pack(f"<{len(segments) + 1}Q", len(buffers), *map(len, segments))
+
+    parts: list[bytes | memoryview] = [_SHARED_ENTRY_MAGIC, header]
+    offset = len(_SHARED_ENTRY_MAGIC) + len(header)
+    for segment in segments:
+        padding = _align(offset) - offset
+        parts.extend((bytes(padding), segment))
+        offset += padding + len(segment)
+    return b"".join(parts)
+
+
+def _loads_shared(data: bytes) -> Any:
+    """Unpickle an entry written by `_dumps_shared`.
+
+    The out-of-band buffers are read-only views of `data`, so the arrays of the
+    returned value share their memory with the cached entry.
+    """
+    offset = len(_SHARED_ENTRY_MAGIC)
+    (buffer_count,) = struct.unpack_from("<Q", data, offset)
+    offset += 8
+    sizes = struct.unpack_from(f"<{buffer_count + 1}Q", data, offset)
+    offset += 8 * (buffer_count + 1)
+
+    view = memoryview(data)
+    segments = []
+    for size in sizes:
+        offset = _align(offset)
+        segments.append(view[offset : offset + size])
+        offset += size
+    return pickle.loads(segments[0], buffers=segments[1:])  # noqa: S301
@@ -47,14 +47,16 @@ from streamlit.runtime.caching.cached_message_replay import (
     CachedResult,
     MsgData,
 )
+from streamlit.runtime.memory_estimate import estimate_size
 from streamlit.runtime.metrics_util import gather_metrics
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import CacheStat, DeepCacheStatsProvider, group_stats
 from streamlit.time_util import time_to_seconds
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
     from streamlit.runtime.caching.hashing import HashFuncsDict
+    from streamlit.runtime.stats import CacheStatsProvider
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -73,7 +75,7 @@ def _equal_validate_funcs(a: ValidateFunc | None, b: ValidateFunc | None) -> boo
     return (a is None and b is None) or (a is not None and b is not None)
 
 
-class ResourceCaches(CacheStatsProvider):
+class ResourceCaches(DeepCacheStatsProvider):
     """Manages all ResourceCache instances."""
 
     def __init__(self) -> None:
@@ -137,6 +139,15 @@ class ResourceCaches(CacheStatsProvider):
             stats.extend(cache.get_stats())
         return group_stats(stats)
 
+    def get_deep_stats(self) -> list[CacheStat]:
+        with self._caches_lock:
+            function_caches = self._function_caches.copy()
+
+        stats: list[CacheStat] = []
+        for cache in function_caches.values():
+            stats.extend(cache.get_deep_stats())
+        return group_stats(stats)
+
 
 # Singleton ResourceCaches instance
 _resource_caches = ResourceCaches()
@@ -492,6 +503,10 @@ class ResourceCache(Cache[R]):
             maxsize=max_entries, ttl=ttl_seconds, timer=cache_utils.TTLCACHE_TIMER
         )
         self._mem_cache_lock = threading.Lock()
+        # The estimated size of each entry, with the id of the entry it was
+        # estimated for. Updated when stats are requested, so that only new
+        # entries are estimated.
+        self._entry_sizes: dict[str, tuple[int, int]] = {}
         self.validate = validate
 
     @property
@@ -526,17 +541,50 @@ class ResourceCache(Cache[R]):
         main_id = st._main.id
         sidebar_id = st.sidebar.id
 
+        result = CachedResult(value, messages, main_id, sidebar_id)
         with self._mem_cache_lock:
-            self._mem_cache[key] = CachedResult(value, messages, main_id, sidebar_id)
+            self._mem_cache[key] = result
 
     def _clear(self, key: str | None = None) -> None:
         with self._mem_cache_lock:
             if key is None:
                 self._mem_cache.clear()
+                self._entry_sizes.clear()
             elif key in self._mem_cache:
                 del self._mem_cache[key]
 
     def get_stats(self) -> list[CacheStat]:
+        """Return the estimated size of each entry."""
+        # Estimating sizes is done outside of the lock, so that it doesn't
+        # block the cached function.
+        with self._mem_cache_lock:
+            entries = list(self._mem_cache.items())
+            previous_sizes = self._entry_sizes
+
+        # Entries that the cache evicted or expired are forgotten.
+        entry_sizes: dict[str, tuple[int, int]] = {}
+        for key, result in entries:
+            entry_size = previous_sizes.get(key)
+            if entry_size is None or entry_size[0] != id(result):
+                entry_size = (id(result), estimate_size(result))
+            entry_sizes[key] = entry_size
+
+        with self._mem_cache_lock:
+            self._entry_sizes = entry_sizes
+
+        return [
+            CacheStat(
+                category_name="st_cache_resource",
+                cache_name=self.display_name,
+                byte_length=size,
+            )
+            for _, size in entry_sizes.values()
+        ]
+
+    def get_deep_stats(self) -> list[CacheStat]:
+        """Return the size of each entry, measured by walking all objects it
+        references.
+        """
         # Shallow clone our cache. Computing item sizes is potentially
         # expensive, and we want to minimize the time we spend holding
         # the lock.
@@ -47,10 +47,11 @@ from streamlit.runtime.caching.cached_message_replay import (
     MsgData,
     replay_cached_messages,
 )
-from streamlit.runtime.caching.hashing import HashFuncsDict, update_hash
+from streamlit.runtime.caching.hashing import HashFuncsDict, hash_stats, update_hash
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
     in_cached_function,
 )
+from streamlit.runtime.stats import RuntimeStat, RuntimeStatsProvider
 
 if TYPE_CHECKING:
     import types
@@ -68,6 +69,83 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+class _CacheCallStats(RuntimeStatsProvider):
+    """Hits, misses and the time spent computing missed values of each cached
+    function.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits: dict[tuple[str, str], int] = defaultdict(int)
+        self._misses: dict[tuple[str, str], int] = defaultdict(int)
+        self._compute_seconds: dict[tuple[str, str], float] = defaultdict(float)
+
+    def record_hit(self, cache_type: CacheType, cache_name: str) -> None:
+        key = (f"st_cache_{cache_type.value.lower()}", cache_name)
+        with self._lock:
+            self._hits[key] += 1
+
+    def record_miss(
+        self, cache_type: CacheType, cache_name: str, compute_seconds: float
+    ) -> None:
+        """Record a call that computed its value, and the time spent calling
+        the function.
+        """
+        key = (f"st_cache_{cache_type.value.lower()}", cache_name)
+        with self._lock:
+            self._misses[key] += 1
+            self._compute_seconds[key] += compute_seconds
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        families = [
+            ("cache_hits", self._hits, "Calls to a cached function that hit.", ""),
+            (
+                "cache_misses",
+                self._misses,
+                "Calls to a cached function that computed a new value.",
+                "",
+            ),
+            (
+                "cache_compute_seconds",
+                self._compute_seconds,
+                "Time spent computing the values of a cached function.",
+                "seconds",
+            ),
+        ]
+
+        stats: list[RuntimeStat] = []
+        with self._lock:
+            for family_name, values, help_text, unit in families:
+                stats.extend(
+                    RuntimeStat(
+                        family_name,
+                        "counter",
+                        (("cache_type", category_name), ("cache", cache_name)),
+                        value,
+                        help=help_text,
+                        unit=unit,
+                    )
+                    for (category_name, cache_name), value in values.items()
+                )
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+            self._compute_seconds.clear()
+
+
+cache_call_stats = _CacheCallStats()
+
+
+def get_cache_call_stats_provider() -> RuntimeStatsProvider:
+    """Return the RuntimeStatsProvider for cached function hits and misses."""
+    return cache_call_stats
+
+
 class Cache(Generic[R]):
     """Function cache interface. Caches persist across script runs."""
 
@@ -200,6 +278,7 @@ class CachedFunc(Generic[P, R]):  # ty: ignore[invalid-argument-type]
     def __init__(self, info: CachedFuncInfo[P, R]) -> None:
         self._info = info
         self._function_key = _make_function_key(info.cache_type, info.func)
+        self._stats_name = f"{info.func.__module__}.{info.func.__qualname__}"
 
     def __repr__(self) -> str:
         return f"<CachedFunc: {self._info.func}>"
@@ -272,6 +351,7 @@ class CachedFunc(Generic[P, R]):  # ty: ignore[invalid-argument-type]
         """Handle a cache hit: replay the result's cached messages, and return its
         value.
         """
+        cache_call_stats.record_hit(self._info.cache_type, self._stats_name)
         replay_cached_messages(
             result,
             self._info.cache_type,
@@ -322,10 +402,16 @@ class CachedFunc(Generic[P, R]):  # ty: ignore[invalid-argument-type]
                 pass
 
             # We acquired the lock before any other thread. Compute the value!
+            start_time = time.perf_counter()
             with self._info.cached_message_replay_ctx.calling_cached_function(
                 self._info.func
             ):
                 computed_value = self._info.func(*func_args, **func_kwargs)
+            cache_call_stats.record_miss(
+                self._info.cache_type,
+                self._stats_name,
+                time.perf_counter() - start_time,
+            )
 
             # We've computed our value, and now we need to write it back to the cache
             # along with any "replay messages" that were generated during value computation.
@@ -449,6 +535,7 @@ def _make_value_key(
     # starts with "_". (Underscore-prefixed args are deliberately excluded from
     # hashing.)
     args_hasher = hashlib.new("md5", usedforsecurity=False)
+    start_time = time.perf_counter()
     for arg_name, arg_value in arg_pairs:
         if arg_name is not None and arg_name.startswith("_"):
             _LOGGER.debug("Not hashing %s because it starts with _", arg_name)
@@ -474,6 +561,12 @@ def _make_value_key(
         except UnhashableTypeError as exc:
             raise UnhashableParamError(cache_type, func, arg_name, arg_value, exc)
 
+    hash_stats.record(
+        cache_type,
+        f"{func.__module__}.{func.__qualname__}",
+        time.perf_counter() - start_time,
+    )
+
     value_key = args_hasher.hexdigest()
     _LOGGER.debug("Cache key: %s", value_key)
 
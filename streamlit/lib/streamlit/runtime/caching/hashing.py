@@ -42,6 +42,7 @@ from streamlit import logger, type_util, util
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.caching.cache_errors import UnhashableTypeError
 from streamlit.runtime.caching.cache_type import CacheType
+from streamlit.runtime.stats import RuntimeStat, RuntimeStatsProvider
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
 if TYPE_CHECKING:
@@ -59,6 +60,10 @@ _PANDAS_SAMPLE_SIZE: Final = 10_000
 _NP_SIZE_LARGE: Final = 500_000
 _NP_SAMPLE_SIZE: Final = 100_000
 
+# Large objects whose data can't be modified in place (e.g. read-only arrays
+# returned by `@st.cache_data(copy=False)`) aren't sampled. They are hashed in
+# full once, and their hash is memoized by identity, see `_HashMemo`.
+
 HashFuncsDict: TypeAlias = dict[Union[str, type[Any]], Callable[[Any], Any]]
 
 # Arbitrary item to denote where we found a cycle in a hashed object.
@@ -237,6 +242,214 @@ class _HashStacks:
 hash_stacks = _HashStacks()
 
 
+def _is_read_only(arr: npt.NDArray[Any]) -> bool:
+    """Return True if the data of a NumPy array can't be modified in place,
+    neither through the array nor through any array it is a view of.
+    """
+    import numpy as np
+
+    base: Any = arr
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return False
+        base = base.base
+
+    if base is None:
+        return True
+
+    # The array is a view of another buffer, e.g. the bytes it was unpickled from.
+    try:
+        return memoryview(base).readonly
+    except TypeError:
+        return False
+
+
+def _immutable_data_stamp(obj: Any) -> tuple[Any, ...] | None:
+    """Return a stamp identifying the data of a large NumPy array or pandas
+    object whose data can't be modified in place, or None for other objects.
+
+    The data of such an object only changes if parts of it are replaced, which
+    changes the stamp.
+    """
+    if type_util.is_type(obj, "numpy.ndarray"):
+        np_obj: npt.NDArray[Any] = cast("npt.NDArray[Any]", obj)
+        if (
+            np_obj.size < _NP_SIZE_LARGE
+            or np_obj.dtype.hasobject
+            or not _is_read_only(np_obj)
+        ):
+            return None
+        return (
+            np_obj.shape,
+            np_obj.strides,
+            str(np_obj.dtype),
+            np_obj.__array_interface__["data"][0],
+        )
+
+    if type_util.is_type(obj, "pandas.core.series.Series"):
+        series_obj: pd.Series = cast("pd.Series", obj)
+        if len(series_obj) < _PANDAS_ROWS_LARGE:
+            return None
+        columns = [series_obj.to_numpy()]
+    elif type_util.is_type(obj, "pandas.core.frame.DataFrame"):
+        df_obj: pd.DataFrame = cast("pd.DataFrame", obj)
+        if len(df_obj) < _PANDAS_ROWS_LARGE:
+            return None
+        columns = [column.to_numpy() for _, column in df_obj.items()]
+    else:
+        return None
+
+    # Columns backed by extension arrays are copied by `to_numpy`, so they
+    # are never read-only.
+    if not all(_is_read_only(column) for column in columns):
+        return None
+
+    return (
+        obj.shape,
+        id(obj.index),
+        id(getattr(obj, "columns", None)),
+        tuple(str(column.dtype) for column in columns),
+        tuple(column.__array_interface__["data"][0] for column in columns),
+    )
+
+
+class _HashMemo:
+    """Process-wide memo of the hashes of objects whose data can't change.
+
+    Entries are keyed by the identity of the object and are only valid while
+    its stamp (see `_immutable_data_stamp`) is unchanged. They are evicted when
+    the object is garbage collected.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref[Any], tuple[Any, ...], bytes]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, obj: Any, stamp: tuple[Any, ...]) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(id(obj))
+            if entry is not None and entry[0]() is obj and entry[1] == stamp:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            return None
+
+    def set(self, obj: Any, stamp: tuple[Any, ...], value: bytes) -> None:
+        key = id(obj)
+        try:
+            ref = weakref.ref(obj, functools.partial(self._evict, key))
+        except TypeError:
+            return
+
+        with self._lock:
+            self._entries[key] = (ref, stamp, value)
+
+    def _evict(self, key: int, ref: weakref.ref[Any]) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+hash_memo = _HashMemo()
+
+
+class _HashStats(RuntimeStatsProvider):
+    """Time spent hashing the arguments of each cached function, and the
+    usage of the hash memo.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seconds: dict[tuple[str, str], float] = collections.defaultdict(float)
+        self._calls: dict[tuple[str, str], int] = collections.defaultdict(int)
+
+    def record(self, cache_type: CacheType, cache_name: str, seconds: float) -> None:
+        """Record the time spent hashing the arguments of a call to a cached
+        function.
+        """
+        key = (f"st_cache_{cache_type.value.lower()}", cache_name)
+        with self._lock:
+            self._seconds[key] += seconds
+            self._calls[key] += 1
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        with self._lock:
+            seconds = dict(self._seconds)
+            calls = dict(self._calls)
+
+        stats: list[RuntimeStat] = []
+        for (category_name, cache_name), value in seconds.items():
+            labels = (("cache_type", category_name), ("cache", cache_name))
+            stats.append(
+                RuntimeStat(
+                    "cache_hash_seconds",
+                    "counter",
+                    labels,
+                    value,
+                    help="Time spent hashing the arguments of a cached function.",
+                    unit="seconds",
+                )
+            )
+            stats.append(
+                RuntimeStat(
+                    "cache_hash_calls",
+                    "counter",
+                    labels,
+                    calls[(category_name, cache_name)],
+                    help="Calls to a cached function whose arguments were hashed.",
+                )
+            )
+
+        stats.append(
+            RuntimeStat(
+                "cache_hash_memo_hits",
+                "counter",
+                (),
+                hash_memo.hits,
+                help="Arguments whose hash was found in the hash memo.",
+            )
+        )
+        stats.append(
+            RuntimeStat(
+                "cache_hash_memo_misses",
+                "counter",
+                (),
+                hash_memo.misses,
+                help="Immutable arguments that were hashed and added to the hash memo.",
+            )
+        )
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._seconds.clear()
+            self._calls.clear()
+
+
+hash_stats = _HashStats()
+
+
+def get_hash_stats_provider() -> RuntimeStatsProvider:
+    """Return the RuntimeStatsProvider for argument hashing."""
+    return hash_stats
+
+
 def _int_to_bytes(i: int) -> bytes:
     num_bytes = (i.bit_length() + 8) // 8
     return i.to_bytes(num_bytes, "little", signed=True)
@@ -416,6 +629,17 @@ class _CacheFuncHasher:
         if isinstance(obj, Enum):
             return str(obj).encode()
 
+        # Large arrays and frames that can't change are hashed in full, once.
+        stamp = _immutable_data_stamp(obj)
+        if stamp is not None:
+            memoized = hash_memo.get(obj, stamp)
+            if memoized is None:
+                memoized = self._immutable_data_to_bytes(obj)
+                if memoized is not None:
+                    hash_memo.set(obj, stamp, memoized)
+            if memoized is not None:
+                return memoized
+
         if type_util.is_type(obj, "pandas.core.series.Series"):
             from pandas.util import hash_pandas_object
 
@@ -651,6 +875,36 @@ class _CacheFuncHasher:
                 self.update(h, item)
             return h.digest()
 
+    def _immutable_data_to_bytes(self, obj: Any) -> bytes | None:
+        """Hash all the data of an object that `_immutable_data_stamp` accepts.
+
+        Return None if pandas cannot hash the object.
+        """
+        h = hashlib.new("md5", usedforsecurity=False)
+
+        if type_util.is_type(obj, "numpy.ndarray"):
+            import numpy as np
+
+            np_obj: npt.NDArray[Any] = cast("npt.NDArray[Any]", obj)
+            self.update(h, np_obj.shape)
+            self.update(h, str(np_obj.dtype))
+            h.update(np.ascontiguousarray(np_obj).view(np.uint8))
+            return h.digest()
+
+        from pandas.util import hash_pandas_object
+
+        try:
+            if type_util.is_type(obj, "pandas.core.series.Series"):
+                self.update(h, obj.size)
+                self.update(h, obj.dtype.name)
+            else:
+                self.update(h, obj.shape)
+                self.update(h, self.to_bytes(hash_pandas_object(obj.dtypes)))
+            h.update(hash_pandas_object(obj).to_numpy())
+            return h.digest()
+        except TypeError:
+            return None
+
 
 class NoResult:
     """Placeholder class for return values when None is meaningful."""
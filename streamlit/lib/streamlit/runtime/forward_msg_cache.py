@@ -14,14 +14,251 @@
 
 from __future__ import annotations
 
+import collections
+import hashlib
+import threading
+import time
 from typing import Final
 
-from streamlit import config, util
+from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.stats import RuntimeStat, RuntimeStatsProvider
 
 _LOGGER: Final = get_logger(__name__)
 
+# The total size of the serialized bodies kept for messages that aren't in a
+# ForwardMsgQueue. Above it, the oldest bodies are dropped and their messages
+# are serialized again when they are sent.
+_MAX_PENDING_BODIES_BYTES: Final = 256 * 1024 * 1024
+
+# The time after which a body that wasn't claimed by a ForwardMsgQueue or sent
+# is dropped, e.g. the body of a message from a script run that was stopped
+# before the message was enqueued.
+_PENDING_BODY_TTL_SECONDS: Final = 10.0
+
+
+class _PendingBodies:
+    """The serialized bodies of hashed ForwardMsgs on their way to or from a
+    ForwardMsgQueue, keyed by hash.
+
+    A message's body is its serialization without its hash and metadata, which
+    is computed anyway to hash the message. Sending the message only needs to
+    append the serialized hash and metadata to it, see
+    `serialize_with_pending_body`.
+
+    Bodies are only kept here between hashing a message and enqueueing it, and
+    between flushing it from its queue and sending it. While the message is
+    queued, its body is kept by the queue, and freed with it. Since messages
+    with the same hash have the same body, each body is kept until every
+    message with its hash was claimed, sent or dropped, or until it expires.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        # msg_hash -> (body, number of pending messages, time it was added)
+        self._bodies: collections.OrderedDict[str, tuple[bytes, int, float]] = (
+            collections.OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def add(self, msg_hash: str, body: bytes) -> None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._bodies.get(msg_hash)
+            if entry is not None:
+                existing_body, pending, _ = entry
+                self._bodies[msg_hash] = (existing_body, pending + 1, now)
+                self._bodies.move_to_end(msg_hash)
+            else:
+                self._bodies[msg_hash] = (body, 1, now)
+                self._size += len(body)
+
+            # Bodies are ordered from the least recently added.
+            while self._bodies and (
+                self._size > _MAX_PENDING_BODIES_BYTES
+                or self._is_expired(next(iter(self._bodies.values())), now)
+            ):
+                _, (evicted, _, _) = self._bodies.popitem(last=False)
+                self._size -= len(evicted)
+
+    @staticmethod
+    def _is_expired(entry: tuple[bytes, int, float], now: float) -> bool:
+        return now - entry[2] >= _PENDING_BODY_TTL_SECONDS
+
+    def pop(self, msg_hash: str) -> bytes | None:
+        """Return the body of a message that is claimed, sent or dropped."""
+        with self._lock:
+            entry = self._bodies.get(msg_hash)
+            if entry is None:
+                return None
+
+            body, pending, added_at = entry
+            if pending > 1:
+                self._bodies[msg_hash] = (body, pending - 1, added_at)
+            else:
+                del self._bodies[msg_hash]
+                self._size -= len(body)
+            return body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+
+pending_bodies = _PendingBodies()
+
+
+class _ForwardMsgStats(RuntimeStatsProvider):
+    """Time spent hashing, serializing and writing ForwardMsgs, and bytes saved
+    by reference messages, by message type.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hash_seconds: dict[str, float] = collections.defaultdict(float)
+        self._serialize_seconds: dict[str, float] = collections.defaultdict(float)
+        self._write_seconds: dict[str, float] = collections.defaultdict(float)
+        self._messages: dict[str, int] = collections.defaultdict(int)
+        self._bytes: dict[str, int] = collections.defaultdict(int)
+        self._unchanged_elements: dict[str, int] = collections.defaultdict(int)
+        self._saved_bytes: dict[str, int] = collections.defaultdict(int)
+
+    def record_hash(self, msg: ForwardMsg, seconds: float) -> None:
+        with self._lock:
+            self._hash_seconds[_get_msg_type(msg)] += seconds
+
+    def record_serialize(self, msg: ForwardMsg, size: int, seconds: float) -> None:
+        msg_type = _get_msg_type(msg)
+        with self._lock:
+            self._serialize_seconds[msg_type] += seconds
+            self._messages[msg_type] += 1
+            self._bytes[msg_type] += size
+
+    def record_write(self, msg: ForwardMsg, seconds: float) -> None:
+        """Record the time spent writing a serialized message to a websocket."""
+        with self._lock:
+            self._write_seconds[_get_msg_type(msg)] += seconds
+
+    def record_unchanged_element(self, msg: ForwardMsg, saved_bytes: int) -> None:
+        """Record an element replaced by a reference message because it didn't
+        change since the previous run.
+        """
+        msg_type = _get_msg_type(msg)
+        with self._lock:
+            self._unchanged_elements[msg_type] += 1
+            self._saved_bytes[msg_type] += saved_bytes
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        families = [
+            (
+                "forward_msg_hash_seconds",
+                self._hash_seconds,
+                "Time spent hashing messages sent to the browser.",
+                "seconds",
+            ),
+            (
+                "forward_msg_serialize_seconds",
+                self._serialize_seconds,
+                "Time spent serializing messages sent to the browser.",
+                "seconds",
+            ),
+            (
+                "forward_msg_write_seconds",
+                self._write_seconds,
+                "Time spent writing messages to browser websockets.",
+                "seconds",
+            ),
+            (
+                "forward_msg_messages",
+                self._messages,
+                "Messages sent to the browser.",
+                "",
+            ),
+            (
+                "forward_msg_bytes",
+                self._bytes,
+                "Size of the messages sent to the browser.",
+                "bytes",
+            ),
+            (
+                "forward_msg_unchanged_elements",
+                self._unchanged_elements,
+                "Unchanged elements replaced by a reference message.",
+                "",
+            ),
+            (
+                "forward_msg_saved_bytes",
+                self._saved_bytes,
+                "Bytes not sent for unchanged elements.",
+                "bytes",
+            ),
+        ]
+
+        stats: list[RuntimeStat] = []
+        with self._lock:
+            for family_name, values, help_text, unit in families:
+                stats.extend(
+                    RuntimeStat(
+                        family_name,
+                        "counter",
+                        (("type", msg_type),),
+                        value,
+                        help=help_text,
+                        unit=unit,
+                    )
+                    for msg_type, value in values.items()
+                )
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hash_seconds.clear()
+            self._serialize_seconds.clear()
+            self._write_seconds.clear()
+            self._messages.clear()
+            self._bytes.clear()
+            self._unchanged_elements.clear()
+            self._saved_bytes.clear()
+
+
+forward_msg_stats = _ForwardMsgStats()
+
+
+def get_forward_msg_stats_provider() -> RuntimeStatsProvider:
+    """Return the RuntimeStatsProvider for ForwardMsg hashing and serialization."""
+    return forward_msg_stats
+
+
+def _get_msg_type(msg: ForwardMsg) -> str:
+    """Return the type of a message, including the element type for new
+    elements, e.g. "delta.new_element.arrow_data_frame".
+    """
+    msg_type = msg.WhichOneof("type") or ""
+    if msg_type != "delta":
+        return msg_type
+
+    delta_type = msg.delta.WhichOneof("type")
+    if delta_type != "new_element":
+        return f"delta.{delta_type}"
+
+    return f"delta.new_element.{msg.delta.new_element.WhichOneof('type')}"
+
+
+def _calc_hash(serialized_msg: bytes) -> str:
+    # The hash only needs to be unique, not secure. SHA-1 is computed with
+    # dedicated CPU instructions on most platforms, which makes it about twice
+    # as fast as MD5 on large messages.
+    return hashlib.sha1(serialized_msg, usedforsecurity=False).hexdigest()
+
 
 def populate_hash_if_needed(msg: ForwardMsg) -> None:
     """Computes and assigns the unique hash for a ForwardMsg.
@@ -39,33 +276,76 @@ def populate_hash_if_needed(msg: ForwardMsg) -> None:
         metadata = msg.metadata
         msg.ClearField("metadata")
 
+        start_time = time.perf_counter()
+
         # Serialize the message to bytes using the deterministic serializer to
         # ensure consistent hashing.
         serialized_msg = msg.SerializeToString(deterministic=True)
+        msg.hash = _calc_hash(serialized_msg)
 
-        # TODO(lukasmasuch): Evaluate more optimized hashing for larger messages:
-        # - Add the type element type and number of bytes to the hash.
-        # - Only hash the first N bytes of the message.
-
-        # MD5 is good enough for what we need, which is uniqueness.
-        msg.hash = util.calc_md5(serialized_msg)
+        # Keep the serialized body, so that sending the message doesn't
+        # serialize it again.
+        pending_bodies.add(msg.hash, serialized_msg)
 
         # Restore metadata.
         msg.metadata.CopyFrom(metadata)
 
+        forward_msg_stats.record_hash(msg, time.perf_counter() - start_time)
+
         # Set cacheable flag if above the min cached size and if its a `new_element`
         # delta. We only cache new_element and add_block deltas since container's
         # are not expected to be larger than a few KB and have other side-effects
         # to consider if cached. But `add_block` deltas should still get a hash.
         # In case we ever allow other delta types to be cached, we should
         # also need to adapt the composable logic in forward_msg_queue.
+        # With runner.diffElements, every element is cached so that it can be
+        # sent as a reference as long as it doesn't change.
+        min_cached_size = (
+            0
+            if config.get_option("runner.diffElements")
+            else int(config.get_option("global.minCachedMessageSize"))
+        )
         msg.metadata.cacheable = (
-            len(serialized_msg) >= int(config.get_option("global.minCachedMessageSize"))
+            len(serialized_msg) >= min_cached_size
             and msg.WhichOneof("type") == "delta"
             and msg.delta.WhichOneof("type") == "new_element"
         )
 
 
+def serialize_with_pending_body(msg: ForwardMsg) -> bytes | None:
+    """Serialize a hashed ForwardMsg by reusing the body serialized to hash it.
+
+    The fields that aren't hashed (hash, metadata and debug_last_backmsg_id)
+    are serialized and appended to the body. Protobuf parsers accept fields in
+    any order, so this is equivalent to serializing the message.
+
+    Parameters
+    ----------
+    msg : ForwardMsg
+        The message to serialize. Its content must not have changed since it
+        was hashed.
+
+    Returns
+    -------
+    bytes or None
+        The serialized message, or None if its body isn't pending anymore.
+
+    """
+    if not msg.hash:
+        return None
+
+    body = pending_bodies.pop(msg.hash)
+    if body is None:
+        return None
+
+    # The fields that aren't part of the hash, set after hashing.
+    envelope = ForwardMsg()
+    envelope.hash = msg.hash
+    envelope.metadata.CopyFrom(msg.metadata)
+    envelope.debug_last_backmsg_id = msg.debug_last_backmsg_id
+    return body + envelope.SerializeToString()
+
+
 def create_reference_msg(msg: ForwardMsg) -> ForwardMsg:
     """Create a ForwardMsg that refers to the given message via its hash.
 
@@ -94,6 +374,9 @@ def create_reference_msg(msg: ForwardMsg) -> ForwardMsg:
         # This is not expected to happen.
         return msg
 
+    # The referenced message isn't sent, so its body isn't needed anymore.
+    pending_bodies.pop(msg.hash)
+
     ref_msg = ForwardMsg()
     ref_msg.ref_hash = msg.hash
     ref_msg.metadata.CopyFrom(msg.metadata)
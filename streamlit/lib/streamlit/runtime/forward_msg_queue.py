@@ -14,9 +14,76 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any, Callable
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.forward_msg_cache import pending_bodies
+from streamlit.runtime.stats import RuntimeStat, RuntimeStatsProvider
+
+
+class _ForwardMsgQueueStats(RuntimeStatsProvider):
+    """Messages enqueued, composed away and dropped by all ForwardMsgQueues.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._enqueued = 0
+        self._composed = 0
+        self._dropped = 0
+
+    def record_enqueue(self, composed: bool) -> None:
+        with self._lock:
+            self._enqueued += 1
+            if composed:
+                self._composed += 1
+
+    def record_drop(self, count: int) -> None:
+        with self._lock:
+            self._dropped += count
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        with self._lock:
+            return [
+                RuntimeStat(
+                    "forward_msg_queue_enqueued",
+                    "counter",
+                    (),
+                    self._enqueued,
+                    help="Messages added to a session's outgoing message queue.",
+                ),
+                RuntimeStat(
+                    "forward_msg_queue_composed",
+                    "counter",
+                    (),
+                    self._composed,
+                    help="Messages that replaced a queued message for the same "
+                    "delta path.",
+                ),
+                RuntimeStat(
+                    "forward_msg_queue_dropped",
+                    "counter",
+                    (),
+                    self._dropped,
+                    help="Queued messages that were cleared before being sent.",
+                ),
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._enqueued = 0
+            self._composed = 0
+            self._dropped = 0
+
+
+forward_msg_queue_stats = _ForwardMsgQueueStats()
+
+
+def get_forward_msg_queue_stats_provider() -> RuntimeStatsProvider:
+    """Return the RuntimeStatsProvider for ForwardMsgQueue composition."""
+    return forward_msg_queue_stats
 
 
 class ForwardMsgQueue:
@@ -26,6 +93,10 @@ class ForwardMsgQueue:
     flushes all session queues and delivers their messages to the appropriate
     clients.
 
+    The queue keeps the serialized bodies of its hashed messages, see
+    `forward_msg_cache.pending_bodies`, so they are freed with the queue if
+    its messages are never sent.
+
     ForwardMsgQueue is not thread-safe - a queue should only be used from
     a single thread.
     """
@@ -49,6 +120,9 @@ class ForwardMsgQueue:
         # an older Delta, with the same delta_path, that's still in the
         # queue).
         self._delta_index_map: dict[tuple[int, ...], int] = {}
+        # A mapping of (id(msg) -> serialized body) for the hashed messages in
+        # the queue.
+        self._bodies: dict[int, bytes] = {}
 
     def get_debug(self) -> dict[str, Any]:
         from google.protobuf.json_format import MessageToDict
@@ -68,7 +142,8 @@ class ForwardMsgQueue:
             ForwardMsgQueue._before_enqueue_msg(msg)
 
         if not _is_composable_message(msg):
-            self._queue.append(msg)
+            self._append(msg)
+            forward_msg_queue_stats.record_enqueue(composed=False)
             return
 
         # If there's a Delta message with the same delta_path already in
@@ -96,13 +171,17 @@ class ForwardMsgQueue:
             old_msg = self._queue[index]
             composed_msg = _maybe_compose_delta_msgs(old_msg, msg)
             if composed_msg is not None:
+                self._bodies.pop(id(old_msg), None)
+                self._claim_body(composed_msg)
                 self._queue[index] = composed_msg
+                forward_msg_queue_stats.record_enqueue(composed=True)
                 return
 
         # No composition occurred. Append this message to the queue, and
         # store its index for potential future composition.
         self._delta_index_map[delta_key] = len(self._queue)
-        self._queue.append(msg)
+        self._append(msg)
+        forward_msg_queue_stats.record_enqueue(composed=False)
 
     def clear(
         self,
@@ -122,6 +201,7 @@ class ForwardMsgQueue:
         preserved to prevent clearing messages unrelated to the running fragments.
         """
 
+        queue = self._queue
         if not retain_lifecycle_msgs:
             self._queue = []
         else:
@@ -155,6 +235,14 @@ class ForwardMsgQueue:
                 )
             ]
 
+        # Messages that are dropped won't be sent, so their bodies are freed.
+        self._bodies = {
+            id(msg): self._bodies[id(msg)]
+            for msg in self._queue
+            if id(msg) in self._bodies
+        }
+        forward_msg_queue_stats.record_drop(len(queue) - len(self._queue))
+
         self._delta_index_map = {}
 
     def flush(self) -> list[ForwardMsg]:
@@ -162,12 +250,31 @@ class ForwardMsgQueue:
         before being cleared.
         """
         queue = self._queue
-        self.clear()
+        # Hand the bodies of the flushed messages over for them to be sent.
+        for msg in queue:
+            body = self._bodies.get(id(msg))
+            if body is not None:
+                pending_bodies.add(msg.hash, body)
+
+        self._queue = []
+        self._delta_index_map = {}
+        self._bodies = {}
         return queue
 
     def __len__(self) -> int:
         return len(self._queue)
 
+    def _append(self, msg: ForwardMsg) -> None:
+        self._claim_body(msg)
+        self._queue.append(msg)
+
+    def _claim_body(self, msg: ForwardMsg) -> None:
+        """Keep the serialized body of a hashed message while it is queued."""
+        if msg.hash:
+            body = pending_bodies.pop(msg.hash)
+            if body is not None:
+                self._bodies[id(msg)] = body
+
 
 def _is_composable_message(msg: ForwardMsg) -> bool:
     """True if the ForwardMsg is potentially composable with other ForwardMsgs."""
@@ -21,7 +21,11 @@ import threading
 from typing import Final
 
 from streamlit.logger import get_logger
-from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorage
+from streamlit.runtime.media_file_storage import (
+    MediaFileKind,
+    MediaFileStorage,
+    MediaFileStorageError,
+)
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -231,3 +235,38 @@ class MediaFileManager:
             self._files_by_session_and_coord[session_id][coordinates] = file_id
 
             return self._storage.get_url(file_id)
+
+    def get_file_id(self, coordinates: str) -> str | None:
+        """Return the ID of the file that the current session uses at the given
+        coordinates, or None if it doesn't use any.
+
+        Safe to call from any thread.
+        """
+        session_id = _get_session_id()
+
+        with self._lock:
+            return self._files_by_session_and_coord[session_id].get(coordinates)
+
+    def add_existing(self, file_id: str, coordinates: str) -> str | None:
+        """Register the current session as a user of a media file that was
+        already added, and return its URL. This skips loading and hashing the
+        file's content again.
+
+        Return None if the file doesn't exist anymore, in which case it must be
+        added again with `add`.
+
+        Safe to call from any thread.
+        """
+        session_id = _get_session_id()
+
+        with self._lock:
+            metadata = self._file_metadata.get(file_id)
+            if metadata is None or metadata.kind != MediaFileKind.MEDIA:
+                return None
+            try:
+                url = self._storage.get_url(file_id)
+            except MediaFileStorageError:
+                return None
+
+            self._files_by_session_and_coord[session_id][coordinates] = file_id
+            return url
@@ -0,0 +1,194 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fast estimates of the memory used by objects stored by Streamlit."""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import math
+import re
+import sys
+from collections import deque
+from typing import TYPE_CHECKING, Any, Final, Literal, cast
+
+from typing_extensions import TypeAlias
+
+from streamlit import type_util
+from streamlit.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    import numpy.typing as npt
+    import pandas as pd
+
+_LOGGER: Final = get_logger(__name__)
+
+# At most this many objects are measured for an estimate, however large or
+# deeply nested the object is.
+_MAX_MEASURED_OBJECTS: Final = 1024
+
+# At most this many items of a container are measured. The size of the other
+# items is extrapolated from them.
+_SAMPLED_ITEMS: Final = 64
+
+_PYARROW_DATA_TYPE_RE: Final = re.compile(
+    r"^pyarrow\.lib\.\w*(Array|Table|RecordBatch)$"
+)
+_POLARS_DATA_TYPE_RE: Final = re.compile(r"^polars\..*\.(DataFrame|Series)$")
+
+# How the objects of a type are measured.
+_Kind: TypeAlias = Literal[
+    "atomic",
+    "dict",
+    "collection",
+    "numpy",
+    "dataframe",
+    "series",
+    "arrow",
+    "polars",
+    "object",
+]
+
+
+def estimate_size(obj: object) -> int:
+    """Return an estimate of the memory used by an object, in bytes.
+
+    Unlike `asizeof`, this doesn't walk the whole object graph, so its cost
+    doesn't grow with the size of the object:
+
+    - The buffers of NumPy arrays, pandas objects, Arrow tables and arrays
+      and Polars frames are measured with the libraries' own size functions.
+    - Built-in containers and the attributes of objects are walked, but only
+      a sample of the items of large containers is measured, and at most
+      `_MAX_MEASURED_OBJECTS` objects are measured in total. Objects beyond
+      that are counted shallowly.
+
+    Objects shared by several containers are counted for each of them.
+    """
+    try:
+        return _estimate_size(obj, _MAX_MEASURED_OBJECTS)
+    except Exception:
+        # An estimate must never prevent storing a value.
+        _LOGGER.debug("Failed to estimate the size of %s", type(obj), exc_info=True)
+        return sys.getsizeof(obj, 0)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_kind(obj_type: type) -> _Kind:
+    if issubclass(obj_type, (str, bytes, bytearray, memoryview, int, float)):
+        return "atomic"
+    if issubclass(obj_type, dict):
+        return "dict"
+    if issubclass(obj_type, (list, tuple, set, frozenset, deque)):
+        return "collection"
+
+    fqn = type_util.get_fqn(obj_type)
+    if fqn == "numpy.ndarray":
+        return "numpy"
+    if fqn == "pandas.core.frame.DataFrame":
+        return "dataframe"
+    if fqn == "pandas.core.series.Series":
+        return "series"
+    if _PYARROW_DATA_TYPE_RE.match(fqn):
+        return "arrow"
+    if _POLARS_DATA_TYPE_RE.match(fqn):
+        return "polars"
+    return "object"
+
+
+def _estimate_size(obj: object, budget: int) -> int:
+    """Estimate the size of an object, measuring at most `budget` objects,
+    including the object itself.
+    """
+    kind = _get_kind(type(obj))
+
+    if kind == "numpy":
+        np_obj = cast("npt.NDArray[Any]", obj)
+        size = max(sys.getsizeof(np_obj, 0), np_obj.nbytes)
+        if np_obj.dtype.hasobject:
+            # The buffer only holds pointers to the items.
+            size += _estimate_items(np_obj.flat, np_obj.size, budget - 1)
+        return size
+
+    if kind == "dataframe":
+        df_obj = cast("pd.DataFrame", obj)
+        size = int(df_obj.memory_usage(index=True, deep=False).sum())
+        if df_obj.shape[1]:
+            column_budget = (budget - 1) // df_obj.shape[1]
+            # Columns are accessed by position, as column names may repeat.
+            for position in range(df_obj.shape[1]):
+                size += _estimate_object_column(df_obj.iloc[:, position], column_budget)
+        return size
+
+    if kind == "series":
+        series_obj = cast("pd.Series[Any]", obj)
+        size = int(series_obj.memory_usage(index=True, deep=False))
+        return size + _estimate_object_column(series_obj, budget - 1)
+
+    if kind == "arrow":
+        return int(cast("Any", obj).nbytes)
+
+    if kind == "polars":
+        return int(cast("Any", obj).estimated_size())
+
+    size = sys.getsizeof(obj, 0)
+    if kind == "atomic" or budget <= 1:
+        return size
+
+    if kind == "dict":
+        dict_obj = cast("dict[Any, Any]", obj)
+        return size + _estimate_items(
+            itertools.chain.from_iterable(dict_obj.items()),
+            2 * len(dict_obj),
+            budget - 1,
+        )
+
+    if kind == "collection":
+        collection_obj = cast("Collection[Any]", obj)
+        return size + _estimate_items(collection_obj, len(collection_obj), budget - 1)
+
+    attributes = getattr(obj, "__dict__", None)
+    if isinstance(attributes, dict):
+        # Instance dicts share their keys with other instances of the class,
+        # which makes their reported size depend on allocation history.
+        # Measure a standalone copy so equal objects get equal estimates.
+        size += _estimate_size(dict(attributes), budget - 1)
+    return size
+
+
+def _estimate_items(items: Iterable[Any], num_items: int, budget: int) -> int:
+    """Estimate the total size of `num_items` items from a sample of them,
+    measuring at most `budget` objects.
+    """
+    # Sampling fewer items when the budget is low leaves room to measure the
+    # items of nested containers too.
+    num_sampled = min(_SAMPLED_ITEMS, max(1, math.isqrt(budget)))
+    sample = list(itertools.islice(items, num_sampled))
+    if not sample:
+        return 0
+    item_budget = budget // len(sample)
+    sample_size = sum(_estimate_size(item, item_budget) for item in sample)
+    return sample_size * num_items // len(sample)
+
+
+def _estimate_object_column(column: pd.Series[Any], budget: int) -> int:
+    """Estimate the size of the Python objects referenced by a pandas column,
+    which pandas only counts as pointers without a deep memory usage.
+    """
+    if not column.dtype.hasobject or budget <= 0:
+        return 0
+    return _estimate_items(column.iloc[:_SAMPLED_ITEMS], len(column), budget)
@@ -28,7 +28,17 @@ from streamlit.runtime.media_file_storage import (
     MediaFileStorage,
     MediaFileStorageError,
 )
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    RuntimeStat,
+    RuntimeStatsProvider,
+)
+from streamlit.runtime.tiered_file_store import (
+    FileContent,
+    SpooledFileWriter,
+    TieredFileStore,
+)
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -41,8 +51,13 @@ PREFERRED_MIMETYPE_EXTENSION_MAP: Final = {
     "text/vtt": ".vtt",
 }
 
+# The size of the chunks in which media files are read from paths.
+_READ_CHUNK_SIZE: Final = 1024 * 1024
+
 
-def _calculate_file_id(data: bytes, mimetype: str, filename: str | None = None) -> str:
+def _calculate_file_id(
+    data: FileContent, mimetype: str, filename: str | None = None
+) -> str:
     """Hash data, mimetype, and an optional filename to generate a stable file ID.
 
     Parameters
@@ -76,9 +91,12 @@ def get_extension_for_mimetype(mimetype: str) -> str:
 
 
 class MemoryFile(NamedTuple):
-    """A MediaFile stored in memory."""
+    """A MediaFile stored in memory.
+
+    The content of large files is a read-only view of a memory-mapped file.
+    """
 
-    content: bytes
+    content: FileContent
     mimetype: str
     kind: MediaFileKind
     filename: str | None
@@ -88,7 +106,17 @@ class MemoryFile(NamedTuple):
         return len(self.content)
 
 
-class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
+class _MediaFileInfo(NamedTuple):
+    """The metadata of a media file, whose content is stored separately."""
+
+    mimetype: str
+    kind: MediaFileKind
+    filename: str | None
+
+
+class MemoryMediaFileStorage(
+    MediaFileStorage, CacheStatsProvider, RuntimeStatsProvider
+):
     def __init__(self, media_endpoint: str) -> None:
         """Create a new MemoryMediaFileStorage instance.
 
@@ -98,7 +126,8 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
             The name of the local endpoint that media is served from.
             This endpoint should start with a forward-slash (e.g. "/media").
         """
-        self._files_by_id: dict[str, MemoryFile] = {}
+        self._files_by_id: dict[str, _MediaFileInfo] = {}
+        self._contents: TieredFileStore[str] = TieredFileStore("media_files")
         self._media_endpoint = media_endpoint
 
     def load_and_get_id(
@@ -109,7 +138,7 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         filename: str | None = None,
     ) -> str:
         """Add a file to the manager and return its ID."""
-        file_data: bytes
+        file_data: FileContent
         file_data = (
             self._read_file(path_or_data)
             if isinstance(path_or_data, str)
@@ -117,14 +146,15 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         )
 
         # Because our file_ids are stable, if we already have a file with the
-        # given ID, we don't need to create a new one.
+        # given ID, we don't need to create a new one. Its contents may have
+        # been discarded to meet the disk budget, though.
         file_id = _calculate_file_id(file_data, mimetype, filename)
-        if file_id not in self._files_by_id:
+        if file_id not in self._files_by_id or file_id not in self._contents:
             _LOGGER.debug("Adding media file %s", file_id)
-            media_file = MemoryFile(
-                content=file_data, mimetype=mimetype, kind=kind, filename=filename
+            self._contents.put(file_id, file_data)
+            self._files_by_id[file_id] = _MediaFileInfo(
+                mimetype=mimetype, kind=kind, filename=filename
             )
-            self._files_by_id[file_id] = media_file
 
         return file_id
 
@@ -136,12 +166,18 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         Raises a MediaFileStorageError if no such file exists.
         """
         file_id = os.path.splitext(filename)[0]
-        try:
-            return self._files_by_id[file_id]
-        except KeyError as e:
+        file_info = self._files_by_id.get(file_id)
+        content = self._contents.get(file_id)
+        if file_info is None or content is None:
             raise MediaFileStorageError(
                 f"Bad filename '{filename}'. (No media file with id '{file_id}')"
-            ) from e
+            )
+        return MemoryFile(
+            content=content,
+            mimetype=file_info.mimetype,
+            kind=file_info.kind,
+            filename=file_info.filename,
+        )
 
     def get_url(self, file_id: str) -> str:
         """Get a URL for a given media file. Raise a MediaFileStorageError if
@@ -157,26 +193,36 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         # that doesn't exist.
         with contextlib.suppress(KeyError):
             del self._files_by_id[file_id]
+        self._contents.remove(file_id)
 
-    def _read_file(self, filename: str) -> bytes:
-        """Read a file into memory. Raise MediaFileStorageError if we can't."""
+    def _read_file(self, filename: str) -> FileContent:
+        """Read a file in chunks, into memory or into a temporary file if it's
+        large. Raise MediaFileStorageError if we can't.
+        """
+        writer = SpooledFileWriter()
         try:
             with open(filename, "rb") as f:
-                return f.read()
+                while chunk := f.read(_READ_CHUNK_SIZE):
+                    writer.write(chunk)
+            return writer.getvalue()
         except Exception as ex:
+            writer.close()
             raise MediaFileStorageError(f"Error opening '{filename}'") from ex
 
     def get_stats(self) -> list[CacheStat]:
-        # We operate on a copy of our dict, to avoid race conditions
-        # with other threads that may be manipulating the cache.
-        files_by_id = self._files_by_id.copy()
-
-        stats: list[CacheStat] = [
+        """Return the storage's CacheStats, which only count the files kept
+        in memory.
+        """
+        memory_bytes = self._contents.memory_bytes
+        if not memory_bytes:
+            return []
+        return [
             CacheStat(
                 category_name="st_memory_media_file_storage",
                 cache_name="",
-                byte_length=len(file.content),
+                byte_length=memory_bytes,
             )
-            for _, file in files_by_id.items()
         ]
-        return group_stats(stats)
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        return self._contents.get_runtime_stats()
@@ -16,10 +16,11 @@ from __future__ import annotations
 
 import uuid
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from streamlit import util
-from streamlit.runtime.stats import CacheStat, group_stats
+from streamlit.runtime.stats import CacheStat, RuntimeStat, RuntimeStatsProvider
+from streamlit.runtime.tiered_file_store import TieredFileStore
 from streamlit.runtime.uploaded_file_manager import (
     UploadedFileManager,
     UploadedFileRec,
@@ -30,13 +31,27 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
-class MemoryUploadedFileManager(UploadedFileManager):
+class _FileInfo(NamedTuple):
+    """The metadata of an uploaded file, whose contents are stored separately."""
+
+    file_id: str
+    name: str
+    type: str
+
+
+class MemoryUploadedFileManager(UploadedFileManager, RuntimeStatsProvider):
     """Holds files uploaded by users of the running Streamlit app.
     This class can be used safely from multiple threads simultaneously.
+
+    The contents of the files are kept in a TieredFileStore, which moves large
+    files to temporary files on disk.
     """
 
     def __init__(self, upload_endpoint: str) -> None:
-        self.file_storage: dict[str, dict[str, UploadedFileRec]] = defaultdict(dict)
+        self.file_storage: dict[str, dict[str, _FileInfo]] = defaultdict(dict)
+        self._contents: TieredFileStore[tuple[str, str]] = TieredFileStore(
+            "uploaded_files"
+        )
         self.endpoint = upload_endpoint
 
     def get_files(
@@ -61,15 +76,24 @@ class MemoryUploadedFileManager(UploadedFileManager):
         file_recs = []
 
         for file_id in file_ids:
-            file_rec = session_storage.get(file_id, None)
-            if file_rec is not None:
-                file_recs.append(file_rec)
+            file_info = session_storage.get(file_id, None)
+            data = self._contents.get((session_id, file_id))
+            if file_info is not None and data is not None:
+                file_recs.append(
+                    UploadedFileRec(
+                        file_id=file_id,
+                        name=file_info.name,
+                        type=file_info.type,
+                        data=data,
+                    )
+                )
 
         return file_recs
 
     def remove_session_files(self, session_id: str) -> None:
         """Remove all files associated with a given session."""
         self.file_storage.pop(session_id, None)
+        self._contents.remove_owner(session_id)
 
     def __repr__(self) -> str:
         return util.repr_(self)
@@ -90,12 +114,16 @@ class MemoryUploadedFileManager(UploadedFileManager):
             The file to add.
         """
 
-        self.file_storage[session_id][file.file_id] = file
+        self._contents.put((session_id, file.file_id), file.data, owner=session_id)
+        self.file_storage[session_id][file.file_id] = _FileInfo(
+            file_id=file.file_id, name=file.name, type=file.type
+        )
 
     def remove_file(self, session_id: str, file_id: str) -> None:
         """Remove file with given file_id associated with a given session."""
         session_storage = self.file_storage[session_id]
         session_storage.pop(file_id, None)
+        self._contents.remove((session_id, file_id))
 
     def get_upload_urls(
         self, session_id: str, file_names: Sequence[str]
@@ -114,25 +142,21 @@ class MemoryUploadedFileManager(UploadedFileManager):
         return result
 
     def get_stats(self) -> list[CacheStat]:
-        """Return the manager's CacheStats.
+        """Return the manager's CacheStats, which only count the files kept
+        in memory.
 
         Safe to call from any thread.
         """
-        # Flatten all files into a single list
-        all_files: list[UploadedFileRec] = []
-        # Make copy of self.file_storage for thread safety, to be sure
-        # that main storage won't be changed form other thread
-        file_storage_copy = self.file_storage.copy()
-
-        for session_storage in file_storage_copy.values():
-            all_files.extend(session_storage.values())
-
-        stats: list[CacheStat] = [
+        memory_bytes = self._contents.memory_bytes
+        if not memory_bytes:
+            return []
+        return [
             CacheStat(
                 category_name="UploadedFileManager",
                 cache_name="",
-                byte_length=len(file.data),
+                byte_length=memory_bytes,
             )
-            for file in all_files
         ]
-        return group_stats(stats)
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        return self._contents.get_runtime_stats()
@@ -25,18 +25,28 @@ from typing import TYPE_CHECKING, Final, NamedTuple
 from streamlit.components.lib.local_component_registry import LocalComponentRegistry
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
-from streamlit.runtime.app_session import AppSession
+from streamlit.runtime.app_session import AppSession, AppSessionStatProvider
 from streamlit.runtime.caching import (
+    get_cache_call_stats_provider,
     get_data_cache_stats_provider,
+    get_hash_stats_provider,
     get_resource_cache_stats_provider,
 )
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.forward_msg_cache import get_forward_msg_stats_provider
+from streamlit.runtime.forward_msg_queue import get_forward_msg_queue_stats_provider
 from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_run_limiter import (
+    get_script_run_limiter_stats_provider,
+)
+from streamlit.runtime.scriptrunner.script_run_stats import (
+    get_script_run_stats_provider,
+)
 from streamlit.runtime.session_manager import (
     ActiveSessionInfo,
     SessionClient,
@@ -47,6 +57,7 @@ from streamlit.runtime.session_manager import (
 from streamlit.runtime.state import (
     SCRIPT_RUN_WITHOUT_ERRORS_KEY,
     SessionStateStatProvider,
+    get_serialization_check_stats_provider,
 )
 from streamlit.runtime.stats import StatsManager
 from streamlit.runtime.websocket_session_manager import WebsocketSessionManager
@@ -218,6 +229,24 @@ class Runtime:
         self._stats_mgr.register_provider(get_resource_cache_stats_provider())
         self._stats_mgr.register_provider(self._uploaded_file_mgr)
         self._stats_mgr.register_provider(SessionStateStatProvider(self._session_mgr))
+        self._stats_mgr.register_runtime_stats_provider(get_hash_stats_provider())
+        self._stats_mgr.register_runtime_stats_provider(
+            get_forward_msg_stats_provider()
+        )
+        self._stats_mgr.register_runtime_stats_provider(
+            get_script_run_limiter_stats_provider()
+        )
+        self._stats_mgr.register_runtime_stats_provider(get_script_run_stats_provider())
+        self._stats_mgr.register_runtime_stats_provider(get_cache_call_stats_provider())
+        self._stats_mgr.register_runtime_stats_provider(
+            get_forward_msg_queue_stats_provider()
+        )
+        self._stats_mgr.register_runtime_stats_provider(
+            AppSessionStatProvider(self._session_mgr)
+        )
+        self._stats_mgr.register_runtime_stats_provider(
+            get_serialization_check_stats_provider()
+        )
 
     @property
     def state(self) -> RuntimeState:
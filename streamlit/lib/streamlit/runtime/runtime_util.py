@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import time
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Final, cast
 
@@ -70,7 +71,17 @@ def serialize_forward_msg(msg: ForwardMsg) -> bytes:
     instead.
     """
 
-    msg_str = msg.SerializeToString()
+    from streamlit.runtime.forward_msg_cache import (
+        forward_msg_stats,
+        serialize_with_pending_body,
+    )
+
+    start_time = time.perf_counter()
+
+    # Hashed messages reuse the body that was serialized to compute their hash.
+    msg_str = serialize_with_pending_body(msg)
+    if msg_str is None:
+        msg_str = msg.SerializeToString()
 
     if len(msg_str) > get_max_message_size_bytes():
         # Overwrite the offending ForwardMsg.delta with an error to display.
@@ -87,6 +98,15 @@ def serialize_forward_msg(msg: ForwardMsg) -> bytes:
         msg.metadata.cacheable = False
         msg_str = msg.SerializeToString()
 
+    seconds = time.perf_counter() - start_time
+    forward_msg_stats.record_serialize(msg, len(msg_str), seconds)
+    _LOGGER.debug(
+        "Serialized %s message (%d bytes) in %.2f ms",
+        msg.WhichOneof("type"),
+        len(msg_str),
+        seconds * 1000,
+    )
+
     return msg_str
 
 
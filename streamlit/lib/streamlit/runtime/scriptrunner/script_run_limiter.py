@@ -0,0 +1,153 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Admission control for script runs across all sessions."""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Callable, Final
+
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.runtime.stats import RuntimeStat, RuntimeStatsProvider
+
+_LOGGER: Final = get_logger(__name__)
+
+# How often a script run waiting for a slot checks whether it's still wanted.
+_PENDING_CHECK_INTERVAL_SECONDS: Final = 0.1
+
+
+class ScriptRunLimiter(RuntimeStatsProvider):
+    """Caps the number of script runs that execute at the same time.
+
+    Each ScriptRunner takes a slot before running its script and releases it
+    when the run ends. Above `runner.maxConcurrentScriptRuns` slots, runs wait
+    in FIFO order for a slot to be released. While a session waits, its rerun
+    requests keep being coalesced by its ScriptRequests, so only its latest
+    RerunData is run.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._waiters: collections.deque[object] = collections.deque()
+        self._running = 0
+
+        # Stats
+        self._runs = 0
+        self._waited_runs = 0
+        self._wait_seconds = 0.0
+
+    def acquire(self, is_pending: Callable[[], bool]) -> bool:
+        """Wait for a free slot and take it.
+
+        Parameters
+        ----------
+        is_pending : Callable[[], bool]
+            Returns whether the run is still wanted. If it returns False while
+            waiting, e.g. because the session was shut down, stop waiting.
+
+        Returns
+        -------
+        bool
+            True if the slot was taken and must be released with `release`.
+
+        """
+        limit: int = config.get_option("runner.maxConcurrentScriptRuns")
+
+        with self._condition:
+            if limit <= 0 or (not self._waiters and self._running < limit):
+                self._running += 1
+                self._runs += 1
+                return True
+
+            start_time = time.perf_counter()
+            waiter = object()
+            self._waiters.append(waiter)
+            try:
+                while self._waiters[0] is not waiter or self._running >= limit:
+                    if not is_pending():
+                        return False
+                    self._condition.wait(_PENDING_CHECK_INTERVAL_SECONDS)
+
+                self._running += 1
+                self._runs += 1
+                self._waited_runs += 1
+                return True
+            finally:
+                self._waiters.remove(waiter)
+                wait_seconds = time.perf_counter() - start_time
+                self._wait_seconds += wait_seconds
+                # The next waiter may be able to take a slot now.
+                self._condition.notify_all()
+                _LOGGER.debug("Waited %.3f s for a script run slot", wait_seconds)
+
+    def release(self) -> None:
+        """Release a slot taken with `acquire`."""
+        with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        with self._condition:
+            return [
+                RuntimeStat(
+                    "script_runs_running",
+                    "gauge",
+                    (),
+                    self._running,
+                    help="Script runs executing.",
+                ),
+                RuntimeStat(
+                    "script_run_queue_depth",
+                    "gauge",
+                    (),
+                    len(self._waiters),
+                    help="Script runs waiting for a free slot.",
+                ),
+                RuntimeStat(
+                    "script_runs",
+                    "counter",
+                    (),
+                    self._runs,
+                    help="Script runs started.",
+                ),
+                RuntimeStat(
+                    "script_run_waits",
+                    "counter",
+                    (),
+                    self._waited_runs,
+                    help="Script runs that waited for a free slot.",
+                ),
+                RuntimeStat(
+                    "script_run_wait_seconds",
+                    "counter",
+                    (),
+                    self._wait_seconds,
+                    help="Time spent by script runs waiting for a free slot.",
+                    unit="seconds",
+                ),
+            ]
+
+
+script_run_limiter = ScriptRunLimiter()
+
+
+def get_script_run_limiter_stats_provider() -> RuntimeStatsProvider:
+    """Return the RuntimeStatsProvider for script run admission."""
+    return script_run_limiter
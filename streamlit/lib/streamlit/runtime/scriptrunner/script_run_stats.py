@@ -0,0 +1,90 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Timings of script and fragment runs across all sessions."""
+
+from __future__ import annotations
+
+import threading
+
+from streamlit.runtime.stats import Histogram, RuntimeStat, RuntimeStatsProvider
+
+
+class ScriptRunStats(RuntimeStatsProvider):
+    """Records how long script runs and fragment runs take.
+
+    A full script run is labeled with the page it ran, and a fragment run
+    with the id of the fragment. The time spent executing the script's code
+    is reported separately from the run's total duration, which also includes
+    preparing the run and cleaning up after it.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._run_seconds = Histogram(
+            "script_run_seconds",
+            ("page",),
+            help="Duration of full script runs.",
+            unit="seconds",
+        )
+        self._fragment_run_seconds = Histogram(
+            "fragment_run_seconds",
+            ("fragment",),
+            help="Duration of fragment runs.",
+            unit="seconds",
+        )
+        self._lock = threading.Lock()
+        self._exec_seconds: dict[str, float] = {}
+
+    def record_run(self, page: str, run_seconds: float, exec_seconds: float) -> None:
+        """Record a full script run of a page."""
+        self._run_seconds.observe((page,), run_seconds)
+        with self._lock:
+            self._exec_seconds[page] = self._exec_seconds.get(page, 0.0) + exec_seconds
+
+    def record_fragment_run(self, fragment_id: str, seconds: float) -> None:
+        """Record the run of a single fragment."""
+        self._fragment_run_seconds.observe((fragment_id,), seconds)
+
+    def clear(self) -> None:
+        self._run_seconds.clear()
+        self._fragment_run_seconds.clear()
+        with self._lock:
+            self._exec_seconds.clear()
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        stats = self._run_seconds.get_runtime_stats()
+        stats.extend(self._fragment_run_seconds.get_runtime_stats())
+        with self._lock:
+            stats.extend(
+                RuntimeStat(
+                    "script_exec_seconds",
+                    "counter",
+                    (("page", page),),
+                    seconds,
+                    help="Time spent executing the code of full script runs.",
+                    unit="seconds",
+                )
+                for page, seconds in self._exec_seconds.items()
+            )
+        return stats
+
+
+script_run_stats = ScriptRunStats()
+
+
+def get_script_run_stats_provider() -> RuntimeStatsProvider:
+    """Return the RuntimeStatsProvider for script run timings."""
+    return script_run_stats
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import gc
+import os
 import sys
 import threading
 import types
@@ -40,6 +41,8 @@ from streamlit.runtime.scriptrunner.exec_code import (
     modified_sys_path,
 )
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_run_limiter import script_run_limiter
+from streamlit.runtime.scriptrunner.script_run_stats import script_run_stats
 from streamlit.runtime.scriptrunner_utils.exceptions import (
     RerunException,
     StopException,
@@ -369,14 +372,29 @@ class ScriptRunner:
         )
         add_script_run_ctx(threading.current_thread(), ctx)
 
-        request = self._requests.on_scriptrunner_ready()
-        while request.type == ScriptRequestType.RERUN:
+        while True:
             # When the script thread starts, we'll have a pending rerun
             # request that we'll handle immediately. When the script finishes,
             # it's possible that another request has come in that we need to
             # handle, which is why we call _run_script in a loop.
-            self._run_script(request.rerun_data)
+            # Each run waits for a slot of the script_run_limiter before taking
+            # the request, so rerun requests received meanwhile are coalesced.
+            has_slot = False
+            if self._requests.has_rerun_request():
+                has_slot = script_run_limiter.acquire(self._requests.has_rerun_request)
             request = self._requests.on_scriptrunner_ready()
+            if request.type != ScriptRequestType.RERUN:
+                if has_slot:
+                    script_run_limiter.release()
+                break
+
+            if not has_slot:
+                # The rerun was requested after we checked for one.
+                script_run_limiter.acquire(lambda: True)
+            try:
+                self._run_script(request.rerun_data)
+            finally:
+                script_run_limiter.release()
 
         if request.type != ScriptRequestType.STOP:
             raise RuntimeError(
@@ -627,7 +645,13 @@ class ScriptRunner:
                                 wrapped_fragment = self._fragment_storage.get(
                                     fragment_id
                                 )
-                                wrapped_fragment()
+                                fragment_start_time = timer()
+                                try:
+                                    wrapped_fragment()
+                                finally:
+                                    script_run_stats.record_fragment_run(
+                                        fragment_id, timer() - fragment_start_time
+                                    )
 
                             except FragmentStorageKeyError:  # noqa: PERF203
                                 # This can happen if the fragment_id is removed from the
@@ -683,6 +707,7 @@ class ScriptRunner:
                 premature_stop,
                 uncaught_exception,
             ) = exec_func_with_error_handling(code_to_exec, ctx)
+            exec_time = timer() - start_time - prep_time
             # setting the session state here triggers a yield-callback call
             # which reads self._requests and checks for rerun data
             self._session_state[SCRIPT_RUN_WITHOUT_ERRORS_KEY] = run_without_errors
@@ -717,6 +742,13 @@ class ScriptRunner:
                     _LOGGER.debug("Failed to create page profile", exc_info=ex)
             self._on_script_finished(ctx, finished_event, premature_stop)
 
+            if not rerun_data.fragment_id_queue:
+                script_run_stats.record_run(
+                    self._get_page_label(ctx.page_script_hash),
+                    timer() - start_time,
+                    exec_time,
+                )
+
             # # Use _log_if_error() to make sure we never ever ever stop running the
             # # script without meaning to.
             _log_if_error(_clean_problem_modules)
@@ -726,6 +758,17 @@ class ScriptRunner:
             else:
                 break
 
+    def _get_page_label(self, page_script_hash: str) -> str:
+        """Return the name of a page to label its script run stats with."""
+        page = self._pages_manager.get_pages().get(page_script_hash)
+        if page is None:
+            return page_script_hash
+        return (
+            page.get("url_pathname")
+            or page.get("page_name")
+            or os.path.splitext(os.path.basename(page["script_path"]))[0]
+        )
+
     def _on_script_finished(
         self, ctx: ScriptRunContext, event: ScriptRunnerEvent, premature_stop: bool
     ) -> None:
@@ -173,6 +173,12 @@ class ScriptRequests:
         with self._lock:
             self._state = ScriptRequestType.STOP
 
+    def has_rerun_request(self) -> bool:
+        """True if a rerun was requested and the ScriptRunner hasn't handled it
+        yet.
+        """
+        return self._state == ScriptRequestType.RERUN
+
     def request_rerun(self, new_data: RerunData) -> bool:
         """Request that the ScriptRunner rerun its script.
 
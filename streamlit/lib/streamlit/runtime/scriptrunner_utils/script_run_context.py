@@ -37,6 +37,7 @@ from streamlit.errors import (
 from streamlit.logger import get_logger
 from streamlit.runtime.forward_msg_cache import (
     create_reference_msg,
+    forward_msg_stats,
     populate_hash_if_needed,
 )
 
@@ -200,6 +201,9 @@ class ScriptRunContext:
         ):
             _LOGGER.debug("Sending cached message ref (hash=%s)", msg.hash)
             msg_to_send = create_reference_msg(msg)
+            forward_msg_stats.record_unchanged_element(
+                msg, msg.ByteSize() - msg_to_send.ByteSize()
+            )
 
         # Pass the message up to our associated ScriptRunner.
         self._enqueue(msg_to_send)
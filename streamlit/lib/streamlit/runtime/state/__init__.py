@@ -19,6 +19,7 @@ from streamlit.runtime.state.session_state import (
     SCRIPT_RUN_WITHOUT_ERRORS_KEY,
     SessionState,
     SessionStateStatProvider,
+    get_serialization_check_stats_provider,
 )
 from streamlit.runtime.state.session_state_proxy import (
     SessionStateProxy,
@@ -36,6 +37,7 @@ __all__ = [
     "WidgetArgs",
     "WidgetCallback",
     "WidgetKwargs",
+    "get_serialization_check_stats_provider",
     "get_session_state",
     "register_widget",
 ]
@@ -98,10 +98,16 @@ class SafeSessionState:
         with self._lock:
             return self._state.filtered_state
 
+    def mark_possibly_mutated(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._state.mark_possibly_mutated(key, value)
+
     def __getitem__(self, key: str) -> Any:
         self._yield_callback()
         with self._lock:
-            return self._state[key]
+            value = self._state[key]
+            self._state.mark_possibly_mutated(key, value)
+            return value
 
     def __setitem__(self, key: str, value: Any) -> None:
         self._yield_callback()
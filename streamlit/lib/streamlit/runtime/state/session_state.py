@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import json
 import pickle
+import threading
+import time
 from collections.abc import Iterator, KeysView, MutableMapping
 from copy import deepcopy
 from dataclasses import dataclass, field, replace
@@ -34,6 +36,7 @@ from streamlit import config, util
 from streamlit.errors import StreamlitAPIException, UnserializableSessionStateError
 from streamlit.proto.WidgetStates_pb2 import WidgetState as WidgetStateProto
 from streamlit.proto.WidgetStates_pb2 import WidgetStates as WidgetStatesProto
+from streamlit.runtime.memory_estimate import estimate_size
 from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
 from streamlit.runtime.state.common import (
     RegisterWidgetResult,
@@ -45,7 +48,13 @@ from streamlit.runtime.state.common import (
     is_keyed_element_id,
 )
 from streamlit.runtime.state.query_params import QueryParams
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheStat,
+    DeepCacheStatsProvider,
+    RuntimeStat,
+    RuntimeStatsProvider,
+    group_stats,
+)
 
 if TYPE_CHECKING:
     from streamlit.runtime.session_manager import SessionManager
@@ -56,6 +65,10 @@ SCRIPT_RUN_WITHOUT_ERRORS_KEY: Final = (
     f"{STREAMLIT_INTERNAL_KEY_PREFIX}_SCRIPT_RUN_WITHOUT_ERRORS"
 )
 
+# Values of these types can't be mutated in place, so reading them can't make
+# them unserializable.
+_IMMUTABLE_TYPES: Final = (str, bytes, int, float, complex, bool, type(None))
+
 
 @dataclass(frozen=True)
 class Serialized:
@@ -373,6 +386,28 @@ class SessionState:
     # widget state at one point.
     query_params: QueryParams = field(default_factory=QueryParams)
 
+    # Estimated size of each value, with the id of the value it was estimated
+    # for, keyed like the dict holding the value. Updated when stats are
+    # requested, so that only new or changed values are estimated.
+    _value_sizes: dict[str, tuple[int, int]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    # The values that passed the last serializability check, and the keys of
+    # values that were handed to user code since then, which may have mutated
+    # them in place. See `_check_serializable`.
+    _serializable_values: dict[str, Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _possibly_mutated_keys: set[str] = field(
+        default_factory=set, repr=False, compare=False
+    )
+    # The keys of values that were handed to user code since their size was
+    # last estimated, and may have grown or shrunk in place.
+    _possibly_resized_keys: set[str] = field(
+        default_factory=set, repr=False, compare=False
+    )
+
     def __repr__(self) -> str:
         return util.repr_(self)
 
@@ -398,6 +433,36 @@ class SessionState:
         self._new_session_state.clear()
         self._new_widget_state.clear()
         self._key_id_mapper.clear()
+        self._value_sizes.clear()
+        self._serializable_values.clear()
+        self._possibly_mutated_keys.clear()
+        self._possibly_resized_keys.clear()
+
+    def _update_value_sizes(self) -> None:
+        """Estimate the size of values that were added, replaced or possibly
+        mutated since the last update, and forget the sizes of removed values.
+
+        This is called from the thread gathering stats while the script thread
+        may modify session state, so the values are copied first. Widget
+        values are estimated once they have been compacted into _old_state.
+        Values mutated in place without being read through `st.session_state`,
+        e.g. through another reference, keep their previous estimate.
+        """
+        possibly_resized_keys = self._possibly_resized_keys
+        self._possibly_resized_keys = set()
+        items = list(self._old_state.items()) + list(self._new_session_state.items())
+
+        value_sizes: dict[str, tuple[int, int]] = {}
+        for key, value in items:
+            value_size = self._value_sizes.get(key)
+            if (
+                value_size is None
+                or value_size[0] != id(value)
+                or key in possibly_resized_keys
+            ):
+                value_size = (id(value), estimate_size(value))
+            value_sizes[key] = value_size
+        self._value_sizes = value_sizes
 
     @property
     def filtered_state(self) -> dict[str, Any]:
@@ -516,6 +581,18 @@ class SessionState:
         # We'll never get here
         raise KeyError
 
+    def mark_possibly_mutated(self, key: str, value: Any) -> None:
+        """Record that the value of an entry was handed to user code, which
+        may mutate it in place, so that its serializability and size are
+        checked again.
+        """
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            widget_id = self._get_widget_id(key)
+            self._possibly_mutated_keys.add(widget_id)
+            # Sizes are keyed by user key in _new_session_state and by widget
+            # id in _old_state.
+            self._possibly_resized_keys.update((key, widget_id))
+
     def __setitem__(self, user_key: str, value: Any) -> None:
         """Set the value of the session_state entry with the given user_key.
 
@@ -731,6 +808,15 @@ class SessionState:
             return True
 
     def get_stats(self) -> list[CacheStat]:
+        """Return the estimated memory used by the values in session state."""
+        self._update_value_sizes()
+        byte_length = sum(size for _, size in self._value_sizes.values())
+        return [CacheStat("st_session_state", "", byte_length)]
+
+    def get_deep_stats(self) -> list[CacheStat]:
+        """Return the memory used by session state, measured by walking all
+        objects it references.
+        """
         # Lazy-load vendored package to prevent import of numpy
         from streamlit.vendor.pympler.asizeof import asizeof
 
@@ -741,20 +827,52 @@ class SessionState:
         """Verify that everything added to session state can be serialized.
         We use pickleability as the metric for serializability, and test for
         pickleability by just trying it.
+
+        A value that passed the previous check isn't pickled again if it's
+        still the same object and it wasn't handed to user code since then.
+        Values assigned to session state are new objects, or the same object
+        as before, which is only checked again if it was read and possibly
+        mutated. The values that passed are kept alive until the next check,
+        so their identity can't be reused by other objects.
         """
-        for k in self:
-            try:
-                pickle.dumps(self[k])
-            except Exception as e:  # noqa: PERF203
-                err_msg = (
-                    f"Cannot serialize the value (of type `{type(self[k])}`) of '{k}' in "
-                    "st.session_state. Streamlit has been configured to use "
-                    "[pickle](https://docs.python.org/3/library/pickle.html) to "
-                    "serialize session_state values. Please convert the value to a "
-                    "pickle-serializable type. To learn more about this behavior, "
-                    "see [our docs](https://docs.streamlit.io/knowledge-base/using-streamlit/serializable-session-state)."
-                )
-                raise UnserializableSessionStateError(err_msg) from e
+        start_time = time.perf_counter()
+        serializable_values: dict[str, Any] = {}
+        num_checked = 0
+        num_skipped = 0
+
+        try:
+            for k in self:
+                value = self[k]
+                if (
+                    k not in self._possibly_mutated_keys
+                    and k in self._serializable_values
+                    and self._serializable_values[k] is value
+                ):
+                    serializable_values[k] = value
+                    num_skipped += 1
+                    continue
+
+                num_checked += 1
+                try:
+                    pickle.dumps(value)
+                except Exception as e:
+                    err_msg = (
+                        f"Cannot serialize the value (of type `{type(value)}`) of '{k}' in "
+                        "st.session_state. Streamlit has been configured to use "
+                        "[pickle](https://docs.python.org/3/library/pickle.html) to "
+                        "serialize session_state values. Please convert the value to a "
+                        "pickle-serializable type. To learn more about this behavior, "
+                        "see [our docs](https://docs.streamlit.io/knowledge-base/using-streamlit/serializable-session-state)."
+                    )
+                    raise UnserializableSessionStateError(err_msg) from e
+                serializable_values[k] = value
+        finally:
+            serialization_check_stats.record(
+                num_checked, num_skipped, time.perf_counter() - start_time
+            )
+
+        self._serializable_values = serializable_values
+        self._possibly_mutated_keys.clear()
 
     def maybe_check_serializable(self) -> None:
         """Verify that session state can be serialized, if the relevant config
@@ -766,6 +884,77 @@ class SessionState:
             self._check_serializable()
 
 
+class _SerializationCheckStats(RuntimeStatsProvider):
+    """Values pickled and skipped by session state serializability checks,
+    and the time spent on the checks, across all sessions.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._checks = 0
+        self._checked_values = 0
+        self._skipped_values = 0
+        self._seconds = 0.0
+
+    def record(self, checked_values: int, skipped_values: int, seconds: float) -> None:
+        with self._lock:
+            self._checks += 1
+            self._checked_values += checked_values
+            self._skipped_values += skipped_values
+            self._seconds += seconds
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        with self._lock:
+            return [
+                RuntimeStat(
+                    "session_state_serialization_checks",
+                    "counter",
+                    (),
+                    self._checks,
+                    help="Serializability checks of session state.",
+                ),
+                RuntimeStat(
+                    "session_state_serialization_checked_values",
+                    "counter",
+                    (),
+                    self._checked_values,
+                    help="Session state values pickled by serializability checks.",
+                ),
+                RuntimeStat(
+                    "session_state_serialization_skipped_values",
+                    "counter",
+                    (),
+                    self._skipped_values,
+                    help="Unchanged session state values not pickled again.",
+                ),
+                RuntimeStat(
+                    "session_state_serialization_check_seconds",
+                    "counter",
+                    (),
+                    self._seconds,
+                    help="Time spent checking that session state is serializable.",
+                    unit="seconds",
+                ),
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._checks = 0
+            self._checked_values = 0
+            self._skipped_values = 0
+            self._seconds = 0.0
+
+
+serialization_check_stats = _SerializationCheckStats()
+
+
+def get_serialization_check_stats_provider() -> RuntimeStatsProvider:
+    """Return the RuntimeStatsProvider for session state serializability checks."""
+    return serialization_check_stats
+
+
 def _is_internal_key(key: str) -> bool:
     return key.startswith(STREAMLIT_INTERNAL_KEY_PREFIX)
 
@@ -788,7 +977,7 @@ def _is_stale_widget(
 
 
 @dataclass
-class SessionStateStatProvider(CacheStatsProvider):
+class SessionStateStatProvider(DeepCacheStatsProvider):
     _session_mgr: SessionManager
 
     def get_stats(self) -> list[CacheStat]:
@@ -797,3 +986,10 @@ class SessionStateStatProvider(CacheStatsProvider):
             session_state = session_info.session.session_state
             stats.extend(session_state.get_stats())
         return group_stats(stats)
+
+    def get_deep_stats(self) -> list[CacheStat]:
+        stats: list[CacheStat] = []
+        for session_info in self._session_mgr.list_active_sessions():
+            session_state = session_info.session.session_state
+            stats.extend(session_state.get_deep_stats())
+        return group_stats(stats)
@@ -143,7 +143,11 @@ class SessionStateProxy(MutableMapping[Key, Any]):
 
     def to_dict(self) -> dict[str, Any]:
         """Return a dict containing all session_state and keyed widget values."""
-        return get_session_state().filtered_state
+        session_state = get_session_state()
+        state = session_state.filtered_state
+        for key, value in state.items():
+            session_state.mark_possibly_mutated(key, value)
+        return state
 
 
 def _missing_attr_error_message(attr_name: str) -> str:
@@ -14,13 +14,28 @@
 
 from __future__ import annotations
 
+import bisect
 import itertools
+import threading
+import time
 from abc import abstractmethod
-from typing import TYPE_CHECKING, NamedTuple, Protocol, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Literal,
+    NamedTuple,
+    Protocol,
+    runtime_checkable,
+)
+
+from streamlit import config
+from streamlit.logger import get_logger
 
 if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import Metric as MetricProto
 
+_LOGGER: Final = get_logger(__name__)
+
 
 class CacheStat(NamedTuple):
     """Describes a single cache entry.
@@ -60,6 +75,198 @@ class CacheStat(NamedTuple):
         metric_point.gauge_value.int_value = self.byte_length
 
 
+class RuntimeStat(NamedTuple):
+    """Describes a single sample of a runtime metric other than cache memory,
+    e.g. the time spent hashing the arguments of a cached function.
+
+    Properties
+    ----------
+    family_name : str
+        The name of the OpenMetrics metric family that the sample belongs to,
+        e.g. "cache_hash_seconds". Samples of a family must all have the same
+        metric_type, help and unit.
+    metric_type : "counter", "gauge" or "histogram"
+        The OpenMetrics type of the metric family.
+    labels : tuple of (str, str)
+        The (name, value) pairs labeling the sample.
+    value : float
+        The sample's value. For histograms, the sum of all observed values.
+    help : str
+        A human-readable description of the metric family.
+    unit : str
+        The unit of the metric family, or the empty string.
+    buckets : tuple of (float, int)
+        For histograms, the (upper bound, cumulative count) pairs of the
+        buckets, in increasing order. The last bucket's upper bound is
+        infinity, and its count is the number of observed values.
+    """
+
+    family_name: str
+    metric_type: Literal["counter", "gauge", "histogram"]
+    labels: tuple[tuple[str, str], ...]
+    value: float
+    help: str = ""
+    unit: str = ""
+    buckets: tuple[tuple[float, int], ...] = ()
+
+    def to_metric_str(self) -> str:
+        if self.metric_type == "histogram":
+            lines = [
+                _format_sample(
+                    f"{self.family_name}_bucket",
+                    (*self.labels, ("le", _format_bound(upper_bound))),
+                    count,
+                )
+                for upper_bound, count in self.buckets
+            ]
+            count = self.buckets[-1][1] if self.buckets else 0
+            lines.extend(
+                (
+                    _format_sample(f"{self.family_name}_count", self.labels, count),
+                    _format_sample(f"{self.family_name}_sum", self.labels, self.value),
+                )
+            )
+            return "\n".join(lines)
+
+        # OpenMetrics counter samples have a "_total" suffix.
+        name = self.family_name + ("_total" if self.metric_type == "counter" else "")
+        return _format_sample(name, self.labels, self.value)
+
+    def marshall_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object."""
+        for name, value in self.labels:
+            label = metric.labels.add()
+            label.name = name
+            label.value = value
+
+        metric_point = metric.metric_points.add()
+        if self.metric_type == "counter":
+            metric_point.counter_value.double_value = self.value
+        elif self.metric_type == "histogram":
+            histogram_value = metric_point.histogram_value
+            histogram_value.double_value = self.value
+            histogram_value.count = self.buckets[-1][1] if self.buckets else 0
+            for upper_bound, count in self.buckets:
+                bucket = histogram_value.buckets.add()
+                bucket.upper_bound = upper_bound
+                bucket.count = count
+        else:
+            metric_point.gauge_value.double_value = self.value
+
+
+def _format_sample(name: str, labels: tuple[tuple[str, str], ...], value: float) -> str:
+    if labels:
+        label_str = ",".join(
+            f'{key}="{_escape_label_value(label_value)}"' for key, label_value in labels
+        )
+        name = f"{name}{{{label_str}}}"
+    return f"{name} {value}"
+
+
+def _format_bound(upper_bound: float) -> str:
+    return "+Inf" if upper_bound == float("inf") else str(upper_bound)
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value, as required by the OpenMetrics text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Default histogram buckets for durations in seconds, from 5ms to 1 minute.
+DEFAULT_SECONDS_BUCKETS: Final = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    """Counts observed values in buckets, separately for each set of label
+    values, and reports them as OpenMetrics histogram RuntimeStats.
+
+    This class is thread-safe.
+
+    Parameters
+    ----------
+    family_name : str
+        The name of the OpenMetrics metric family, e.g. "script_run_seconds".
+    label_names : tuple of str
+        The names of the labels whose values are passed to `observe`.
+    help : str
+        A human-readable description of the metric family.
+    unit : str
+        The unit of the metric family, or the empty string.
+    buckets : tuple of float
+        The upper bounds of the buckets, in increasing order. A bucket with
+        an infinite upper bound is always added.
+    """
+
+    def __init__(
+        self,
+        family_name: str,
+        label_names: tuple[str, ...],
+        help: str = "",
+        unit: str = "",
+        buckets: tuple[float, ...] = DEFAULT_SECONDS_BUCKETS,
+    ) -> None:
+        self._family_name = family_name
+        self._label_names = label_names
+        self._help = help
+        self._unit = unit
+        self._upper_bounds = buckets
+        # Label values -> (non-cumulative bucket counts, sum of values)
+        self._series: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_values: tuple[str, ...], value: float) -> None:
+        """Count a value for the given label values."""
+        index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            counts, total = self._series.get(
+                label_values, ([0] * (len(self._upper_bounds) + 1), 0.0)
+            )
+            counts[index] += 1
+            self._series[label_values] = (counts, total + value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        with self._lock:
+            series = [
+                (label_values, list(counts), total)
+                for label_values, (counts, total) in self._series.items()
+            ]
+
+        stats: list[RuntimeStat] = []
+        for label_values, counts, total in series:
+            cumulative_counts = itertools.accumulate(counts)
+            upper_bounds = (*self._upper_bounds, float("inf"))
+            stats.append(
+                RuntimeStat(
+                    self._family_name,
+                    "histogram",
+                    tuple(zip(self._label_names, label_values)),
+                    total,
+                    help=self._help,
+                    unit=self._unit,
+                    buckets=tuple(zip(upper_bounds, cumulative_counts)),
+                )
+            )
+        return stats
+
+
 def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
     """Group a list of CacheStats by category_name and cache_name and sum byte_length."""
 
@@ -89,9 +296,36 @@ class CacheStatsProvider(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class DeepCacheStatsProvider(CacheStatsProvider, Protocol):
+    """A CacheStatsProvider whose `get_stats` returns estimates that are kept
+    up to date as entries are written, and that can measure its entries exactly
+    with a slower walk of their whole object graphs.
+    """
+
+    @abstractmethod
+    def get_deep_stats(self) -> list[CacheStat]:
+        raise NotImplementedError
+
+
+@runtime_checkable
+class RuntimeStatsProvider(Protocol):
+    @abstractmethod
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        raise NotImplementedError
+
+
 class StatsManager:
     def __init__(self) -> None:
         self._cache_stats_providers: list[CacheStatsProvider] = []
+        self._runtime_stats_providers: list[RuntimeStatsProvider] = []
+
+        # Results of the last deep walk of each DeepCacheStatsProvider, by
+        # index in _cache_stats_providers.
+        self._deep_stats: dict[int, list[CacheStat]] = {}
+        self._deep_stats_lock = threading.Lock()
+        self._deep_walk_thread: threading.Thread | None = None
+        self._last_deep_walk_time: float | None = None
 
     def register_provider(self, provider: CacheStatsProvider) -> None:
         """Register a CacheStatsProvider with the manager.
@@ -101,9 +335,77 @@ class StatsManager:
         self._cache_stats_providers.append(provider)
 
     def get_stats(self) -> list[CacheStat]:
-        """Return a list containing all stats from each registered provider."""
+        """Return a list containing all stats from each registered provider.
+
+        If `server.deepMemoryStatsInterval` is set, the stats of each
+        DeepCacheStatsProvider come from the last deep walk of its entries
+        instead, and a new walk is started in a background thread once the
+        last one is older than the interval.
+        """
+        interval: float = config.get_option("server.deepMemoryStatsInterval")
+        if interval > 0:
+            self._maybe_start_deep_walk(interval)
+
+        with self._deep_stats_lock:
+            deep_stats = self._deep_stats if interval > 0 else {}
+
         all_stats: list[CacheStat] = []
-        for provider in self._cache_stats_providers:
-            all_stats.extend(provider.get_stats())
+        for index, provider in enumerate(self._cache_stats_providers):
+            if index in deep_stats:
+                all_stats.extend(deep_stats[index])
+            else:
+                all_stats.extend(provider.get_stats())
+
+        return all_stats
+
+    def _maybe_start_deep_walk(self, interval: float) -> None:
+        now = time.monotonic()
+        with self._deep_stats_lock:
+            if (
+                self._deep_walk_thread is not None and self._deep_walk_thread.is_alive()
+            ) or (
+                self._last_deep_walk_time is not None
+                and now - self._last_deep_walk_time < interval
+            ):
+                return
+
+            self._last_deep_walk_time = now
+            self._deep_walk_thread = threading.Thread(
+                target=self._run_deep_walk, name="DeepMemoryStats", daemon=True
+            )
+            self._deep_walk_thread.start()
+
+    def _run_deep_walk(self) -> None:
+        start_time = time.perf_counter()
+        for index, provider in enumerate(self._cache_stats_providers):
+            if not isinstance(provider, DeepCacheStatsProvider):
+                continue
+            try:
+                stats = provider.get_deep_stats()
+            except Exception:
+                _LOGGER.exception("Failed to measure the memory of %s", provider)
+                continue
+            with self._deep_stats_lock:
+                self._deep_stats[index] = stats
+
+        _LOGGER.debug(
+            "Measured memory of cache stats providers in %.2f s",
+            time.perf_counter() - start_time,
+        )
+
+    def register_runtime_stats_provider(self, provider: RuntimeStatsProvider) -> None:
+        """Register a RuntimeStatsProvider with the manager.
+        This function is not thread-safe. Call it immediately after
+        creation.
+        """
+        self._runtime_stats_providers.append(provider)
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        """Return a list containing all runtime stats from each registered
+        provider.
+        """
+        all_stats: list[RuntimeStat] = []
+        for provider in self._runtime_stats_providers:
+            all_stats.extend(provider.get_runtime_stats())
 
         return all_stats
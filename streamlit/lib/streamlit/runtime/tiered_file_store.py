@@ -0,0 +1,349 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage for file contents that keeps small files in memory and spills large
+files to temporary files on disk.
+"""
+
+from __future__ import annotations
+
+import mmap
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable
+from typing import IO, TYPE_CHECKING, Final, Generic, TypeVar, Union, cast
+
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.runtime.stats import RuntimeStat, RuntimeStatsProvider
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+_LOGGER: Final = get_logger(__name__)
+
+_BYTES_PER_MB: Final = 1024 * 1024
+
+# The contents of a stored file. Files spilled to disk are read-only views of
+# memory-mapped temporary files, which the OS pages in and out as needed.
+FileContent: TypeAlias = Union[bytes, memoryview]
+
+_K = TypeVar("_K", bound=Hashable)
+
+
+def _get_size_option(key: str) -> int:
+    """Return a size config option, in megabytes, in bytes."""
+    megabytes: float = config.get_option(key)
+    return int(megabytes * _BYTES_PER_MB)
+
+
+def _get_spill_directory() -> str | None:
+    directory: str | None = config.get_option("server.fileSpillDirectory")
+    return directory or None
+
+
+def _map_file(file: IO[bytes]) -> memoryview:
+    """Return a read-only view of the contents of a temporary file.
+
+    The mapping stays valid after the file is closed. Temporary files are
+    already unlinked on POSIX systems, so the disk space is released as soon
+    as the view is garbage collected.
+    """
+    file.flush()
+    return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _spill(content: bytes) -> FileContent:
+    """Write content to a temporary file and return a view of it, or return
+    the content itself if that fails.
+    """
+    try:
+        with tempfile.TemporaryFile(dir=_get_spill_directory()) as file:
+            file.write(content)
+            return _map_file(file)
+    except OSError:
+        _LOGGER.warning(
+            "Failed to move a file to disk, keeping it in memory.", exc_info=True
+        )
+        return content
+
+
+class SpooledFileWriter:
+    """Receives the contents of a file in chunks, e.g. from a streamed upload.
+
+    The contents are kept in memory until they grow past
+    `server.fileSpillThreshold`, and then moved to a temporary file, so large
+    files are never buffered in memory as a whole.
+    """
+
+    def __init__(self) -> None:
+        self._threshold = _get_size_option("server.fileSpillThreshold")
+        # With a max_size of 0, the file never rolls over to disk.
+        self._file = tempfile.SpooledTemporaryFile(
+            max_size=self._threshold, dir=_get_spill_directory()
+        )
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self.size += len(data)
+
+    def writes_to_disk(self, size: int) -> bool:
+        """Return whether writing `size` more bytes writes to disk."""
+        return 0 < self._threshold < self.size + size
+
+    def getvalue(self) -> FileContent:
+        """Return the written contents and close the writer."""
+        try:
+            if self._threshold and self.size > self._threshold:
+                return _map_file(self._file)
+            self._file.seek(0)
+            return self._file.read()
+        finally:
+            self._file.close()
+
+    def close(self) -> None:
+        """Discard the written contents."""
+        self._file.close()
+
+
+class _Entry:
+    __slots__ = ("content", "moving_to_disk", "on_disk", "owner")
+
+    def __init__(self, content: FileContent, owner: str | None) -> None:
+        self.content = content
+        self.owner = owner
+        self.on_disk = isinstance(content, memoryview)
+        # Whether the entry was picked to be moved to disk, and is being
+        # written to a temporary file.
+        self.moving_to_disk = False
+
+
+class TieredFileStore(RuntimeStatsProvider, Generic[_K]):
+    """Stores file contents in memory, or on disk for large files.
+
+    Files larger than `server.fileSpillThreshold` are written to memory-mapped
+    temporary files. When the files kept in memory exceed
+    `server.fileMemoryBudget`, or the files of a single owner (e.g. a session)
+    exceed `server.sessionFileMemoryBudget`, the least recently used files are
+    moved to disk until the budget is met. Moved files stay available: callers
+    that keep the old bytes alive just delay freeing their memory. When the
+    files on disk exceed `server.fileDiskBudget`, the least recently used files
+    on disk are removed from the store.
+
+    This class is thread-safe. Files are written to disk without holding its
+    lock, so a slow disk doesn't block readers of other files.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        # In least recently used order.
+        self._entries: OrderedDict[_K, _Entry] = OrderedDict()
+        self._memory_bytes = 0
+        self._memory_bytes_by_owner: defaultdict[str, int] = defaultdict(int)
+        self._disk_bytes = 0
+        self._spills = 0
+        self._evictions = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """The total size of the files kept in memory."""
+        with self._lock:
+            return self._memory_bytes
+
+    def put(self, key: _K, content: FileContent, owner: str | None = None) -> None:
+        """Store the contents of a file, replacing any file with the same key.
+
+        Parameters
+        ----------
+        key
+            The key of the file.
+        content
+            The contents of the file. Contents returned by
+            `SpooledFileWriter.getvalue` may already be on disk.
+        owner
+            The owner of the file, e.g. a session id, whose files are subject
+            to `server.sessionFileMemoryBudget`.
+        """
+        threshold = _get_size_option("server.fileSpillThreshold")
+        if isinstance(content, bytes) and 0 < threshold < len(content):
+            content = _spill(content)
+
+        with self._lock:
+            if isinstance(content, memoryview):
+                self._spills += 1
+            self._remove_entry(key)
+            entry = _Entry(content, owner)
+            self._entries[key] = entry
+            self._account(entry, 1)
+            entries_to_move = self._pick_entries_to_move(owner)
+
+        for key_to_move, entry_to_move in entries_to_move:
+            self._move_to_disk(key_to_move, entry_to_move)
+
+        disk_budget = _get_size_option("server.fileDiskBudget")
+        if disk_budget > 0:
+            with self._lock:
+                self._evict_from_disk(disk_budget, keep=key)
+
+    def get(self, key: _K) -> FileContent | None:
+        """Return the contents of a file, or None if it isn't stored."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry.content
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def remove(self, key: _K) -> None:
+        """Remove a file. It's not an error to remove a file that isn't stored."""
+        with self._lock:
+            self._remove_entry(key)
+
+    def remove_owner(self, owner: str) -> None:
+        """Remove all files of an owner."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.owner == owner]:
+                self._remove_entry(key)
+
+    def _remove_entry(self, key: _K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._account(entry, -1)
+
+    def _account(self, entry: _Entry, sign: int) -> None:
+        size = len(entry.content) * sign
+        if entry.on_disk:
+            self._disk_bytes += size
+            return
+
+        self._memory_bytes += size
+        if entry.owner is not None:
+            self._memory_bytes_by_owner[entry.owner] += size
+            if not self._memory_bytes_by_owner[entry.owner]:
+                del self._memory_bytes_by_owner[entry.owner]
+
+    def _pick_entries_to_move(self, owner: str | None) -> list[tuple[_K, _Entry]]:
+        """Pick the least recently used files to move to disk for the memory
+        budgets to be met, and mark them as moving. Must be called with the
+        lock held.
+
+        Files already being moved by other threads count as moved.
+        """
+        owner_budget = _get_size_option("server.sessionFileMemoryBudget")
+        if owner is None:
+            owner_budget = 0
+        budget = _get_size_option("server.fileMemoryBudget")
+        if owner_budget <= 0 and budget <= 0:
+            return []
+
+        memory_bytes = self._memory_bytes
+        owner_bytes = (
+            self._memory_bytes_by_owner.get(owner, 0) if owner is not None else 0
+        )
+        for entry in self._entries.values():
+            if entry.moving_to_disk:
+                memory_bytes -= len(entry.content)
+                if entry.owner == owner:
+                    owner_bytes -= len(entry.content)
+
+        entries_to_move = []
+        for key, entry in self._entries.items():
+            over_owner_budget = 0 < owner_budget < owner_bytes
+            over_budget = 0 < budget < memory_bytes
+            if not over_owner_budget and not over_budget:
+                break
+            if entry.on_disk or entry.moving_to_disk or not entry.content:
+                continue
+            if over_budget or entry.owner == owner:
+                entry.moving_to_disk = True
+                entries_to_move.append((key, entry))
+                memory_bytes -= len(entry.content)
+                if entry.owner == owner:
+                    owner_bytes -= len(entry.content)
+        return entries_to_move
+
+    def _move_to_disk(self, key: _K, entry: _Entry) -> None:
+        """Write a file picked by `_pick_entries_to_move` to disk, and replace
+        its contents with the written file. Must be called without the lock.
+        """
+        content = _spill(cast("bytes", entry.content))
+        with self._lock:
+            entry.moving_to_disk = False
+            # The file may have been removed or replaced while it was written,
+            # in which case the written file is dropped.
+            if (
+                not isinstance(content, memoryview)
+                or self._entries.get(key) is not entry
+            ):
+                return
+            self._account(entry, -1)
+            entry.content = content
+            entry.on_disk = True
+            self._account(entry, 1)
+            self._spills += 1
+
+    def _evict_from_disk(self, budget: int, keep: _K) -> None:
+        """Remove the least recently used files on disk, other than `keep`,
+        until the disk budget is met. Must be called with the lock held.
+        """
+        for key, entry in list(self._entries.items()):
+            if self._disk_bytes <= budget:
+                break
+            if entry.on_disk and key != keep:
+                _LOGGER.debug("Discarding file %s to meet the disk budget.", key)
+                self._remove_entry(key)
+                self._evictions += 1
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        labels = (("store", self._name),)
+        with self._lock:
+            return [
+                RuntimeStat(
+                    "file_store_memory_bytes",
+                    "gauge",
+                    labels,
+                    self._memory_bytes,
+                    help="Size of the stored files kept in memory.",
+                    unit="bytes",
+                ),
+                RuntimeStat(
+                    "file_store_disk_bytes",
+                    "gauge",
+                    labels,
+                    self._disk_bytes,
+                    help="Size of the stored files spilled to temporary files.",
+                    unit="bytes",
+                ),
+                RuntimeStat(
+                    "file_store_spills",
+                    "counter",
+                    labels,
+                    self._spills,
+                    help="Files stored in temporary files.",
+                ),
+                RuntimeStat(
+                    "file_store_evictions",
+                    "counter",
+                    labels,
+                    self._evictions,
+                    help="Files discarded to meet the disk budget.",
+                ),
+            ]
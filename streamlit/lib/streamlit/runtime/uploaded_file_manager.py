@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import io
 from abc import abstractmethod
-from typing import TYPE_CHECKING, NamedTuple, Protocol
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, SupportsIndex
 
 from streamlit import util
 from streamlit.runtime.stats import CacheStatsProvider
@@ -25,15 +25,19 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from streamlit.proto.Common_pb2 import FileURLs as FileURLsProto
+    from streamlit.runtime.tiered_file_store import FileContent
 
 
 class UploadedFileRec(NamedTuple):
-    """Metadata and raw bytes for an uploaded file. Immutable."""
+    """Metadata and raw bytes for an uploaded file. Immutable.
+
+    The bytes of large files may be a read-only view of a memory-mapped file.
+    """
 
     file_id: str
     name: str
     type: str
-    data: bytes
+    data: FileContent
 
 
 class UploadFileUrlInfo(NamedTuple):
@@ -58,11 +62,48 @@ class DeletedFile(NamedTuple):
     file_id: str
 
 
+class _MappedFileReader(io.RawIOBase):
+    """Reads the memory-mapped contents of a file stored on disk, for an
+    io.BufferedReader.
+    """
+
+    def __init__(self, data: memoryview) -> None:
+        super().__init__()
+        self._data = data
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        with memoryview(buffer) as view, view.cast("B") as target:
+            data = self._data[self._pos : self._pos + len(target)]
+            target[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += len(self._data)
+        if pos < 0:
+            raise ValueError(f"negative seek value {pos}")
+        self._pos = pos
+        return pos
+
+
 class UploadedFile(io.BytesIO):
     """A mutable uploaded file.
 
     This class extends BytesIO, which has copy-on-write semantics when
-    initialized with `bytes`.
+    initialized with `bytes`. Files stored on disk are read through an
+    io.BufferedReader over their memory-mapped view instead, and only copied
+    into the BytesIO buffer when they are modified, pickled, or a writable
+    buffer is requested.
     """
 
     def __init__(self, record: UploadedFileRec, file_urls: FileURLsProto) -> None:
@@ -70,7 +111,14 @@ class UploadedFile(io.BytesIO):
         # the Python docs - possibly because it's a CPython-only optimization
         # and not guaranteed to be in other Python runtimes. But it's detailed
         # here: https://hg.python.org/cpython/rev/79a5fbe2c78f
-        super().__init__(record.data)
+        self._mapped: memoryview | None = None
+        self._reader: io.BufferedReader | None = None
+        if isinstance(record.data, memoryview):
+            super().__init__()
+            self._mapped = record.data
+            self._reader = io.BufferedReader(_MappedFileReader(record.data))
+        else:
+            super().__init__(record.data)
         self.file_id = record.file_id
         self.name = record.name
         self.type = record.type
@@ -88,6 +136,78 @@ class UploadedFile(io.BytesIO):
     def __repr__(self) -> str:
         return util.repr_(self)
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        # Memory-mapped views can't be pickled or copied.
+        self._copy_mapped()
+        return super().__reduce_ex__(protocol)
+
+    def __next__(self) -> bytes:
+        return next(self._reader) if self._reader else super().__next__()
+
+    def getvalue(self) -> bytes:
+        return bytes(self._mapped) if self._mapped else super().getvalue()
+
+    def getbuffer(self) -> memoryview:
+        self._copy_mapped()
+        return super().getbuffer()
+
+    def tell(self) -> int:
+        return self._reader.tell() if self._reader else super().tell()
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        return (
+            self._reader.seek(pos, whence)
+            if self._reader
+            else super().seek(pos, whence)
+        )
+
+    def read(self, size: int | None = -1) -> bytes:
+        return self._reader.read(size) if self._reader else super().read(size)
+
+    def read1(self, size: int | None = -1) -> bytes:
+        return self._reader.read1(size) if self._reader else super().read1(size)
+
+    def readinto(self, buffer: Any) -> int:
+        return (
+            self._reader.readinto(buffer) if self._reader else super().readinto(buffer)
+        )
+
+    def readline(self, size: int | None = -1) -> bytes:
+        return self._reader.readline(size) if self._reader else super().readline(size)
+
+    def readlines(self, hint: int | None = -1) -> list[bytes]:
+        return self._reader.readlines(hint) if self._reader else super().readlines(hint)
+
+    def write(self, buffer: Any) -> int:
+        self._copy_mapped()
+        return super().write(buffer)
+
+    def writelines(self, lines: Any) -> None:
+        self._copy_mapped()
+        super().writelines(lines)
+
+    def truncate(self, size: int | None = None) -> int:
+        self._copy_mapped()
+        return super().truncate(size)
+
+    def close(self) -> None:
+        # Drop the view, so the memory-mapped file can be released.
+        self._mapped = None
+        self._reader = None
+        super().close()
+
+    def _copy_mapped(self) -> None:
+        """Copy the contents of a file stored on disk into the BytesIO buffer,
+        before it's modified.
+        """
+        if self._mapped is None or self._reader is None:
+            return
+        mapped, pos = self._mapped, self._reader.tell()
+        self._mapped = None
+        self._reader = None
+        super().__init__(mapped)
+        super().seek(pos)
+
 
 class UploadedFileManager(CacheStatsProvider, Protocol):
     """UploadedFileManager protocol, that should be implemented by the concrete
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import hmac
 import json
+import time
 from typing import TYPE_CHECKING, Any, Final
 from urllib.parse import urlparse
 
@@ -31,6 +32,7 @@ from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.runtime import Runtime, SessionClient, SessionClientDisconnectedError
+from streamlit.runtime.forward_msg_cache import forward_msg_stats
 from streamlit.runtime.runtime_util import serialize_forward_msg
 from streamlit.web.server.server_util import (
     AUTH_COOKIE_NAME,
@@ -123,10 +125,16 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
 
     def write_forward_msg(self, msg: ForwardMsg) -> None:
         """Send a ForwardMsg to the browser."""
+        serialized_msg = serialize_forward_msg(msg)
+        start_time = time.perf_counter()
         try:
-            self.write_message(serialize_forward_msg(msg), binary=True)
+            self.write_message(serialized_msg, binary=True)
         except tornado.websocket.WebSocketClosedError as e:
             raise SessionClientDisconnectedError from e
+        finally:
+            # Tornado buffers the frame, so this is the time to compress and
+            # queue it, and to flush it if the socket is writable.
+            forward_msg_stats.record_write(msg, time.perf_counter() - start_time)
 
     def select_subprotocol(self, subprotocols: list[str]) -> str | None:
         """Return the first subprotocol in the given list.
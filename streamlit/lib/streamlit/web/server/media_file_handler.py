@@ -14,7 +14,8 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import os
+from typing import TYPE_CHECKING, Any, Final, cast
 from urllib.parse import quote
 
 import tornado.web
@@ -27,8 +28,20 @@ from streamlit.runtime.memory_media_file_storage import (
 )
 from streamlit.web.server import allow_all_cross_origin_requests, is_allowed_origin
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 _LOGGER = get_logger(__name__)
 
+# The size of the chunks in which media files stored on disk are sent. Tornado
+# flushes each chunk before reading the next one from the file.
+_CHUNK_SIZE: Final = 256 * 1024
+
+
+def _iter_chunks(content: memoryview, start: int, end: int) -> Iterator[bytes]:
+    for chunk_start in range(start, end, _CHUNK_SIZE):
+        yield bytes(content[chunk_start : min(chunk_start + _CHUNK_SIZE, end)])
+
 
 class MediaFileHandler(tornado.web.StaticFileHandler):
     _storage: MemoryMediaFileStorage
@@ -112,6 +125,13 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
         # allow caching among files in the MediaFileManager
         return None
 
+    @classmethod
+    def get_content_version(cls, abspath: str) -> str:
+        # File ids are hashes of the file content, so they can be used as
+        # versions without hashing the whole content again, as the default
+        # implementation does.
+        return os.path.splitext(abspath)[0]
+
     @classmethod
     def get_absolute_path(cls, root: str, path: str) -> str:  # noqa: ARG003
         # All files are stored in memory, so the absolute path is just the
@@ -135,14 +155,22 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
             "MediaFileHandler: Sending %s file %s", media_file.mimetype, abspath
         )
 
+        content = media_file.content
+        if isinstance(content, memoryview):
+            # The file is stored on disk. Send it in chunks, so that only the
+            # chunk being sent has to be paged in.
+            return _iter_chunks(
+                content, start or 0, len(content) if end is None else end
+            )
+
         # If there is no start and end, just return the full content
         if start is None and end is None:
-            return media_file.content
+            return content
 
         if start is None:
             start = 0
         if end is None:
-            end = len(media_file.content)
+            end = len(content)
 
         # content is bytes that work just by slicing supplied by start and end
-        return media_file.content[start:end]
+        return content[start:end]
@@ -312,6 +312,8 @@ class Server:
         )
 
         self._runtime.stats_mgr.register_provider(media_file_storage)
+        self._runtime.stats_mgr.register_runtime_stats_provider(media_file_storage)
+        self._runtime.stats_mgr.register_runtime_stats_provider(uploaded_file_mgr)
 
     @classmethod
     def initialize_mimetypes(cls) -> None:
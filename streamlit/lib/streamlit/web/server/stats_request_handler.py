@@ -23,7 +23,7 @@ from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
 
 if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-    from streamlit.runtime.stats import CacheStat, StatsManager
+    from streamlit.runtime.stats import CacheStat, RuntimeStat, StatsManager
 
 
 class StatsRequestHandler(tornado.web.RequestHandler):
@@ -46,36 +46,64 @@ class StatsRequestHandler(tornado.web.RequestHandler):
             emit_endpoint_deprecation_notice(self, new_path="/_stcore/metrics")
 
         stats = self._manager.get_stats()
+        runtime_stats = self._manager.get_runtime_stats()
 
         # If the request asked for protobuf output, we return a serialized
         # protobuf. Else we return text.
         if "application/x-protobuf" in self.request.headers.get_list("Accept"):
-            self.write(self._stats_to_proto(stats).SerializeToString())
+            self.write(self._stats_to_proto(stats, runtime_stats).SerializeToString())
             self.set_header("Content-Type", "application/x-protobuf")
             self.set_status(200)
         else:
-            self.write(self._stats_to_text(self._manager.get_stats()))
+            self.write(self._stats_to_text(stats, runtime_stats))
             self.set_header("Content-Type", "application/openmetrics-text")
             self.set_status(200)
 
     @staticmethod
-    def _stats_to_text(stats: list[CacheStat]) -> str:
+    def _group_runtime_stats(
+        runtime_stats: list[RuntimeStat],
+    ) -> dict[str, list[RuntimeStat]]:
+        families: dict[str, list[RuntimeStat]] = {}
+        for stat in runtime_stats:
+            families.setdefault(stat.family_name, []).append(stat)
+        return families
+
+    @staticmethod
+    def _stats_to_text(
+        stats: list[CacheStat], runtime_stats: list[RuntimeStat] | None = None
+    ) -> str:
         metric_type = "# TYPE cache_memory_bytes gauge"
         metric_unit = "# UNIT cache_memory_bytes bytes"
         metric_help = "# HELP Total memory consumed by a cache."
         openmetrics_eof = "# EOF\n"
 
-        # Format: header, stats, EOF
+        # Format: header, stats, [header, stats for each runtime family], EOF
         result = [metric_type, metric_unit, metric_help]
         result.extend(stat.to_metric_str() for stat in stats)
+
+        families = StatsRequestHandler._group_runtime_stats(runtime_stats or [])
+        for family_name, family_stats in families.items():
+            first = family_stats[0]
+            result.append(f"# TYPE {family_name} {first.metric_type}")
+            if first.unit:
+                result.append(f"# UNIT {family_name} {first.unit}")
+            result.append(f"# HELP {family_name} {first.help}")
+            result.extend(stat.to_metric_str() for stat in family_stats)
+
         result.append(openmetrics_eof)
 
         return "\n".join(result)
 
     @staticmethod
-    def _stats_to_proto(stats: list[CacheStat]) -> MetricSetProto:
+    def _stats_to_proto(
+        stats: list[CacheStat], runtime_stats: list[RuntimeStat] | None = None
+    ) -> MetricSetProto:
         # Lazy load the import of this proto message for better performance:
-        from streamlit.proto.openmetrics_data_model_pb2 import GAUGE
+        from streamlit.proto.openmetrics_data_model_pb2 import (
+            COUNTER,
+            GAUGE,
+            HISTOGRAM,
+        )
         from streamlit.proto.openmetrics_data_model_pb2 import (
             MetricSet as MetricSetProto,
         )
@@ -94,4 +122,21 @@ class StatsRequestHandler(tornado.web.RequestHandler):
 
         metric_set = MetricSetProto()
         metric_set.metric_families.append(metric_family)
+
+        families = StatsRequestHandler._group_runtime_stats(runtime_stats or [])
+        for family_name, family_stats in families.items():
+            first = family_stats[0]
+            runtime_family = metric_set.metric_families.add()
+            runtime_family.name = family_name
+            runtime_family.type = {
+                "counter": COUNTER,
+                "gauge": GAUGE,
+                "histogram": HISTOGRAM,
+            }[first.metric_type]
+            runtime_family.unit = first.unit
+            runtime_family.help = first.help
+
+            for stat in family_stats:
+                stat.marshall_metric_proto(runtime_family.metrics.add())
+
         return metric_set
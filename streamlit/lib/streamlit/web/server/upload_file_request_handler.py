@@ -14,22 +14,173 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, cast
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Final, cast
 
 import tornado.httputil
+import tornado.ioloop
 import tornado.web
 
 from streamlit import config
+from streamlit.runtime.tiered_file_store import SpooledFileWriter
 from streamlit.runtime.uploaded_file_manager import UploadedFileRec
 from streamlit.web.server import routes, server_util
 from streamlit.web.server.server_util import is_xsrf_enabled
 
 if TYPE_CHECKING:
+    from asyncio import Future
+
     from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 
+# Max size of the headers of a part of a multipart/form-data body.
+_MAX_PART_HEADERS_SIZE: Final = 64 * 1024
+
+
+class _ParserState(Enum):
+    PREAMBLE = "preamble"
+    DELIMITER = "delimiter"
+    HEADERS = "headers"
+    BODY = "body"
+    DONE = "done"
+
+
+class _UploadedFilePart:
+    def __init__(self, filename: str, content_type: str) -> None:
+        self.filename = filename
+        self.content_type = content_type
+        self.writer = SpooledFileWriter()
+
+
+def _get_multipart_boundary(content_type: str) -> bytes | None:
+    """Return the boundary of a multipart/form-data body, like
+    `tornado.httputil.parse_body_arguments` does.
+    """
+    if not content_type.startswith("multipart/form-data"):
+        return None
+
+    for field in content_type.split(";"):
+        key, _, value = field.strip().partition("=")
+        if key == "boundary" and value:
+            boundary = value.encode()
+            if boundary.startswith(b'"') and boundary.endswith(b'"'):
+                boundary = boundary[1:-1]
+            return boundary
+    return None
+
+
+class _MultipartFileParser:
+    """Incrementally parses a multipart/form-data request body, and streams
+    the contents of its files into SpooledFileWriters, so that large uploads
+    are never buffered in memory as a whole.
+
+    The headers of each part are parsed by Tornado, so parts are interpreted
+    like by `tornado.httputil.parse_multipart_form_data`. The contents of
+    parts that aren't files are discarded.
+    """
+
+    def __init__(self, boundary: bytes) -> None:
+        self._boundary = boundary
+        self._delimiter = b"\r\n--" + boundary
+        # The first delimiter of a body isn't preceded by a line break.
+        self._buffer = bytearray(b"\r\n")
+        self._state = _ParserState.PREAMBLE
+        self._part: _UploadedFilePart | None = None
+        self.files: list[_UploadedFilePart] = []
+        # Whether the final delimiter was found.
+        self.complete = False
 
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+        while self._state != _ParserState.DONE and self._parse_next():
+            pass
+
+    def writes_to_disk(self, data: bytes) -> bool:
+        """Return whether feeding `data` writes to the temporary file of a
+        large file.
+        """
+        return self._part is not None and self._part.writer.writes_to_disk(len(data))
+
+    def close(self) -> None:
+        """Discard the contents of all files."""
+        for part in self.files:
+            part.writer.close()
+
+    def _parse_next(self) -> bool:
+        """Parse the next element of the buffered body. Return False if more
+        data is needed.
+        """
+        buffer = self._buffer
+
+        if self._state in (_ParserState.PREAMBLE, _ParserState.BODY):
+            index = buffer.find(self._delimiter)
+            if index == -1:
+                # Keep enough data to find a delimiter split across chunks.
+                self._consume(len(buffer) - len(self._delimiter) + 1)
+                return False
+            self._consume(index)
+            del buffer[: len(self._delimiter)]
+            self._part = None
+            self._state = _ParserState.DELIMITER
+            return True
+
+        if self._state == _ParserState.DELIMITER:
+            if len(buffer) < 2:
+                return False
+            if buffer.startswith(b"--"):
+                self.complete = True
+                self._state = _ParserState.DONE
+            elif buffer.startswith(b"\r\n"):
+                del buffer[:2]
+                self._state = _ParserState.HEADERS
+            else:
+                # Malformed body. It won't be complete.
+                self._state = _ParserState.DONE
+            return True
+
+        # _ParserState.HEADERS
+        index = 0 if buffer.startswith(b"\r\n") else buffer.find(b"\r\n\r\n")
+        if index == -1:
+            if len(buffer) > _MAX_PART_HEADERS_SIZE:
+                self._state = _ParserState.DONE
+            return False
+        headers_end = index + (2 if index == 0 else 4)
+        self._start_part(bytes(buffer[:headers_end]))
+        del buffer[:headers_end]
+        self._state = _ParserState.BODY
+        return True
+
+    def _consume(self, size: int) -> None:
+        """Write the first bytes of the buffer to the current file."""
+        if size <= 0:
+            return
+        if self._part is not None:
+            self._part.writer.write(bytes(self._buffer[:size]))
+        del self._buffer[:size]
+
+    def _start_part(self, headers: bytes) -> None:
+        # Let Tornado parse a body that only contains the headers of the part.
+        files: dict[str, list[Any]] = {}
+        tornado.httputil.parse_multipart_form_data(
+            self._boundary,
+            b"--" + self._boundary + b"\r\n" + headers + self._delimiter + b"--",
+            {},
+            files,
+        )
+        for flist in files.values():
+            for file in flist:
+                self._part = _UploadedFilePart(file["filename"], file["content_type"])
+                self.files.append(self._part)
+                return
+
+
+@tornado.web.stream_request_body
 class UploadFileRequestHandler(tornado.web.RequestHandler):
-    """Implements the POST /upload_file endpoint."""
+    """Implements the POST /upload_file endpoint.
+
+    The request body is parsed while it's received, and the uploaded file is
+    written to disk if it's large. Writes to disk are done in a thread, so they
+    don't block the event loop.
+    """
 
     def initialize(
         self,
@@ -48,6 +199,43 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
         """
         self._file_mgr = file_mgr
         self._is_active_session = is_active_session
+        self._parser: _MultipartFileParser | None = None
+        # The chunk being written to disk in a thread, if any.
+        self._pending_write: Future[None] | None = None
+
+    def prepare(self) -> None:
+        boundary = _get_multipart_boundary(self.request.headers.get("Content-Type", ""))
+        if boundary:
+            self._parser = _MultipartFileParser(boundary)
+
+    async def data_received(self, chunk: bytes) -> None:
+        if self._parser is None:
+            return
+        if not self._parser.writes_to_disk(chunk):
+            self._parser.feed(chunk)
+            return
+        # Tornado doesn't read more of the body until the chunk is written.
+        self._pending_write = tornado.ioloop.IOLoop.current().run_in_executor(
+            None, self._parser.feed, chunk
+        )
+        await self._pending_write
+
+    def on_finish(self) -> None:
+        # Discard the files that weren't added to the UploadedFileManager.
+        self._close_parser()
+
+    def on_connection_close(self) -> None:
+        self._close_parser()
+
+    def _close_parser(self) -> None:
+        parser = self._parser
+        if parser is None:
+            return
+        if self._pending_write is not None and not self._pending_write.done():
+            # Don't close the files while a chunk is written to them.
+            self._pending_write.add_done_callback(lambda _: parser.close())
+        else:
+            parser.close()
 
     def set_default_headers(self) -> None:
         self.set_header("Access-Control-Allow-Methods", "PUT, OPTIONS, DELETE")
@@ -88,19 +276,9 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
     def put(self, **kwargs: Any) -> None:
         """Receive an uploaded file and add it to our UploadedFileManager."""
 
-        args: dict[str, list[bytes]] = {}
-        files: dict[str, list[Any]] = {}
-
         session_id = self.path_kwargs["session_id"]
         file_id = self.path_kwargs["file_id"]
 
-        tornado.httputil.parse_body_arguments(
-            content_type=self.request.headers["Content-Type"],
-            body=self.request.body,
-            arguments=args,
-            files=files,
-        )
-
         try:
             if not self._is_active_session(session_id):
                 self.send_error(400, reason="Invalid session_id")
@@ -109,18 +287,9 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
             self.send_error(400, reason=str(ex))
             return
 
-        uploaded_files: list[UploadedFileRec] = []
-
-        for flist in files.values():
-            uploaded_files.extend(
-                UploadedFileRec(
-                    file_id=file_id,
-                    name=file["filename"],
-                    type=file["content_type"],
-                    data=file["body"],
-                )
-                for file in flist
-            )
+        uploaded_files: list[_UploadedFilePart] = []
+        if self._parser is not None and self._parser.complete:
+            uploaded_files = self._parser.files
 
         if len(uploaded_files) != 1:
             self.send_error(
@@ -128,7 +297,16 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
             )
             return
 
-        self._file_mgr.add_file(session_id=session_id, file=uploaded_files[0])
+        uploaded_file = uploaded_files[0]
+        self._file_mgr.add_file(
+            session_id=session_id,
+            file=UploadedFileRec(
+                file_id=file_id,
+                name=uploaded_file.filename,
+                type=uploaded_file.content_type,
+                data=uploaded_file.writer.getvalue(),
+            ),
+        )
         self.set_status(204)
 
     def delete(self, **kwargs: Any) -> None:
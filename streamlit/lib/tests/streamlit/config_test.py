@@ -507,6 +507,7 @@ class ConfigTest(unittest.TestCase):
                 "browser.gatherUsageStats",
                 "browser.serverAddress",
                 "browser.serverPort",
+                "client.chartDownsampleThreshold",
                 "client.showErrorDetails",
                 "client.showSidebarNavigation",
                 "client.toolbarMode",
@@ -569,6 +570,8 @@ class ConfigTest(unittest.TestCase):
                 "logger.enableRich",
                 "logger.level",
                 "logger.messageFormat",
+                "runner.diffElements",
+                "runner.maxConcurrentScriptRuns",
                 "runner.enforceSerializableSessionState",
                 "runner.magicEnabled",
                 "runner.postScriptGC",
@@ -584,6 +587,7 @@ class ConfigTest(unittest.TestCase):
                 "server.cookieSecret",
                 "server.corsAllowedOrigins",
                 "server.customComponentBaseUrlPath",
+                "server.deepMemoryStatsInterval",
                 "server.disconnectedSessionTTL",
                 "server.enableArrowTruncation",
                 "server.enableCORS",
@@ -591,6 +595,10 @@ class ConfigTest(unittest.TestCase):
                 "server.enableWebsocketCompression",
                 "server.websocketPingInterval",
                 "server.enableXsrfProtection",
+                "server.fileDiskBudget",
+                "server.fileMemoryBudget",
+                "server.fileSpillDirectory",
+                "server.fileSpillThreshold",
                 "server.fileWatcherType",
                 "server.folderWatchBlacklist",
                 "server.folderWatchList",
@@ -600,6 +608,7 @@ class ConfigTest(unittest.TestCase):
                 "server.port",
                 "server.runOnSave",
                 "server.scriptHealthCheckEnabled",
+                "server.sessionFileMemoryBudget",
                 "server.showEmailPrompt",
                 "server.sslCertFile",
                 "server.sslKeyFile",
@@ -29,6 +29,7 @@ from parameterized import parameterized
 from PIL import Image, ImageDraw
 
 import streamlit as st
+from streamlit import runtime
 from streamlit.elements.lib.image_utils import (
     AtomicImage,
     _image_may_have_alpha_channel,
@@ -586,3 +587,58 @@ class ImageProtoTest(DeltaGeneratorTestCase):
             st.image(img, width=invalid_width)
 
         assert str(exc_info.value) == expected_error_message
+
+    def test_unchanged_image_not_encoded_again(self):
+        """An image that was already encoded reuses its media file."""
+        img = np.zeros((32, 32, 3), dtype=np.uint8)
+
+        st.image(img)
+        url = self.get_delta_from_queue().new_element.imgs.imgs[0].url
+
+        with mock.patch(
+            "streamlit.elements.lib.image_utils._np_array_to_bytes"
+        ) as mock_to_bytes:
+            st.image(img)
+            st.image(img.copy())
+            mock_to_bytes.assert_not_called()
+
+        assert self.get_delta_from_queue().new_element.imgs.imgs[0].url == url
+
+    def test_changed_image_encoded_again(self):
+        """Mutating an image, or displaying it differently, encodes it again."""
+        img = np.zeros((32, 32, 3), dtype=np.uint8)
+        st.image(img)
+        url = self.get_delta_from_queue().new_element.imgs.imgs[0].url
+
+        img[0, 0] = 255
+        st.image(img)
+        assert self.get_delta_from_queue().new_element.imgs.imgs[0].url != url
+
+        st.image(img, output_format="PNG")
+        assert self.get_delta_from_queue().new_element.imgs.imgs[0].url.endswith(".png")
+
+    def test_removed_media_file_added_again(self):
+        """An image whose media file was removed is encoded and added again."""
+        img = Image.new("RGB", (64, 64), color="red")
+        st.image(img)
+        url = self.get_delta_from_queue().new_element.imgs.imgs[0].url
+
+        media_file_mgr = runtime.get_instance().media_file_mgr
+        media_file_mgr.clear_session_refs()
+        media_file_mgr.remove_orphaned_files()
+
+        st.image(img)
+        assert self.get_delta_from_queue().new_element.imgs.imgs[0].url == url
+        file_id = _calculate_file_id(_pil_to_bytes(img, format="JPEG"), "image/jpeg")
+        assert self.media_file_storage.get_file(file_id) is not None
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_image_gallery_performance(self):
+        """Benchmark rerunning a gallery of unchanged thumbnails."""
+        rng = np.random.default_rng(0)
+        thumbnails = [
+            Image.fromarray(rng.integers(0, 255, (256, 256, 3), dtype=np.uint8))
+            for _ in range(50)
+        ]
+
+        self.benchmark(lambda: st.image(thumbnails, width=128))
@@ -0,0 +1,242 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the downsampling of built-in chart data."""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit.elements.lib.chart_downsampling import (
+    DownsamplingInfo,
+    downsample_chart_data,
+)
+
+
+def _create_series_df(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=num_rows, freq="min"),
+            "a": rng.standard_normal(num_rows).cumsum(),
+            "b": rng.standard_normal(num_rows),
+        }
+    )
+
+
+class DownsampleChartDataTest(unittest.TestCase):
+    def test_small_data_is_unchanged(self) -> None:
+        """Data with at most max_rows rows, or a max_rows of 0, isn't changed."""
+        df = _create_series_df(100)
+
+        for max_rows in [0, 100]:
+            out_df, info = downsample_chart_data(
+                df,
+                "min_max",
+                x_column="time",
+                y_column_list=["a"],
+                color_column=None,
+                max_rows=max_rows,
+            )
+            assert out_df is df
+            assert info is None
+
+    def test_min_max_keeps_extremes(self) -> None:
+        """Min-max downsampling keeps the first and last rows, and the lowest
+        and highest value of each series."""
+        df = _create_series_df(10000)
+
+        out_df, info = downsample_chart_data(
+            df,
+            "min_max",
+            x_column="time",
+            y_column_list=["a", "b"],
+            color_column=None,
+            max_rows=500,
+        )
+
+        assert info == DownsamplingInfo("min_max", 10000, len(out_df))
+        assert len(out_df) <= 500
+        assert out_df.index[0] == 0
+        assert out_df.index[-1] == 9999
+        for name in ["a", "b"]:
+            assert out_df[name].min() == df[name].min()
+            assert out_df[name].max() == df[name].max()
+        # Rows are kept unchanged, in their original order.
+        pd.testing.assert_frame_equal(out_df, df.loc[out_df.index])
+        assert out_df.index.is_monotonic_increasing
+
+    def test_min_max_sorts_by_x(self) -> None:
+        """Buckets are made of rows with neighboring x values, even if the
+        data isn't sorted by x."""
+        df = _create_series_df(10000).sample(frac=1, random_state=0)
+
+        out_df, _ = downsample_chart_data(
+            df,
+            "min_max",
+            x_column="time",
+            y_column_list=["a"],
+            color_column=None,
+            max_rows=100,
+        )
+
+        assert out_df["time"].min() == df["time"].min()
+        assert out_df["time"].max() == df["time"].max()
+        assert out_df["a"].min() == df["a"].min()
+        assert out_df["a"].max() == df["a"].max()
+
+    def test_index_as_x(self) -> None:
+        """The index is used as x if there's no x column."""
+        df = _create_series_df(10000).set_index("time")
+
+        out_df, info = downsample_chart_data(
+            df,
+            "min_max",
+            x_column=None,
+            y_column_list=["a"],
+            color_column=None,
+            max_rows=100,
+        )
+
+        assert info is not None
+        assert out_df.index[0] == df.index[0]
+        assert out_df.index[-1] == df.index[-1]
+
+    def test_missing_values(self) -> None:
+        """Missing values don't hide the extremes of a bucket."""
+        df = pd.DataFrame({"x": range(1000), "y": np.nan})
+        df.loc[500, "y"] = 1.0
+
+        out_df, _ = downsample_chart_data(
+            df,
+            "min_max",
+            x_column="x",
+            y_column_list=["y"],
+            color_column=None,
+            max_rows=10,
+        )
+
+        assert 500 in out_df.index
+
+    def test_colors_are_downsampled_separately(self) -> None:
+        """Every series of a color column is downsampled on its own."""
+        df = _create_series_df(9000)
+        df["color"] = ["red", "green", None] * 3000
+
+        out_df, _ = downsample_chart_data(
+            df,
+            "min_max",
+            x_column="time",
+            y_column_list=["a"],
+            color_column="color",
+            max_rows=300,
+        )
+
+        assert len(out_df) <= 300
+        for _, group in df.groupby("color", dropna=False):
+            out_group = out_df.loc[out_df.index.intersection(group.index)]
+            assert out_group["a"].min() == group["a"].min()
+            assert out_group["a"].max() == group["a"].max()
+
+    def test_too_many_colors(self) -> None:
+        """Data isn't downsampled if there's no room for two rows per series."""
+        df = pd.DataFrame({"x": range(1000), "y": range(1000), "c": range(1000)})
+
+        out_df, info = downsample_chart_data(
+            df,
+            "min_max",
+            x_column="x",
+            y_column_list=["y"],
+            color_column="c",
+            max_rows=100,
+        )
+
+        assert out_df is df
+        assert info is None
+
+    def test_grid(self) -> None:
+        """Grid downsampling keeps one row per cell of a grid over x and y."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {"x": rng.uniform(0, 1, 10000), "y": rng.uniform(0, 1, 10000)}
+        )
+
+        out_df, info = downsample_chart_data(
+            df,
+            "grid",
+            x_column="x",
+            y_column_list=["y"],
+            color_column=None,
+            max_rows=100,
+        )
+
+        assert info is not None
+        assert info.method == "grid"
+        # A 9 x 9 grid, leaving room for the bins of missing values.
+        assert len(out_df) == 81
+        pd.testing.assert_frame_equal(out_df, df.loc[out_df.index])
+
+    def test_non_numeric_data_is_unchanged(self) -> None:
+        """Data with x or y values that aren't numbers or dates isn't
+        downsampled."""
+        df = pd.DataFrame({"x": [str(i) for i in range(1000)], "y": range(1000)})
+
+        out_df, info = downsample_chart_data(
+            df,
+            "min_max",
+            x_column="x",
+            y_column_list=["y"],
+            color_column=None,
+            max_rows=100,
+        )
+        assert out_df is df
+        assert info is None
+
+        out_df, info = downsample_chart_data(
+            df,
+            "min_max",
+            x_column="y",
+            y_column_list=["x"],
+            color_column=None,
+            max_rows=100,
+        )
+        assert out_df is df
+        assert info is None
+
+    def test_to_usermeta(self) -> None:
+        """The info is recorded in the usermeta of a chart's spec."""
+        info = DownsamplingInfo("min_max", 1000, 100)
+        assert info.to_usermeta() == {
+            "downsampling": {"method": "min_max", "originalRows": 1000, "rows": 100}
+        }
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_downsample_performance(self) -> None:
+        """Benchmark downsampling a long series."""
+        df = _create_series_df(1_000_000)
+
+        self.benchmark(
+            lambda: downsample_chart_data(
+                df,
+                "min_max",
+                x_column="time",
+                y_column_list=["a", "b"],
+                color_column=None,
+                max_rows=5000,
+            )
+        )
@@ -45,6 +45,7 @@ from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.caching import cached_message_replay
 from streamlit.type_util import is_altair_version_less_than
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
+from tests.testutil import patch_config_options
 
 df1 = pd.DataFrame([["A", "B", "C", "D"], [28, 55, 43, 91]], index=["a", "b"]).T
 df2 = pd.DataFrame([["E", "F", "G", "H"], [11, 12, 13, 14]], index=["a", "b"]).T
@@ -1374,6 +1375,45 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
         # So if there's no exception, then the test passes.
         st.line_chart(df, x="b", y="c", color="d")
 
+    @parameterized.expand(ST_CHART_ARGS)
+    @patch_config_options({"client.chartDownsampleThreshold": 100})
+    def test_large_data_is_downsampled(
+        self, chart_command: Callable, altair_type: str
+    ) -> None:
+        """Built-in charts with more rows than the threshold are downsampled,
+        and record it in the spec's usermeta."""
+        df = pd.DataFrame({"x": range(1000), "y": [i % 7 for i in range(1000)]})
+
+        chart_command(df, x="x", y="y")
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        chart_spec = json.loads(proto.spec)
+        downsampling = chart_spec["usermeta"]["downsampling"]
+        assert downsampling["method"] == (
+            "grid" if chart_command == st.scatter_chart else "min_max"
+        )
+        assert downsampling["originalRows"] == 1000
+
+        output_df = convert_arrow_bytes_to_pandas_df(proto.datasets[0].data.data)
+        assert len(output_df) == downsampling["rows"]
+        assert len(output_df) <= 100
+        assert output_df["y"].min() == 0
+        assert output_df["y"].max() == 6
+
+    @parameterized.expand(ST_CHART_ARGS)
+    def test_downsampling_is_disabled_by_default(
+        self, chart_command: Callable, altair_type: str
+    ) -> None:
+        """Built-in charts send all rows unless a threshold is configured."""
+        df = pd.DataFrame({"x": range(1000), "y": range(1000)})
+
+        chart_command(df, x="x", y="y")
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        assert "usermeta" not in json.loads(proto.spec)
+        output_df = convert_arrow_bytes_to_pandas_df(proto.datasets[0].data.data)
+        assert len(output_df) == 1000
+
     @parameterized.expand(ST_CHART_ARGS)
     def test_unused_columns_are_dropped(
         self, chart_command: Callable, altair_type: str
@@ -25,6 +25,8 @@ import unittest
 from typing import Any
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
+import numpy as np
+import pandas as pd
 import pytest
 from parameterized import parameterized
 
@@ -270,6 +272,77 @@ If you think this is actually a Streamlit bug, please
         assert example_instance.foo(1) == 2
 
 
+class CacheDataCopyTest(unittest.TestCase):
+    """st.cache_data tests for the `copy` option."""
+
+    def setUp(self) -> None:
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+    def tearDown(self) -> None:
+        st.cache_data.clear()
+
+    def test_copies_arrays_by_default(self) -> None:
+        """By default, each call returns its own writeable copy of an array."""
+
+        @st.cache_data
+        def f() -> np.ndarray:
+            return np.arange(1000)
+
+        r1 = f()
+        r2 = f()
+
+        assert r2.flags.writeable
+        assert not np.shares_memory(r1, r2)
+
+    def test_shares_arrays_without_copy(self) -> None:
+        """With `copy=False`, cache hits return read-only views of the same array."""
+
+        @st.cache_data(copy=False)
+        def f() -> np.ndarray:
+            return np.arange(1000)
+
+        f()
+        r1 = f()
+        r2 = f()
+
+        np.testing.assert_array_equal(r1, np.arange(1000))
+        assert not r1.flags.writeable
+        assert np.shares_memory(r1, r2)
+        with pytest.raises(ValueError, match="read-only"):
+            r1[0] = 1
+
+    def test_shares_dataframes_without_copy(self) -> None:
+        """With `copy=False`, cache hits return DataFrames sharing their data."""
+
+        expected = pd.DataFrame({"a": np.arange(100), "b": np.arange(100) * 2.0})
+
+        @st.cache_data(copy=False)
+        def f() -> pd.DataFrame:
+            return expected.copy()
+
+        f()
+        df1 = f()
+        df2 = f()
+
+        pd.testing.assert_frame_equal(df1, expected)
+        assert np.shares_memory(df1["b"].to_numpy(), df2["b"].to_numpy())
+
+    def test_shares_values_without_buffers(self) -> None:
+        """With `copy=False`, values without data buffers are still unpickled."""
+
+        @st.cache_data(copy=False)
+        def f() -> list[int]:
+            return [0, 1]
+
+        r1 = f()
+        r1[0] = 1
+
+        assert f() == [0, 1]
+
+
 class CacheDataPersistTest(DeltaGeneratorTestCase):
     """st.cache_data disk persistence tests"""
 
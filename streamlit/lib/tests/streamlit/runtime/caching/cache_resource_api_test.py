@@ -31,6 +31,7 @@ from streamlit.runtime.caching import (
     get_resource_cache_stats_provider,
 )
 from streamlit.runtime.caching.hashing import UserHashError
+from streamlit.runtime.memory_estimate import estimate_size
 from streamlit.runtime.scriptrunner import add_script_run_ctx
 from streamlit.runtime.stats import CacheStat
 from streamlit.vendor.pympler.asizeof import asizeof
@@ -341,6 +342,45 @@ class CacheResourceStatsProviderTest(unittest.TestCase):
         # instead of List equality
         assert set(expected) == set(get_resource_cache_stats_provider().get_stats())
 
+    def test_deep_stats(self):
+        """Deep stats measure each entry with asizeof."""
+
+        @st.cache_resource
+        def foo(count):
+            return [3.14] * count
+
+        foo(53)
+
+        # asizeof measures instance dicts as CPython reports them, and their
+        # size depends on allocation history, so measure the expected value
+        # before the cached entry's dict is materialized.
+        expected = [
+            CacheStat(
+                category_name="st_cache_resource",
+                cache_name=f"{foo.__module__}.{foo.__qualname__}",
+                byte_length=asizeof(as_cached_result([3.14] * 53)),
+            )
+        ]
+        assert get_resource_cache_stats_provider().get_deep_stats() == expected
+
+    def test_stats_forget_evicted_entries(self):
+        """Entries evicted from a full cache are not reported anymore."""
+
+        @st.cache_resource(max_entries=1)
+        def foo(count):
+            return [3.14] * count
+
+        foo(1)
+        foo(53)
+
+        assert get_resource_cache_stats_provider().get_stats() == [
+            CacheStat(
+                category_name="st_cache_resource",
+                cache_name=f"{foo.__module__}.{foo.__qualname__}",
+                byte_length=get_byte_length(as_cached_result([3.14] * 53)),
+            )
+        ]
+
 
 class CacheResourceMessageReplayTest(DeltaGeneratorTestCase):
     def setUp(self):
@@ -490,5 +530,5 @@ class CacheResourceMessageReplayTest(DeltaGeneratorTestCase):
 
 
 def get_byte_length(value: Any) -> int:
-    """Return the byte length of the pickled value."""
-    return asizeof(value)
+    """Return the estimated byte length of the value."""
+    return estimate_size(value)
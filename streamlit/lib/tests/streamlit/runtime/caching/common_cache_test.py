@@ -30,7 +30,7 @@ import streamlit as st
 from streamlit.runtime import Runtime
 from streamlit.runtime.caching import cache_data, cache_resource
 from streamlit.runtime.caching.cache_errors import CacheReplayClosureError
-from streamlit.runtime.caching.cache_utils import CachedResult
+from streamlit.runtime.caching.cache_utils import CachedResult, cache_call_stats
 from streamlit.runtime.caching.storage.dummy_cache_storage import (
     MemoryCacheStorageManager,
 )
@@ -104,6 +104,35 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         assert foo() == 42
         assert foo() == 42
 
+    @parameterized.expand(
+        [
+            ("cache_data", cache_data, "st_cache_data"),
+            ("cache_resource", cache_resource, "st_cache_resource"),
+        ]
+    )
+    def test_call_stats(self, _, cache_decorator, cache_type: str) -> None:
+        """Hits, misses and compute time are counted for each function."""
+        cache_call_stats.clear()
+
+        @cache_decorator
+        def foo(x):
+            return x
+
+        foo(1)
+        foo(1)
+        foo(2)
+
+        cache_name = f"{foo.__module__}.{foo.__qualname__}"
+        labels = (("cache_type", cache_type), ("cache", cache_name))
+        stats = {
+            stat.family_name: stat.value
+            for stat in cache_call_stats.get_runtime_stats()
+            if stat.labels == labels
+        }
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 2
+        assert stats["cache_compute_seconds"] >= 0
+
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
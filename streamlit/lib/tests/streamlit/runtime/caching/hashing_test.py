@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import datetime
 import functools
+import gc
 import hashlib
 import os
 import re
@@ -45,6 +46,8 @@ from streamlit.runtime.caching.hashing import (
     _NP_SIZE_LARGE,
     _PANDAS_ROWS_LARGE,
     UserHashError,
+    hash_memo,
+    hash_stats,
     update_hash,
 )
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
@@ -717,6 +720,84 @@ class HashTest(unittest.TestCase):
         assert get_hash(complex_obj1) != get_hash(complex_obj3)
 
 
+class HashMemoTest(unittest.TestCase):
+    """Tests for the memoized hashes of large objects that can't change."""
+
+    def setUp(self) -> None:
+        hash_memo.clear()
+        hash_stats.clear()
+
+    def tearDown(self) -> None:
+        hash_memo.clear()
+        hash_stats.clear()
+
+    def test_read_only_numpy_is_memoized(self) -> None:
+        """Large read-only arrays are hashed once, then found in the memo."""
+        arr = np.zeros(_NP_SIZE_LARGE)
+        arr.setflags(write=False)
+
+        assert get_hash(arr) == get_hash(arr)
+        assert hash_memo.misses == 1
+        assert hash_memo.hits == 1
+
+    def test_read_only_numpy_is_fully_hashed(self) -> None:
+        """Read-only arrays aren't sampled, so any difference changes the hash."""
+        arr1 = np.zeros(_NP_SIZE_LARGE)
+        arr2 = np.zeros(_NP_SIZE_LARGE)
+        arr2[-1] = 1
+        arr1.setflags(write=False)
+        arr2.setflags(write=False)
+
+        assert get_hash(arr1) != get_hash(arr2)
+
+    def test_writeable_numpy_is_not_memoized(self) -> None:
+        """Writeable arrays, and read-only views of them, can change in place."""
+        arr = np.zeros(_NP_SIZE_LARGE)
+        view = arr.view()
+        view.setflags(write=False)
+
+        get_hash(arr)
+        get_hash(view)
+
+        assert len(hash_memo) == 0
+        assert hash_memo.misses == 0
+
+    def test_read_only_dataframe_is_memoized(self) -> None:
+        """DataFrames whose columns are read-only are memoized until collected."""
+        arr = np.zeros((_PANDAS_ROWS_LARGE, 4))
+        arr.setflags(write=False)
+        df = pd.DataFrame(arr, columns=list("ABCD"), copy=False)
+
+        assert get_hash(df) == get_hash(df)
+        assert hash_memo.hits == 1
+        assert len(hash_memo) == 1
+
+        del df
+        gc.collect()
+        assert len(hash_memo) == 0
+
+    def test_hash_time_is_recorded_per_function(self) -> None:
+        """The time spent hashing arguments is exposed as runtime stats."""
+
+        @cache_data
+        def foo(x: int) -> int:
+            return x
+
+        foo(1)
+        foo(2)
+
+        stats = {
+            (stat.family_name, stat.labels): stat.value
+            for stat in hash_stats.get_runtime_stats()
+        }
+        labels = (
+            ("cache_type", "st_cache_data"),
+            ("cache", f"{foo.__module__}.{foo.__qualname__}"),
+        )
+        assert stats[("cache_hash_calls", labels)] == 2
+        assert stats[("cache_hash_seconds", labels)] > 0
+
+
 class NotHashableTest(unittest.TestCase):
     """Tests for various unhashable types."""
 
@@ -17,10 +17,15 @@
 from __future__ import annotations
 
 import unittest
+from unittest.mock import patch
 
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime.forward_msg_cache import (
     create_reference_msg,
+    forward_msg_stats,
+    pending_bodies,
     populate_hash_if_needed,
+    serialize_with_pending_body,
 )
 from streamlit.testing.v1.util import patch_config_options
 from tests.streamlit.message_mocks import (
@@ -30,6 +35,14 @@ from tests.streamlit.message_mocks import (
 
 
 class ForwardMsgCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        pending_bodies.clear()
+        forward_msg_stats.clear()
+
+    def tearDown(self) -> None:
+        pending_bodies.clear()
+        forward_msg_stats.clear()
+
     def test_msg_hash(self):
         """Test that ForwardMsg hash generation works as expected"""
         with patch_config_options({"global.minCachedMessageSize": 0}):
@@ -74,6 +87,15 @@ class ForwardMsgCacheTest(unittest.TestCase):
             populate_hash_if_needed(msg)
             assert not msg.metadata.cacheable
 
+    def test_cacheable_below_min_cached_message_size_with_diff_elements(self):
+        """Test that with runner.diffElements, every element is cacheable."""
+        with patch_config_options(
+            {"global.minCachedMessageSize": 1000, "runner.diffElements": True}
+        ):
+            msg = create_dataframe_msg([1, 2, 3])
+            populate_hash_if_needed(msg)
+            assert msg.metadata.cacheable
+
     def test_delta_metadata(self):
         """Test that delta metadata doesn't change the hash"""
         msg1 = create_dataframe_msg([1, 2, 3], 1)
@@ -101,3 +123,61 @@ class ForwardMsgCacheTest(unittest.TestCase):
             populate_hash_if_needed(ref_msg)
             assert ref_msg.hash == ""
             assert not ref_msg.metadata.cacheable
+
+    def test_serialize_with_pending_body(self) -> None:
+        """A hashed message is serialized once, by reusing its hashed body."""
+        msg = create_dataframe_msg([1, 2, 3], 34)
+        populate_hash_if_needed(msg)
+        assert len(pending_bodies) == 1
+
+        parsed_msg = ForwardMsg()
+        parsed_msg.ParseFromString(serialize_with_pending_body(msg))
+
+        assert parsed_msg == msg
+        assert len(pending_bodies) == 0
+        # The body was consumed, so the message must be serialized normally.
+        assert serialize_with_pending_body(msg) is None
+
+    def test_identical_msgs_share_pending_body(self) -> None:
+        """Messages with the same hash keep their body until all are sent."""
+        msg1 = create_dataframe_msg([1, 2, 3], 1)
+        msg2 = create_dataframe_msg([1, 2, 3], 2)
+        populate_hash_if_needed(msg1)
+        populate_hash_if_needed(msg2)
+
+        assert serialize_with_pending_body(msg1) is not None
+        assert serialize_with_pending_body(msg2) is not None
+        assert len(pending_bodies) == 0
+
+    def test_reference_msg_releases_pending_body(self) -> None:
+        """The body of a message replaced by a reference message is dropped."""
+        msg = create_dataframe_msg([1, 2, 3], 34)
+        populate_hash_if_needed(msg)
+        create_reference_msg(msg)
+
+        assert len(pending_bodies) == 0
+
+    @patch("streamlit.runtime.forward_msg_cache.time.monotonic")
+    def test_unclaimed_pending_bodies_expire(self, mock_monotonic) -> None:
+        """Bodies that no queue claimed and that weren't sent are dropped."""
+        mock_monotonic.return_value = 0
+        pending_bodies.add("old", b"old body")
+
+        mock_monotonic.return_value = 20
+        pending_bodies.add("new", b"new body")
+
+        assert pending_bodies.pop("old") is None
+        assert pending_bodies.pop("new") == b"new body"
+
+    def test_hash_time_is_recorded(self) -> None:
+        """The time spent hashing is exposed as runtime stats by message type."""
+        populate_hash_if_needed(create_dataframe_msg([1, 2, 3]))
+
+        stats = forward_msg_stats.get_runtime_stats()
+
+        assert [(stat.family_name, stat.labels) for stat in stats] == [
+            (
+                "forward_msg_hash_seconds",
+                (("type", "delta.new_element.arrow_data_frame"),),
+            )
+        ]
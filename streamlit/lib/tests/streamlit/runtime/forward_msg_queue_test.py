@@ -25,7 +25,15 @@ from streamlit.cursor import make_delta_path
 from streamlit.elements import arrow
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.proto.RootContainer_pb2 import RootContainer
-from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.runtime.forward_msg_cache import (
+    pending_bodies,
+    populate_hash_if_needed,
+    serialize_with_pending_body,
+)
+from streamlit.runtime.forward_msg_queue import (
+    ForwardMsgQueue,
+    forward_msg_queue_stats,
+)
 
 # For the messages below, we don't really care about their contents so much as
 # their general type.
@@ -358,3 +366,67 @@ class ForwardMsgQueueTest(unittest.TestCase):
         fmq.enqueue(TEXT_DELTA_MSG2)
 
         assert count == 0
+
+    def test_queued_msgs_keep_pending_bodies(self) -> None:
+        """The queue keeps the serialized bodies of its hashed messages, and
+        drops those of messages that are composed away or cleared."""
+        pending_bodies.clear()
+        fmq = ForwardMsgQueue()
+
+        msg1 = copy.deepcopy(TEXT_DELTA_MSG1)
+        msg2 = copy.deepcopy(TEXT_DELTA_MSG2)
+        msg1.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        msg2.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        populate_hash_if_needed(msg1)
+        populate_hash_if_needed(msg2)
+        assert len(pending_bodies) == 2
+
+        fmq.enqueue(msg1)
+        fmq.enqueue(msg2)
+        assert len(pending_bodies) == 0
+        assert list(fmq._bodies) == [id(msg2)]
+
+        fmq.clear()
+        assert fmq._bodies == {}
+        assert len(pending_bodies) == 0
+
+    def test_flushed_msgs_reuse_pending_bodies(self) -> None:
+        """Flushed messages are serialized with the bodies kept by the queue."""
+        pending_bodies.clear()
+        fmq = ForwardMsgQueue()
+
+        msg = copy.deepcopy(TEXT_DELTA_MSG1)
+        populate_hash_if_needed(msg)
+        fmq.enqueue(msg)
+        assert fmq.flush() == [msg]
+        assert fmq._bodies == {}
+
+        parsed_msg = ForwardMsg()
+        parsed_msg.ParseFromString(serialize_with_pending_body(msg))
+        assert parsed_msg == msg
+        assert len(pending_bodies) == 0
+
+    def test_composition_stats(self) -> None:
+        """Enqueued, composed and cleared messages are counted."""
+        forward_msg_queue_stats.clear()
+        fmq = ForwardMsgQueue()
+
+        msg1 = copy.deepcopy(TEXT_DELTA_MSG1)
+        msg2 = copy.deepcopy(TEXT_DELTA_MSG2)
+        msg1.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+        msg2.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+
+        fmq.enqueue(NEW_SESSION_MSG)
+        fmq.enqueue(msg1)
+        fmq.enqueue(msg2)
+        fmq.clear(retain_lifecycle_msgs=True)
+
+        stats = {
+            stat.family_name: stat.value
+            for stat in forward_msg_queue_stats.get_runtime_stats()
+        }
+        assert stats == {
+            "forward_msg_queue_enqueued": 3,
+            "forward_msg_queue_composed": 1,
+            "forward_msg_queue_dropped": 1,
+        }
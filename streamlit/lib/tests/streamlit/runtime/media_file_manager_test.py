@@ -363,6 +363,35 @@ class MediaFileManagerTest(TestCase):
             [call(file_id) for file_id in file_ids], any_order=True
         )
 
+    @mock.patch("streamlit.runtime.media_file_manager._get_session_id")
+    def test_add_existing(self, mock_get_session_id):
+        """add_existing registers a session as a user of a file that was
+        already added, until the file is removed.
+        """
+        mock_get_session_id.return_value = "mock_session_1"
+        sample = IMAGE_FIXTURES["png"]
+        url = self.media_file_manager.add(
+            sample["content"], sample["mimetype"], "coord1"
+        )
+        file_id = self.media_file_manager.get_file_id("coord1")
+        assert file_id == _calculate_file_id(sample["content"], sample["mimetype"])
+        assert self.media_file_manager.get_file_id("other_coord") is None
+
+        mock_get_session_id.return_value = "mock_session_2"
+        assert self.media_file_manager.add_existing(file_id, "coord2") == url
+        assert self.media_file_manager.get_file_id("coord2") == file_id
+
+        # The file is still used by the second session.
+        mock_get_session_id.return_value = "mock_session_1"
+        self.media_file_manager.clear_session_refs()
+        self.media_file_manager.remove_orphaned_files()
+        assert self.media_file_manager.add_existing(file_id, "coord1") == url
+
+        for session_id in ("mock_session_1", "mock_session_2"):
+            self.media_file_manager.clear_session_refs(session_id)
+        self.media_file_manager.remove_orphaned_files()
+        assert self.media_file_manager.add_existing(file_id, "coord1") is None
+
 
 class MediaFileManagerThreadingTest(unittest.TestCase):
     # The number of threads to run our tests on
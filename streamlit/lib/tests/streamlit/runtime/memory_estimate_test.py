@@ -0,0 +1,87 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for memory_estimate."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from streamlit.runtime.memory_estimate import _MAX_MEASURED_OBJECTS, estimate_size
+
+
+class EstimateSizeTest(unittest.TestCase):
+    def test_numpy_array(self) -> None:
+        """Arrays are measured by their buffer size."""
+        arr = np.zeros(100_000)
+        assert estimate_size(arr) >= arr.nbytes
+
+        view = arr[:50_000]
+        assert estimate_size(view) >= view.nbytes
+
+    def test_pandas(self) -> None:
+        """Frames and series are measured with their shallow memory usage,
+        plus a sampled estimate of the objects in object columns."""
+        df = pd.DataFrame({"a": np.arange(10_000), "b": ["x" * 100] * 10_000})
+
+        assert estimate_size(df) > df.memory_usage(deep=False).sum()
+        assert estimate_size(df["a"]) == df["a"].memory_usage(deep=False)
+
+    def test_arrow(self) -> None:
+        """Arrow tables are measured by their buffer size."""
+        table = pa.table({"a": list(range(10_000))})
+        assert estimate_size(table) == table.nbytes
+
+    def test_containers_are_sampled(self) -> None:
+        """Large containers are estimated from a sample of their items."""
+        items = [b"x" * 1000] * 10_000
+        assert estimate_size(items) == sys.getsizeof(items) + 10_000 * sys.getsizeof(
+            items[0]
+        )
+
+    def test_objects(self) -> None:
+        """The attributes of objects are measured."""
+
+        class Holder:
+            def __init__(self) -> None:
+                self.data = np.zeros(100_000)
+
+        assert estimate_size(Holder()) > 800_000
+
+    def test_measured_objects_are_limited(self) -> None:
+        """At most _MAX_MEASURED_OBJECTS objects are measured, however large
+        and deeply nested the object is."""
+        nested = [
+            [[(i, j, k) for k in range(100)] for j in range(100)] for i in range(100)
+        ]
+
+        with patch(
+            "streamlit.runtime.memory_estimate.sys.getsizeof", wraps=sys.getsizeof
+        ) as mock_getsizeof:
+            assert estimate_size(nested) > 100 * 100 * 100 * sys.getsizeof((0, 0, 0))
+
+        assert mock_getsizeof.call_count <= _MAX_MEASURED_OBJECTS
+
+    def test_cycles(self) -> None:
+        """Objects referencing themselves are estimated."""
+        cyclic: list[object] = [b"x" * 1000]
+        cyclic.append(cyclic)
+
+        assert estimate_size(cyclic) > 1000
@@ -29,6 +29,7 @@ from streamlit.runtime.memory_media_file_storage import (
     MemoryMediaFileStorage,
     get_extension_for_mimetype,
 )
+from tests.testutil import patch_config_options
 
 
 class MemoryMediaFileStorageTest(unittest.TestCase):
@@ -173,6 +174,27 @@ class MemoryMediaFileStorageTest(unittest.TestCase):
         with pytest.raises(MediaFileStorageError):
             self.storage.get_file(file_id2)
 
+    @patch_config_options(
+        {"server.fileSpillThreshold": 1 / 1024, "server.fileDiskBudget": 1 / 1024}
+    )
+    def test_reload_discarded_file(self):
+        """A file discarded to meet the disk budget is stored again when it's
+        loaded again.
+        """
+        file_id1 = self.storage.load_and_get_id(
+            b"1" * 2048, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+        self.storage.load_and_get_id(
+            b"2" * 2048, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+        with pytest.raises(MediaFileStorageError):
+            self.storage.get_file(file_id1)
+
+        assert file_id1 == self.storage.load_and_get_id(
+            b"1" * 2048, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+        assert self.storage.get_file(file_id1).content == b"1" * 2048
+
     def test_delete_invalid_file_is_a_noop(self):
         """deleting a file that doesn't exist doesn't raise an error."""
         self.storage.delete_file("mock_file_id")
@@ -135,6 +135,24 @@ class RuntimeTest(RuntimeTestCase):
         self.runtime.disconnect_session(session_id)
         assert self.runtime.state == RuntimeState.NO_SESSIONS_CONNECTED
 
+    async def test_session_runtime_stats(self):
+        """Connected sessions are reported in the runtime stats."""
+        await self.runtime.start()
+
+        session_id = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+        stats = {
+            stat.family_name: stat.value
+            for stat in self.runtime.stats_mgr.get_runtime_stats()
+            if not stat.labels
+        }
+        assert stats["sessions"] == 1
+        assert stats["active_sessions"] == 1
+        assert stats["threads"] >= 1
+
+        self.runtime.disconnect_session(session_id)
+
     async def test_connect_session_error_if_both_session_id_args(self):
         """Test that setting both existing_session_id and session_id_override is an error."""
         await self.runtime.start()
@@ -20,6 +20,7 @@ import unittest
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import runtime_util
+from streamlit.runtime.forward_msg_cache import pending_bodies, populate_hash_if_needed
 from streamlit.runtime.runtime_util import serialize_forward_msg
 from tests.streamlit.message_mocks import create_dataframe_msg
 from tests.testutil import patch_config_options
@@ -49,3 +50,17 @@ class RuntimeUtilTest(unittest.TestCase):
                 "exceeds the message size limit"
                 in deserialized_msg.delta.new_element.exception.message
             )
+
+    def test_serialize_hashed_msg(self) -> None:
+        """Hashed messages are serialized from their pending body, with the
+        same content as a full serialization."""
+        pending_bodies.clear()
+        msg = create_dataframe_msg([1, 2, 3])
+        populate_hash_if_needed(msg)
+
+        serialized = serialize_forward_msg(msg)
+
+        deserialized_msg = ForwardMsg()
+        deserialized_msg.ParseFromString(serialized)
+        assert deserialized_msg == msg
+        assert len(pending_bodies) == 0
@@ -0,0 +1,97 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ScriptRunLimiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from typing import Callable
+
+from streamlit.runtime.scriptrunner.script_run_limiter import ScriptRunLimiter
+from tests.testutil import patch_config_options
+
+
+def _stats(limiter: ScriptRunLimiter) -> dict[str, float]:
+    return {stat.family_name: stat.value for stat in limiter.get_runtime_stats()}
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out")
+        time.sleep(0.01)
+
+
+class ScriptRunLimiterTest(unittest.TestCase):
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 0})
+    def test_unlimited(self) -> None:
+        """Without a limit, runs never wait."""
+        limiter = ScriptRunLimiter()
+
+        assert all(limiter.acquire(lambda: True) for _ in range(10))
+        assert _stats(limiter)["script_runs_running"] == 10
+        assert _stats(limiter)["script_run_waits"] == 0
+
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 1})
+    def test_waits_for_free_slot(self) -> None:
+        """Runs above the limit wait until a slot is released, in FIFO order."""
+        limiter = ScriptRunLimiter()
+        assert limiter.acquire(lambda: True)
+
+        admitted: list[int] = []
+
+        def run(index: int) -> None:
+            limiter.acquire(lambda: True)
+            admitted.append(index)
+
+        threads = []
+        for index in range(2):
+            thread = threading.Thread(target=run, args=(index,))
+            thread.start()
+            threads.append(thread)
+            queue_depth = index + 1
+            _wait_for(
+                lambda depth=queue_depth: (
+                    _stats(limiter)["script_run_queue_depth"] == depth
+                )
+            )
+
+        assert admitted == []
+
+        limiter.release()
+        _wait_for(lambda: admitted == [0])
+        limiter.release()
+        _wait_for(lambda: admitted == [0, 1])
+
+        for thread in threads:
+            thread.join()
+
+        stats = _stats(limiter)
+        assert stats["script_run_queue_depth"] == 0
+        assert stats["script_run_waits"] == 2
+        assert stats["script_run_wait_seconds"] > 0
+
+    @patch_config_options({"runner.maxConcurrentScriptRuns": 1})
+    def test_stops_waiting_when_not_pending(self) -> None:
+        """A run that isn't wanted anymore stops waiting without a slot."""
+        limiter = ScriptRunLimiter()
+        assert limiter.acquire(lambda: True)
+
+        assert not limiter.acquire(lambda: False)
+        assert _stats(limiter)["script_runs_running"] == 1
+        assert _stats(limiter)["script_run_queue_depth"] == 0
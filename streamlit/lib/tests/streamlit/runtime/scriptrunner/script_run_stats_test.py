@@ -0,0 +1,60 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ScriptRunStats."""
+
+from __future__ import annotations
+
+import unittest
+
+import pytest
+
+from streamlit.runtime.scriptrunner.script_run_stats import ScriptRunStats
+
+
+class ScriptRunStatsTest(unittest.TestCase):
+    def test_records_runs(self) -> None:
+        """Full runs are reported by page and fragment runs by fragment id."""
+        stats = ScriptRunStats()
+        stats.record_run("main", 0.3, 0.2)
+        stats.record_run("main", 0.5, 0.4)
+        stats.record_run("other", 1.0, 0.9)
+        stats.record_fragment_run("fragment_id", 0.1)
+
+        runtime_stats = {
+            (stat.family_name, stat.labels): stat for stat in stats.get_runtime_stats()
+        }
+
+        main_runs = runtime_stats["script_run_seconds", (("page", "main"),)]
+        assert main_runs.metric_type == "histogram"
+        assert main_runs.buckets[-1] == (float("inf"), 2)
+        assert main_runs.value == pytest.approx(0.8)
+
+        fragment_runs = runtime_stats[
+            "fragment_run_seconds", (("fragment", "fragment_id"),)
+        ]
+        assert fragment_runs.buckets[-1] == (float("inf"), 1)
+
+        exec_seconds = runtime_stats["script_exec_seconds", (("page", "main"),)]
+        assert exec_seconds.metric_type == "counter"
+        assert exec_seconds.value == pytest.approx(0.6)
+
+    def test_clear(self) -> None:
+        """clear() drops all recorded runs."""
+        stats = ScriptRunStats()
+        stats.record_run("main", 0.3, 0.2)
+        stats.record_fragment_run("fragment_id", 0.1)
+
+        stats.clear()
+        assert stats.get_runtime_stats() == []
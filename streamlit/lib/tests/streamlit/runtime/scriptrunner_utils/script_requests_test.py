@@ -73,6 +73,17 @@ class ScriptRequestsTest(unittest.TestCase):
         assert reqs._state == ScriptRequestType.RERUN
         assert rerun_data == reqs._rerun_data
 
+    def test_has_rerun_request(self) -> None:
+        """has_rerun_request is True until the rerun request is handled."""
+        reqs = ScriptRequests()
+        assert not reqs.has_rerun_request()
+
+        reqs.request_rerun(RerunData())
+        assert reqs.has_rerun_request()
+
+        reqs.on_scriptrunner_ready()
+        assert not reqs.has_rerun_request()
+
     def test_rerun_coalesce_none_and_none(self):
         """Coalesce two null-WidgetStates rerun requests."""
         reqs = ScriptRequests()
@@ -23,7 +23,10 @@ from parameterized import parameterized
 
 from streamlit.errors import NoSessionContext, StreamlitAPIException
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
-from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+from streamlit.runtime.forward_msg_cache import (
+    forward_msg_stats,
+    populate_hash_if_needed,
+)
 from streamlit.runtime.fragment import MemoryFragmentStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.pages_manager import PagesManager
@@ -229,6 +232,34 @@ class ScriptRunContextTest(unittest.TestCase):
             assert fake_enqueue_result is not None
             assert fake_enqueue_result["msg"].WhichOneof("type") == "ref_hash"
 
+    def test_enqueue_reference_message_records_saved_bytes(self):
+        """Test that the bytes saved by a reference message are recorded."""
+        forward_msg_stats.clear()
+        fake_enqueue_result: dict[str, ForwardMsg] = {}
+
+        def fake_enqueue(msg: ForwardMsg):
+            fake_enqueue_result["msg"] = msg
+
+        with patch_config_options(
+            {"global.minCachedMessageSize": 1000, "runner.diffElements": True}
+        ):
+            msg = create_dataframe_msg([1, 2, 3])
+            populate_hash_if_needed(msg)
+            ctx = _create_script_run_context(
+                fake_enqueue, cached_message_hashes={msg.hash}
+            )
+            add_script_run_ctx(ctx=ctx)
+            enqueue_message(msg)
+
+        ref_msg = fake_enqueue_result["msg"]
+        assert ref_msg.ref_hash == msg.hash
+        stats = {
+            stat.family_name: stat.value
+            for stat in forward_msg_stats.get_runtime_stats()
+        }
+        assert stats["forward_msg_unchanged_elements"] == 1
+        assert stats["forward_msg_saved_bytes"] == msg.ByteSize() - ref_msg.ByteSize()
+
     def test_enqueue_message_with_fragment_id(self):
         fake_enqueue_result = {}
 
@@ -96,6 +96,37 @@ class SessionStateProxyTests(unittest.TestCase):
             delattr(self.session_state_proxy, self.reserved_key)
 
 
+class SessionStateProxyMutationTrackingTests(unittest.TestCase):
+    """Values handed to user code through the proxy are marked as possibly
+    mutated, so that their serializability is checked again.
+    """
+
+    def setUp(self):
+        self.session_state = SessionState()
+        self.session_state["data"] = {"a": 1}
+        self.session_state["count"] = 1
+        self.session_state._check_serializable()
+
+        patcher = patch(
+            "streamlit.runtime.state.session_state_proxy.get_session_state",
+            MagicMock(return_value=SafeSessionState(self.session_state, lambda: None)),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session_state_proxy = SessionStateProxy()
+
+    def test_getitem_marks_mutable_values(self) -> None:
+        """Reading a mutable value marks it, reading an immutable one doesn't."""
+        _ = self.session_state_proxy["data"]
+        _ = self.session_state_proxy.count
+        assert self.session_state._possibly_mutated_keys == {"data"}
+
+    def test_to_dict_marks_mutable_values(self) -> None:
+        """to_dict hands all values to user code."""
+        self.session_state_proxy.to_dict()
+        assert self.session_state._possibly_mutated_keys == {"data"}
+
+
 class SessionStateProxyAttributeTests(unittest.TestCase):
     """Tests of SessionStateProxy attribute methods.
 
@@ -44,6 +44,7 @@ from streamlit.runtime.state.session_state import (
     WidgetMetadata,
     WStates,
     _is_stale_widget,
+    serialization_check_stats,
 )
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from streamlit.testing.v1.app_test import AppTest
@@ -884,6 +885,70 @@ class SessionStateMethodTests(unittest.TestCase):
         with pytest.raises(UnserializableSessionStateError):
             self.session_state._check_serializable()
 
+    def test_check_serializable_skips_unchanged_values(self) -> None:
+        """Values that passed a check aren't pickled again unless they were
+        replaced or handed to user code.
+        """
+        self.session_state["data"] = {"a": 1}
+        self.session_state["count"] = 1
+
+        with patch("streamlit.runtime.state.session_state.pickle.dumps") as mock_dumps:
+            self.session_state._check_serializable()
+            first_check_calls = mock_dumps.call_count
+            assert first_check_calls >= 2
+
+            self.session_state._check_serializable()
+            assert mock_dumps.call_count == first_check_calls
+
+            self.session_state["count"] = 2
+            self.session_state._check_serializable()
+            mock_dumps.assert_called_with(2)
+            assert mock_dumps.call_count == first_check_calls + 1
+
+    def test_check_serializable_rechecks_mutated_values(self) -> None:
+        """A value read by user code may have been mutated in place, so it's
+        checked again.
+        """
+        data: dict[str, Any] = {}
+        self.session_state["data"] = data
+        self.session_state._check_serializable()
+
+        data["func"] = lambda x: x
+        # Without a read, the unchanged object isn't checked again.
+        self.session_state._check_serializable()
+
+        self.session_state.mark_possibly_mutated("data", data)
+        with pytest.raises(UnserializableSessionStateError):
+            self.session_state._check_serializable()
+
+    def test_immutable_values_not_marked(self) -> None:
+        """Reading immutable values doesn't require checking them again."""
+        self.session_state["count"] = 1
+        self.session_state["data"] = [1]
+
+        self.session_state.mark_possibly_mutated("count", 1)
+        self.session_state.mark_possibly_mutated("data", [1])
+
+        assert self.session_state._possibly_mutated_keys == {"data"}
+
+    def test_serialization_check_stats(self) -> None:
+        """Checked and skipped values are reported as runtime stats."""
+        self.session_state["data"] = {"a": 1}
+        serialization_check_stats.clear()
+
+        self.session_state._check_serializable()
+        self.session_state._check_serializable()
+
+        stats = {
+            stat.family_name: stat.value
+            for stat in serialization_check_stats.get_runtime_stats()
+        }
+        assert stats["session_state_serialization_checks"] == 2
+        num_values = len(self.session_state)
+        assert stats["session_state_serialization_checked_values"] == num_values
+        assert stats["session_state_serialization_skipped_values"] == num_values
+        assert stats["session_state_serialization_check_seconds"] > 0
+
 
 @given(state=stst.session_state())
 @settings(deadline=400)
@@ -1028,14 +1093,41 @@ class SessionStateStatProviderTests(DeltaGeneratorTestCase):
         new_size_2 = state.get_stats()[0].byte_length
         assert new_size_2 == new_size
 
+        # Widget values are only estimated once they are compacted.
         st.checkbox("checkbox", key="checkbox")
+        assert state.get_stats()[0].byte_length == new_size_2
+
+        state._compact_state()
         new_size_3 = state.get_stats()[0].byte_length
         assert new_size_3 > new_size_2
         assert new_size_3 - new_size_2 < expected_session_state_size_bytes
 
+        del state["foo"]
+        assert state.get_stats()[0].byte_length < new_size_3
+
+    def test_session_state_stats_of_mutated_values(self):
+        """Values read through session state are estimated again, as they may
+        have been mutated in place."""
+        state = _raw_session_state()
+        state["foo"] = []
+        state._compact_state()
+        size = state.get_stats()[0].byte_length
+
+        value = state["foo"]
+        value.extend(range(1000))
+        state.mark_possibly_mutated("foo", value)
         state._compact_state()
-        new_size_4 = state.get_stats()[0].byte_length
-        assert new_size_4 <= new_size_3
+
+        assert state.get_stats()[0].byte_length > size
+
+    def test_session_state_deep_stats(self):
+        """Deep stats measure the whole session state, not only its values."""
+        state = _raw_session_state()
+        state["foo"] = [1, 2, 3]
+
+        deep_stat = state.get_deep_stats()[0]
+        assert deep_stat.category_name == "st_session_state"
+        assert deep_stat.byte_length > state.get_stats()[0].byte_length
 
 
 class KeyIdMapperTest(unittest.TestCase):
@@ -19,9 +19,14 @@ import unittest
 from streamlit.runtime.stats import (
     CacheStat,
     CacheStatsProvider,
+    DeepCacheStatsProvider,
+    Histogram,
+    RuntimeStat,
+    RuntimeStatsProvider,
     StatsManager,
     group_stats,
 )
+from tests.testutil import patch_config_options
 
 
 class MockStatsProvider(CacheStatsProvider):
@@ -32,6 +37,26 @@ class MockStatsProvider(CacheStatsProvider):
         return self.stats
 
 
+class MockRuntimeStatsProvider(RuntimeStatsProvider):
+    def __init__(self):
+        self.stats: list[RuntimeStat] = []
+
+    def get_runtime_stats(self) -> list[RuntimeStat]:
+        return self.stats
+
+
+class MockDeepStatsProvider(DeepCacheStatsProvider):
+    def __init__(self):
+        self.stats = [CacheStat("provider", "estimate", 1)]
+        self.deep_stats = [CacheStat("provider", "deep", 2)]
+
+    def get_stats(self) -> list[CacheStat]:
+        return self.stats
+
+    def get_deep_stats(self) -> list[CacheStat]:
+        return self.deep_stats
+
+
 class StatsManagerTest(unittest.TestCase):
     def test_get_stats(self):
         """StatsManager.get_stats should return all providers' stats."""
@@ -57,6 +82,100 @@ class StatsManagerTest(unittest.TestCase):
 
         assert provider1.stats + provider2.stats == manager.get_stats()
 
+    @patch_config_options({"server.deepMemoryStatsInterval": 0})
+    def test_get_stats_without_deep_walk(self) -> None:
+        """Without a deep walk interval, providers' estimates are returned."""
+        manager = StatsManager()
+        manager.register_provider(MockDeepStatsProvider())
+
+        assert manager.get_stats() == [CacheStat("provider", "estimate", 1)]
+        assert manager._deep_walk_thread is None
+
+    @patch_config_options({"server.deepMemoryStatsInterval": 60})
+    def test_get_stats_with_deep_walk(self) -> None:
+        """With a deep walk interval, a scrape starts a background deep walk,
+        whose results are returned by later scrapes. Walks are rate limited."""
+        manager = StatsManager()
+        provider = MockDeepStatsProvider()
+        manager.register_provider(provider)
+        manager.register_provider(MockStatsProvider())
+
+        manager.get_stats()
+        thread = manager._deep_walk_thread
+        assert thread is not None
+        thread.join()
+
+        assert manager.get_stats() == [CacheStat("provider", "deep", 2)]
+        # The last walk is recent, so no new walk is started.
+        assert manager._deep_walk_thread is thread
+
+    def test_get_runtime_stats(self):
+        """StatsManager.get_runtime_stats should return all runtime providers'
+        stats, and no cache stats."""
+        manager = StatsManager()
+        provider = MockRuntimeStatsProvider()
+        manager.register_runtime_stats_provider(provider)
+        manager.register_provider(MockStatsProvider())
+
+        assert manager.get_runtime_stats() == []
+
+        provider.stats = [RuntimeStat("hash_seconds", "counter", (), 1.5)]
+        assert manager.get_runtime_stats() == provider.stats
+        assert manager.get_stats() == []
+
+    def test_runtime_stat_to_metric_str(self):
+        """Counter samples get the "_total" suffix, and labels are optional."""
+        labels = (("cache_type", "st_cache_data"), ("cache", "foo"))
+
+        assert (
+            RuntimeStat("hash_seconds", "counter", labels, 1.5).to_metric_str()
+            == 'hash_seconds_total{cache_type="st_cache_data",cache="foo"} 1.5'
+        )
+        assert RuntimeStat("sessions", "gauge", (), 2).to_metric_str() == "sessions 2"
+
+    def test_runtime_stat_to_metric_str_escapes_label_values(self):
+        """Backslashes, double quotes and newlines in label values are escaped."""
+        labels = (("page", 'a\\b"c\nd'),)
+
+        assert (
+            RuntimeStat("sessions", "gauge", labels, 1).to_metric_str()
+            == 'sessions{page="a\\\\b\\"c\\nd"} 1'
+        )
+
+    def test_histogram(self) -> None:
+        """Histograms count values in cumulative buckets for each label value,
+        and are written as OpenMetrics bucket, count and sum samples."""
+        histogram = Histogram(
+            "run_seconds", ("page",), help="Runs.", unit="seconds", buckets=(0.1, 1.0)
+        )
+        histogram.observe(("main",), 0.1)
+        histogram.observe(("main",), 0.5)
+        histogram.observe(("main",), 2.0)
+        histogram.observe(("other",), 0.05)
+
+        stats = histogram.get_runtime_stats()
+        assert stats[0] == RuntimeStat(
+            "run_seconds",
+            "histogram",
+            (("page", "main"),),
+            2.6,
+            help="Runs.",
+            unit="seconds",
+            buckets=((0.1, 1), (1.0, 2), (float("inf"), 3)),
+        )
+        assert stats[1].buckets == ((0.1, 1), (1.0, 1), (float("inf"), 1))
+
+        assert stats[1].to_metric_str() == (
+            'run_seconds_bucket{page="other",le="0.1"} 1\n'
+            'run_seconds_bucket{page="other",le="1.0"} 1\n'
+            'run_seconds_bucket{page="other",le="+Inf"} 1\n'
+            'run_seconds_count{page="other"} 1\n'
+            'run_seconds_sum{page="other"} 0.05'
+        )
+
+        histogram.clear()
+        assert histogram.get_runtime_stats() == []
+
     def test_group_stats(self):
         """Should return stats grouped by category_name and cache_name.
         byte_length should be summed."""
@@ -0,0 +1,225 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for TieredFileStore."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from streamlit.runtime.tiered_file_store import SpooledFileWriter, TieredFileStore
+from tests.testutil import patch_config_options
+
+# 1 KB, in megabytes.
+_KB: float = 1 / 1024
+
+
+def _stats(store: TieredFileStore[str]) -> dict[str, float]:
+    return {stat.family_name: stat.value for stat in store.get_runtime_stats()}
+
+
+class TieredFileStoreTest(unittest.TestCase):
+    @patch_config_options({"server.fileSpillThreshold": _KB})
+    def test_spills_large_files(self) -> None:
+        """Files above the spill threshold are stored on disk."""
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("small", b"a" * 100)
+        store.put("large", b"b" * 2048)
+
+        assert store.get("small") == b"a" * 100
+        large = store.get("large")
+        assert isinstance(large, memoryview)
+        assert large == b"b" * 2048
+
+        stats = _stats(store)
+        assert stats["file_store_memory_bytes"] == 100
+        assert stats["file_store_disk_bytes"] == 2048
+        assert stats["file_store_spills"] == 1
+
+    @patch_config_options({"server.fileSpillThreshold": 0})
+    def test_no_threshold(self) -> None:
+        """Without a threshold, all files are kept in memory."""
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("large", b"b" * 2048)
+        assert isinstance(store.get("large"), bytes)
+
+    @patch_config_options(
+        {"server.fileSpillThreshold": 0, "server.sessionFileMemoryBudget": _KB}
+    )
+    def test_owner_budget(self) -> None:
+        """An owner's least recently used files are moved to disk when its
+        files exceed the budget. Other owners' files are kept in memory.
+        """
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("file1", b"1" * 400, owner="session1")
+        store.put("file2", b"2" * 400, owner="session1")
+        store.put("other", b"3" * 400, owner="session2")
+        # file1 is now more recently used than file2.
+        store.get("file1")
+        store.put("file3", b"4" * 400, owner="session1")
+
+        assert isinstance(store.get("file2"), memoryview)
+        assert isinstance(store.get("file1"), bytes)
+        assert isinstance(store.get("file3"), bytes)
+        assert isinstance(store.get("other"), bytes)
+        assert store.memory_bytes == 1200
+
+    @patch_config_options(
+        {"server.fileSpillThreshold": 0, "server.fileMemoryBudget": _KB}
+    )
+    def test_global_budget(self) -> None:
+        """The least recently used files are moved to disk when all files
+        exceed the budget.
+        """
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("file1", b"1" * 400, owner="session1")
+        store.put("file2", b"2" * 400)
+        store.put("file3", b"3" * 400, owner="session2")
+
+        assert isinstance(store.get("file1"), memoryview)
+        assert store.get("file1") == b"1" * 400
+        assert store.memory_bytes == 800
+
+    @patch_config_options(
+        {"server.fileSpillThreshold": 0, "server.fileMemoryBudget": _KB}
+    )
+    def test_moves_files_to_disk_without_lock(self) -> None:
+        """Files are written to disk without holding the store's lock, and a
+        file removed while it's written is dropped.
+        """
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("file1", b"1" * 400)
+        store.put("file2", b"2" * 400)
+
+        def spill(content: bytes) -> memoryview:
+            # The store is usable while the file is written.
+            assert not store._lock.locked()
+            assert store.get("file2") == b"2" * 400
+            store.remove("file1")
+            return memoryview(content)
+
+        with patch("streamlit.runtime.tiered_file_store._spill", side_effect=spill):
+            store.put("file3", b"3" * 400)
+
+        assert "file1" not in store
+        stats = _stats(store)
+        assert stats["file_store_memory_bytes"] == 800
+        assert stats["file_store_disk_bytes"] == 0
+        assert stats["file_store_spills"] == 0
+
+    @patch_config_options(
+        {"server.fileSpillThreshold": _KB, "server.fileDiskBudget": 5 * _KB}
+    )
+    def test_disk_budget(self) -> None:
+        """The least recently used files on disk are discarded when the files
+        on disk exceed the budget. Files in memory are kept.
+        """
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("small", b"0" * 100)
+        store.put("file1", b"1" * 2048)
+        store.put("file2", b"2" * 2048)
+        # file1 is now more recently used than file2.
+        store.get("file1")
+        store.put("file3", b"3" * 2048)
+
+        assert "file2" not in store
+        assert store.get("file1") == b"1" * 2048
+        assert store.get("file3") == b"3" * 2048
+        assert store.get("small") == b"0" * 100
+
+        stats = _stats(store)
+        assert stats["file_store_disk_bytes"] == 4096
+        assert stats["file_store_evictions"] == 1
+
+    @patch_config_options(
+        {"server.fileSpillThreshold": _KB, "server.fileDiskBudget": _KB}
+    )
+    def test_disk_budget_keeps_new_file(self) -> None:
+        """A file larger than the disk budget is still stored."""
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("file1", b"1" * 2048)
+        store.put("file2", b"2" * 2048)
+
+        assert "file1" not in store
+        assert store.get("file2") == b"2" * 2048
+
+    @patch_config_options({"server.fileSpillThreshold": _KB})
+    def test_remove(self) -> None:
+        """Removed files are forgotten, and no longer counted."""
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("file1", b"1" * 100, owner="session1")
+        store.put("file2", b"2" * 2048, owner="session1")
+        store.put("file3", b"3" * 100, owner="session2")
+
+        store.remove("file3")
+        store.remove("missing")
+        assert "file3" not in store
+
+        store.remove_owner("session1")
+        assert store.get("file1") is None
+        assert store.get("file2") is None
+
+        stats = _stats(store)
+        assert stats["file_store_memory_bytes"] == 0
+        assert stats["file_store_disk_bytes"] == 0
+
+    @patch_config_options({"server.fileSpillThreshold": _KB})
+    def test_replace(self) -> None:
+        """Storing a file with an existing key replaces it."""
+        store: TieredFileStore[str] = TieredFileStore("test")
+        store.put("file", b"1" * 2048)
+        store.put("file", b"2" * 100)
+
+        assert store.get("file") == b"2" * 100
+        stats = _stats(store)
+        assert stats["file_store_memory_bytes"] == 100
+        assert stats["file_store_disk_bytes"] == 0
+
+    @patch_config_options({"server.fileSpillThreshold": _KB})
+    def test_spill_failure(self) -> None:
+        """Files are kept in memory if they can't be written to disk."""
+        store: TieredFileStore[str] = TieredFileStore("test")
+        with patch(
+            "streamlit.runtime.tiered_file_store.tempfile.TemporaryFile",
+            side_effect=OSError,
+        ):
+            store.put("file", b"1" * 2048)
+
+        assert store.get("file") == b"1" * 2048
+        assert store.memory_bytes == 2048
+
+
+class SpooledFileWriterTest(unittest.TestCase):
+    @patch_config_options({"server.fileSpillThreshold": _KB})
+    def test_small_file(self) -> None:
+        """Small files are returned as bytes."""
+        writer = SpooledFileWriter()
+        writer.write(b"12")
+        writer.write(b"34")
+
+        assert writer.size == 4
+        assert writer.getvalue() == b"1234"
+
+    @patch_config_options({"server.fileSpillThreshold": _KB})
+    def test_large_file(self) -> None:
+        """Large files are written to a temporary file while they're received."""
+        writer = SpooledFileWriter()
+        for _ in range(4):
+            writer.write(b"1" * 512)
+
+        content = writer.getvalue()
+        assert isinstance(content, memoryview)
+        assert content == b"1" * 2048
+        assert content.readonly
@@ -16,13 +16,24 @@
 
 from __future__ import annotations
 
+import io
+import mmap
+import pickle
+import tempfile
 import unittest
+from typing import TYPE_CHECKING
 
+import pytest
+
+from streamlit.proto.Common_pb2 import FileURLs
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.stats import CacheStat
-from streamlit.runtime.uploaded_file_manager import UploadedFileRec
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from tests.exception_capturing_thread import call_on_threads
 
+if TYPE_CHECKING:
+    from streamlit.runtime.tiered_file_store import FileContent
+
 FILE_1 = UploadedFileRec(file_id="url1", name="file1", type="type", data=b"file1")
 FILE_2 = UploadedFileRec(file_id="url2", name="file2", type="type", data=b"file222")
 
@@ -109,6 +120,64 @@ class UploadedFileManagerTest(unittest.TestCase):
         assert expected == self.mgr.get_stats()
 
 
+def _create_uploaded_file(data: FileContent) -> UploadedFile:
+    return UploadedFile(
+        UploadedFileRec(file_id="id", name="name", type="type", data=data),
+        FileURLs(file_id="id", upload_url="u", delete_url="d"),
+    )
+
+
+def _map_bytes(data: bytes) -> memoryview:
+    with tempfile.TemporaryFile() as file:
+        file.write(data)
+        file.flush()
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class UploadedFileTest(unittest.TestCase):
+    DATA = b"a,b\n1,2\n3,4\nlast"
+
+    def test_reads_files_stored_on_disk(self):
+        """Files stored on disk are read like files stored in memory."""
+        for file in [
+            _create_uploaded_file(self.DATA),
+            _create_uploaded_file(_map_bytes(self.DATA)),
+        ]:
+            assert file.size == len(self.DATA)
+            assert file.read(2) == b"a,"
+            assert file.readline() == b"b\n"
+            assert file.tell() == 4
+            assert list(file) == [b"1,2\n", b"3,4\n", b"last"]
+            assert file.read() == b""
+
+            file.seek(-4, io.SEEK_END)
+            buffer = bytearray(8)
+            assert file.readinto(buffer) == 4
+            assert buffer[:4] == b"last"
+
+            file.seek(0)
+            assert file.readlines(5) == [b"a,b\n", b"1,2\n"]
+            assert file.getvalue() == self.DATA
+
+    def test_files_stored_on_disk_are_copied_on_write(self):
+        """Files stored on disk are copied when they are modified or pickled,
+        and the copy keeps the stream position."""
+        file = _create_uploaded_file(_map_bytes(self.DATA))
+        file.seek(1)
+
+        pickled_file = pickle.loads(pickle.dumps(file))
+        assert pickled_file.getvalue() == self.DATA
+        assert pickled_file.tell() == 1
+
+        file.write(b"X")
+        assert file.tell() == 2
+        assert file.getvalue() == b"aXb" + self.DATA[3:]
+
+        file.close()
+        with pytest.raises(ValueError, match="closed file"):
+            file.read()
+
+
 class UploadedFileManagerThreadingTest(unittest.TestCase):
     # The number of threads to run our tests on
     NUM_THREADS = 50
@@ -126,6 +126,26 @@ class MediaFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
         assert rsp.headers["Content-Length"] == str(len(b"mock_data"))
         assert rsp.headers["Content-Disposition"] == content_disposition_header
 
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    @patch_config_options({"server.fileSpillThreshold": 1 / 1024})
+    def test_media_file_on_disk(self) -> None:
+        """Media files stored on disk are served in full and in ranges."""
+        data = bytes(range(256)) * 1024
+        url = self.media_file_manager.add(data, "video/mp4", "mock_coords")
+
+        rsp = self.fetch(url, method="GET")
+        assert rsp.code == 200
+        assert rsp.body == data
+        assert rsp.headers["Content-Length"] == str(len(data))
+
+        rsp = self.fetch(url, method="GET", headers={"Range": "bytes=1000-200999"})
+        assert rsp.code == 206
+        assert rsp.body == data[1000:201000]
+        assert rsp.headers["Content-Range"] == f"bytes 1000-200999/{len(data)}"
+
     def test_invalid_file(self) -> None:
         """Requests for invalid files fail with 404."""
         url = f"{MOCK_ENDPOINT}/invalid_media_file.mp4"
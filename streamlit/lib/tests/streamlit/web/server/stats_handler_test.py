@@ -22,7 +22,7 @@ from google.protobuf.json_format import MessageToDict
 from tornado.httputil import HTTPHeaders
 
 from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, RuntimeStat
 from streamlit.web.server.server import METRIC_ENDPOINT
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
 
@@ -30,8 +30,12 @@ from streamlit.web.server.stats_request_handler import StatsRequestHandler
 class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def get_app(self):
         self.mock_stats = []
+        self.mock_runtime_stats = []
         mock_stats_manager = MagicMock()
         mock_stats_manager.get_stats = MagicMock(side_effect=lambda: self.mock_stats)
+        mock_stats_manager.get_runtime_stats = MagicMock(
+            side_effect=lambda: self.mock_runtime_stats
+        )
         return tornado.web.Application(
             [
                 (
@@ -159,3 +163,99 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
         }
 
         assert expected == MessageToDict(metric_set)
+
+    def test_runtime_stats(self):
+        """Runtime stats are grouped by family after the cache memory stats."""
+        labels = (("cache_type", "st_cache_data"), ("cache", "foo"))
+        self.mock_runtime_stats = [
+            RuntimeStat(
+                "cache_hash_seconds", "counter", labels, 0.5, "Hashing.", "seconds"
+            ),
+            RuntimeStat("cache_hash_memo_hits", "counter", (), 3, "Memo hits."),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        assert response.code == 200
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b"# TYPE cache_hash_seconds counter\n"
+            b"# UNIT cache_hash_seconds seconds\n"
+            b"# HELP cache_hash_seconds Hashing.\n"
+            b'cache_hash_seconds_total{cache_type="st_cache_data",cache="foo"} 0.5\n'
+            b"# TYPE cache_hash_memo_hits counter\n"
+            b"# HELP cache_hash_memo_hits Memo hits.\n"
+            b"cache_hash_memo_hits_total 3\n"
+            b"# EOF\n"
+        )
+
+        assert expected_body == response.body
+
+    def test_protobuf_runtime_stats(self):
+        """Runtime stats are returned as counter families in protobuf format."""
+        self.mock_runtime_stats = [
+            RuntimeStat(
+                "cache_hash_seconds",
+                "counter",
+                (("cache", "foo"),),
+                0.5,
+                "Hashing.",
+                "seconds",
+            ),
+        ]
+
+        headers = HTTPHeaders()
+        headers.add("Accept", "application/x-protobuf")
+        response = self.fetch("/_stcore/metrics", headers=headers)
+        assert response.code == 200
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+
+        assert MessageToDict(metric_set)["metricFamilies"][1] == {
+            "name": "cache_hash_seconds",
+            "type": "COUNTER",
+            "unit": "seconds",
+            "help": "Hashing.",
+            "metrics": [
+                {
+                    "labels": [{"name": "cache", "value": "foo"}],
+                    "metricPoints": [{"counterValue": {"doubleValue": 0.5}}],
+                }
+            ],
+        }
+
+    def test_protobuf_histogram_stats(self) -> None:
+        """Histogram stats are returned as histogram families in protobuf format."""
+        self.mock_runtime_stats = [
+            RuntimeStat(
+                "script_run_seconds",
+                "histogram",
+                (("page", "main"),),
+                0.5,
+                "Script runs.",
+                "seconds",
+                buckets=((0.1, 0), (float("inf"), 1)),
+            ),
+        ]
+
+        headers = HTTPHeaders()
+        headers.add("Accept", "application/x-protobuf")
+        response = self.fetch("/_stcore/metrics", headers=headers)
+        assert response.code == 200
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+
+        metric_family = metric_set.metric_families[1]
+        assert metric_family.name == "script_run_seconds"
+        assert MessageToDict(metric_family)["type"] == "HISTOGRAM"
+
+        histogram_value = metric_family.metrics[0].metric_points[0].histogram_value
+        assert histogram_value.double_value == 0.5
+        assert histogram_value.count == 1
+        assert [
+            (bucket.upper_bound, bucket.count) for bucket in histogram_value.buckets
+        ] == [(0.1, 0), (float("inf"), 1)]
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import NamedTuple
 from unittest.mock import MagicMock, patch
 
@@ -27,7 +28,10 @@ import tornado.websocket
 from streamlit.logger import get_logger
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.web.server.server import UPLOAD_FILE_ENDPOINT
-from streamlit.web.server.upload_file_request_handler import UploadFileRequestHandler
+from streamlit.web.server.upload_file_request_handler import (
+    UploadFileRequestHandler,
+    _MultipartFileParser,
+)
 from tests.testutil import patch_config_options
 
 LOGGER = get_logger(__name__)
@@ -148,6 +152,49 @@ class UploadFileRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
         ]
         assert response.headers["Access-Control-Allow-Origin"] == "http://example.com"
 
+    @patch_config_options({"server.fileSpillThreshold": 1 / 1024})
+    def test_upload_large_file(self):
+        """Large files are streamed to disk while they're uploaded."""
+        data = bytes(range(256)) * 64
+        response = self._upload_files(
+            {"file": ("large.bin", data, "application/octet-stream")},
+            session_id="test_session_id",
+            file_id="file_id",
+        )
+
+        assert response.code == 204, response.reason
+        (rec,) = self.file_mgr.get_files("test_session_id", ["file_id"])
+        assert rec.name == "large.bin"
+        assert rec.type == "application/octet-stream"
+        assert isinstance(rec.data, memoryview)
+        assert rec.data == data
+
+    @patch_config_options({"server.fileSpillThreshold": 1 / 1024})
+    def test_upload_large_file_writes_in_thread(self):
+        """Chunks written to the temporary file of a large file are written in
+        a thread, not on the event loop.
+        """
+        data = bytes(range(256)) * 1024
+        feed_threads = set()
+        feed = _MultipartFileParser.feed
+
+        def record_thread(parser, chunk):
+            feed_threads.add(threading.current_thread())
+            feed(parser, chunk)
+
+        with patch.object(_MultipartFileParser, "feed", record_thread):
+            response = self._upload_files(
+                {"file": ("large.bin", data, "application/octet-stream")},
+                session_id="test_session_id",
+                file_id="file_id",
+            )
+
+        assert response.code == 204, response.reason
+        (rec,) = self.file_mgr.get_files("test_session_id", ["file_id"])
+        assert rec.data == data
+        assert threading.main_thread() in feed_threads
+        assert len(feed_threads) > 1
+
     def test_upload_multiple_files_error(self):
         """Uploading multiple files will error"""
         file_1 = MockFile("file1", b"123")